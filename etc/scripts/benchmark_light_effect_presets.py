@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""Benchmark and regression harness for the built-in light effect presets.
+
+This helper imports the built-in preset registry and evaluates each preset
+headlessly (without Blender) on synthetic swarms of different sizes, using a
+stand-in for ``LightEffectEvaluationContext``. For each preset and swarm size
+it reports the evaluation time in nanoseconds per drone per frame and the
+peak memory allocated while evaluating the preset.
+
+The script can also compare the output of the presets against golden arrays
+stored in ``test/data/light_effect_presets.npz`` so optimizations of the presets
+can be verified for correctness as well. Use ``--update-golden`` to regenerate
+the golden arrays after an intentional change in the output of a preset.
+
+Examples::
+
+    uv run python etc/scripts/benchmark_light_effect_presets.py
+    uv run python etc/scripts/benchmark_light_effect_presets.py --sizes 100,1000 \\
+        --frames 20 --preset "radar_*"
+    uv run python etc/scripts/benchmark_light_effect_presets.py --check-only
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import sys
+import tracemalloc
+from fnmatch import fnmatch
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any
+
+import numpy as np
+from numpy import float32
+from numpy.typing import NDArray
+
+DEFAULT_SIZES = (100, 1000, 10000, 50000)
+DEFAULT_FRAMES = 50
+
+SWARM_RADIUS = 30.0
+
+GOLDEN_DRONE_COUNT = 64
+GOLDEN_FRAMES = (0, 1, 7, 25, 60, 99, 150, 333)
+GOLDEN_RTOL = 1e-5
+GOLDEN_ATOL = 1e-5
+
+
+def find_repo_root(start: Path) -> Path:
+    for candidate in (start, *start.parents):
+        if (candidate / "pyproject.toml").exists() and (
+            candidate / "src" / "modules"
+        ).exists():
+            return candidate
+    raise SystemExit("Could not locate the repository root from the script location.")
+
+
+REPO_ROOT = find_repo_root(Path(__file__).resolve().parent)
+MODULE_ROOT = REPO_ROOT / "src" / "modules"
+GOLDEN_PATH = REPO_ROOT / "test" / "data" / "light_effect_presets.npz"
+
+if str(MODULE_ROOT) not in sys.path:
+    sys.path.insert(0, str(MODULE_ROOT))
+
+# Importing the package root registers all built-in presets.
+import sbstudio.plugin.presets.light_effects  # noqa: F401
+from sbstudio.plugin.presets.light_effects.base import PresetMeta, iter_preset_mapping
+from sbstudio.plugin.presets.light_effects.features import (
+    clear_spatial_feature_store,
+)
+
+
+class StandInObjectPositions:
+    """Stand-in for ObjectPositions that holds a NumPy array."""
+
+    def __init__(self, positions: NDArray[float32]):
+        self._as_array = positions
+
+    @property
+    def as_array(self) -> NDArray[float32]:
+        return self._as_array
+
+    def __len__(self) -> int:
+        return len(self._as_array)
+
+
+class StandInLightEffect:
+    """Stand-in for LightEffect with the minimal functionality needed by presets."""
+
+    def __init__(self, frame_start: int, total_frames: int):
+        self._frame_start = frame_start
+        self._total_frames = total_frames
+
+    def get_time_fraction_for_frame(self, frame: int) -> float:
+        if self._total_frames <= 1:
+            return 0.0
+        return (frame - self._frame_start) / (self._total_frames - 1)
+
+
+class StandInLightEffectEvaluationContext:
+    """Stand-in for LightEffectEvaluationContext.
+
+    A new context is created for every frame, just like in Blender, but all
+    the contexts refer to the same storyboard entry, which corresponds to a
+    swarm that is holding a static formation.
+    """
+
+    def __init__(
+        self,
+        positions: NDArray[float32],
+        mapping: list[int] | None,
+        storyboard_entry_id: str | None = "benchmark",
+    ):
+        self.positions = StandInObjectPositions(positions)
+        self.mapping = mapping
+        self.storyboard_entry_id = storyboard_entry_id
+        self.mask = np.zeros(len(positions), dtype=bool)
+        self._cache: dict[str, Any] = {}
+
+    @property
+    def num_drones(self) -> int:
+        return len(self.positions)
+
+    @property
+    def swarm_center(self) -> NDArray[float32]:
+        try:
+            return self._cache["swarm_center"]
+        except KeyError:
+            center = self.positions.as_array.mean(axis=0).astype("float32")
+            self._cache["swarm_center"] = center
+            return center
+
+
+def make_swarm(count: int) -> tuple[NDArray[float32], list[int]]:
+    """Creates a deterministic synthetic swarm with the given number of drones.
+
+    Drones are placed on a Fibonacci sphere so the swarm is truly 3D and every
+    drone has a distinct polar angle and height. The mapping assigns the
+    drones to the markers of the formation in a scrambled but deterministic
+    order.
+
+    Returns:
+        the positions of the drones and the drone-to-marker mapping
+    """
+    golden_angle = math.pi * (3.0 - math.sqrt(5.0))
+    index = np.arange(count, dtype=np.float64)
+    z = 1.0 - 2.0 * (index + 0.5) / max(count, 1)
+    r = np.sqrt(1.0 - z * z)
+    theta = golden_angle * index
+    positions = (
+        np.column_stack([r * np.cos(theta), r * np.sin(theta), z + 1.0]) * SWARM_RADIUS
+    )
+
+    stride = 7919 if count % 7919 else 1
+    mapping = ((np.arange(count) * stride) % max(count, 1)).tolist()
+
+    return positions.astype(float32), mapping
+
+
+def evaluate_preset(
+    meta: PresetMeta,
+    positions: NDArray[float32],
+    mapping: list[int] | None,
+    frames: list[int],
+) -> NDArray[float32]:
+    """Evaluates a preset on the given swarm in the given frames.
+
+    Returns:
+        the output of the preset, one row per frame
+    """
+    clear_spatial_feature_store()
+
+    effect = StandInLightEffect(
+        frames[0] if frames else 0, frames[-1] - frames[0] + 1 if frames else 0
+    )
+    result = np.zeros((len(frames), len(positions)), dtype=float32)
+    for row, frame in enumerate(frames):
+        context = StandInLightEffectEvaluationContext(positions, mapping)
+        meta.function(effect, context, frame, out=result[row])  # ty:ignore[invalid-argument-type]
+
+    return result
+
+
+def benchmark_preset(
+    meta: PresetMeta, count: int, num_frames: int
+) -> tuple[float, int]:
+    """Benchmarks a single preset on a swarm of the given size.
+
+    Returns:
+        the evaluation time in nanoseconds per drone per frame, and the peak
+        memory allocated during the evaluation, in bytes
+    """
+    positions, mapping = make_swarm(count)
+    frames = list(range(1, num_frames + 1))
+
+    # Warm-up run so that lazy imports and first-call overheads are excluded
+    evaluate_preset(meta, positions, mapping, frames[:1])
+
+    started_at = perf_counter_ns()
+    evaluate_preset(meta, positions, mapping, frames)
+    elapsed = perf_counter_ns() - started_at
+
+    # Memory is measured in a separate run because tracing allocations slows
+    # down the evaluation considerably
+    tracemalloc.start()
+    try:
+        evaluate_preset(meta, positions, mapping, frames)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return elapsed / (count * num_frames), peak
+
+
+def compute_golden_outputs(presets: list[PresetMeta]) -> dict[str, NDArray[float32]]:
+    """Computes the outputs of the given presets on the swarm used for the golden
+    arrays.
+    """
+    positions, mapping = make_swarm(GOLDEN_DRONE_COUNT)
+    frames = list(GOLDEN_FRAMES)
+    return {
+        meta.id: evaluate_preset(meta, positions, mapping, frames) for meta in presets
+    }
+
+
+def check_golden_outputs(
+    presets: list[PresetMeta], path: Path = GOLDEN_PATH
+) -> list[str]:
+    """Compares the outputs of the given presets with the golden arrays.
+
+    Returns:
+        the list of error messages; empty if all the outputs match
+    """
+    if not path.exists():
+        return [f"golden file not found: {path}; run with --update-golden"]
+
+    errors: list[str] = []
+    with np.load(path) as golden:
+        for preset_id, actual in compute_golden_outputs(presets).items():
+            if preset_id not in golden:
+                errors.append(f"{preset_id}: no golden output")
+                continue
+
+            expected = golden[preset_id]
+            if expected.shape != actual.shape:
+                errors.append(
+                    f"{preset_id}: shape mismatch, expected {expected.shape}, "
+                    f"got {actual.shape}"
+                )
+            elif not np.allclose(actual, expected, rtol=GOLDEN_RTOL, atol=GOLDEN_ATOL):
+                diff = float(np.abs(actual - expected).max())
+                errors.append(f"{preset_id}: output differs, max abs diff = {diff:g}")
+
+    return errors
+
+
+def update_golden_outputs(presets: list[PresetMeta], path: Path = GOLDEN_PATH) -> None:
+    """Stores the outputs of the given presets as golden arrays."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(path, **compute_golden_outputs(presets))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the built-in light effect presets and check their outputs."
+    )
+    parser.add_argument(
+        "--sizes",
+        type=str,
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Comma-separated list of swarm sizes. Default: %(default)s.",
+    )
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=DEFAULT_FRAMES,
+        help="Number of frames to evaluate per preset. Default: %(default)s.",
+    )
+    parser.add_argument(
+        "--preset",
+        type=str,
+        default="*",
+        help="Glob pattern of the preset IDs to run. Default: all presets.",
+    )
+    parser.add_argument(
+        "--check-only",
+        action="store_true",
+        help="Only compare the outputs with the golden arrays; skip the benchmark.",
+    )
+    parser.add_argument(
+        "--skip-check",
+        action="store_true",
+        help="Do not compare the outputs with the golden arrays.",
+    )
+    parser.add_argument(
+        "--update-golden",
+        action="store_true",
+        help="Regenerate the golden arrays from the current preset outputs.",
+    )
+    args = parser.parse_args()
+
+    try:
+        args.sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    except ValueError:
+        parser.error("--sizes must be a comma-separated list of integers")
+    if not args.sizes or any(size <= 0 for size in args.sizes):
+        parser.error("--sizes must contain positive integers only")
+    if args.frames <= 0:
+        parser.error("--frames must be a positive integer")
+
+    return args
+
+
+def main() -> int:
+    args = parse_args()
+
+    presets = [meta for meta in iter_preset_mapping() if fnmatch(meta.id, args.preset)]
+    if not presets:
+        print(f"No presets match {args.preset!r}")
+        return 1
+
+    if args.update_golden:
+        # Golden arrays always cover all the presets
+        update_golden_outputs(list(iter_preset_mapping()))
+        print(f"Golden arrays written to {GOLDEN_PATH}")
+        return 0
+
+    if not args.check_only:
+        print(
+            f"Benchmarking {len(presets)} preset(s) over {args.frames} frames; "
+            "cells show ns/drone/frame and peak allocation"
+        )
+        print(f"{'preset':<32}" + "".join(f"{size:>22}" for size in args.sizes))
+        for meta in presets:
+            cells = []
+            for size in args.sizes:
+                ns_per_item, peak = benchmark_preset(meta, size, args.frames)
+                cells.append(f"{ns_per_item:>10.1f} ns {peak / 1024:>6.0f} KiB")
+            print(f"{meta.id:<32}" + "".join(f"{cell:>22}" for cell in cells))
+
+    if args.skip_check:
+        return 0
+
+    errors = check_golden_outputs(presets)
+    if errors:
+        print("\nOutputs differ from the golden arrays:")
+        for error in errors:
+            print(f"  - {error}")
+        return 1
+
+    print(f"\nOutputs of {len(presets)} preset(s) match the golden arrays.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -129,6 +129,7 @@ class MockLightEffectEvaluationContext:
         self._positions = MockObjectPositions(positions)
         self._mapping = mapping
         self._cache: dict[str, Any] = {}
+        self.storyboard_entry_id: str | None = None
 
     @property
     def positions(self) -> MockObjectPositions:
@@ -2,6 +2,10 @@
 """Script to read `translations_tuple` from `src/modules/sbstudio/i18n/translations.py`
 and write a sorted version to `src/modules/sbstudio/i18n/translations_sorted.py`.
 
+The script also writes the compact representation of the translations that the
+add-on loads at runtime to `src/modules/sbstudio/i18n/locales/`, one JSON file
+per language.
+
 Suggested workflow:
 
     1. Run `python etc/scripts/sort_translations.py`
@@ -9,23 +13,45 @@ Suggested workflow:
        with the one in `src/modules/sbstudio/i18n/translations_sorted.py`
     3. Run `ruff format src/modules/sbstudio/i18n/translations.py`
     4. Remove `src/modules/sbstudio/i18n/translations_sorted.py`
+    5. Commit the contents of `src/modules/sbstudio/i18n/locales/` along with
+       `src/modules/sbstudio/i18n/translations.py`
 
 """
 
+import json
 import sys
 from importlib.util import module_from_spec, spec_from_file_location
 from pathlib import Path
 
-src = (
-    Path(__file__).parents[2]
-    / "src"
-    / "modules"
-    / "sbstudio"
-    / "i18n"
-    / "translations.py"
-)
+modules = Path(__file__).parents[2] / "src" / "modules"
+src = modules / "sbstudio" / "i18n" / "translations.py"
 dst = src.parent / "translations_sorted.py"
 
+sys.path.insert(0, str(modules))
+
+from sbstudio.i18n import LOCALES_DIR, compile_translations
+
+
+def write_compiled_translations(translations_tuple, directory: Path) -> None:
+    """Writes the compact representation of the translations to the given
+    directory, one file per language, with one translation per line to keep
+    the diffs readable. Files of languages without translations are removed.
+    """
+    compiled = compile_translations(translations_tuple)
+
+    directory.mkdir(parents=True, exist_ok=True)
+    for path in directory.glob("*.json"):
+        if path.stem not in compiled:
+            path.unlink()
+
+    for lang, items in compiled.items():
+        with open(directory / f"{lang}.json", "w", encoding="utf-8") as f:
+            f.write("[\n")
+            for index, item in enumerate(items):
+                comma = "," if index < len(items) - 1 else ""
+                f.write(f"  {json.dumps(item, ensure_ascii=False)}{comma}\n")
+            f.write("]\n")
+
 
 def main() -> int:
     if not src.exists():
@@ -44,6 +70,9 @@ def main() -> int:
         f.write(f"translations_tuple = {translations_tuple!r}\n")
 
     print(f"Wrote sorted translations to: {dst}")
+
+    write_compiled_translations(translations_tuple, LOCALES_DIR)
+    print(f"Wrote compiled translations to: {LOCALES_DIR}")
     return 0
 
 
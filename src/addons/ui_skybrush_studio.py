@@ -16,6 +16,7 @@ __license__ = "GPLv3"
 #############################################################################
 # imports needed to set up the Python path properly
 
+import logging
 import sys
 from functools import partial
 from pathlib import Path
@@ -46,158 +47,191 @@ for candidate in candidates:
 #############################################################################
 # imports needed by the addon
 
-from sbstudio.i18n.translations import translations_dict
-from sbstudio.plugin.lists import (
-    SKYBRUSH_UL_dronegrouplist,
-    SKYBRUSH_UL_lightfxlist,
-    SKYBRUSH_UL_scheduleoverridelist,
-)
-from sbstudio.plugin.menus import GenerateMarkersMenu
-from sbstudio.plugin.model import (
-    ColorFunctionProperties,
-    DroneGroupsProperties,
-    DroneShowAddonFileSpecificSettings,
-    DroneShowAddonGlobalSettings,
-    DroneShowAddonObjectProperties,
-    DroneShowAddonProperties,
-    FormationsPanelProperties,
-    LEDControlPanelProperties,
-    LightEffect,
-    LightEffectCollection,
-    PyroControlPanelProperties,
-    SafetyCheckProperties,
-    ScheduleOverride,
-    Storyboard,
-    StoryboardEntry,
-    StoryboardEntryOrTransition,
-    get_formation_order_overlay,
-    get_led_control_overlay,
-    get_pyro_effects_overlay,
-    get_safety_check_overlay,
-)
-from sbstudio.plugin.model.led_control import register as register_led_control
-from sbstudio.plugin.model.led_control import unregister as unregister_led_control
-from sbstudio.plugin.operators import (
-    AddMarkersFromQRCodeOperator,
-    AddMarkersFromStaticCSVOperator,
-    AddMarkersFromSVGOperator,
-    AddMarkersFromZippedCSVOperator,
-    AddMarkersFromZippedDSSOperator,
-    AddSelectedDronesToDroneGroupOperator,
-    AppendFormationToStoryboardOperator,
-    ApplyColorsToSelectedDronesOperator,
-    ClearDroneGroupOperator,
-    CreateDroneGroupOperator,
-    CreateFormationOperator,
-    CreateLightEffectOperator,
-    CreateNewScheduleOverrideEntryOperator,
-    CreateNewStoryboardEntryOperator,
-    CreateTakeoffGridOperator,
-    DACExportOperator,
-    DDSFExportOperator,
-    DeselectFormationOperator,
-    DetachMaterialsFromDroneTemplateOperator,
-    DrotekExportOperator,
-    DSSPath3ExportOperator,
-    DSSPathExportOperator,
-    DuplicateLightEffectOperator,
-    EVSKYExportOperator,
-    ExportLightEffectsOperator,
-    FinaleCSVExportOperator,
-    FixConstraintOrderingOperator,
-    GetFormationStatisticsOperator,
-    ImportLightEffectsOperator,
-    InvalidateLightEffectPixelCacheOperator,
-    KMZExportOperator,
-    LandOperator,
-    LitebeeExportOperator,
-    MoveDroneGroupDownOperator,
-    MoveDroneGroupUpOperator,
-    MoveLightEffectDownOperator,
-    MoveLightEffectUpOperator,
-    MoveStoryboardEntryDownOperator,
-    MoveStoryboardEntryUpOperator,
-    PrepareSceneOperator,
-    RecalculateTransitionsOperator,
-    RefreshFileFormatsOperator,
-    RegisterHardwareIDOperator,
-    RemoveDroneGroupOperator,
-    RemoveFormationOperator,
-    RemoveLightEffectOperator,
-    RemoveScheduleOverrideEntryOperator,
-    RemoveStoryboardEntryOperator,
-    ReorderFormationMarkersOperator,
-    ReturnToHomeOperator,
-    RunAllMigrationOperators,
-    RunFullProximityCheckOperator,
-    SelectDronesFromDroneGroup,
-    SelectFormationOperator,
-    SelectStoryboardEntryForCurrentFrameOperator,
-    SetGatewayURLOperator,
-    SetLightEffectEndFrameOperator,
-    SetLightEffectStartFrameOperator,
-    SetServerURLOperator,
-    SetStoryboardEntryEndFrameOperator,
-    SetStoryboardEntryStartFrameOperator,
-    SetupSceneOperator,
-    SkybrushCSVExportOperator,
-    SkybrushExportOperator,
-    SkybrushPDFExportOperator,
-    SkybrushSKYCAndPDFExportOperator,
-    SwapColorsInLEDControlPanelOperator,
-    TakeoffOperator,
-    TriggerPyroOnSelectedDronesOperator,
-    UpdateFormationOperator,
-    UpdateFrameRangeFromStoryboardOperator,
-    UpdatePyroParamsFromSelectedDroneOperator,
-    UpdateTimeMarkersFromStoryboardOperator,
-    UseSelectedVertexGroupForFormationOperator,
-    ValidateTrajectoriesOperator,
-    VVIZExportOperator,
-)
-from sbstudio.plugin.panels import (
-    DroneGroupsPanel,
-    DroneShowAddonObjectPropertiesPanel,
-    ExportPanel,
-    FormationsPanel,
-    LEDControlPanel,
-    LightEffectsPanel,
-    PyroControlPanel,
-    SafetyCheckPanel,
-    SetupPanel,
-    ShowPanel,
-    StoryboardEditor,
-    SwarmPanel,
-    TransitionEditorFromCurrentFormation,
-    TransitionEditorIntoCurrentFormation,
-)
-from sbstudio.plugin.plugin_helpers import (
-    register_header,
-    register_list,
-    register_menu,
-    register_operator,
-    register_panel,
-    register_translations,
-    register_type,
-    unregister_header,
-    unregister_list,
-    unregister_menu,
-    unregister_operator,
-    unregister_panel,
-    unregister_translations,
-    unregister_type,
-)
-from sbstudio.plugin.presets import register as register_presets
-from sbstudio.plugin.presets import unregister as unregister_presets
-from sbstudio.plugin.state import register as register_state
-from sbstudio.plugin.state import unregister as unregister_state
-from sbstudio.plugin.tasks import (
-    InitializationTask,
-    InvalidatePixelCacheTask,
-    PyroEffectsTask,
-    SafetyCheckTask,
-    UpdateLightEffectsTask,
-)
+from sbstudio.startup_timer import StartupTimer
+
+log = logging.getLogger(__name__)
+
+startup_timer = StartupTimer(budget=1.0)
+"""Timer that measures the duration of the startup of the add-on. The report
+of the timer is logged as a warning if the startup exceeds its budget.
+"""
+
+with startup_timer.measure("import sbstudio.plugin.i18n"):
+    from sbstudio.plugin.i18n import register as register_translations
+    from sbstudio.plugin.i18n import unregister as unregister_translations
+
+with startup_timer.measure("import sbstudio.plugin.lists"):
+    from sbstudio.plugin.lists import (
+        SKYBRUSH_UL_dronegrouplist,
+        SKYBRUSH_UL_lightfxlist,
+        SKYBRUSH_UL_scheduleoverridelist,
+    )
+
+with startup_timer.measure("import sbstudio.plugin.menus"):
+    from sbstudio.plugin.menus import GenerateMarkersMenu
+
+with startup_timer.measure("import sbstudio.plugin.model"):
+    from sbstudio.plugin.model import (
+        ColorFunctionProperties,
+        DroneGroupsProperties,
+        DroneShowAddonFileSpecificSettings,
+        DroneShowAddonGlobalSettings,
+        DroneShowAddonObjectProperties,
+        DroneShowAddonProperties,
+        FormationsPanelProperties,
+        LEDControlPanelProperties,
+        LightEffect,
+        LightEffectCollection,
+        PyroControlPanelProperties,
+        SafetyCheckProperties,
+        ScheduleOverride,
+        Storyboard,
+        StoryboardEntry,
+        StoryboardEntryOrTransition,
+        get_formation_order_overlay,
+        get_led_control_overlay,
+        get_pyro_effects_overlay,
+        get_safety_check_overlay,
+    )
+
+with startup_timer.measure("import sbstudio.plugin.model.led_control"):
+    from sbstudio.plugin.model.led_control import register as register_led_control
+    from sbstudio.plugin.model.led_control import unregister as unregister_led_control
+
+with startup_timer.measure("import sbstudio.plugin.operators"):
+    from sbstudio.plugin.operators import (
+        AddMarkersFromQRCodeOperator,
+        AddMarkersFromStaticCSVOperator,
+        AddMarkersFromSVGOperator,
+        AddMarkersFromZippedCSVOperator,
+        AddMarkersFromZippedDSSOperator,
+        AddSelectedDronesToDroneGroupOperator,
+        AppendFormationToStoryboardOperator,
+        ApplyColorsToSelectedDronesOperator,
+        ClearDroneGroupOperator,
+        CreateDroneGroupOperator,
+        CreateFormationOperator,
+        CreateLightEffectOperator,
+        CreateNewScheduleOverrideEntryOperator,
+        CreateNewStoryboardEntryOperator,
+        CreateTakeoffGridOperator,
+        DACExportOperator,
+        DDSFExportOperator,
+        DeselectFormationOperator,
+        DetachMaterialsFromDroneTemplateOperator,
+        DrotekExportOperator,
+        DSSPath3ExportOperator,
+        DSSPathExportOperator,
+        DuplicateLightEffectOperator,
+        EVSKYExportOperator,
+        ExportLightEffectsOperator,
+        FinaleCSVExportOperator,
+        FixConstraintOrderingOperator,
+        GetFormationStatisticsOperator,
+        ImportLightEffectsOperator,
+        InvalidateLightEffectPixelCacheOperator,
+        KMZExportOperator,
+        LandOperator,
+        LitebeeExportOperator,
+        MoveDroneGroupDownOperator,
+        MoveDroneGroupUpOperator,
+        MoveLightEffectDownOperator,
+        MoveLightEffectUpOperator,
+        MoveStoryboardEntryDownOperator,
+        MoveStoryboardEntryUpOperator,
+        PrepareSceneOperator,
+        RecalculateTransitionsOperator,
+        RefreshFileFormatsOperator,
+        RegisterHardwareIDOperator,
+        RemoveDroneGroupOperator,
+        RemoveFormationOperator,
+        RemoveLightEffectOperator,
+        RemoveScheduleOverrideEntryOperator,
+        RemoveStoryboardEntryOperator,
+        ReorderFormationMarkersOperator,
+        ReturnToHomeOperator,
+        RunAllMigrationOperators,
+        RunFullProximityCheckOperator,
+        SelectDronesFromDroneGroup,
+        SelectFormationOperator,
+        SelectStoryboardEntryForCurrentFrameOperator,
+        SetGatewayURLOperator,
+        SetLightEffectEndFrameOperator,
+        SetLightEffectStartFrameOperator,
+        SetServerURLOperator,
+        SetStoryboardEntryEndFrameOperator,
+        SetStoryboardEntryStartFrameOperator,
+        SetupSceneOperator,
+        SkybrushBundleExportOperator,
+        SkybrushCSVExportOperator,
+        SkybrushExportOperator,
+        SkybrushPDFExportOperator,
+        SkybrushSKYCAndPDFExportOperator,
+        SwapColorsInLEDControlPanelOperator,
+        TakeoffOperator,
+        TriggerPyroOnSelectedDronesOperator,
+        UpdateFormationOperator,
+        UpdateFrameRangeFromStoryboardOperator,
+        UpdatePyroParamsFromSelectedDroneOperator,
+        UpdateTimeMarkersFromStoryboardOperator,
+        UseSelectedVertexGroupForFormationOperator,
+        ValidateTrajectoriesOperator,
+        VVIZExportOperator,
+    )
+
+with startup_timer.measure("import sbstudio.plugin.panels"):
+    from sbstudio.plugin.panels import (
+        DroneGroupsPanel,
+        DroneShowAddonObjectPropertiesPanel,
+        ExportPanel,
+        FormationsPanel,
+        LEDControlPanel,
+        LightEffectsPanel,
+        PyroControlPanel,
+        SafetyCheckPanel,
+        SetupPanel,
+        ShowPanel,
+        StoryboardEditor,
+        SwarmPanel,
+        TransitionEditorFromCurrentFormation,
+        TransitionEditorIntoCurrentFormation,
+    )
+
+with startup_timer.measure("import sbstudio.plugin.plugin_helpers"):
+    from sbstudio.plugin.plugin_helpers import (
+        register_header,
+        register_list,
+        register_menu,
+        register_operator,
+        register_panel,
+        register_type,
+        unregister_header,
+        unregister_list,
+        unregister_menu,
+        unregister_operator,
+        unregister_panel,
+        unregister_type,
+    )
+
+with startup_timer.measure("import sbstudio.plugin.presets"):
+    from sbstudio.plugin.presets import register as register_presets
+    from sbstudio.plugin.presets import unregister as unregister_presets
+
+with startup_timer.measure("import sbstudio.plugin.state"):
+    from sbstudio.plugin.state import register as register_state
+    from sbstudio.plugin.state import unregister as unregister_state
+
+with startup_timer.measure("import sbstudio.plugin.tasks"):
+    from sbstudio.plugin.tasks import (
+        InitializationTask,
+        InvalidateFormationCacheTask,
+        InvalidatePixelCacheTask,
+        InvalidateStoryboardIndexTask,
+        InvalidateVertexGroupCacheTask,
+        PyroEffectsTask,
+        SafetyCheckTask,
+        UpdateLightEffectsTask,
+    )
 
 types = (
     FormationsPanelProperties,
@@ -263,6 +297,7 @@ operators = (
     SkybrushCSVExportOperator,
     SkybrushPDFExportOperator,
     SkybrushSKYCAndPDFExportOperator,
+    SkybrushBundleExportOperator,
     DACExportOperator,
     DDSFExportOperator,
     DrotekExportOperator,
@@ -335,7 +370,10 @@ headers = ()
 
 tasks = (
     InitializationTask(),
+    InvalidateFormationCacheTask(),
     InvalidatePixelCacheTask(),
+    InvalidateStoryboardIndexTask(),
+    InvalidateVertexGroupCacheTask(),
     PyroEffectsTask(),
     SafetyCheckTask(),
     UpdateLightEffectsTask(),
@@ -352,30 +390,42 @@ overlay_getters = (
 
 
 def register():
-    register_translations(translations_dict)
-    register_presets()
-    register_state()
-
-    for custom_type in types:
-        register_type(custom_type)
-    for operator in operators:
-        register_operator(operator)
-    for list_ in lists:
-        register_list(list_)
-    for menu in menus:
-        register_menu(menu)
-    for panel in panels:
-        register_panel(panel)
-    for header in headers:
-        register_header(header)
+    with startup_timer.measure("register translations"):
+        register_translations()
+    with startup_timer.measure("register presets"):
+        register_presets()
+    with startup_timer.measure("register state"):
+        register_state()
+
+    with startup_timer.measure("register types"):
+        for custom_type in types:
+            register_type(custom_type)
+    with startup_timer.measure("register operators"):
+        for operator in operators:
+            register_operator(operator)
+    with startup_timer.measure("register user interface"):
+        for list_ in lists:
+            register_list(list_)
+        for menu in menus:
+            register_menu(menu)
+        for panel in panels:
+            register_panel(panel)
+        for header in headers:
+            register_header(header)
 
     Scene.skybrush = PointerProperty(type=DroneShowAddonProperties)
     Object.skybrush = PointerProperty(type=DroneShowAddonObjectProperties)
 
-    register_led_control()
+    with startup_timer.measure("register tasks"):
+        register_led_control()
+        for task in tasks:
+            task.register()
 
-    for task in tasks:
-        task.register()
+    startup_timer.report(log)
+
+    # Imports are measured only once; later registrations (e.g., after the
+    # add-on is disabled and enabled again) are measured on their own
+    startup_timer.reset()
 
 
 def unregister():
@@ -13,8 +13,8 @@ from ssl import CERT_NONE, create_default_context
 from typing import Any
 from urllib.error import HTTPError
 from urllib.parse import urljoin, urlparse, urlunparse
-from urllib.request import Request, urlopen
 
+from sbstudio.connection_pool import ConnectionPool
 from sbstudio.utils import create_path_and_open
 
 from .errors import SkybrushStudioAPIError
@@ -122,6 +122,9 @@ class SkybrushStudioBaseAPI:
     _api_key: str | None
     """The optional API key that will be submitted with each request."""
 
+    _connection_pool: ConnectionPool
+    """Pool of persistent connections that the requests are sent on."""
+
     _http_status: dict[int | None, str]
     """Predefined HTTP status messages."""
 
@@ -135,7 +138,7 @@ class SkybrushStudioBaseAPI:
             url: the root URL of the Skybrush API
         """
         self._api_key = None
-        self._request_context = create_default_context()
+        self._connection_pool = ConnectionPool(ssl_context=create_default_context())
         self._http_status = {status.value: status.phrase for status in HTTPStatus}
         self._http_status[None] = "HTTP error"
 
@@ -247,10 +250,10 @@ class SkybrushStudioBaseAPI:
         if signature is not None:
             headers["X-Skybrush-Request-Signature"] = signature
 
-        req = Request(self.joined_url(url), data=data, headers=headers, method=method)
-
         try:
-            with urlopen(req, context=self._request_context) as raw_response:
+            with self._connection_pool.request(
+                method, self.joined_url(url), body=data, headers=headers
+            ) as raw_response:
                 response = Response(raw_response)
                 response._run_sanity_checks()
                 yield response
@@ -318,4 +321,4 @@ class SkybrushStudioBaseAPI:
         ctx = create_default_context()
         ctx.check_hostname = False
         ctx.verify_mode = CERT_NONE
-        self._request_context = ctx
+        self._connection_pool.ssl_context = ctx
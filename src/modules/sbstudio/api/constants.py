@@ -5,3 +5,8 @@ SKYBRUSH_STUDIO_SERVER_URL = "https://studio.skybrush.io/api/v1"
 
 MINIMUM_BACKEND_VERSION = Version(2, 35, 0)
 """The minimum version of the backend that is compatible with this version of the plugin."""
+
+BINARY_POINTS_FEATURE = "encoding:binary-points"
+"""Feature tag of servers that accept point sets and return mappings in the
+compact binary representation of `sbstudio.model.binary_arrays`.
+"""
@@ -1,15 +1,34 @@
+from __future__ import annotations
+
 from contextlib import contextmanager
-from typing import Iterator
+from typing import TYPE_CHECKING, Any, Iterator
 
+from sbstudio.coalescing_forwarder import CoalescingForwarder
 from sbstudio.plugin.errors import TaskCancelled
-from sbstudio.plugin.utils.progress import ProgressHandler, ProgressReport
 
 from .base import SkybrushStudioBaseAPI
 from .errors import SkybrushStudioAPIError
 
+if TYPE_CHECKING:
+    from sbstudio.plugin.utils.progress import ProgressHandler, ProgressReport
+
 __all__ = ("SkybrushGatewayAPI",)
 
 
+_MAX_PROGRESS_UPDATES_PER_SECOND = 4.0
+"""Maximum number of progress updates to send to the gateway per second."""
+
+_CANCELLATION_POLL_INTERVAL = 1.0
+"""Number of seconds without progress updates after which the gateway is
+polled again for the cancellation state of the operation.
+"""
+
+_MIN_PROGRESS_STEP = 0.5
+"""Minimum change in the percentage of an operation that is worth sending to
+the gateway.
+"""
+
+
 class SkybrushGatewayAPI(SkybrushStudioBaseAPI):
     """Class that represents a connection to the API of a
     Skybrush Gateway for request signing and progress display.
@@ -44,24 +63,37 @@ class SkybrushGatewayAPI(SkybrushStudioBaseAPI):
         """
         task_url = self._create_task(title=title)
         last_percentage: float | None = None
+        last_update: dict[str, Any] | None = None
 
-        def handler(progress: ProgressReport) -> bool:
-            nonlocal last_percentage
-            last_percentage = progress.percentage
-            with self._send_request(
-                task_url,
-                json={
-                    "progress": round(progress.percentage, 1)
-                    if progress.percentage is not None
-                    else -1,
-                    "title": progress.operation,
-                },
-            ) as response:
-                cancelled = bool(response.as_json())
-                return cancelled
+        def send(update: dict[str, Any]) -> bool:
+            with self._send_request(task_url, json=update) as response:
+                return bool(response.as_json())
 
         try:
-            yield handler
+            # Progress updates are sent from a background thread so the
+            # operation being tracked is not slowed down by the requests
+            with CoalescingForwarder(
+                send,
+                max_rate=_MAX_PROGRESS_UPDATES_PER_SECOND,
+                poll_interval=_CANCELLATION_POLL_INTERVAL,
+                name="Skybrush Gateway progress",
+            ) as forwarder:
+
+                def handler(progress: ProgressReport) -> bool:
+                    nonlocal last_percentage, last_update
+                    last_percentage = progress.percentage
+                    update = {
+                        "progress": round(progress.percentage, 1)
+                        if progress.percentage is not None
+                        else -1,
+                        "title": progress.operation,
+                    }
+                    if _is_significant_progress_update(last_update, update):
+                        last_update = update
+                        forwarder.submit(update)
+                    return forwarder.cancelled
+
+                yield handler
         except (TaskCancelled, KeyboardInterrupt):
             with self._send_request(
                 task_url,
@@ -124,3 +156,22 @@ class SkybrushGatewayAPI(SkybrushStudioBaseAPI):
             )
 
         return self.joined_url(task_url)
+
+
+def _is_significant_progress_update(
+    old: dict[str, Any] | None, new: dict[str, Any]
+) -> bool:
+    """Returns whether a progress update is worth sending to the gateway,
+    given the previous update that was sent.
+    """
+    if old is None or old["title"] != new["title"]:
+        return True
+
+    old_progress, new_progress = old["progress"], new["progress"]
+    if old_progress < 0 or new_progress < 0:
+        return old_progress != new_progress
+
+    return (
+        abs(new_progress - old_progress) >= _MIN_PROGRESS_STEP
+        or new_progress >= 100 > old_progress
+    )
@@ -2,12 +2,16 @@ import logging
 import re
 from base64 import b64encode
 from collections.abc import Sequence
+from copy import copy
+from json import dumps as json_dumps
+from json import loads as json_loads
 from pathlib import Path
-from typing import Any
+from typing import Any, Self
 
 from natsort import natsorted
 
 from sbstudio.model.audio import Audio
+from sbstudio.model.binary_arrays import decode_index_array, encode_point_array
 from sbstudio.model.cameras import Camera
 from sbstudio.model.color import Color3D
 from sbstudio.model.light_program import LightProgram
@@ -20,12 +24,14 @@ from sbstudio.model.trajectory import Trajectory
 from sbstudio.model.types import Coordinate3D
 from sbstudio.model.yaw import YawSetpointList
 from sbstudio.plugin.errors import SkybrushStudioExportWarning
-from sbstudio.plugin.gateway import get_gateway_if_configured
+from sbstudio.response_cache import ResponseCache
 
 from .base import SkybrushStudioBaseAPI
-from .constants import SKYBRUSH_STUDIO_SERVER_URL
+from .constants import BINARY_POINTS_FEATURE, SKYBRUSH_STUDIO_SERVER_URL
 from .errors import SkybrushStudioAPIError
+from .gateway import SkybrushGatewayAPI
 from .types import Limits, Mapping, SmartRTHPlan, TransitionPlan, Version
+from .version import get_backend_version
 
 __all__ = ("SkybrushStudioAPI",)
 
@@ -47,13 +53,63 @@ class SkybrushStudioAPI(SkybrushStudioBaseAPI):
     _api_key: str | None = None
     """The optional API key that will be submitted with each request."""
 
-    def _sign_request_body(self, data: bytes) -> str | None:
+    _binary_points: bool | None = None
+    """Whether the server accepts point sets and returns mappings in binary
+    form; ``None`` if not known yet.
+    """
+
+    response_cache: ResponseCache | None = None
+    """Cache of the responses of deterministic planning requests; ``None`` if
+    the responses should not be cached.
+    """
+
+    _gateway: SkybrushGatewayAPI | None = None
+    """The Studio Gateway that signs the requests if it was resolved in
+    advance with `with_gateway_resolved()`.
+    """
+
+    _gateway_resolved: bool = False
+    """Whether the Studio Gateway was resolved in advance. When it was not, the
+    gateway is looked up from the add-on preferences for each request.
+    """
+
+    def with_gateway_resolved(self) -> Self:
+        """Returns a copy of this API object that signs its requests with the
+        Studio Gateway that is configured at the time of the call.
+
+        The gateway is looked up in the add-on preferences, which must happen
+        on the main thread of Blender. The returned copy does not access
+        Blender so it can be used from worker threads. It shares its
+        connection pool and response cache with this object.
+
+        The features of the server are resolved on this object before it is
+        copied so the copies made for worker threads do not query them again.
+        """
+        self._supports_binary_points()
+
+        result = copy(self)
+        result._gateway = self._find_gateway()
+        result._gateway_resolved = True
+        return result
+
+    @staticmethod
+    def _find_gateway() -> SkybrushGatewayAPI | None:
+        """Looks up the Studio Gateway in the add-on preferences.
+
+        Returns:
+            the gateway, or ``None`` if it is not configured or there was an
+            error while looking it up
+        """
+        from sbstudio.plugin.gateway import get_gateway_if_configured
+
         try:
-            gateway = get_gateway_if_configured()
+            return get_gateway_if_configured()
         except Exception as ex:
             log.warning(f"Could not find Studio Gateway: {ex}")
-            gateway = None
+            return None
 
+    def _sign_request_body(self, data: bytes) -> str | None:
+        gateway = self._gateway if self._gateway_resolved else self._find_gateway()
         if gateway is None:
             # Gateway not configured or there was an error
             return None
@@ -64,6 +120,67 @@ class SkybrushStudioAPI(SkybrushStudioBaseAPI):
             log.warning(f"Could not sign request: {ex}")
             return None
 
+    def _send_cacheable_request(self, url: str, data: Any) -> Any:
+        """Sends a JSON request to the given URL, relative to the API root, and
+        returns the parsed JSON response.
+
+        The response must be a deterministic function of the request body and
+        the version of the server. Responses are looked up in and stored in
+        the response cache of the API object if it has one.
+        """
+        cache = self.response_cache
+        if cache is None:
+            with self._send_request(url, json=data) as response:
+                return response.as_json()
+
+        key = ResponseCache.key_of(
+            self.joined_url(url), data, str(get_backend_version(self))
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            try:
+                return json_loads(cached)
+            except ValueError:
+                log.warning(f"Invalid cached response for {url}, ignoring")
+
+        with self._send_request(url, json=data) as response:
+            result = response.as_json()
+
+        if isinstance(result, dict) and result.get("version") == data.get("version"):
+            cache.put(key, json_dumps(result).encode("utf-8"))
+
+        return result
+
+    def _encode_point_sets(self, data: dict[str, Any], *keys: str) -> None:
+        """Switches the given request body to the binary representation of
+        point sets, in place, if the server supports it.
+
+        The version of the request is bumped from 1 to 2 when the binary
+        representation is used; servers respond with the same version and
+        return mappings in binary form as well.
+
+        Args:
+            data: the request body to update
+            keys: the keys of the point sets in the request body
+        """
+        if self._supports_binary_points():
+            data["version"] = 2
+            for key in keys:
+                data[key] = encode_point_array(data[key])
+
+    def _supports_binary_points(self) -> bool:
+        """Returns whether the server supports the binary representation of
+        point sets, based on the features it advertises in its limits.
+        """
+        if self._binary_points is None:
+            try:
+                features = self.get_limits().features
+            except SkybrushStudioAPIError as ex:
+                log.warning(f"Could not query server limits: {ex}")
+                features = []
+            self._binary_points = BINARY_POINTS_FEATURE in features
+        return self._binary_points
+
     @staticmethod
     def validate_api_key(key: str) -> str:
         """Validates the given API key.
@@ -119,10 +236,10 @@ class SkybrushStudioAPI(SkybrushStudioBaseAPI):
             "min_distance": float(min_distance),
             "points": points,
         }
-        with self._send_request("operations/decompose", json=data) as response:
-            result = response.as_json()
+        self._encode_point_sets(data, "points")
+        result = self._send_cacheable_request("operations/decompose", data)
 
-        if result.get("version") != 1:
+        if result.get("version") != data["version"]:
             raise SkybrushStudioAPIError("invalid response version")
 
         return result.get("groups")
@@ -477,13 +594,17 @@ class SkybrushStudioAPI(SkybrushStudioBaseAPI):
         if radius is not None:
             data["radius"] = radius
 
-        with self._send_request("operations/match-points", json=data) as response:
-            result = response.as_json()
+        self._encode_point_sets(data, "source", "target")
+        result = self._send_cacheable_request("operations/match-points", data)
 
-        if result.get("version") != 1:
+        if result.get("version") != data["version"]:
             raise SkybrushStudioAPIError("invalid response version")
 
-        return result.get("mapping"), result.get("clearance")
+        mapping = _decode_mapping(result.get("mapping"))
+        if mapping is None:
+            raise SkybrushStudioAPIError("invalid response format")
+
+        return mapping, result.get("clearance")
 
     def plan_landing(
         self,
@@ -518,10 +639,10 @@ class SkybrushStudioAPI(SkybrushStudioBaseAPI):
             "target_altitude": float(target_altitude),
             "spindown_time": float(spindown_time),
         }
-        with self._send_request("operations/plan-landing", json=data) as response:
-            result = response.as_json()
+        self._encode_point_sets(data, "points")
+        result = self._send_cacheable_request("operations/plan-landing", data)
 
-        if result.get("version") != 1:
+        if result.get("version") != data["version"]:
             raise SkybrushStudioAPIError("invalid response version")
 
         return result["start_times"], result["durations"]
@@ -564,10 +685,10 @@ class SkybrushStudioAPI(SkybrushStudioBaseAPI):
             "rth_model": rth_model,
         }
 
-        with self._send_request("operations/plan-smart-rth", json=data) as response:
-            result = response.as_json()
+        self._encode_point_sets(data, "source", "target")
+        result = self._send_cacheable_request("operations/plan-smart-rth", data)
 
-        if result.get("version") != 1:
+        if result.get("version") != data["version"]:
             raise SkybrushStudioAPIError("invalid response version")
 
         start_times = result.get("start_times")
@@ -608,10 +729,10 @@ class SkybrushStudioAPI(SkybrushStudioBaseAPI):
             "min_distance": float(min_distance),
             "points": points,
         }
-        with self._send_request("operations/plan-takeoff", json=data) as response:
-            result = response.as_json()
+        self._encode_point_sets(data, "points")
+        result = self._send_cacheable_request("operations/plan-takeoff", data)
 
-        if result.get("version") != 1:
+        if result.get("version") != data["version"]:
             raise SkybrushStudioAPIError("invalid response version")
 
         return result.get("groups")
@@ -663,10 +784,10 @@ class SkybrushStudioAPI(SkybrushStudioBaseAPI):
         if max_velocity_z_up is not None:
             data["max_velocity_z_up"] = max_velocity_z_up
 
-        with self._send_request("operations/plan-transition", json=data) as response:
-            result = response.as_json()
+        self._encode_point_sets(data, "source", "target")
+        result = self._send_cacheable_request("operations/plan-transition", data)
 
-        if result.get("version") != 1:
+        if result.get("version") != data["version"]:
             raise SkybrushStudioAPIError("invalid response version")
 
         start_times = result.get("start_times")
@@ -674,12 +795,24 @@ class SkybrushStudioAPI(SkybrushStudioBaseAPI):
         if start_times is None or durations is None:
             raise SkybrushStudioAPIError("invalid response format")
 
-        mapping = result.get("mapping")
+        mapping = _decode_mapping(result.get("mapping"))
         clearance = result.get("clearance")
 
         return TransitionPlan(
             start_times=list(start_times),
             durations=list(durations),
-            mapping=list(mapping) if mapping is not None else None,
+            mapping=mapping,
             clearance=float(clearance) if clearance is not None else None,
         )
+
+
+def _decode_mapping(mapping: Any) -> Mapping | None:
+    """Decodes a mapping received from the server, either in its JSON or in its
+    binary representation.
+    """
+    if mapping is None:
+        return None
+    elif isinstance(mapping, str):
+        return decode_index_array(mapping)
+    else:
+        return list(mapping)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from threading import Lock
 from typing import TYPE_CHECKING
 
 from .constants import MINIMUM_BACKEND_VERSION
@@ -9,9 +10,22 @@ from .types import Version
 if TYPE_CHECKING:
     from sbstudio.plugin.api import SkybrushStudioAPI
 
-__all__ = ("ensure_backend_version", "is_backend_version_at_least")
+__all__ = (
+    "ensure_backend_version",
+    "get_backend_version",
+    "is_backend_version_at_least",
+)
 
-_backend_version_cache: tuple[SkybrushStudioAPI, Version] | None = None
+_backend_versions: dict[tuple[str, str | None], Version] = {}
+"""Cache of the known backend versions, keyed by the root URL of the API and
+the API key. Copies of the same API object share the same entry.
+"""
+
+_backend_versions_lock = Lock()
+"""Lock that guards the cache of the known backend versions. It is held while
+the version is being queried so concurrent queries for the same backend
+result in a single request.
+"""
 
 
 def _get_or_query_backend_version(
@@ -24,15 +38,12 @@ def _get_or_query_backend_version(
         api: the API object to use for the query
         force: whether to force the query even if we know the backend version
     """
-    global _backend_version_cache
-
-    if not force and _backend_version_cache is not None:
-        cached_api, cached_version = _backend_version_cache
-        if cached_api == api:
-            return cached_version
-
-    version = api.get_version()
-    _backend_version_cache = (api, version)
+    key = api.url, api.api_key
+    with _backend_versions_lock:
+        version = None if force else _backend_versions.get(key)
+        if version is None:
+            version = api.get_version()
+            _backend_versions[key] = version
 
     return version
 
@@ -55,6 +66,18 @@ def ensure_backend_version(api: SkybrushStudioAPI):
         raise BackendVersionMismatchError(version)
 
 
+def get_backend_version(api: SkybrushStudioAPI) -> Version:
+    """Returns the version number of the backend.
+
+    This function re-uses the cached version number if we already know the
+    version number of the backend.
+
+    Args:
+        api: the API object to use for the query
+    """
+    return _get_or_query_backend_version(api)
+
+
 def is_backend_version_at_least(version: Version, *, api: SkybrushStudioAPI) -> bool:
     """Returns whether the backend version is at least the given version.
 
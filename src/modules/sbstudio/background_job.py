@@ -0,0 +1,167 @@
+"""Long-running jobs that keep the user interface of Blender responsive."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Generator
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from sbstudio.plugin.errors import TaskCancelled
+
+if TYPE_CHECKING:
+    from sbstudio.plugin.utils.progress import ProgressHandler, ProgressReport
+
+__all__ = ("BackgroundJob",)
+
+
+T = TypeVar("T")
+
+WorkerFunction = Callable[["ProgressHandler | None"], T]
+"""Type alias for the function that performs the part of a job that runs on
+a worker thread. It receives a progress handler that returns `True` if the
+job was cancelled.
+"""
+
+
+class BackgroundJob(Generic[T]):
+    """Long-running job that consists of two phases.
+
+    The first phase needs access to Blender and therefore runs on the main
+    thread. It is represented by a generator that is advanced in short time
+    slices by `step()`, typically from a modal operator or a timer, so Blender
+    can redraw its user interface between the slices. The generator returns a
+    function that performs the second phase of the job (e.g., network I/O or
+    CPU-bound post-processing) on a worker thread while Blender stays
+    responsive.
+
+    Both phases may be cancelled with `cancel()`. The main-thread phase is
+    cancelled immediately. The worker-thread phase is notified via the
+    progress handler that it receives, which returns `True` after the job was
+    cancelled; the job is finished only when the worker has stopped.
+    """
+
+    progress: ProgressReport | None = None
+    """The most recent progress report of the job."""
+
+    _cancelled: bool = False
+    """Whether the job was cancelled."""
+
+    _future: Future[T] | None = None
+    """Future that resolves to the result of the worker-thread phase; `None`
+    if the main-thread phase is still running.
+    """
+
+    _steps: Generator[Any, None, WorkerFunction[T]]
+    """Generator that performs the main-thread phase of the job."""
+
+    def __init__(self, steps: Generator[Any, None, WorkerFunction[T]]):
+        """Constructor.
+
+        Args:
+            steps: generator that performs the main-thread phase of the job in
+                small steps and returns the function to call on the worker
+                thread
+        """
+        self._steps = steps
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the job was cancelled."""
+        return self._cancelled
+
+    @property
+    def running_in_background(self) -> bool:
+        """Whether the main-thread phase of the job has finished and the job
+        is running on the worker thread.
+        """
+        return self._future is not None
+
+    def cancel(self) -> None:
+        """Cancels the job.
+
+        When the job is running on the worker thread, the worker is only
+        notified about the cancellation; call `step()` until it returns `True`
+        to wait for the worker to stop.
+        """
+        self._cancelled = True
+        if self._future is None:
+            self._steps.close()
+        else:
+            self._future.cancel()
+
+    def handle_progress(self, progress: ProgressReport) -> bool:
+        """Progress handler that records the given progress report as the most
+        recent one and returns whether the job was cancelled.
+
+        Can be used as the progress handler of the main-thread phase as well.
+        """
+        self.progress = progress
+        return self._cancelled
+
+    def result(self) -> T:
+        """Returns the result of the job after `step()` returned `True`.
+
+        The result is returned even if the job was cancelled when the worker
+        thread finished before it noticed the cancellation.
+
+        Raises:
+            TaskCancelled: if the job was cancelled
+            Exception: any exception that was raised by the job
+        """
+        if self._future is None:
+            if self._cancelled:
+                raise TaskCancelled("Job was cancelled")
+            raise RuntimeError("Job has not finished yet")
+        if self._future.cancelled():
+            raise TaskCancelled("Job was cancelled")
+        return self._future.result()
+
+    def run(self) -> T:
+        """Runs the job to completion on the current thread."""
+        while True:
+            try:
+                next(self._steps)
+            except StopIteration as ex:
+                worker: WorkerFunction[T] = ex.value
+                return worker(self.handle_progress)
+
+    def step(self, time_budget: float = 0.05) -> bool:
+        """Advances the main-thread phase of the job for at most the given
+        amount of time, and starts the worker-thread phase when the main-thread
+        phase has finished.
+
+        Exceptions raised from the main-thread phase are propagated to the
+        caller.
+
+        Args:
+            time_budget: the maximum amount of time to spend, in seconds. The
+                time budget may be exceeded by the duration of a single step.
+
+        Returns:
+            whether the job has finished, either successfully or with an
+            error, or it was cancelled and the worker thread (if any) has
+            stopped
+        """
+        if self._future is None:
+            if self._cancelled:
+                return True
+
+            deadline = perf_counter() + time_budget
+            try:
+                while perf_counter() < deadline:
+                    next(self._steps)
+            except StopIteration as ex:
+                self._future = self._start_worker(ex.value)
+            return False
+
+        return self._future.done()
+
+    def _start_worker(self, worker: WorkerFunction[T]) -> Future[T]:
+        """Starts the worker-thread phase of the job."""
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            return executor.submit(worker, self.handle_progress)
+        finally:
+            # The thread of the executor terminates when the worker returns
+            executor.shutdown(wait=False)
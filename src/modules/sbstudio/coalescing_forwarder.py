@@ -0,0 +1,175 @@
+"""Forwarder that sends the most recent item submitted to it from a background
+thread, with rate limiting.
+"""
+
+import logging
+from collections.abc import Callable
+from threading import Condition, Thread
+from time import monotonic
+from typing import Generic, TypeVar, cast
+
+__all__ = ("CoalescingForwarder",)
+
+
+T = TypeVar("T")
+
+log = logging.getLogger(__name__)
+
+
+class CoalescingForwarder(Generic[T]):
+    """Forwards items submitted to it to a sender function on a background
+    thread, at most a given number of times per second.
+
+    Items submitted while the previous item is still being sent or while the
+    rate limit is in effect are coalesced; only the most recent one is
+    forwarded. Submitting an item never blocks the caller.
+
+    The sender function returns whether the receiving end requested the
+    cancellation of the operation that the items belong to. When no new items
+    are submitted for a given amount of time, the most recently sent item is
+    sent again to poll the cancellation state. Once the cancellation has been
+    requested, the `cancelled` property stays `True` so the submitter can check
+    it cheaply after each submission.
+
+    Errors raised by the sender function are logged and stop the forwarding of
+    further items; the forwarder is meant for best-effort status reporting.
+
+    The forwarder must be closed with `close()` when it is not needed any more.
+    Closing the forwarder sends the last pending item, if any, without waiting
+    for the rate limit.
+    """
+
+    _cancelled: bool = False
+    """Whether the receiving end requested cancellation."""
+
+    _closing: bool = False
+    """Whether `close()` has been called."""
+
+    _condition: Condition
+    """Condition variable that guards the pending item and notifies the
+    background thread about new items.
+    """
+
+    _has_pending: bool = False
+    """Whether there is an item waiting to be sent."""
+
+    _min_interval: float
+    """Minimum number of seconds between consecutive sends."""
+
+    _pending: T | None = None
+    """The item waiting to be sent."""
+
+    _poll_interval: float | None
+    """Number of seconds of inactivity after which the most recently sent item
+    is sent again to poll the cancellation state; ``None`` to disable polling.
+    """
+
+    _send: Callable[[T], bool]
+    """The function that sends an item and returns whether cancellation was
+    requested.
+    """
+
+    _thread: Thread
+    """The background thread that sends the items."""
+
+    def __init__(
+        self,
+        send: Callable[[T], bool],
+        *,
+        max_rate: float = 4.0,
+        poll_interval: float | None = 1.0,
+        name: str | None = None,
+    ):
+        """Constructor.
+
+        Args:
+            send: the function that sends an item and returns whether the
+                receiving end requested cancellation
+            max_rate: maximum number of items to send per second
+            poll_interval: number of seconds of inactivity after which the most
+                recently sent item is sent again to poll the cancellation
+                state; ``None`` to disable polling
+            name: optional name of the background thread
+        """
+        self._send = send
+        self._min_interval = 1.0 / max_rate if max_rate > 0 else 0.0
+        self._poll_interval = poll_interval
+        self._condition = Condition()
+        self._thread = Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the receiving end requested cancellation."""
+        return self._cancelled
+
+    def close(self) -> None:
+        """Sends the last pending item, if any, and stops the background
+        thread. Blocks until the background thread terminates.
+        """
+        with self._condition:
+            self._closing = True
+            self._condition.notify()
+        self._thread.join()
+
+    def submit(self, item: T) -> bool:
+        """Submits an item to be forwarded, replacing the pending item if it
+        has not been sent yet.
+
+        Returns:
+            whether the receiving end requested cancellation, based on the
+            responses received so far
+        """
+        with self._condition:
+            if self._closing:
+                raise RuntimeError("forwarder is already closed")
+            self._pending = item
+            self._has_pending = True
+            self._condition.notify()
+        return self._cancelled
+
+    def _run(self) -> None:
+        last_item: T | None = None
+        last_sent_at: float | None = None
+
+        while True:
+            with self._condition:
+                while True:
+                    now = monotonic()
+                    if self._has_pending:
+                        if self._closing or last_sent_at is None:
+                            break
+                        wait_time = last_sent_at + self._min_interval - now
+                    elif self._closing:
+                        return
+                    elif last_sent_at is not None and self._poll_interval is not None:
+                        wait_time = last_sent_at + self._poll_interval - now
+                    else:
+                        wait_time = None
+
+                    if wait_time is not None and wait_time <= 0:
+                        break
+
+                    self._condition.wait(wait_time)
+
+                if self._has_pending:
+                    last_item = self._pending
+                    self._pending = None
+                    self._has_pending = False
+
+            try:
+                cancelled = self._send(cast(T, last_item))
+            except Exception:
+                log.warning("Error while forwarding item", exc_info=True)
+                return
+            finally:
+                last_sent_at = monotonic()
+
+            if cancelled:
+                self._cancelled = True
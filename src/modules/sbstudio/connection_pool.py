@@ -0,0 +1,418 @@
+"""Pool of persistent HTTP connections that allows consecutive requests to
+the same host to reuse the same TCP (and TLS) connection.
+"""
+
+from base64 import b64encode
+from collections.abc import Generator
+from contextlib import contextmanager
+from http.client import (
+    BadStatusLine,
+    HTTPConnection,
+    HTTPResponse,
+    HTTPSConnection,
+)
+from io import BytesIO
+from ssl import SSLContext
+from sys import version_info
+from threading import Lock
+from time import monotonic
+from urllib.error import HTTPError, URLError
+from urllib.parse import unquote, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+__all__ = ("ConnectionPool",)
+
+
+_ConnectionKey = tuple[str, str, int | None, str | None]
+"""Type alias for the keys of the pool, consisting of the URL scheme, the
+hostname, the port and the URL of the proxy that the connection goes through.
+"""
+
+_USER_AGENT = f"Python-urllib/{version_info[0]}.{version_info[1]}"
+"""Default user agent of the requests; the same as the one sent by
+`urllib.request.urlopen()`.
+"""
+
+_MAX_REDIRECTIONS = 10
+"""Maximum number of redirections to follow for a single request."""
+
+_MAX_DRAINED_BODY_LENGTH = 65536
+"""Maximum number of unread bytes in a response body that are read and
+discarded when the response is released, in order to allow the reuse of
+the connection.
+"""
+
+_REDIRECT_STATUS_CODES = (301, 302, 303, 307, 308)
+"""HTTP status codes that denote redirections."""
+
+_STALE_CONNECTION_ERRORS = (
+    BadStatusLine,
+    BrokenPipeError,
+    ConnectionAbortedError,
+    ConnectionResetError,
+)
+"""Exceptions that signal that a reused connection was closed by the server
+in the meanwhile. `RemoteDisconnected` is a subclass of `BadStatusLine`.
+"""
+
+
+class ConnectionPool:
+    """Pool of persistent HTTP and HTTPS connections, keyed by the scheme, the
+    host and the port of the URL being requested.
+
+    Connections are returned to the pool when the response received on them
+    has been read entirely and the server did not ask to close the connection.
+    Idle connections are closed when they have not been used for a given
+    amount of time or when there are too many idle connections to the same
+    host. The pool never blocks; when all the pooled connections to a host are
+    in use, a new connection is opened for the request.
+
+    The pool is safe to use from multiple threads.
+
+    Errors are reported the same way as `urllib.request.urlopen()` reports
+    them: connection errors are wrapped in `URLError` and non-successful HTTP
+    status codes raise an `HTTPError`. Redirections are followed
+    automatically. Proxies are configured the same way as for `urlopen()`:
+    HTTP requests are sent to the proxy and HTTPS requests are tunneled
+    through it.
+    """
+
+    idle_timeout: float
+    """Number of seconds after which an idle connection is closed."""
+
+    max_idle_connections_per_host: int
+    """Maximum number of idle connections to keep for the same host."""
+
+    timeout: float | None
+    """Timeout of blocking socket operations, in seconds; ``None`` means to
+    use the global default timeout of the socket module.
+    """
+
+    _idle: dict[_ConnectionKey, list[tuple[HTTPConnection, float]]]
+    """Idle connections for each host, along with the time when they were
+    returned to the pool, in the order they were returned.
+    """
+
+    _lock: Lock
+    """Lock that guards the idle connections."""
+
+    _proxies: dict[str, str]
+    """Mapping from URL schemes to the URLs of the proxies to use for them."""
+
+    _proxies_from_system: bool
+    """Whether the proxies were taken from the environment or the system
+    settings, in which case the system settings also decide which hosts
+    bypass the proxies.
+    """
+
+    _ssl_context: SSLContext | None
+    """SSL context to use for HTTPS connections; ``None`` means to use the
+    default context.
+    """
+
+    def __init__(
+        self,
+        *,
+        ssl_context: SSLContext | None = None,
+        idle_timeout: float = 30.0,
+        max_idle_connections_per_host: int = 4,
+        timeout: float | None = None,
+        proxies: dict[str, str] | None = None,
+    ):
+        """Constructor.
+
+        Args:
+            ssl_context: the SSL context to use for HTTPS connections
+            idle_timeout: number of seconds after which an idle connection is
+                closed
+            max_idle_connections_per_host: maximum number of idle connections
+                to keep for the same host
+            timeout: timeout of blocking socket operations, in seconds
+            proxies: mapping from URL schemes to the URLs of the proxies to
+                use for them, in the same format as the one returned by
+                `urllib.request.getproxies()`. The ``no`` key may contain a
+                comma-separated list of hosts that bypass the proxies.
+                ``None`` means to use the proxies configured in the
+                environment or in the system settings
+        """
+        self.idle_timeout = idle_timeout
+        self.max_idle_connections_per_host = max_idle_connections_per_host
+        self.timeout = timeout
+
+        self._idle = {}
+        self._lock = Lock()
+        self._proxies = getproxies() if proxies is None else dict(proxies)
+        self._proxies_from_system = proxies is None
+        self._ssl_context = ssl_context
+
+    @property
+    def ssl_context(self) -> SSLContext | None:
+        """The SSL context to use for HTTPS connections. Setting the context
+        closes all idle connections so new requests use the new context.
+        """
+        return self._ssl_context
+
+    @ssl_context.setter
+    def ssl_context(self, value: SSLContext | None) -> None:
+        self._ssl_context = value
+        self.close()
+
+    @property
+    def num_idle_connections(self) -> int:
+        """The number of idle connections in the pool."""
+        with self._lock:
+            return sum(len(items) for items in self._idle.values())
+
+    def close(self) -> None:
+        """Closes all idle connections in the pool.
+
+        Connections that are in use at the time of the call are not affected;
+        they are returned to the pool when their responses are released.
+        """
+        with self._lock:
+            idle, self._idle = self._idle, {}
+
+        for items in idle.values():
+            for conn, _ in items:
+                conn.close()
+
+    @contextmanager
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Generator[HTTPResponse]:
+        """Sends an HTTP request to the given URL and returns a context manager
+        that yields the response.
+
+        The connection of the response is returned to the pool or closed when
+        the context is exited.
+
+        Args:
+            method: the HTTP method of the request
+            url: the absolute URL to send the request to
+            body: the body of the request
+            headers: additional headers of the request
+
+        Raises:
+            HTTPError: if the server returned a non-successful status code
+            URLError: if the request could not be sent to the server
+        """
+        headers = dict(headers or {})
+
+        for _ in range(_MAX_REDIRECTIONS + 1):
+            key, conn, response = self._send(method, url, body, headers)
+            status = response.status
+
+            location = response.getheader("Location")
+            if status in _REDIRECT_STATUS_CODES and location:
+                if method in ("GET", "HEAD") or status in (301, 302, 303):
+                    self._release(key, conn, response)
+
+                    # Same behaviour as urllib.request: POST requests are
+                    # turned into GET requests without a body
+                    if method not in ("GET", "HEAD"):
+                        method, body = "GET", None
+                        headers = {
+                            name: value
+                            for name, value in headers.items()
+                            if not name.lower().startswith("content-")
+                        }
+                    url = urljoin(url, location)
+                    continue
+
+            if status < 200 or status >= 300:
+                # Error responses are small; read the body so the connection
+                # can be reused and the caller can still inspect the body
+                error_body = response.read()
+                self._release(key, conn, response)
+                raise HTTPError(
+                    url, status, response.reason, response.headers, BytesIO(error_body)
+                )
+
+            try:
+                yield response
+            finally:
+                self._release(key, conn, response)
+            return
+
+        raise URLError(f"too many redirections while requesting {url!r}")
+
+    def _acquire(self, key: _ConnectionKey) -> tuple[HTTPConnection, bool]:
+        """Takes an idle connection to the given host from the pool or creates
+        a new one if there are no idle connections.
+
+        Returns:
+            the connection and whether it is a reused connection
+        """
+        expired: list[HTTPConnection] = []
+        conn: HTTPConnection | None = None
+
+        with self._lock:
+            items = self._idle.get(key)
+            if items:
+                deadline = monotonic() - self.idle_timeout
+                while items and items[0][1] < deadline:
+                    expired.append(items.pop(0)[0])
+                if items:
+                    conn = items.pop()[0]
+
+        for expired_conn in expired:
+            expired_conn.close()
+
+        if conn is not None:
+            return conn, True
+
+        scheme, host, port, proxy = key
+        if proxy is None:
+            if scheme == "https":
+                conn = HTTPSConnection(host, port, context=self._ssl_context)
+            else:
+                conn = HTTPConnection(host, port)
+        else:
+            proxy_parts = urlsplit(proxy)
+            proxy_host = proxy_parts.hostname or ""
+            if scheme == "https":
+                conn = HTTPSConnection(
+                    proxy_host, proxy_parts.port, context=self._ssl_context
+                )
+                conn.set_tunnel(host, port, headers=_get_proxy_headers(proxy))
+            else:
+                conn = HTTPConnection(proxy_host, proxy_parts.port)
+        if self.timeout is not None:
+            conn.timeout = self.timeout
+
+        return conn, False
+
+    def _get_proxy(self, scheme: str, host: str) -> str | None:
+        """Returns the URL of the proxy to use for requests with the given
+        URL scheme to the given host, or ``None`` if the requests should be
+        sent to the host directly.
+
+        Raises:
+            URLError: if the proxy is not an HTTP proxy
+        """
+        proxy = self._proxies.get(scheme)
+        if not proxy:
+            return None
+
+        if self._proxies_from_system:
+            bypass = proxy_bypass(host)
+        else:
+            bypass = _is_proxy_bypassed(host, self._proxies.get("no", ""))
+        if bypass:
+            return None
+
+        if "://" not in proxy:
+            proxy = "http://" + proxy
+        if not proxy.startswith("http://"):
+            raise URLError(f"unsupported proxy: {proxy!r}")
+
+        return proxy
+
+    def _release(
+        self, key: _ConnectionKey, conn: HTTPConnection, response: HTTPResponse
+    ) -> None:
+        """Returns a connection to the pool after the given response was
+        received on it, or closes the connection if it cannot be reused.
+        """
+        if not response.isclosed():
+            length = response.length
+            if length is not None and length <= _MAX_DRAINED_BODY_LENGTH:
+                try:
+                    response.read()
+                except Exception:
+                    pass
+
+        if not response.isclosed() or conn.sock is None:
+            # Body not read entirely or the server closed the connection
+            conn.close()
+            return
+
+        with self._lock:
+            items = self._idle.setdefault(key, [])
+            if len(items) < self.max_idle_connections_per_host:
+                items.append((conn, monotonic()))
+                return
+
+        conn.close()
+
+    def _send(
+        self, method: str, url: str, body: bytes | None, headers: dict[str, str]
+    ) -> tuple[_ConnectionKey, HTTPConnection, HTTPResponse]:
+        """Sends a single request on a pooled connection and waits for the
+        status line and the headers of the response.
+
+        A request sent on a reused connection is retried once on a new
+        connection if it turns out that the server has closed the reused
+        connection in the meanwhile.
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise URLError(f"unsupported URL: {url!r}")
+
+        proxy = self._get_proxy(parts.scheme, parts.hostname)
+        key: _ConnectionKey = (parts.scheme, parts.hostname, parts.port, proxy)
+        if not any(name.lower() == "user-agent" for name in headers):
+            headers = {"User-Agent": _USER_AGENT, **headers}
+        if proxy is not None and parts.scheme == "http":
+            # Requests sent to an HTTP proxy contain the absolute URL
+            target = parts._replace(fragment="").geturl()
+            headers.update(_get_proxy_headers(proxy))
+        else:
+            target = parts.path or "/"
+            if parts.query:
+                target += "?" + parts.query
+
+        while True:
+            conn, reused = self._acquire(key)
+            try:
+                try:
+                    conn.request(method, target, body=body, headers=headers)
+                except OSError as ex:
+                    if reused and isinstance(ex, _STALE_CONNECTION_ERRORS):
+                        conn.close()
+                        continue
+                    raise URLError(ex) from ex
+                response = conn.getresponse()
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if reused:
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+
+            return key, conn, response
+
+
+def _get_proxy_headers(proxy: str) -> dict[str, str]:
+    """Returns the headers that authenticate the requests sent to the given
+    proxy with the credentials in its URL, if any.
+    """
+    parts = urlsplit(proxy)
+    if parts.username is None:
+        return {}
+
+    credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+    token = b64encode(credentials.encode("utf-8")).decode("ascii")
+    return {"Proxy-Authorization": f"Basic {token}"}
+
+
+def _is_proxy_bypassed(host: str, no_proxy: str) -> bool:
+    """Returns whether requests to the given host bypass the proxies according
+    to the given comma-separated list of hosts and domains, in the format of
+    the ``no_proxy`` environment variable.
+    """
+    host = host.lower()
+    for entry in no_proxy.split(","):
+        entry = entry.strip().lstrip(".").lower()
+        if entry == "*":
+            return True
+        if entry and (host == entry or host.endswith("." + entry)):
+            return True
+    return False
@@ -0,0 +1,170 @@
+"""Translations of the user interface of the add-on.
+
+The translations are maintained in `translations.py`, in the format used by the
+UI translations add-on of Blender. Importing that module means compiling a
+huge tuple literal that contains all the languages, even though most of the
+tuple consists of untranslated entries and only one language is used at a
+time. The add-on therefore loads the translations from compact JSON files in
+the `locales` directory instead, one file per language, and loads the file of
+a language only when it is used. The JSON files are generated from
+`translations.py` by `etc/scripts/sort_translations.py`.
+"""
+
+from collections.abc import Iterable
+from json import load
+from pathlib import Path
+from typing import Any
+
+__all__ = (
+    "LOCALES_DIR",
+    "TranslationCatalog",
+    "TranslationDict",
+    "compile_translations",
+    "load_translations",
+)
+
+LOCALES_DIR = Path(__file__).with_name("locales")
+"""Directory containing the compact representation of the translations, one
+JSON file per language.
+"""
+
+LocaleTranslationDict = dict[tuple[str, str], str]
+"""Type alias for dictionaries that map (context, message) pairs to their
+translations in a single language.
+"""
+
+TranslationDict = dict[str, LocaleTranslationDict]
+"""Type alias for dictionaries mapping language codes to dictionaries that map
+(context, message) pairs to their translations, as expected by
+`bpy.app.translations.register()`.
+"""
+
+
+def compile_translations(
+    translations_tuple: Iterable[Any],
+) -> dict[str, list[tuple[str, str, str]]]:
+    """Converts a translations tuple in the format used by the UI translations
+    add-on of Blender into the compact representation that is stored in the
+    JSON files.
+
+    Empty and fuzzy translations are left out, and so are the headers of the
+    translation catalogs (i.e. the translations of the empty message) as
+    Blender does not use them.
+
+    Returns:
+        a dictionary mapping language codes to lists of (context, message,
+        translation) triplets, sorted by language code and then by context
+        and message
+    """
+    result: dict[str, list[tuple[str, str, str]]] = {}
+    for msg in translations_tuple:
+        context, message = msg[0]
+        if not message:
+            continue
+
+        for lang, translation, (is_fuzzy, _) in msg[2:]:
+            if translation and not is_fuzzy:
+                result.setdefault(lang, []).append((context, message, translation))
+
+    return {lang: sorted(result[lang]) for lang in sorted(result)}
+
+
+def load_translations(
+    locale: str, directory: Path = LOCALES_DIR
+) -> LocaleTranslationDict | None:
+    """Loads the translations of a single language from their compact JSON
+    representation.
+
+    Returns:
+        the translations of the given language, or ``None`` if there are no
+        translations for the language
+    """
+    try:
+        with (directory / f"{locale}.json").open(encoding="utf-8") as fp:
+            items: list[list[str]] = load(fp)
+    except FileNotFoundError:
+        return None
+
+    return {(context, message): translation for context, message, translation in items}
+
+
+class TranslationCatalog:
+    """Collection of the translations of the user interface that loads the
+    translations of each language only when they are needed.
+    """
+
+    directory: Path
+    """Directory containing the compact representation of the translations."""
+
+    translations: TranslationDict
+    """The translations loaded so far, in the format expected by
+    `bpy.app.translations.register()`.
+    """
+
+    def __init__(self, directory: Path = LOCALES_DIR):
+        """Constructor.
+
+        Args:
+            directory: directory containing the compact representation of the
+                translations
+        """
+        self.directory = directory
+        self.translations = {}
+
+    @property
+    def available_locales(self) -> list[str]:
+        """The codes of the languages that have translations, sorted."""
+        return sorted(path.stem for path in self.directory.glob("*.json"))
+
+    def ensure_loaded(self, locale: str) -> bool:
+        """Ensures that the translations of the given language are loaded.
+
+        The translations of the more generic variants of the language (e.g.,
+        ``sr_RS`` for ``sr_RS@latin`` and ``sr`` for ``sr_RS``) are also loaded
+        if they exist, matching the way Blender falls back to them.
+
+        Returns:
+            whether new translations were loaded
+        """
+        changed = False
+        for candidate in _get_locale_variants(locale):
+            if candidate in self.translations:
+                continue
+
+            translations = load_translations(candidate, self.directory)
+            if translations is not None:
+                self.translations[candidate] = translations
+                changed = True
+
+        return changed
+
+    def format_memory_report(self) -> str:
+        """Returns a human-readable summary of the size of the translations that
+        were loaded and the size of the translations that were not loaded.
+        """
+        loaded_size, skipped_size, num_skipped = 0, 0, 0
+        for path in self.directory.glob("*.json"):
+            size = path.stat().st_size
+            if path.stem in self.translations:
+                loaded_size += size
+            else:
+                skipped_size += size
+                num_skipped += 1
+
+        loaded = ", ".join(sorted(self.translations)) or "no languages"
+        return (
+            f"Loaded translations for {loaded} ({loaded_size / 1024:.1f} KiB), "
+            f"skipped {num_skipped} other language(s) ({skipped_size / 1024:.1f} KiB)"
+        )
+
+
+def _get_locale_variants(locale: str) -> list[str]:
+    """Returns the given locale and its more generic variants, from the most
+    specific to the most generic one.
+    """
+    result = [locale]
+    for separator in "@_":
+        base, _, _ = result[-1].partition(separator)
+        if base and base != result[-1]:
+            result.append(base)
+    return result
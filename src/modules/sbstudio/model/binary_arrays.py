@@ -0,0 +1,55 @@
+"""Compact binary representations of point sets and index arrays for
+transferring them in JSON documents.
+
+Point sets are stored as base64-encoded little-endian 32-bit floats, with the
+X, Y and Z coordinates of each point following each other, similarly to the
+binary representation of trajectories. Index arrays are stored as
+base64-encoded little-endian 32-bit integers, with -1 standing for missing
+items.
+"""
+
+from base64 import b64decode, b64encode
+from collections.abc import Sequence
+
+from numpy import array, frombuffer
+
+from .types import Coordinate3D
+
+__all__ = (
+    "decode_index_array",
+    "decode_point_array",
+    "encode_index_array",
+    "encode_point_array",
+)
+
+
+def encode_point_array(points: Sequence[Coordinate3D]) -> str:
+    """Encodes the given points into their binary representation."""
+    floats = array(points, dtype="<f4").reshape(-1)
+    if len(floats) % 3:
+        raise ValueError("points must have three coordinates")
+    return b64encode(floats.tobytes()).decode("ascii")
+
+
+def decode_point_array(encoded: str) -> list[Coordinate3D]:
+    """Decodes a list of points from their binary representation."""
+    floats = frombuffer(b64decode(encoded), dtype="<f4")
+    if len(floats) % 3:
+        raise ValueError("encoded data does not contain 3D points")
+    return [tuple(point) for point in floats.reshape(-1, 3).tolist()]
+
+
+def encode_index_array(items: Sequence[int | None]) -> str:
+    """Encodes the given sequence of indices into its binary representation,
+    replacing ``None`` items with -1.
+    """
+    ints = array([-1 if item is None else item for item in items], dtype="<i4")
+    return b64encode(ints.tobytes()).decode("ascii")
+
+
+def decode_index_array(encoded: str) -> list[int | None]:
+    """Decodes a list of indices from their binary representation, replacing
+    negative items with ``None``.
+    """
+    ints = frombuffer(b64decode(encoded), dtype="<i4")
+    return [None if item < 0 else item for item in ints.tolist()]
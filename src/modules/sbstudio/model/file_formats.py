@@ -3,6 +3,7 @@ from enum import Enum
 from sbstudio.api.types import Limits
 
 __all__ = (
+    "FIXED_FRAME_RATES",
     "FileFormat",
     "get_supported_file_formats",
 )
@@ -34,6 +35,15 @@ class FileFormat(Enum):
     KMZ = "kmz"
 
 
+FIXED_FRAME_RATES: dict[FileFormat, int] = {
+    FileFormat.DAC: 30,
+    FileFormat.DROTEK: 5,
+}
+"""Frame rates that the exporters of some formats always use, irrespectively
+of the frame rates chosen by the user.
+"""
+
+
 _file_formats: tuple[FileFormat, ...] = ()
 
 
@@ -0,0 +1,346 @@
+"""Influence curves of the constraints that attach the drones to the markers
+of the formations in transitions, and the scheduling of the transitions of the
+individual drones.
+
+Nothing in this module accesses Blender; writing the curves to the constraints
+is done by the transition recalculation operator.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from numpy import array, bool_, float32, full, int64, maximum, object_, where, zeros
+from numpy.typing import NDArray
+
+from sbstudio.errors import SkybrushStudioError
+
+if TYPE_CHECKING:
+    from sbstudio.api.types import Mapping
+
+__all__ = (
+    "InfluenceCurveDescriptor",
+    "InfluenceCurveKeyframes",
+    "InfluenceCurveTransitionType",
+    "plan_influence_curves",
+)
+
+
+class InfluenceCurveTransitionType(Enum):
+    """Possible types of a transition phase of an influence curve."""
+
+    LINEAR = "linear"
+    SMOOTH_FROM_LEFT = "smoothFromLeft"
+    SMOOTH_FROM_RIGHT = "smoothFromRight"
+    SMOOTH = "smooth"
+
+    @classmethod
+    def from_enum_property(cls, value: str):
+        """Create an influence curve transition type from its
+        representation as a Blender EnumProperty."""
+        parts = value.lower().split("_")
+        return cls(parts[0] + "".join(p.capitalize() for p in parts[1:]))
+
+
+@dataclass
+class InfluenceCurveDescriptor:
+    """Dataclass that describes how the influence curve of a constraint should
+    look like.
+
+    We currently work with one type of influence curve at the moment. The curve
+    starts from zero at the start of the scene, stays zero until (and including)
+    a _windup start frame_, then transitions to 1 until (and including) a
+    _start frame_. The transition can be linear, smooth from the left,
+    smooth from the right or completely smooth. The curve will then either stay
+    1 indefinitely, or stay 1 until a designated _end frame_.
+
+    The key points of the influence curve are described by this data class.
+    The curves are written to the constraints with `write_influence_curves()`
+    in the transition recalculation operator.
+    """
+
+    scene_start_frame: int
+    """The start frame of the entire scene."""
+
+    windup_start_frame: int | None
+    """The windup start frame, i.e. the _last_ frame when the influence curve
+    should still be zero before winding up to full influence. `None` means that
+    it is the same as the start frame of the scene.
+
+    When this frame is earlier than the start frame of the scene, it is assumed
+    to be equal to the start frame of the scene.
+    """
+
+    start_frame: int
+    """The first frame when the influence should become equal to 1. Must be
+    larger than the windup start frame; when it is smaller or equal, it is
+    assumed to be one larger than the windup start frame.
+    """
+
+    end_frame: int | None = None
+    """The last frame when the influence is still equal to 1; ``None`` means
+    that the influence curve stays 1 infinitely.
+
+    The end frame must be larger than or equal to the start frame; when it is
+    smaller, it is assumed to be equal to the start frame.
+    """
+
+    windup_type: InfluenceCurveTransitionType = InfluenceCurveTransitionType.SMOOTH
+    """The type of the windup transition that defines its velocity profile."""
+
+    def __init__(
+        self,
+        scene_start_frame: int,
+        windup_start_frame: float | None,
+        start_frame: float,
+        end_frame: float | None = None,
+        windup_type: InfluenceCurveTransitionType = InfluenceCurveTransitionType.SMOOTH,
+    ):
+        # Note that explicit __init__() method implementation is needed to
+        # ensure that int type arguments are truly ints
+        self.scene_start_frame = round(scene_start_frame)
+        self.windup_start_frame = (
+            None if windup_start_frame is None else round(windup_start_frame)
+        )
+        self.start_frame = round(start_frame)
+        self.end_frame = None if end_frame is None else round(end_frame)
+        self.windup_type = windup_type
+
+
+@dataclass
+class InfluenceCurveKeyframes:
+    """Keyframes of a batch of influence curves, computed from their
+    descriptors in one go.
+
+    Each influence curve has at most four keyframes. All arrays have one row
+    per influence curve and four columns; ``mask`` tells which columns of a
+    row contain actual keyframes.
+    """
+
+    frames: NDArray[int64]
+    """The frames of the keyframes."""
+
+    values: NDArray[float32]
+    """The values of the keyframes."""
+
+    mask: NDArray[bool_]
+    """Whether the corresponding keyframe exists in the curve."""
+
+    interpolations: NDArray[object_]
+    """The interpolation types of the keyframes."""
+
+    handle_left_types: NDArray[object_]
+    """The types of the left handles of the keyframes."""
+
+    handle_right_types: NDArray[object_]
+    """The types of the right handles of the keyframes."""
+
+    @classmethod
+    def from_descriptors(
+        cls, descriptors: Sequence[InfluenceCurveDescriptor]
+    ) -> InfluenceCurveKeyframes:
+        """Computes the keyframes of the influence curves described by the given
+        descriptors.
+        """
+        n = len(descriptors)
+        scene_start = array([d.scene_start_frame for d in descriptors], dtype=int64)
+        windup_start = array(
+            [
+                d.scene_start_frame
+                if d.windup_start_frame is None
+                else d.windup_start_frame
+                for d in descriptors
+            ],
+            dtype=int64,
+        )
+        start = array([d.start_frame for d in descriptors], dtype=int64)
+        end = array(
+            [
+                d.start_frame if d.end_frame is None else d.end_frame
+                for d in descriptors
+            ],
+            dtype=int64,
+        )
+        windup_types = [d.windup_type for d in descriptors]
+
+        # Special case: if the start frame is the start of the scene, it means
+        # that this is the first transition in the timeline. In this case we
+        # need to start with an influence of 1 to ensure that the drone do not
+        # jump around in the first frame of the show if their associated
+        # takeoff marker is at a different position from the position of the
+        # drone itself
+        is_first = scene_start == start
+
+        frames = zeros((n, 4), dtype=int64)
+        values = zeros((n, 4), dtype=float32)
+        mask = zeros((n, 4), dtype=bool_)
+
+        # Zero influence at the start of the scene
+        frames[:, 0] = scene_start - is_first
+        mask[:, 0] = True
+
+        # Hold current influence value until the start of the windup
+        frames[:, 1] = windup_start
+        mask[:, 1] = ~is_first & (windup_start > scene_start)
+
+        # Ramp up to 1 at the start frame
+        last_frame = where(mask[:, 1], frames[:, 1], frames[:, 0])
+        frames[:, 2] = maximum(start, last_frame + 1)
+        values[:, 2] = 1.0
+        mask[:, 2] = True
+
+        # Add a keyframe at the end frame. Do not wind the constraint down to
+        # zero after the end frame; it makes it harder to remove storyboard
+        # entries from the middle of the storyboard as the end frame of the
+        # previous constraint would have to be adjusted
+        frames[:, 3] = maximum(end, frames[:, 2])
+        values[:, 3] = 1.0
+        mask[:, 3] = frames[:, 3] > frames[:, 2]
+
+        interpolations = full((n, 4), "LINEAR", dtype=object_)
+        handle_left_types = full((n, 4), "AUTO_CLAMPED", dtype=object_)
+        handle_right_types = full((n, 4), "AUTO_CLAMPED", dtype=object_)
+
+        # The keyframe where the windup starts is the one preceding the ramp
+        start_of_transition = where(mask[:, 1], 1, 0)
+        for row, windup_type in enumerate(windup_types):
+            if windup_type == InfluenceCurveTransitionType.LINEAR:
+                continue
+            interpolations[row, start_of_transition[row]] = "BEZIER"
+            if windup_type == InfluenceCurveTransitionType.SMOOTH_FROM_RIGHT:
+                handle_right_types[row, start_of_transition[row]] = "VECTOR"
+            elif windup_type == InfluenceCurveTransitionType.SMOOTH_FROM_LEFT:
+                handle_left_types[row, 2] = "VECTOR"
+
+        return cls(
+            frames=frames,
+            values=values,
+            mask=mask,
+            interpolations=interpolations,
+            handle_left_types=handle_left_types,
+            handle_right_types=handle_right_types,
+        )
+
+
+def plan_influence_curves(
+    mapping: Mapping,
+    *,
+    name: str,
+    scene_start_frame: int,
+    windup_start_frame: int,
+    start_frame: int,
+    end_frame: int | None,
+    windup_type: InfluenceCurveTransitionType,
+    is_first: bool = False,
+    pre_delay_per_drone: float = 0,
+    post_delay_per_drone: float = 0,
+    schedule_overrides: dict[int, tuple[int, int]] | None = None,
+    get_departure_index: Callable[[int], int] | None = None,
+    get_arrival_index: Callable[[int], int] | None = None,
+) -> list[InfluenceCurveDescriptor | None]:
+    """Calculates the influence curves of the drones in a transition.
+
+    Parameters:
+        mapping: the mapping from drone indices to target marker indices in
+            the transition; ``None`` for drones that are not matched
+        name: the name of the target formation, used in error messages
+        scene_start_frame: the first frame of the scene
+        windup_start_frame: the frame where the transition starts if there
+            are no departure delays, i.e. the end of the previous formation
+        start_frame: the frame where the transition ends if there are no
+            arrival delays, i.e. the start of the target formation
+        end_frame: the frame where the next transition starts; ``None`` if
+            this is the last transition
+        windup_type: the velocity profile of the transitions
+        is_first: whether this is the transition into the first formation,
+            which holds the drones at the formation from the start of the scene
+        pre_delay_per_drone: the departure delay of each drone in a staggered
+            transition relative to the one departing before it, in frames
+        post_delay_per_drone: the arrival delay of each drone in a staggered
+            transition relative to the one arriving after it, in frames
+        schedule_overrides: mapping from departure indices to the departure
+            and arrival delays that override the staggered schedule of the
+            drone with the given departure index
+        get_departure_index: function that returns the departure index of the
+            drone with the given index. Must be provided if the transition is
+            staggered or there are schedule overrides
+        get_arrival_index: function that returns the arrival index of the
+            drone with the given index. Must be provided if the transition is
+            staggered
+
+    Returns:
+        the influence curve of each drone, or ``None`` for drones that are not
+        matched and hence do not need an influence curve
+
+    Raises:
+        SkybrushStudioError: if there is not enough time for the transition of
+            a drone
+    """
+    is_staggered = get_arrival_index is not None
+    num_drones_transitioning = sum(
+        1 for target_index in mapping if target_index is not None
+    )
+
+    result: list[InfluenceCurveDescriptor | None] = []
+    for drone_index, target_index in enumerate(mapping):
+        if target_index is None:
+            result.append(None)
+            continue
+
+        departure_delay = 0
+        arrival_delay = 0
+        departure_index: int | None = None
+
+        if is_staggered:
+            assert get_departure_index is not None
+            assert get_arrival_index is not None
+            departure_index = get_departure_index(drone_index)
+            arrival_index = get_arrival_index(drone_index)
+            departure_delay = pre_delay_per_drone * departure_index
+            arrival_delay = -post_delay_per_drone * (
+                num_drones_transitioning - arrival_index - 1
+            )
+
+        if schedule_overrides:
+            # Determine the index of the drone in the departure sequence so we
+            # can look up whether there is an override for it
+            assert get_departure_index is not None
+            if departure_index is None:
+                departure_index = get_departure_index(drone_index)
+            override = schedule_overrides.get(departure_index)
+            if override:
+                departure_delay, arrival_delay = override[0], -override[1]
+
+        # windup_start_frame can be later than the end of the previous
+        # formation for staggered departures, and start_frame can be earlier
+        # than the start of the formation for staggered arrivals
+        drone_windup_start_frame = windup_start_frame + departure_delay
+        drone_start_frame = start_frame + arrival_delay
+
+        if is_first:
+            # Special case: this is the constraint that holds the drones at the
+            # first formation, so we need to set the start frame and the
+            # windup start frame to the start of the scene
+            drone_start_frame = drone_windup_start_frame = scene_start_frame
+        elif drone_windup_start_frame >= drone_start_frame:
+            raise SkybrushStudioError(
+                f"Not enough time to plan staggered transition to "
+                f"formation {name!r} at drone index {drone_index + 1} "
+                f"(1-based). Try decreasing departure or arrival delay "
+                f"or allow more time for the transition."
+            )
+
+        result.append(
+            InfluenceCurveDescriptor(
+                scene_start_frame=scene_start_frame,
+                windup_start_frame=drone_windup_start_frame,
+                start_frame=drone_start_frame,
+                end_frame=end_frame,
+                windup_type=windup_type,
+            )
+        )
+
+    return result
@@ -0,0 +1,102 @@
+from collections.abc import Sequence
+
+from numpy import argsort, array, flatnonzero, int64, maximum, ndarray
+
+__all__ = ("FrameIntervalIndex",)
+
+
+class FrameIntervalIndex:
+    """Index of closed frame intervals (e.g., the entries of a storyboard)
+    that answers frame lookup queries with binary search.
+
+    Intervals are identified by their position in the sequences that the
+    index was constructed from. When multiple intervals would be equally good
+    answers to a query, the one with the smallest position is returned.
+    """
+
+    starts: ndarray
+    """The first frames of the intervals, in their original order."""
+
+    ends: ndarray
+    """The last frames of the intervals, in their original order."""
+
+    _by_start: ndarray
+    """Positions of the intervals, sorted by their start frames."""
+
+    _by_end: ndarray
+    """Positions of the intervals, sorted by their end frames."""
+
+    _sorted_starts: ndarray
+    _sorted_ends: ndarray
+
+    _overlapping: bool
+    """Whether at least two intervals share a common frame."""
+
+    def __init__(self, starts: Sequence[int], ends: Sequence[int]):
+        """Constructor.
+
+        Args:
+            starts: the first frames of the intervals
+            ends: the last frames of the intervals; must have the same length
+                as ``starts``
+        """
+        if len(starts) != len(ends):
+            raise ValueError("starts and ends must have the same length")
+
+        self.starts = array(starts, dtype=int64)
+        self.ends = array(ends, dtype=int64)
+
+        self._by_start = argsort(self.starts, kind="stable")
+        self._by_end = argsort(self.ends, kind="stable")
+        self._sorted_starts = self.starts[self._by_start]
+        self._sorted_ends = self.ends[self._by_end]
+
+        if len(self.starts) > 1:
+            ends_so_far = maximum.accumulate(self.ends[self._by_start])
+            self._overlapping = bool(
+                (self._sorted_starts[1:] <= ends_so_far[:-1]).any()
+            )
+        else:
+            self._overlapping = False
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def find_interval_containing(self, frame: int) -> int:
+        """Returns the position of the interval containing the given frame, or
+        -1 if no interval contains the frame.
+        """
+        if self._overlapping:
+            # Rare case; we need to find the first matching interval in the
+            # original order
+            matches = flatnonzero((self.starts <= frame) & (self.ends >= frame))
+            return int(matches[0]) if len(matches) else -1
+
+        pos = int(self._sorted_starts.searchsorted(frame, side="right")) - 1
+        if pos >= 0:
+            index = int(self._by_start[pos])
+            if self.ends[index] >= frame:
+                return index
+
+        return -1
+
+    def find_first_interval_after(self, frame: int) -> int:
+        """Returns the position of the interval that starts after the given
+        frame and is closest to it, or -1 if there is no such interval.
+        """
+        pos = int(self._sorted_starts.searchsorted(frame, side="right"))
+        return int(self._by_start[pos]) if pos < len(self._by_start) else -1
+
+    def find_last_interval_before(self, frame: int) -> int:
+        """Returns the position of the interval that ends before or at the given
+        frame and is closest to it, or -1 if there is no such interval.
+        """
+        sorted_ends = self._sorted_ends
+        pos = int(sorted_ends.searchsorted(frame, side="right")) - 1
+        if pos < 0:
+            return -1
+
+        # Find the first interval with the same end frame; these are sorted
+        # by their positions because the sort was stable
+        pos = int(sorted_ends.searchsorted(sorted_ends[pos], side="left"))
+        return int(self._by_end[pos])
@@ -0,0 +1,44 @@
+"""Blender-independent helpers for setting the values of keyframes."""
+
+from collections.abc import Sequence
+from typing import cast
+
+__all__ = ("resolve_keyframe_values",)
+
+
+def resolve_keyframe_values(
+    values: Sequence[tuple[float, float | Sequence[float] | None]],
+    current_value: float | Sequence[float],
+    array_index: int | None = None,
+) -> list[tuple[float, float]]:
+    """Returns the frame-value pairs to set on the F-curve of a single
+    component of an animated property.
+
+    `None` values are replaced by the current value of the property, like
+    `keyframe_insert()` does, no matter whether the frame had a keyframe
+    before.
+
+    Parameters:
+        values: pairs of frame numbers and values; values are sequences for
+            array properties
+        current_value: the current value of the property
+        array_index: the index of the component for array properties; `None`
+            for scalar properties
+
+    Returns:
+        pairs of frame numbers and the values of the component
+    """
+    if array_index is None:
+        scalar_values = cast(Sequence[tuple[float, float | None]], values)
+        default = cast(float, current_value)
+        return [
+            (frame, default if value is None else value)
+            for frame, value in scalar_values
+        ]
+
+    array_values = cast(Sequence[tuple[float, Sequence[float] | None]], values)
+    default = cast(Sequence[float], current_value)[array_index]
+    return [
+        (frame, default if value is None else value[array_index])
+        for frame, value in array_values
+    ]
@@ -0,0 +1,162 @@
+"""Writer for the Google Earth KMZ format that shows the drones of a show on
+the surface of the Earth.
+
+Each drone is represented by an animated placemark (a ``gx:Track``) that can
+be played back with the time slider of Google Earth. Optionally, the path of
+each drone is also shown as a line. The show coordinate system is mapped to
+geodetic coordinates with a flat Earth approximation around the origin of the
+show, which is accurate enough for the size of a typical drone show.
+"""
+
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+from math import cos, radians, sin
+from pathlib import Path
+from typing import IO, Literal
+from xml.sax.saxutils import escape
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from numpy import degrees, float64, rint
+from numpy.typing import NDArray
+
+from .location import ShowLocation
+
+__all__ = ("KMZExportMode", "write_kmz")
+
+KMZExportMode = Literal["point", "trajectory"]
+"""Type alias for the supported export modes of the KMZ writer."""
+
+EARTH_RADIUS = 6378137.0
+"""Radius of the Earth used by the flat Earth approximation, in meters."""
+
+_ICON_URL = "http://maps.google.com/mapfiles/kml/shapes/shaded_dot.png"
+"""URL of the icon used for the placemarks of the drones."""
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+"""Start time of the show on the time slider of Google Earth."""
+
+
+def write_kmz(
+    output: str | Path | IO[bytes],
+    tables: Iterable[tuple[str, NDArray[float64]]],
+    *,
+    location: ShowLocation,
+    title: str = "",
+    mode: KMZExportMode = "trajectory",
+) -> None:
+    """Writes the baked animation of multiple drones into a KMZ file.
+
+    Args:
+        output: the output file or its name
+        tables: pairs of drone names and their baked animations. Each
+            animation is an array of shape ``(N, 7)`` in the same layout as
+            the one returned by `parse_skybrush_csv()`, i.e. each row contains
+            a timestamp in seconds, the coordinates and the color components
+        location: the location of the origin of the show coordinate system on
+            the Earth and its orientation
+        title: the title of the show
+        mode: whether to show the drones only (``point``) or the drones and
+            their paths (``trajectory``)
+    """
+
+    header = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<kml xmlns="http://www.opengis.net/kml/2.2" '
+        'xmlns:gx="http://www.google.com/kml/ext/2.2">\n'
+        "<Document>\n"
+        f"<name>{escape(title)}</name>\n"
+    )
+    footer = "</Document>\n</kml>\n"
+
+    with ZipFile(output, "w", compression=ZIP_DEFLATED) as zip_file:
+        with zip_file.open("doc.kml", "w") as fp:
+            fp.write(header.encode("utf-8"))
+            for name, table in tables:
+                placemarks = _format_placemarks(name, table, location, mode)
+                fp.write(placemarks.encode("utf-8"))
+            fp.write(footer.encode("utf-8"))
+
+
+def _format_placemarks(
+    name: str,
+    table: NDArray[float64],
+    location: ShowLocation,
+    mode: KMZExportMode,
+) -> str:
+    """Formats the placemark(s) of a single drone.
+
+    The color of the placemark is the first color of the drone as KML does
+    not support changing the style of a placemark over time.
+    """
+    if not len(table):
+        return ""
+
+    lat, lon = _to_geodetic(table[:, 1], table[:, 2], location)
+    alt = table[:, 3] + 0.0
+    coords = [
+        f"{lon_:.7f} {lat_:.7f} {alt_:.3f}"
+        for lon_, lat_, alt_ in zip(lon.tolist(), lat.tolist(), alt.tolist())
+    ]
+    whens = [_format_time(t) for t in table[:, 0].tolist()]
+
+    r, g, b = rint(table[0, 4:7]).clip(0, 255).astype(int).tolist()
+    color = f"ff{b:02x}{g:02x}{r:02x}"
+    name = escape(name)
+
+    parts = [
+        "<Placemark>\n",
+        f"<name>{name}</name>\n",
+        "<Style>",
+        f"<IconStyle><color>{color}</color><Icon><href>{_ICON_URL}</href></Icon></IconStyle>",
+        "<LabelStyle><scale>0</scale></LabelStyle>",
+        "</Style>\n",
+        "<gx:Track>\n<altitudeMode>relativeToGround</altitudeMode>\n",
+    ]
+    parts.extend(f"<when>{when}</when>\n" for when in whens)
+    parts.extend(f"<gx:coord>{coord}</gx:coord>\n" for coord in coords)
+    parts.append("</gx:Track>\n</Placemark>\n")
+
+    if mode == "trajectory":
+        parts.extend(
+            [
+                "<Placemark>\n",
+                f"<name>{name} trajectory</name>\n",
+                f"<Style><LineStyle><color>{color}</color><width>1</width></LineStyle></Style>\n",
+                "<LineString>\n<altitudeMode>relativeToGround</altitudeMode>\n",
+                "<coordinates>\n",
+                "\n".join(coord.replace(" ", ",") for coord in coords),
+                "\n</coordinates>\n</LineString>\n</Placemark>\n",
+            ]
+        )
+
+    return "".join(parts)
+
+
+def _format_time(seconds: float) -> str:
+    """Formats a timestamp of the show, in seconds, as an ISO 8601 timestamp
+    on the time slider of Google Earth.
+    """
+    timestamp = _EPOCH + timedelta(seconds=round(seconds, 3))
+    return timestamp.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+def _to_geodetic(
+    x: NDArray[float64], y: NDArray[float64], location: ShowLocation
+) -> tuple[NDArray[float64], NDArray[float64]]:
+    """Converts coordinates in the show coordinate system to latitudes and
+    longitudes, using a flat Earth approximation around the show origin.
+
+    Returns:
+        the latitudes and the longitudes, in degrees
+    """
+    # The X axis points towards the orientation of the show (measured from
+    # North towards East) and the Y axis points 90 degrees to the left of it
+    angle = radians(location.orientation)
+    north = x * cos(angle) + y * sin(angle)
+    east = x * sin(angle) - y * cos(angle)
+
+    lat = location.latitude + degrees(north / EARTH_RADIUS)
+    lon = location.longitude + degrees(
+        east / (EARTH_RADIUS * cos(radians(location.latitude)))
+    )
+    return lat, lon
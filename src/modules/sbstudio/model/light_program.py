@@ -4,11 +4,14 @@ from collections.abc import Iterable, Sequence
 from operator import attrgetter
 from typing import Self
 
+from numpy import arange, array, empty, float32, int64, minimum, searchsorted
+from numpy.typing import NDArray
+
 from sbstudio.utils import simplify_path
 
 from .color import Color4D
 
-__all__ = ("LightProgram",)
+__all__ = ("LightProgram", "rasterize_light_programs")
 
 
 def _simplify_color_distance_func(
@@ -108,3 +111,70 @@ class LightProgram:
         )
 
         return LightProgram(new_items)
+
+
+def rasterize_light_programs(
+    programs: Sequence[LightProgram],
+    fps: float,
+    num_frames: int,
+    *,
+    fades: bool = False,
+) -> NDArray[float32]:
+    """Samples a batch of light programs at every frame and returns the result
+    as RGBA colors in a NumPy array.
+
+    Each light program is sampled relative to its own first keyframe. Colors
+    are held constant between keyframes unless `fades` is set to `True`, in
+    which case the color is linearly interpolated towards every keyframe that
+    has its ``is_fade`` flag set. Frames after the last keyframe of a program
+    keep the last color; when the last keyframe falls beyond the end of the
+    sampled range, its color is shown in the last frame. Empty light programs
+    yield black.
+
+    Parameters:
+        programs: the light programs to sample
+        fps: the number of frames per second
+        num_frames: the number of frames to sample
+        fades: whether to honour the ``is_fade`` flags of the keyframes
+
+    Returns:
+        an array of shape ``(len(programs), num_frames, 4)`` where the color
+        components are in the range [0; 1]
+    """
+    result = empty((len(programs), num_frames, 4), dtype=float32)
+    result[..., 3] = 1.0
+    if num_frames <= 0:
+        return result
+
+    frames = arange(num_frames, dtype=int64)
+    for row, program in zip(result, programs):
+        colors = program.colors
+        if not colors:
+            row[:, :3] = 0.0
+            continue
+
+        times = array([color.t for color in colors], dtype=float)
+        rgb = array([(color.r, color.g, color.b) for color in colors], dtype=float32)
+        rgb /= 255
+        key_frames = ((times - times[0]) * fps).round().astype(int64)
+
+        # Index of the last keyframe at or before each frame
+        index = searchsorted(key_frames, frames, side="right") - 1
+        row[:, :3] = rgb[index]
+
+        if fades:
+            next_index = minimum(index + 1, len(colors) - 1)
+            is_fade = array([color.is_fade for color in colors], dtype=bool)
+            span = key_frames[next_index] - key_frames[index]
+            mask = is_fade[next_index] & (span > 0)
+            if mask.any():
+                ratio = ((frames - key_frames[index])[mask] / span[mask]).astype(
+                    float32
+                )
+                start, end = rgb[index[mask]], rgb[next_index[mask]]
+                row[mask, :3] = start + (end - start) * ratio[:, None]
+
+        if key_frames[-1] >= num_frames:
+            row[-1, :3] = rgb[-1]
+
+    return result
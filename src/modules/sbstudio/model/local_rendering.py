@@ -0,0 +1,110 @@
+"""Rendering of the formats that can be produced without the Skybrush Studio
+server, directly from the raw samples of the drones.
+"""
+
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import IO, Any
+
+from numpy import array, float64, searchsorted, zeros
+from numpy.typing import NDArray
+
+from .file_formats import FileFormat
+from .kmz import KMZExportMode, write_kmz
+from .light_program import LightProgram
+from .location import ShowLocation
+from .skybrush_csv import write_skybrush_csv_zip
+from .trajectory import Trajectory
+
+__all__ = (
+    "LOCALLY_RENDERED_FORMATS",
+    "is_rendered_locally",
+    "iter_tables_of_samples",
+    "render_show_locally",
+)
+
+LOCALLY_RENDERED_FORMATS = (FileFormat.CSV, FileFormat.KMZ)
+"""Formats that can be rendered without the Skybrush Studio server."""
+
+
+def is_rendered_locally(
+    format: FileFormat | Sequence[FileFormat], settings: dict[str, Any]
+) -> bool:
+    """Returns whether an export into the given format(s) with the given
+    export settings is rendered locally, without the Skybrush Studio server.
+
+    Bundles of multiple formats are always rendered by the server.
+    """
+    return (
+        isinstance(format, FileFormat)
+        and format in LOCALLY_RENDERED_FORMATS
+        and bool(settings.get("render_locally", False))
+    )
+
+
+def iter_tables_of_samples(
+    trajectories: dict[str, Trajectory], lights: dict[str, LightProgram]
+) -> Iterator[tuple[str, NDArray[float64]]]:
+    """Converts the raw samples of the drones into tables where each row
+    contains a timestamp, the coordinates and the color components of a drone
+    at the timestamp, as expected by the local renderers.
+
+    The color in each row is the last color sample of the drone at or before
+    the timestamp of the row; drones without a light program are white.
+    """
+    for name, trajectory in trajectories.items():
+        points = trajectory.points
+        table = zeros((len(points), 7), dtype=float64)
+        if points:
+            table[:, :4] = [(point.t, point.x, point.y, point.z) for point in points]
+
+        light_program = lights.get(name)
+        if light_program and light_program.colors:
+            colors = light_program.colors
+            times = array([color.t for color in colors], dtype=float64)
+            values = array([(color.r, color.g, color.b) for color in colors])
+            # Tolerate rounding errors between the two sets of timestamps
+            index = searchsorted(times, table[:, 0] + 1e-6, side="right") - 1
+            table[:, 4:7] = values[index.clip(0)]
+        else:
+            table[:, 4:7] = 255
+
+        yield name, table
+
+
+def render_show_locally(
+    format: FileFormat,
+    output: str | Path | IO[bytes],
+    trajectories: dict[str, Trajectory],
+    lights: dict[str, LightProgram],
+    *,
+    title: str = "",
+    location: ShowLocation | None = None,
+    kmz_mode: KMZExportMode = "trajectory",
+) -> None:
+    """Renders the show into the given format without the Skybrush Studio
+    server, directly from the raw samples of the drones.
+
+    Args:
+        format: the format to render; must be one of `LOCALLY_RENDERED_FORMATS`
+        output: the output file or its name
+        trajectories: the sampled trajectories of the drones
+        lights: the sampled light programs of the drones
+        title: the title of the show
+        location: the location of the show; required for KMZ files
+        kmz_mode: whether KMZ files show the drones only (``point``) or the
+            drones and their paths (``trajectory``)
+
+    Raises:
+        ValueError: if the format cannot be rendered locally or a KMZ file is
+            requested without a show location
+    """
+    tables = iter_tables_of_samples(trajectories, lights)
+    if format is FileFormat.CSV:
+        write_skybrush_csv_zip(output, tables)
+    elif format is FileFormat.KMZ:
+        if location is None:
+            raise ValueError("KMZ files need a show location")
+        write_kmz(output, tables, location=location, title=title, mode=kmz_mode)
+    else:
+        raise ValueError(f"Format cannot be rendered locally: {format!r}")
@@ -0,0 +1,55 @@
+"""Compact string representation of drone-to-marker mappings, suitable for
+storing them in Blender string properties.
+
+Mappings are stored as a prefix followed by the base64-encoded little-endian
+32-bit representation of the mapping, with -1 standing for unmapped items.
+The legacy JSON representation (e.g., ``[0, 2, null, 1]``) is still accepted
+when decoding.
+"""
+
+from __future__ import annotations
+
+from json import loads
+from typing import TYPE_CHECKING
+
+from .binary_arrays import decode_index_array, encode_index_array
+
+if TYPE_CHECKING:
+    from sbstudio.api.types import Mapping
+
+__all__ = ("decode_mapping", "encode_mapping", "is_legacy_encoded_mapping")
+
+
+_PREFIX = "i32:"
+"""Prefix of mappings stored in the binary format."""
+
+
+def encode_mapping(mapping: Mapping) -> str:
+    """Encodes the given mapping into its compact string representation."""
+    return _PREFIX + encode_index_array(mapping)
+
+
+def decode_mapping(encoded: str) -> Mapping | None:
+    """Decodes a mapping from its string representation.
+
+    Both the compact binary and the legacy JSON representations are accepted.
+
+    Returns:
+        the decoded mapping, or ``None`` if the string does not contain a
+        mapping
+    """
+    encoded = encoded.strip()
+    if encoded.startswith(_PREFIX):
+        return decode_index_array(encoded[len(_PREFIX) :])
+    elif is_legacy_encoded_mapping(encoded):
+        return loads(encoded)
+    else:
+        return None
+
+
+def is_legacy_encoded_mapping(encoded: str) -> bool:
+    """Returns whether the given string contains a mapping in the legacy JSON
+    representation.
+    """
+    encoded = encoded.strip()
+    return len(encoded) >= 2 and encoded[0] == "[" and encoded[-1] == "]"
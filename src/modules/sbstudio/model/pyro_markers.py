@@ -1,8 +1,11 @@
+from collections.abc import Sequence
 from dataclasses import asdict, dataclass, field
 from json import dumps, loads
 from typing import Any, Self
 
-__all__ = ("PyroMarkers", "PyroPayload")
+from numpy import argsort, array, float64, int32, ndarray, unique
+
+__all__ = ("PyroEventIndex", "PyroMarkers", "PyroPayload")
 
 
 @dataclass
@@ -131,3 +134,126 @@ class PyroMarkers:
         for marker in self.markers.values():
             marker.frame += frame_delta
         return self
+
+
+class PyroEventIndex:
+    """Index of all the pyro trigger events of a swarm that allows one to
+    query the events that are active in a given frame quickly.
+
+    The index decodes the pyro markers of all the drones once and stores the
+    events in flat arrays sorted by their start frames. Queries use binary
+    search to find the range of events that may be active in a given frame,
+    so it is not necessary to iterate over all the drones in every frame.
+    """
+
+    markers: list[PyroMarkers]
+    """The decoded pyro markers of each drone, indexed by the drone index."""
+
+    start_frames: ndarray
+    """The start frames of the pyro events, sorted in ascending order."""
+
+    end_frames: ndarray
+    """The end frames of the pyro events, in the same order as the start frames."""
+
+    drone_indices: ndarray
+    """The indices of the drones that the pyro events belong to, in the same
+    order as the start frames.
+    """
+
+    channels: ndarray
+    """The (1-based) pyro channels of the pyro events, in the same order as
+    the start frames.
+    """
+
+    _max_duration: float
+    """The duration of the longest pyro event, in frames."""
+
+    @classmethod
+    def from_markers(cls, markers: Sequence[PyroMarkers], fps: float):
+        """Creates a pyro event index from the pyro markers of the drones.
+
+        Args:
+            markers: the pyro markers of each drone, indexed by the drone index
+            fps: the number of frames per second, used to convert the
+                durations of the pyro payloads to frames
+        """
+        starts: list[int] = []
+        ends: list[float] = []
+        drone_indices: list[int] = []
+        channels: list[int] = []
+
+        for drone_index, markers_of_drone in enumerate(markers):
+            for channel, marker in markers_of_drone.markers.items():
+                starts.append(marker.frame)
+                ends.append(marker.frame + marker.payload.duration * fps)
+                drone_indices.append(drone_index)
+                channels.append(channel)
+
+        return cls(
+            list(markers),
+            start_frames=array(starts, dtype=float64),
+            end_frames=array(ends, dtype=float64),
+            drone_indices=array(drone_indices, dtype=int32),
+            channels=array(channels, dtype=int32),
+        )
+
+    def __init__(
+        self,
+        markers: list[PyroMarkers],
+        *,
+        start_frames: ndarray,
+        end_frames: ndarray,
+        drone_indices: ndarray,
+        channels: ndarray,
+    ):
+        """Constructor.
+
+        The event arrays do not need to be sorted; the constructor sorts them
+        by their start frames.
+        """
+        order = argsort(start_frames, kind="stable")
+
+        self.markers = markers
+        self.start_frames = start_frames[order]
+        self.end_frames = end_frames[order]
+        self.drone_indices = drone_indices[order]
+        self.channels = channels[order]
+
+        durations = self.end_frames - self.start_frames
+        self._max_duration = float(durations.max()) if len(durations) else 0.0
+
+    def __len__(self) -> int:
+        """Returns the number of pyro events in the index."""
+        return len(self.start_frames)
+
+    @property
+    def num_drones(self) -> int:
+        """Returns the number of drones that the index was built for."""
+        return len(self.markers)
+
+    def get_events_active_at_frame(self, frame: float) -> tuple[ndarray, ndarray]:
+        """Returns the pyro events that are active at the given frame.
+
+        An event is active between its start frame and its end frame (both
+        inclusive), consistently with `PyroMarker.is_active_at_frame()`.
+
+        Args:
+            frame: the frame to query
+
+        Returns:
+            the drone indices and the channels of the active events, as two
+            arrays of the same length
+        """
+        # Only events that started no earlier than the duration of the
+        # longest event may be active at the given frame
+        lo = self.start_frames.searchsorted(frame - self._max_duration, "left")
+        hi = self.start_frames.searchsorted(frame, "right")
+        active = self.end_frames[lo:hi] >= frame
+        return self.drone_indices[lo:hi][active], self.channels[lo:hi][active]
+
+    def get_drones_active_at_frame(self, frame: float) -> ndarray:
+        """Returns the sorted indices of the drones that have at least one
+        active pyro event at the given frame.
+        """
+        drone_indices, _ = self.get_events_active_at_frame(frame)
+        return unique(drone_indices)
@@ -0,0 +1,50 @@
+"""Selection of the frames of a scene to sample when exporting a show, and
+reuse of the samples taken at one set of frames for a subset of these frames.
+"""
+
+__all__ = ("get_decimation_indices", "get_frame_step", "get_sampled_frames")
+
+
+def get_frame_step(scene_fps: int, fps: int) -> int:
+    """Returns the number of frames between consecutive samples when a scene
+    with the given frame rate is sampled at the given number of samples per
+    second.
+    """
+    return max(1, int(scene_fps // fps))
+
+
+def get_sampled_frames(start: int, end: int, step: int) -> list[int]:
+    """Returns the frames to sample from the given frame range, both ends
+    inclusive, with the given number of frames between consecutive samples.
+
+    The start frame is always sampled first. The end frame is always sampled
+    last, even if the step does not divide the range evenly.
+    """
+    end = max(start, end)
+    frames = list(range(start, end, step))
+    frames.append(end)
+    return frames
+
+
+def get_decimation_indices(
+    start: int, end: int, source_step: int, target_step: int
+) -> list[int] | None:
+    """Returns the indices of the samples taken from the given frame range
+    with the given source step that were taken at the frames that would be
+    sampled with the given target step.
+
+    Returns:
+        the indices of the samples, or ``None`` if some of the frames of the
+        target step are not sampled with the source step
+    """
+    index_of_frame = {
+        frame: index
+        for index, frame in enumerate(get_sampled_frames(start, end, source_step))
+    }
+    try:
+        return [
+            index_of_frame[frame]
+            for frame in get_sampled_frames(start, end, target_step)
+        ]
+    except KeyError:
+        return None
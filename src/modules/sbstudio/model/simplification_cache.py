@@ -0,0 +1,102 @@
+"""Cache of the simplified light programs of drones, keyed by a content hash of
+the raw samples they were simplified from.
+"""
+
+from array import array
+from hashlib import blake2b
+from itertools import chain
+from operator import attrgetter
+from threading import Lock
+
+from sbstudio.utils import LRUCache
+
+from .color import Color4D
+from .light_program import LightProgram
+
+__all__ = ("SimplificationCache",)
+
+
+_ColorTuple = tuple[float, int, int, int, bool]
+"""Type alias for the immutable representation of a single color of a light
+program in the cache.
+"""
+
+_get_color_tuple = attrgetter("t", "r", "g", "b", "is_fade")
+"""Returns the immutable representation of a color of a light program."""
+
+
+class SimplificationCache:
+    """Cache of the simplified light programs of drones.
+
+    Consecutive exports of the same show typically differ only in a few drones.
+    The cache allows us to skip the simplification of the light programs of
+    all the other drones: each entry is keyed by the name of the drone and a
+    hash of the raw samples of its light program (including their timestamps,
+    so the frame range and the frame rate are implicitly part of the key).
+    Entries are evicted in LRU order when the cache is full.
+
+    Trajectories and yaw setpoints are not cached; they are simplified in a
+    single linear pass, which is cheaper than hashing their samples.
+
+    Simplified light programs are stored as tuples, and the cache returns new
+    light programs constructed from them so the caller is free to modify them
+    (e.g., to shift them in time). The cache is safe to use from multiple
+    threads.
+    """
+
+    hits: int
+    """Number of cache hits since the cache was created or cleared."""
+
+    misses: int
+    """Number of cache misses since the cache was created or cleared."""
+
+    _items: LRUCache[tuple[str, bytes], tuple[_ColorTuple, ...]]
+    """The colors of the cached simplified light programs."""
+
+    _lock: Lock
+    """Lock that guards the cached objects and the statistics."""
+
+    def __init__(self, max_size: int = 16384):
+        """Constructor.
+
+        Args:
+            max_size: maximum number of simplified light programs to keep in
+                the cache
+        """
+        self.hits = 0
+        self.misses = 0
+
+        self._items = LRUCache(max_size)
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def clear(self) -> None:
+        """Removes all the items from the cache and resets the statistics."""
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def simplify_light_program(self, name: str, program: LightProgram) -> LightProgram:
+        """Returns the simplified version of the light program of the drone
+        with the given name, using the cache if possible.
+        """
+        values = array("d", chain.from_iterable(map(_get_color_tuple, program.colors)))
+        key = name, blake2b(values.tobytes(), digest_size=16).digest()
+
+        with self._lock:
+            cached = self._items.get(key) if key in self._items else None
+            if cached is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if cached is not None:
+            return LightProgram([Color4D(*color) for color in cached])
+
+        result = program.simplify()
+        with self._lock:
+            self._items[key] = tuple(map(_get_color_tuple, result.colors))
+        return result
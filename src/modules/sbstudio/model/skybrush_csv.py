@@ -0,0 +1,274 @@
+"""Parsers for the dynamic and static CSV formats of Skybrush, and a writer
+for zipped dynamic CSV files.
+
+The parsers convert an entire file into a NumPy array in one go with the C
+parser of NumPy. Files that the fast parser cannot handle (e.g., files with
+quoted values or rows of varying length) are parsed row by row with the
+``csv`` module instead, which also pinpoints the offending row in the error
+message if the file is invalid.
+
+The writer formats the files of the individual drones one by one and
+compresses each file into the output ZIP file right after it was formatted,
+so only the file of a single drone is kept in memory at a time.
+"""
+
+import csv
+from collections.abc import Iterable
+from io import StringIO
+from pathlib import Path
+from typing import IO
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from numpy import (
+    column_stack,
+    diff,
+    flatnonzero,
+    float64,
+    full,
+    loadtxt,
+    rint,
+    zeros,
+)
+from numpy.typing import NDArray
+
+__all__ = (
+    "format_skybrush_csv",
+    "parse_skybrush_csv",
+    "parse_skybrush_static_csv",
+    "write_skybrush_csv_zip",
+)
+
+_HEADER = "Time_msec,x,y,z,Red,Green,Blue"
+"""Header row of the dynamic CSV files written by the writer."""
+
+
+def parse_skybrush_csv(data: bytes, *, filename: str = "") -> NDArray[float64]:
+    """Parses the contents of a dynamic Skybrush CSV file that contains the
+    baked animation of a single drone.
+
+    Each row of the file contains a timestamp in milliseconds, the X, Y and
+    Z coordinates, and optionally the red, green and blue components of the
+    color of the drone. The file may start with a header row.
+
+    Args:
+        data: the raw contents of the file
+        filename: the name of the file, used in error messages
+
+    Returns:
+        an array of shape ``(N, 7)`` where each row contains the timestamp in
+        seconds, the coordinates and the color components of a single row of
+        the file. Colors default to white when they are not specified.
+
+    Raises:
+        RuntimeError: if the file is invalid
+    """
+    text = _skip_header(data.decode("ascii"), ("time_msec", "time [msec]"))
+    table = _load_table(text, num_values=4)
+    if table is None:
+        _, table = _parse_rows(text, filename, num_names=0, num_values=4)
+
+    table[:, 0] /= 1000.0
+
+    decreasing = flatnonzero(diff(table[:, 0]) <= 0)
+    if len(decreasing):
+        raise RuntimeError(
+            f"Timestamps must be strictly increasing in input CSV file "
+            f"{filename!r}, data row {decreasing[0] + 2}"
+        )
+
+    return table
+
+
+def format_skybrush_csv(table: NDArray[float64]) -> bytes:
+    """Formats the baked animation of a single drone as a dynamic Skybrush CSV
+    file.
+
+    Args:
+        table: an array of shape ``(N, 7)`` in the same layout as the one
+            returned by `parse_skybrush_csv()`, i.e. each row contains a
+            timestamp in seconds, the coordinates and the color components
+
+    Returns:
+        the contents of the file, with a header row and CRLF line endings
+    """
+    times = rint(table[:, 0] * 1000).astype(int).tolist()
+    # Adding zero turns negative zeros into positive ones after rounding
+    coords = (table[:, 1:4].round(3) + 0.0).tolist()
+    colors = rint(table[:, 4:7]).clip(0, 255).astype(int).tolist()
+
+    lines = [_HEADER]
+    lines.extend(
+        f"{t},{x:.3f},{y:.3f},{z:.3f},{r},{g},{b}"
+        for t, (x, y, z), (r, g, b) in zip(times, coords, colors)
+    )
+    lines.append("")
+    return "\r\n".join(lines).encode("ascii")
+
+
+def parse_skybrush_static_csv(
+    data: bytes, *, filename: str = ""
+) -> tuple[list[str], NDArray[float64]]:
+    """Parses the contents of a static Skybrush CSV file that contains a list
+    of named static positions and colors.
+
+    Each row of the file contains a name, the X, Y and Z coordinates, and
+    optionally the red, green and blue components of the color of the point.
+    The file may start with a header row.
+
+    Args:
+        data: the raw contents of the file
+        filename: the name of the file, used in error messages
+
+    Returns:
+        the names of the points and an array of shape ``(N, 6)`` where each
+        row contains the coordinates and the color components of a point.
+        Colors default to white when they are not specified.
+
+    Raises:
+        RuntimeError: if the file is invalid or contains duplicate names
+    """
+    text = _skip_header(data.decode("utf-8"), ("name",))
+
+    table = None
+    if '"' not in text:
+        names: list[str] = []
+        lines: list[str] = []
+        for line in text.splitlines():
+            if line:
+                name, _, rest = line.partition(",")
+                names.append(name)
+                lines.append(rest)
+        table = _load_table("\n".join(lines), num_values=3)
+
+    if table is None:
+        names, table = _parse_rows(text, filename, num_names=1, num_values=3)
+
+    if len(set(names)) != len(names):
+        seen: set[str] = set()
+        for name in names:
+            if name in seen:
+                raise RuntimeError(f"Duplicate object name in input CSV file: {name}")
+            seen.add(name)
+
+    return names, table
+
+
+def write_skybrush_csv_zip(
+    output: str | Path | IO[bytes],
+    tables: Iterable[tuple[str, NDArray[float64]]],
+) -> None:
+    """Writes the baked animation of multiple drones into a ZIP file containing
+    a dynamic Skybrush CSV file for each drone.
+
+    Each file is compressed into the ZIP file as soon as it is formatted, so
+    the contents of the whole ZIP file are never kept in memory at once.
+
+    Args:
+        output: the output file or its name
+        tables: pairs of drone names and their baked animations, in the format
+            accepted by `format_skybrush_csv()`
+    """
+
+    with ZipFile(output, "w", compression=ZIP_DEFLATED) as zip_file:
+        for name, table in tables:
+            with zip_file.open(f"{name}.csv", "w") as fp:
+                fp.write(format_skybrush_csv(table))
+
+
+def _load_table(text: str, *, num_values: int) -> NDArray[float64] | None:
+    """Parses the given text as a table of numbers with the fast parser of
+    NumPy.
+
+    Args:
+        text: the text to parse
+        num_values: number of numeric values in each row before the optional
+            color components
+
+    Returns:
+        the parsed table with ``num_values + 3`` columns, or ``None`` if the
+        fast parser cannot handle the text. The text should then be parsed
+        row by row.
+    """
+    if not text.strip():
+        return None
+
+    try:
+        table = loadtxt(
+            StringIO(text), delimiter=",", dtype=float64, ndmin=2, comments=None
+        )
+    except ValueError:
+        return None
+
+    num_columns = table.shape[1]
+    if num_columns == num_values:
+        return column_stack((table, full((len(table), 3), 255.0)))
+    elif num_columns >= num_values + 3:
+        table = table[:, : num_values + 3]
+        colors = table[:, num_values:]
+        # Color components must be integers
+        return table if (colors == colors.round()).all() else None
+    else:
+        return None
+
+
+def _parse_rows(
+    text: str, filename: str, *, num_names: int, num_values: int
+) -> tuple[list[str], NDArray[float64]]:
+    """Parses the given text row by row.
+
+    Args:
+        text: the text to parse
+        filename: the name of the file, used in error messages
+        num_names: number of string columns at the start of each row
+        num_values: number of numeric values in each row after the string
+            columns and before the optional color components
+
+    Returns:
+        the first string column of each row (empty if there are no string
+        columns) and the table of numeric values, with ``num_values + 3``
+        columns
+
+    Raises:
+        RuntimeError: if a row is invalid
+    """
+    names: list[str] = []
+    rows: list[list[float]] = []
+    start, end = num_names, num_names + num_values
+    for row in csv.reader(StringIO(text), delimiter=","):
+        # skip empty lines
+        if not row:
+            continue
+
+        try:
+            values = [float(value) for value in row[start:end]]
+            if len(values) != num_values:
+                raise ValueError("not enough values")
+            if len(row) > end:
+                r, g, b = (int(value) for value in row[end : end + 3])
+            else:
+                r, g, b = 255, 255, 255
+        except Exception:
+            raise RuntimeError(
+                f"Invalid content in input CSV file {filename!r}, row {row!r}"
+            ) from None
+
+        if num_names:
+            names.append(row[0])
+        rows.append([*values, r, g, b])
+
+    table = zeros((len(rows), num_values + 3), dtype=float64)
+    if rows:
+        table[:] = rows
+    return names, table
+
+
+def _skip_header(text: str, prefixes: tuple[str, ...]) -> str:
+    """Removes the header row from the given text if its first non-empty row
+    starts with one of the given prefixes (case-insensitive).
+    """
+    text = text.lstrip("\r\n")
+    first_line, _, rest = text.partition("\n")
+    if first_line.lower().startswith(prefixes):
+        return rest
+    else:
+        return text
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterator
+from collections.abc import Generator, Iterator
 from contextlib import contextmanager
 from functools import lru_cache
 from socket import gaierror
 from typing import TYPE_CHECKING, TypedDict, TypeVar
 from urllib.error import URLError
 
+import bpy
+
 from sbstudio.api import SkybrushStudioAPI
 from sbstudio.api.version import ensure_backend_version
 from sbstudio.errors import SkybrushStudioError
+from sbstudio.response_cache import ResponseCache
 
 from .constants import DEFAULT_SERVER_URL
 from .errors import SkybrushStudioExportWarning, TaskCancelled
@@ -20,7 +23,11 @@ if TYPE_CHECKING:
     from bpy.types import Operator
 
 
-__all__ = ("get_api", "call_api_from_blender_operator")
+__all__ = (
+    "get_api",
+    "call_api_from_blender_operator",
+    "report_api_errors_to_blender_operator",
+)
 
 T = TypeVar("T")
 
@@ -57,6 +64,24 @@ def _get_api_from_url_and_key(url: str, key: str) -> SkybrushStudioAPI:
     return result
 
 
+@lru_cache(maxsize=1)
+def _get_response_cache() -> ResponseCache:
+    """Constructs the cache of the responses of planning requests, stored in
+    the user data directory of Blender.
+
+    Memoized so all API objects share the same cache.
+    """
+    try:
+        directory = bpy.utils.user_resource(
+            "DATAFILES", path="skybrush/response_cache", create=True
+        )
+    except Exception as ex:
+        log.warning(f"Could not create response cache directory: {ex}")
+        directory = None
+
+    return ResponseCache(directory or None)
+
+
 class APISettings(TypedDict):
     """Dictionary representing the settings required to construct a SkybrushStudioAPI_
     object instance.
@@ -104,8 +129,13 @@ def get_api(*, check_version: bool = True) -> SkybrushStudioAPI:
     Args:
         check_version: whether to check the version of the backend
     """
+    from sbstudio.plugin.model.global_settings import get_preferences
+
     settings = _get_api_settings()
     api = _get_api_from_url_and_key(**settings)
+    api.response_cache = (
+        _get_response_cache() if get_preferences().use_response_cache else None
+    )
     if check_version:
         ensure_backend_version(api)
 
@@ -116,6 +146,25 @@ def get_api(*, check_version: bool = True) -> SkybrushStudioAPI:
 def call_api_from_blender_operator(
     operator: Operator, what: str = "operation", *, check_version: bool = True
 ) -> Iterator[SkybrushStudioAPI]:
+    """Context manager that yields the Skybrush Studio API object back to the
+    caller and reports the exceptions raised in the context to the given
+    Blender operator, as in `report_api_errors_to_blender_operator()`.
+
+    Args:
+        check_version: whether to check the version number of the backend
+    """
+    with report_api_errors_to_blender_operator(operator, what):
+        # TODO(ntamas): This is not entirely correct here. When an exception happens
+        # during get_api(...), we will not yield anything back to the caller. If we
+        # handle _that_ exception without re-raising it, the caller itself will raise
+        # a "generator didn't yield" exception, which is quite confusing.
+        yield get_api(check_version=check_version)
+
+
+@contextmanager
+def report_api_errors_to_blender_operator(
+    operator: Operator, what: str = "operation"
+) -> Generator[None]:
     """Context manager that yields immediately back to the caller from a
     try-except block, catches all exceptions, and calls the ``report()`` method
     of the given Blender operator with an appropriate error message if there
@@ -123,16 +172,12 @@ def call_api_from_blender_operator(
     return ``{"CANCELLED"}`` from the operator immediately in response to an
     exception.
 
-    Args:
-        check_version: whether to check the version number of the backend
+    Unlike `call_api_from_blender_operator()`, it does not need online access,
+    so it can also be used for operations that may run without the server.
     """
     default_message = f"Error while invoking {what} on the Skybrush Studio server"
     try:
-        # TODO(ntamas): This is not entirely correct here. When an exception happens
-        # during get_api(...), we will not yield anything back to the caller. If we
-        # handle _that_ exception without re-raising it, the caller itself will raise
-        # a "generator didn't yield" exception, which is quite confusing.
-        yield get_api(check_version=check_version)
+        yield
     except SkybrushStudioExportWarning as ex:
         operator.report({"WARNING"}, str(ex))
         raise
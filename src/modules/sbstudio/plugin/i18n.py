@@ -0,0 +1,89 @@
+"""Registration of the translations of the user interface with Blender.
+
+Only the translations of the language of the user interface are loaded when
+the add-on is registered. The translations of other languages are loaded when
+the user switches to them in the preferences of Blender.
+"""
+
+import logging
+
+import bpy
+from bpy.app.handlers import persistent
+
+from sbstudio.i18n import TranslationCatalog
+
+from .plugin_helpers import register_translations, unregister_translations
+
+__all__ = ("register", "unregister")
+
+log = logging.getLogger(__name__)
+
+_catalog: TranslationCatalog | None = None
+"""The translations loaded so far; ``None`` if the translations are not
+registered.
+"""
+
+_msgbus_owner = object()
+"""Owner of the message bus subscription that notifies us about changes in
+the language of the user interface.
+"""
+
+
+def _on_language_changed() -> None:
+    """Callback that is called when the user changes the language of the user
+    interface.
+    """
+    if _catalog is None or not _catalog.ensure_loaded(bpy.app.translations.locale):
+        return
+
+    log.info(_catalog.format_memory_report())
+
+    # Blender does not allow extending registered translations so we need to
+    # register them again
+    unregister_translations()
+    register_translations(_catalog.translations)
+
+
+@persistent
+def _subscribe_to_language_changes(*args) -> None:
+    """Subscribes to changes in the language of the user interface.
+
+    Blender clears all message bus subscriptions when a file is loaded (the
+    ``PERSISTENT`` option only keeps them across ID remapping) so this function
+    is also called after every file load.
+    """
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    bpy.msgbus.subscribe_rna(
+        key=(bpy.types.PreferencesView, "language"),
+        owner=_msgbus_owner,
+        args=(),
+        notify=_on_language_changed,
+        options={"PERSISTENT"},
+    )
+
+
+def register() -> None:
+    """Registers the translations of the current language of the user
+    interface with Blender, and subscribes to changes in the language of the
+    user interface.
+    """
+    global _catalog
+
+    _catalog = TranslationCatalog()
+    _catalog.ensure_loaded(bpy.app.translations.locale)
+    log.info(_catalog.format_memory_report())
+    register_translations(_catalog.translations)
+
+    _subscribe_to_language_changes()
+    bpy.app.handlers.load_post.append(_subscribe_to_language_changes)
+
+
+def unregister() -> None:
+    """Unregisters the translations of the user interface from Blender."""
+    global _catalog
+
+    if _subscribe_to_language_changes in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_subscribe_to_language_changes)
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    unregister_translations()
+    _catalog = None
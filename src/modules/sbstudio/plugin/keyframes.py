@@ -4,7 +4,20 @@ from collections import defaultdict
 from collections.abc import Callable, Sequence
 from typing import overload
 
-from bpy.types import FCurve, Object
+from bpy.types import FCurve, Keyframe, KeyframeHandleType, Object
+from numpy import (
+    asarray,
+    column_stack,
+    concatenate,
+    empty,
+    float32,
+    full,
+    int32,
+    unique,
+)
+from numpy.typing import ArrayLike, NDArray
+
+from sbstudio.model.keyframes import resolve_keyframe_values
 
 from .actions import (
     ensure_animation_data_exists_for_object,
@@ -14,7 +27,149 @@ from .actions import (
     iter_all_f_curves,
 )
 
-__all__ = ("clear_keyframes", "get_keyframes", "set_keyframes")
+__all__ = (
+    "add_keyframes_in_bulk",
+    "clear_keyframes",
+    "get_keyframes",
+    "remove_keyframes_in_range",
+    "set_keyframes",
+)
+
+
+INTERPOLATION_TYPES: dict[str, int] = {"CONSTANT": 0, "LINEAR": 1, "BEZIER": 2}
+"""Mapping from the names of keyframe interpolation types to the integer values
+that Blender uses when the interpolation types are accessed in bulk with
+`foreach_get()` and `foreach_set()`.
+"""
+
+HANDLE_TYPES: dict[str, int] = {
+    "FREE": 0,
+    "AUTO": 1,
+    "VECTOR": 2,
+    "ALIGNED": 3,
+    "AUTO_CLAMPED": 4,
+}
+"""Mapping from the names of keyframe handle types to the integer values that
+Blender uses when the handle types are accessed in bulk with `foreach_get()`
+and `foreach_set()`.
+"""
+
+_KEYFRAME_ATTRIBUTES: tuple[tuple[str, int, type], ...] = (
+    ("co", 2, float32),
+    ("handle_left", 2, float32),
+    ("handle_right", 2, float32),
+    ("interpolation", 0, int32),
+    ("handle_left_type", 0, int32),
+    ("handle_right_type", 0, int32),
+    ("easing", 0, int32),
+    ("type", 0, int32),
+    ("amplitude", 0, float32),
+    ("back", 0, float32),
+    ("period", 0, float32),
+    ("select_control_point", 0, bool),
+    ("select_left_handle", 0, bool),
+    ("select_right_handle", 0, bool),
+)
+"""Attributes of keyframes that are copied when the keyframes of an F-curve are
+rebuilt in bulk, along with the number of their components (zero for scalars)
+and the data type to use when accessing them with `foreach_get()`.
+"""
+
+_BULK_REMOVAL_THRESHOLD = 16
+"""Number of keyframes to remove from an F-curve above which it is faster to
+rebuild the entire F-curve in bulk than to remove the keyframes one by one.
+"""
+
+
+def add_keyframes_in_bulk(
+    fcurve: FCurve,
+    frames: ArrayLike,
+    values: ArrayLike,
+    *,
+    interpolation: str | Sequence[str] = "LINEAR",
+    handle_type: KeyframeHandleType | Sequence[KeyframeHandleType] = "AUTO_CLAMPED",
+    handle_left_type: KeyframeHandleType | Sequence[KeyframeHandleType] | None = None,
+    handle_right_type: KeyframeHandleType | Sequence[KeyframeHandleType] | None = None,
+    update: bool = True,
+) -> None:
+    """Appends multiple keyframes to an F-curve in one go.
+
+    This is considerably faster than adding keyframes one by one with
+    `keyframe_points.insert()` or by setting the attributes of the individual
+    keyframes, because the coordinates, the interpolation types and the handle
+    types of all the keyframes are written with a single `foreach_set()` call
+    each.
+
+    Existing keyframes of the F-curve are kept intact. No attempt is made to
+    merge keyframes with the same frame number; it is the responsibility of
+    the caller to ensure that the new keyframes do not clash with the existing
+    ones.
+
+    Parameters:
+        fcurve: the F-curve to add the keyframes to
+        frames: the frame numbers of the new keyframes
+        values: the values of the new keyframes, in the same order as the frame
+            numbers
+        interpolation: the interpolation type of the new keyframes, or a
+            sequence of interpolation types, one for each new keyframe
+        handle_type: the type of the left and right handles of the new
+            keyframes, or a sequence of handle types, one for each new keyframe
+        handle_left_type: when not `None`, overrides the type of the left
+            handles of the new keyframes
+        handle_right_type: when not `None`, overrides the type of the right
+            handles of the new keyframes
+        update: whether to call `FCurve.update()` at the end to sort the
+            keyframes and recalculate their handles. Set it to `False` if you
+            intend to add more keyframes to the same F-curve and call
+            `FCurve.update()` yourself when you are done.
+    """
+    frames = asarray(frames, dtype=float32).ravel()
+    values = asarray(values, dtype=float32).ravel()
+    if len(frames) != len(values):
+        raise ValueError("frames and values must have the same length")
+
+    num_new = len(frames)
+    if not num_new:
+        return
+
+    points = fcurve.keyframe_points
+    num_existing = len(points)
+
+    co = column_stack((frames, values)).ravel()
+    interpolations = _to_enum_values(interpolation, INTERPOLATION_TYPES, num_new)
+    left_types = _to_enum_values(
+        handle_type if handle_left_type is None else handle_left_type,
+        HANDLE_TYPES,
+        num_new,
+    )
+    right_types = _to_enum_values(
+        handle_type if handle_right_type is None else handle_right_type,
+        HANDLE_TYPES,
+        num_new,
+    )
+
+    if num_existing:
+        # foreach_set() writes the entire collection so we need to prepend
+        # the attributes of the existing keyframes
+        co = concatenate((_get_keyframe_attribute(fcurve, "co", 2), co))
+        interpolations = concatenate(
+            (_get_keyframe_attribute(fcurve, "interpolation"), interpolations)
+        )
+        left_types = concatenate(
+            (_get_keyframe_attribute(fcurve, "handle_left_type"), left_types)
+        )
+        right_types = concatenate(
+            (_get_keyframe_attribute(fcurve, "handle_right_type"), right_types)
+        )
+
+    points.add(num_new)
+    points.foreach_set("co", co)
+    points.foreach_set("interpolation", interpolations)
+    points.foreach_set("handle_left_type", left_types)
+    points.foreach_set("handle_right_type", right_types)
+
+    if update:
+        fcurve.update()
 
 
 def clear_keyframes(
@@ -49,22 +204,55 @@ def clear_keyframes(
         if start is None and end is None:
             curve.keyframe_points.clear()
         else:
-            points = curve.keyframe_points
-            indices_to_delete = []
+            remove_keyframes_in_range(curve, start, end)
 
-            # TODO(ntamas): it would be faster to find the appropriate slice with
-            # binary search
-            for index, point in enumerate(points):
-                time = point.co[0]
-                if start is not None and time < start:
-                    continue
-                if end is not None and time > end:
-                    break
-                indices_to_delete.append(index)
 
-            for index in reversed(indices_to_delete):
-                points.remove(points[index], fast=True)
-            points.handles_recalc()
+def remove_keyframes_in_range(
+    fcurve: FCurve, start: float | None = None, end: float | None = None
+) -> int:
+    """Removes all the keyframes of an F-curve in the given frame range.
+
+    The frames of all the keyframes are read in one go and the range to delete
+    is located with binary search. Short ranges are removed keyframe by
+    keyframe; when the range is long, the remaining keyframes are written back
+    to the F-curve in bulk instead.
+
+    Parameters:
+        fcurve: the F-curve to modify
+        start: the start of the range (inclusive); `None` to remove from the
+            beginning
+        end: the end of the range (inclusive); `None` to remove until the end
+
+    Returns:
+        the number of keyframes removed
+    """
+    points = fcurve.keyframe_points
+    num_points = len(points)
+    if not num_points:
+        return 0
+
+    frames = _get_keyframe_attribute(fcurve, "co", 2)[::2]
+    lo = 0 if start is None else int(frames.searchsorted(start, side="left"))
+    hi = num_points if end is None else int(frames.searchsorted(end, side="right"))
+    num_to_remove = hi - lo
+    if num_to_remove <= 0:
+        return 0
+
+    if num_to_remove == num_points:
+        points.clear()
+    elif num_to_remove <= _BULK_REMOVAL_THRESHOLD:
+        for index in reversed(range(lo, hi)):
+            points.remove(points[index], fast=True)
+        points.handles_recalc()
+    else:
+        attributes = _get_all_keyframe_attributes(fcurve)
+        points.clear()
+        points.add(num_points - num_to_remove)
+        for attr, values in attributes.items():
+            points.foreach_set(attr, concatenate((values[:lo], values[hi:])).ravel())
+        points.handles_recalc()
+
+    return num_to_remove
 
 
 def get_keyframes(
@@ -136,7 +324,8 @@ def set_keyframes(
         values: the values to set. Each item must be a pair consisting of a
             frame number and a value, and the entire sequence is assumed to be
             sorted by time. The value may be `None` for keyframes where we want
-            to keep the current value.
+            to use the current value of the property, even if the frame
+            already has a keyframe with a different value.
         clear_range: whether to remove any additional keyframes in the range
             spanned by the values. It may also be a tuple consisting of two
             frames if you want to specify the range to clear explicitly.
@@ -165,27 +354,32 @@ def set_keyframes(
 
     anim_data = ensure_animation_data_exists_for_object(object)
 
-    for frame, _value in values:
-        target.keyframe_insert(prop, frame=frame)
+    # Insert the first keyframe the usual way so Blender creates the F-curves
+    # if needed and applies its defaults for new keyframes; the remaining
+    # keyframes are then added in bulk with the same settings
+    target.keyframe_insert(prop, frame=values[0][0])
 
     if is_array:
         fcurves = find_all_f_curves_for_data_path(anim_data, data_path)
-        result = []
-        for fcurve in fcurves:
-            array_index = fcurve.array_index
-            values_for_curve = [
-                (frame, value[array_index] if value is not None else None)
-                for frame, value in values
-            ]
-            result.extend(_update_keyframes_on_single_f_curve(fcurve, values_for_curve))
     else:
         fcurve = find_f_curve_for_data_path(anim_data, data_path)
         assert fcurve is not None
-        result = _update_keyframes_on_single_f_curve(fcurve, values)
+        fcurves = [fcurve]
 
-    if interpolation is not None:
-        for point in result:
-            point.interpolation = interpolation
+    current_value = getattr(target, prop)
+    result = []
+    for fcurve in fcurves:
+        values_for_curve = resolve_keyframe_values(
+            values, current_value, fcurve.array_index if is_array else None
+        )
+        _add_missing_keyframes(fcurve, values_for_curve)
+        result.extend(
+            _update_keyframes_on_single_f_curve(
+                fcurve,
+                values_for_curve,
+                interpolation,
+            )
+        )
 
     return result
 
@@ -203,29 +397,137 @@ def update_fcurves(object: Object, data_path: str) -> None:
         fcurve.update()
 
 
-def _update_keyframes_on_single_f_curve(
-    fcurve: FCurve, values: Sequence[tuple[float, float | None]]
-) -> list:
-    result = []
+def _add_missing_keyframes(
+    fcurve: FCurve,
+    values: Sequence[tuple[float, float]],
+) -> None:
+    """Adds keyframes in bulk to an F-curve for those frames in the given
+    frame-value pairs that do not have a keyframe yet, mimicking what
+    `keyframe_insert()` would do for each frame.
 
-    if values:
-        index = 0
-        next_value = values[index]
-        for point in fcurve.keyframe_points:
-            if point.co[0] == next_value[0]:
-                if next_value[1] is not None:
-                    point.co[1] = next_value[1]
-                    point.handle_left[1] = next_value[1]
-                    point.handle_right[1] = next_value[1]
+    The F-curve must already have a keyframe at the first frame; its
+    interpolation and handle types are used for the new keyframes.
+    """
+    points = fcurve.keyframe_points
+    existing = _get_keyframe_attribute(fcurve, "co", 2).reshape(-1, 2)[:, 0]
+
+    frames = unique(asarray([frame for frame, _ in values], dtype=float32))
+    indices = existing.searchsorted(frames).clip(0, len(existing) - 1)
+    missing = existing[indices] != frames
+    if not missing.any():
+        return
+
+    new_values = {float32(frame): value for frame, value in values}
+    new_frames = frames[missing]
+
+    template = points[int(existing.searchsorted(float32(values[0][0])))]
+    interpolation = template.interpolation
+    if interpolation not in INTERPOLATION_TYPES:
+        # Easing interpolations cannot be set in bulk; they are rarely used
+        # as the default for new keyframes anyway
+        interpolation = "BEZIER"
+
+    add_keyframes_in_bulk(
+        fcurve,
+        new_frames,
+        [new_values[frame] for frame in new_frames],
+        interpolation=interpolation,
+        handle_left_type=template.handle_left_type,
+        handle_right_type=template.handle_right_type,
+    )
+
+
+def _get_keyframe_attribute(fcurve: FCurve, attr: str, width: int = 0) -> NDArray:
+    """Reads the given attribute of all the keyframes of an F-curve in bulk.
 
-                result.append(point)
+    Parameters:
+        fcurve: the F-curve to read
+        attr: the name of the attribute to read
+        width: number of components of the attribute for vector attributes
+            (e.g., 2 for coordinates); zero for integer (enum) attributes
 
-                index += 1
-                if index >= len(values):
-                    break
+    Returns:
+        the values of the attribute; a flat float32 array for vector
+        attributes and an int32 array for integer attributes
+    """
+    points = fcurve.keyframe_points
+    if width:
+        result = empty(len(points) * width, dtype=float32)
+    else:
+        result = empty(len(points), dtype=int32)
+    points.foreach_get(attr, result)
+    return result
 
-                next_value = values[index]
-        else:
-            raise RuntimeError("Cannot set all keyframes")
 
+def _get_all_keyframe_attributes(fcurve: FCurve) -> dict[str, NDArray]:
+    """Reads all the attributes of all the keyframes of an F-curve in bulk.
+
+    Returns:
+        a dictionary mapping attribute names to arrays with one row per
+        keyframe
+    """
+    points = fcurve.keyframe_points
+    num_points = len(points)
+    result: dict[str, NDArray] = {}
+    for attr, width, dtype in _KEYFRAME_ATTRIBUTES:
+        values = empty(num_points * max(width, 1), dtype=dtype)
+        points.foreach_get(attr, values)
+        result[attr] = values.reshape(num_points, width) if width else values
     return result
+
+
+def _to_enum_values(
+    value: str | Sequence[str], mapping: dict[str, int], length: int
+) -> NDArray[int32]:
+    """Converts a single enum name or a sequence of enum names to an array of
+    the integer values that Blender uses for the enum in `foreach_set()`.
+    """
+    if isinstance(value, str):
+        return full(length, mapping[value], dtype=int32)
+
+    if len(value) != length:
+        raise ValueError(f"expected {length} items, got {len(value)}")
+    return asarray([mapping[item] for item in value], dtype=int32)
+
+
+def _update_keyframes_on_single_f_curve(
+    fcurve: FCurve,
+    values: Sequence[tuple[float, float | None]],
+    interpolation: str | None = None,
+) -> list[Keyframe]:
+    if not values:
+        return []
+
+    points = fcurve.keyframe_points
+    co = _get_keyframe_attribute(fcurve, "co", 2).reshape(-1, 2)
+
+    # Keyframes are sorted by frame numbers so we can use binary search to
+    # find the keyframes corresponding to the values
+    frames = asarray([frame for frame, _ in values], dtype=float32)
+    indices = co[:, 0].searchsorted(frames)
+    if (indices >= len(co)).any() or (
+        co[indices.clip(0, len(co) - 1), 0] != frames
+    ).any():
+        raise RuntimeError("Cannot set all keyframes")
+
+    to_update = [
+        (index, value)
+        for index, (_, value) in zip(indices.tolist(), values)
+        if value is not None
+    ]
+    if to_update:
+        update_indices, new_values = zip(*to_update)
+        update_indices = list(update_indices)
+        co[update_indices, 1] = new_values
+        points.foreach_set("co", co.ravel())
+        for attr in ("handle_left", "handle_right"):
+            handles = _get_keyframe_attribute(fcurve, attr, 2).reshape(-1, 2)
+            handles[update_indices, 1] = new_values
+            points.foreach_set(attr, handles.ravel())
+
+    if interpolation is not None:
+        interpolations = _get_keyframe_attribute(fcurve, "interpolation")
+        interpolations[indices] = INTERPOLATION_TYPES[interpolation]
+        points.foreach_set("interpolation", interpolations)
+
+    return [points[index] for index in indices.tolist()]
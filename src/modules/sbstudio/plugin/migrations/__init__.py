@@ -4,13 +4,15 @@ from typing import Type
 from bpy.types import Context
 
 from .base import Migration
+from .use_binary_storyboard_mappings import UseBinaryStoryboardMappingsMigration
 from .use_common_material_for_all_drones import UseSharedMaterialForAllDronesMigration
 
 __all__ = ("get_migration_details", "is_migration_needed", "migrate")
 
 migrations: dict[int, Type[Migration]] = {}
 candidates: list[Type[Migration]] = [
-    UseSharedMaterialForAllDronesMigration  # version 1 -> 2
+    UseSharedMaterialForAllDronesMigration,  # version 1 -> 2
+    UseBinaryStoryboardMappingsMigration,  # version 2 -> 3
 ]
 LATEST_VERSION: int = 1
 
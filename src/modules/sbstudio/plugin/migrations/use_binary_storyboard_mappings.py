@@ -0,0 +1,42 @@
+from logging import Logger
+
+from bpy.types import Context
+
+from sbstudio.model.mapping import is_legacy_encoded_mapping
+
+from .base import Migration
+
+__all__ = ("UseBinaryStoryboardMappingsMigration",)
+
+
+class UseBinaryStoryboardMappingsMigration(Migration):
+    """Converts the mappings of storyboard entries from the legacy JSON
+    representation to the compact binary representation that is faster to
+    decode for large shows.
+    """
+
+    label = "Update storage format of storyboard mappings"
+    description = (
+        "Convert the drone-to-marker mappings of storyboard entries to a\n"
+        "compact binary format that is faster to load for large shows."
+    )
+    version_range = (2, 3)
+
+    @classmethod
+    def needs_migration(cls, context: Context) -> bool:
+        """Returns whether the current Blender content needs migration."""
+        storyboard = context.scene.skybrush.storyboard
+        return any(
+            is_legacy_encoded_mapping(entry.mapping) for entry in storyboard.entries
+        )
+
+    def execute(self, context: Context, *, log: Logger):
+        """Executes the migration/upgrade on the current Blender content."""
+        storyboard = context.scene.skybrush.storyboard
+        num_converted = 0
+        for entry in storyboard.entries:
+            if is_legacy_encoded_mapping(entry.mapping):
+                entry.update_mapping(entry.get_mapping())
+                num_converted += 1
+
+        log.info(f"Converted the mappings of {num_converted} storyboard entries")
@@ -3,27 +3,30 @@ from __future__ import annotations
 from collections.abc import Iterable, Sequence
 from functools import partial
 from itertools import count
-from typing import TYPE_CHECKING, TypeGuard
+from typing import TYPE_CHECKING, TypeGuard, cast
 
 import bpy
 from bpy.types import Collection
-from numpy import array, c_, dot, float64, ones, zeros
+from numpy import array, float32, float64, zeros
 from numpy.typing import NDArray
 
 from sbstudio.model.types import Coordinate3D
 from sbstudio.plugin.constants import Collections
 from sbstudio.plugin.objects import (
     get_derived_object_after_applying_modifiers,
+    get_vertex_coordinates_of_object,
+    get_vertex_indices_of_object_in_vertex_group_by_name,
     get_vertices_of_object_in_vertex_group_by_name,
 )
 from sbstudio.plugin.utils import create_object_in_collection
 from sbstudio.plugin.utils.evaluator import get_position_of_object
 
 if TYPE_CHECKING:
-    from bpy.types import EmptyDisplayType, MeshVertex, Object
+    from bpy.types import EmptyDisplayType, Mesh, MeshVertex, Object
 
 __all__ = (
     "add_objects_to_formation",
+    "add_point_cloud_to_formation",
     "add_points_to_formation",
     "count_markers_in_formation",
     "create_formation",
@@ -31,11 +34,135 @@ __all__ = (
     "get_markers_from_formation",
     "get_markers_and_related_objects_from_formation",
     "get_world_coordinates_of_markers_from_formation",
+    "invalidate_formation_cache",
     "is_formation",
     "remove_formation",
+    "resolve_formation",
+    "ResolvedFormation",
 )
 
 
+class ResolvedFormation:
+    """The ordered list of markers of a formation, along with a lookup table
+    that maps markers to their indices.
+
+    Instances of this class are cached by `resolve_formation()` until the
+    objects, meshes or collections of the scene change, so they must be treated
+    as read-only.
+    """
+
+    markers_and_objects: list[tuple[Object | MeshVertex, Object]]
+    """The markers of the formation and their corresponding objects, in the
+    order returned by `get_markers_and_related_objects_from_formation()`.
+    """
+
+    signature: tuple
+    """Signature of the formation at the time it was resolved; see
+    `_get_formation_signature()`.
+    """
+
+    _index_of_marker: dict[Object | MeshVertex, int] | None = None
+    """Dictionary mapping markers to their indices; constructed lazily."""
+
+    def __init__(
+        self,
+        markers_and_objects: list[tuple[Object | MeshVertex, Object]],
+        signature: tuple = (),
+    ):
+        self.markers_and_objects = markers_and_objects
+        self.signature = signature
+
+    def __len__(self) -> int:
+        return len(self.markers_and_objects)
+
+    @property
+    def markers(self) -> list[Object | MeshVertex]:
+        """The markers of the formation, in order."""
+        return [marker for marker, _ in self.markers_and_objects]
+
+    def find(self, marker: Object | MeshVertex | None, *, default: int = 0) -> int:
+        """Returns the index of the given marker in the formation, or the given
+        default value if the marker is not part of the formation.
+        """
+        if marker is None:
+            return default
+
+        if self._index_of_marker is None:
+            index_of_marker: dict[Object | MeshVertex, int] = {}
+            for index, (item, _) in enumerate(self.markers_and_objects):
+                # Keep the first occurrence, just like list.index() would
+                index_of_marker.setdefault(item, index)
+            self._index_of_marker = index_of_marker
+
+        return self._index_of_marker.get(marker, default)
+
+
+_formation_cache: dict[int, ResolvedFormation] = {}
+"""Cache of resolved formations, keyed by the address of the formation
+collection. Cleared whenever the dependency graph reports that an object, a
+mesh or a collection was updated.
+"""
+
+
+def invalidate_formation_cache() -> None:
+    """Clears the cached marker lists of all formations. Must be called whenever
+    the objects in a formation or their vertex groups might have changed.
+    """
+    _formation_cache.clear()
+
+
+def resolve_formation(formation: Collection) -> ResolvedFormation:
+    """Returns the markers of the given formation along with a lookup table that
+    maps the markers to their indices.
+
+    The result is cached until the next object, mesh or collection update in
+    the dependency graph so repeated queries within the same operation do not
+    need to walk the formation again. Scripts may also delete, rename or add
+    objects without triggering a dependency graph update in between, so the
+    cached result is used only if the objects in the formation and the
+    number of vertices of their meshes are the same as when the formation was
+    resolved.
+    """
+    key = formation.as_pointer()
+    signature = _get_formation_signature(formation)
+    result = _formation_cache.get(key)
+    if result is None or result.signature != signature:
+        result = _formation_cache[key] = ResolvedFormation(
+            _collect_markers_and_related_objects_from_formation(formation),
+            signature,
+        )
+    return result
+
+
+def _get_formation_signature(formation: Collection) -> tuple:
+    """Returns a signature of the given formation that changes when objects
+    are added to or removed from the formation, when they are renamed, when
+    the number of vertices of their meshes changes or when a different vertex
+    group is designated to hold their markers.
+
+    The signature is much cheaper to calculate than the list of markers of the
+    formation as it does not need to look at the contents of vertex groups.
+    """
+    return (
+        formation.name,
+        tuple(
+            (
+                obj.as_pointer(),
+                obj.name,
+                len(cast("Mesh", obj.data).vertices) if obj.type == "MESH" else -1,
+                obj.skybrush.formation_vertex_group,
+            )
+            for obj in formation.objects
+        ),
+    )
+
+
+_POINT_CLOUD_VERTEX_GROUP_NAME = "Markers"
+"""Name of the vertex group holding the markers of point cloud meshes created
+by `add_point_cloud_to_formation()`.
+"""
+
+
 def _get_marker_name(formation: str, index: int) -> str:
     """Proposes a new name for a marker with the given index in the given
     formation.
@@ -44,7 +171,10 @@ def _get_marker_name(formation: str, index: int) -> str:
 
 
 def create_formation(
-    name: str, points: Iterable[Coordinate3D] | None = None
+    name: str,
+    points: Iterable[Coordinate3D] | None = None,
+    *,
+    point_cloud: bool = False,
 ) -> Collection:
     """Creates a new static formation object with the given name and the given
     points.
@@ -53,6 +183,9 @@ def create_formation(
         name: the name of the formation
         points: iterable yielding the points in the formation, or `None` if the
             formation should be empty
+        point_cloud: whether to store the points as the vertices of a single
+            mesh instead of creating a separate marker for each point; see
+            `add_point_cloud_to_formation()`
 
     Returns:
         the formation object that was created
@@ -64,7 +197,10 @@ def create_formation(
         remover=remove_formation,
     )
 
-    add_points_to_formation(formation, points, name=name)
+    if point_cloud:
+        add_point_cloud_to_formation(formation, points, name=name)
+    else:
+        add_points_to_formation(formation, points, name=name)
 
     return formation
 
@@ -115,6 +251,55 @@ def add_objects_to_formation(
     if objects:
         for obj in objects:
             formation.objects.link(obj)
+        invalidate_formation_cache()
+
+
+def add_point_cloud_to_formation(
+    formation: Collection,
+    points: Iterable[Coordinate3D] | NDArray[float64] | None,
+    *,
+    name: str | None = None,
+) -> Object | None:
+    """Adds the given points to a formation object as the vertices of a single
+    new mesh.
+
+    All the vertices of the mesh are added to a vertex group that is designated
+    as the formation vertex group of the mesh, so each vertex becomes a marker
+    of the formation, in the order of the points. This is considerably faster
+    than `add_points_to_formation()` for large formations as the vertices are
+    written in bulk and only a single Blender object is created.
+
+    Parameters:
+        formation: the formation to add the points to
+        points: the points to add to the formation, in world coordinates
+        name: the name of the mesh to create; `None` means to derive it from
+            the name of the formation
+
+    Returns:
+        the mesh object that was added to the formation, or `None` if there
+        were no points to add
+    """
+    coords = array(points if points is not None else [], dtype=float32).reshape(-1, 3)
+    num_points = len(coords)
+    if not num_points:
+        return None
+
+    name = f"{name or formation.name or ''} - Points"
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(num_points)
+    mesh.vertices.foreach_set("co", coords.ravel())
+    mesh.update()
+
+    obj = bpy.data.objects.new(name, mesh)
+    vertex_group = obj.vertex_groups.new(name=_POINT_CLOUD_VERTEX_GROUP_NAME)
+    vertex_group.add(range(num_points), 1.0, "REPLACE")
+    obj.skybrush.formation_vertex_group = vertex_group.name
+
+    formation.objects.link(obj)
+    invalidate_formation_cache()
+
+    return obj
 
 
 def add_points_to_formation(
@@ -160,6 +345,9 @@ def add_points_to_formation(
         existing_names.add(marker_name)
         index += 1
 
+    if result:
+        invalidate_formation_cache()
+
     return result
 
 
@@ -172,18 +360,7 @@ def count_markers_in_formation(formation: Collection) -> int:
 
     The mesh is evaluated before applying mesh modifiers.
     """
-    result = 0
-
-    for obj in formation.objects:
-        vertex_group_name = obj.skybrush.formation_vertex_group
-        if vertex_group_name:
-            result += len(
-                get_vertices_of_object_in_vertex_group_by_name(obj, vertex_group_name)
-            )
-        else:
-            result += 1
-
-    return result
+    return len(resolve_formation(formation))
 
 
 def get_markers_and_related_objects_from_formation(
@@ -204,7 +381,15 @@ def get_markers_and_related_objects_from_formation(
     (obtained after applying the modifiers) but the _original_ vertices that are
     actually part of the base mesh.
     """
+    return list(resolve_formation(formation).markers_and_objects)
+
 
+def _collect_markers_and_related_objects_from_formation(
+    formation: Collection,
+) -> list[tuple[Object | MeshVertex, Object]]:
+    """Walks the formation and collects its markers and their corresponding
+    objects, bypassing the cache used by `resolve_formation()`.
+    """
     # WARNING: When refactoring, do _not_ change the order in which this
     # function returns the markers because that would mess up the stored
     # mappings of the StoryboardEntry_ objects. Doing so would be a breaking
@@ -246,18 +431,7 @@ def get_markers_from_formation(
     (obtained after applying the modifiers) but the _original_ vertices that are
     actually part of the base mesh.
     """
-    result: list[Object | MeshVertex] = []
-
-    for obj in formation.objects:
-        vertex_group_name = obj.skybrush.formation_vertex_group
-        if vertex_group_name:
-            result.extend(
-                get_vertices_of_object_in_vertex_group_by_name(obj, vertex_group_name)
-            )
-        else:
-            result.append(obj)
-
-    return result
+    return resolve_formation(formation).markers
 
 
 def ensure_formation_consists_of_points(
@@ -282,6 +456,8 @@ def ensure_formation_consists_of_points(
             else:
                 formation.objects.unlink(obj)
 
+    invalidate_formation_cache()
+
     # Move the empties to the points
     num_empties = len(formation.objects)
     for obj, point in zip(formation.objects, points):
@@ -325,7 +501,7 @@ def get_world_coordinates_of_markers_from_formation(
         finally:
             scene.frame_set(current_frame)
 
-    vertices_by_obj: dict[Object, list[MeshVertex]] = {}
+    coords_by_obj: dict[Object, NDArray[float32]] = {}
 
     num_rows = 0
     for obj in formation.objects:
@@ -338,11 +514,12 @@ def get_world_coordinates_of_markers_from_formation(
                 derived_object = get_derived_object_after_applying_modifiers(obj)
             else:
                 derived_object = obj
-            vertices = get_vertices_of_object_in_vertex_group_by_name(
+            indices = get_vertex_indices_of_object_in_vertex_group_by_name(
                 derived_object, vertex_group_name
             )
-            vertices_by_obj[obj] = vertices
-            num_rows += len(vertices)
+            coords = get_vertex_coordinates_of_object(derived_object)[indices]
+            coords_by_obj[obj] = coords
+            num_rows += len(coords)
         else:
             num_rows += 1
 
@@ -350,15 +527,14 @@ def get_world_coordinates_of_markers_from_formation(
     row_index = 0
 
     for obj in formation.objects:
-        vertices = vertices_by_obj.get(obj)
-        if vertices is not None:
-            num_vertices = len(vertices)
-            mw = array(obj.matrix_world)
+        coords = coords_by_obj.get(obj)
+        if coords is not None:
+            num_vertices = len(coords)
             if num_vertices:
-                coords = c_[array([v.co for v in vertices]), ones(num_vertices)]
-                result[row_index : (row_index + num_vertices), :] = dot(mw, coords.T)[
-                    0:3
-                ].T
+                mw = array(obj.matrix_world)
+                result[row_index : (row_index + num_vertices), :] = (
+                    coords @ mw[:3, :3].T + mw[:3, 3]
+                )
             row_index += num_vertices
         else:
             result[row_index, :] = get_position_of_object(obj)
@@ -393,3 +569,4 @@ def remove_formation(formation: Collection) -> None:
             bpy.data.objects.remove(obj)
 
     bpy.data.collections.remove(formation)
+    invalidate_formation_cache()
@@ -163,6 +163,16 @@ class DroneShowAddonGlobalSettings(AddonPreferences):
         default=False,
     )
 
+    use_response_cache: bool = BoolProperty(
+        name="Cache planning results",
+        description=(
+            "Whether to cache the results of transition, takeoff, landing and "
+            "return-to-home planning requests on disk so repeated requests with "
+            "the same input are answered without contacting the server"
+        ),
+        default=True,
+    )
+
     def draw(self, context: Context) -> None:
         layout = self.layout
 
@@ -198,6 +208,7 @@ class DroneShowAddonGlobalSettings(AddonPreferences):
         if mode not in ("COMMUNITY", "LOCAL"):
             layout.separator()
 
+        layout.prop(self, "use_response_cache")
         layout.prop(self, "enable_experimental_features")
 
     def _draw_hardware_id_widgets(self) -> None:
@@ -77,6 +77,7 @@ from sbstudio.plugin.presets.light_effects import (
     get_preset_enum_items,
     get_preset_function,
 )
+from sbstudio.plugin.presets.light_effects.features import SpatialFeatures
 from sbstudio.plugin.utils import remove_if_unused, with_context
 from sbstudio.plugin.utils.collections import pick_unique_name
 from sbstudio.plugin.utils.color_ramp import update_color_ramp_from
@@ -383,6 +384,7 @@ class _ContextCache(TypedDict, total=False):
     inside an otherwise immutable (frozen) object.
     """
 
+    spatial_features: SpatialFeatures
     swarm_center: NDArray[float32]
 
 
@@ -431,6 +433,12 @@ class LightEffectEvaluationContext:
     are blended into the backdrop.
     """
 
+    storyboard_entry_id: str | None = None
+    """ID of the storyboard entry containing the frame being evaluated, or `None` if
+    the frame is not in a storyboard entry (e.g., it is in a transition). Used to
+    cache position-dependent quantities while the swarm is holding a formation.
+    """
+
     _cache: _ContextCache = field(default_factory=dict)
     """Internal cache for lazily computed properties."""
 
@@ -1,13 +1,18 @@
 from bpy.props import StringProperty
 from bpy.types import Context, PropertyGroup
 
-from sbstudio.plugin.utils.pyro_markers import update_pyro_particles_of_object
+from sbstudio.plugin.utils.pyro_markers import (
+    invalidate_pyro_event_index,
+    update_pyro_particles_of_object,
+)
 
 __all__ = ("DroneShowAddonObjectProperties",)
 
 
 def pyro_markers_updated(self, context: Context):
     """Called when the pyro markers got updated by the user."""
+    invalidate_pyro_event_index()
+
     object = context.object
     if object is None or object.skybrush is None:
         return
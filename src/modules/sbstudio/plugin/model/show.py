@@ -42,7 +42,8 @@ class DroneShowAddonProperties(PropertyGroup):
         description=(
             "Current version of the show content stored in Blender. "
             "Version 1 is the initial version (plugin version <= 3.13.2). "
-            "Version 2 uses a shared material for all drones to speed up light effects."
+            "Version 2 uses a shared material for all drones to speed up light effects. "
+            "Version 3 stores the mappings of storyboard entries in a compact binary format."
         ),
         min=1,
         default=1,
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import enum
-import json
 from dataclasses import dataclass
+from itertools import count
 from operator import attrgetter
 from typing import TYPE_CHECKING
 from uuid import uuid4
@@ -19,6 +19,8 @@ from bpy.props import (
 from bpy.types import PropertyGroup
 
 from sbstudio.api.types import Mapping
+from sbstudio.model.intervals import FrameIntervalIndex
+from sbstudio.model.mapping import decode_mapping, encode_mapping
 from sbstudio.plugin.constants import (
     DEFAULT_STORYBOARD_ENTRY_DURATION,
     DEFAULT_STORYBOARD_TRANSITION_DURATION,
@@ -45,9 +47,39 @@ __all__ = (
     "StoryboardEntryOrTransition",
     "Storyboard",
     "StoryboardEntryPurpose",
+    "invalidate_storyboard_index",
 )
 
 
+_index_cache: dict[int, FrameIntervalIndex] = {}
+"""Cached frame indices of storyboards, keyed by the pointer of the
+storyboard.
+"""
+
+_mapping_cache: dict[tuple[str, int], Mapping | None] = {}
+"""Decoded mappings of storyboard entries, keyed by the identifier of the
+entry and the revision number of its mapping.
+"""
+
+_mapping_revisions = count(1)
+"""Source of revision numbers of mappings. Revision numbers are unique within
+a session so a cached mapping can never be mistaken for a newer one, not even
+after an undo.
+"""
+
+
+def invalidate_storyboard_index() -> None:
+    """Invalidates the cached frame indices and decoded mappings of all the
+    storyboards.
+
+    Must be called when storyboard entries are added, removed, reordered or
+    retimed in a way that does not trigger the update callbacks of the
+    entries (e.g., undo), and when a new file is loaded.
+    """
+    _index_cache.clear()
+    _mapping_cache.clear()
+
+
 class ScheduleOverride(PropertyGroup):
     """Blender property group representing overrides to the departure and
     arrival delays of a drone in a transition.
@@ -105,7 +137,12 @@ def _handle_formation_change(self: StoryboardEntry, context: Context | None = No
 
 
 def _handle_mapping_change(self: StoryboardEntry, context: Context | None = None):
-    self._invalidate_decoded_mapping()
+    _mapping_cache.pop(self._mapping_cache_key, None)
+    self.mapping_revision = next(_mapping_revisions)
+
+
+def _handle_timing_change(self: StoryboardEntry, context: Context | None = None):
+    invalidate_storyboard_index()
 
 
 def _get_frame_end(self: StoryboardEntry) -> int:
@@ -183,6 +220,7 @@ class StoryboardEntry(PropertyGroup):
         description="Frame when this formation should start in the show",
         default=0,
         options=set(),
+        update=_handle_timing_change,
     )
     duration = IntProperty(
         name="Duration",
@@ -190,6 +228,7 @@ class StoryboardEntry(PropertyGroup):
         min=1,
         default=1,
         options=set(),
+        update=_handle_timing_change,
     )
     frame_end = IntProperty(
         name="End Frame",
@@ -296,7 +335,9 @@ class StoryboardEntry(PropertyGroup):
     )
 
     # mapping is stored as a string so we don't need to maintain a separate
-    # Blender collection as it would not be efficient
+    # Blender collection as it would not be efficient. The string contains the
+    # base64-encoded binary representation of the mapping; see
+    # sbstudio.model.mapping for details
 
     mapping = StringProperty(
         name="Mapping",
@@ -309,13 +350,29 @@ class StoryboardEntry(PropertyGroup):
         options={"HIDDEN"},
         update=_handle_mapping_change,
     )
+    mapping_revision = IntProperty(
+        name="Mapping revision",
+        description=(
+            "Revision number of the mapping; changes every time the mapping is modified"
+        ),
+        default=0,
+        options={"HIDDEN"},
+    )
+
+    transition_fingerprint = StringProperty(
+        name="Transition fingerprint",
+        description=(
+            "Fingerprint of the inputs of the transition into this entry when "
+            "it was last calculated. Used to decide whether the transition "
+            "needs to be recalculated."
+        ),
+        default="",
+        options={"HIDDEN"},
+    )
 
     sort_key = attrgetter("frame_start", "frame_end")
     """Sorting key for storyboard entries."""
 
-    _decoded_mapping: Mapping | None = None
-    """Decoded mapping of the storyboard entry."""
-
     @property
     def active_schedule_override_entry(self) -> ScheduleOverride | None:
         """The active schedule override currently selected for editing, or
@@ -406,19 +463,12 @@ class StoryboardEntry(PropertyGroup):
         """Returns the mapping of the markers in the storyboard entry to drone
         indices, or ``None`` if there is no mapping yet.
         """
-        if self._decoded_mapping is None:
-            encoded_mapping = self.mapping.strip()
-            if (
-                not encoded_mapping
-                or len(encoded_mapping) < 2
-                or encoded_mapping[0] != "["
-                or encoded_mapping[-1] != "]"
-            ):
-                return None
-            else:
-                self._decoded_mapping = json.loads(encoded_mapping)
-
-        return self._decoded_mapping
+        key = self._mapping_cache_key
+        try:
+            return _mapping_cache[key]
+        except KeyError:
+            mapping = _mapping_cache[key] = decode_mapping(self.mapping)
+            return mapping
 
     def remove_active_schedule_override_entry(self) -> None:
         """Removes the active schedule override entry from the collection and
@@ -446,11 +496,17 @@ class StoryboardEntry(PropertyGroup):
         if mapping is None:
             self.mapping = ""
         else:
-            self.mapping = json.dumps(mapping)
-        assert self._decoded_mapping is None
+            self.mapping = encode_mapping(mapping)
+            _mapping_cache[self._mapping_cache_key] = list(mapping)
 
-    def _invalidate_decoded_mapping(self) -> None:
-        self._decoded_mapping = None
+    @property
+    def _mapping_cache_key(self) -> tuple[str, int]:
+        # Do not use self.id here; it might need to write the entry, which is
+        # not allowed in all contexts where we need the mapping
+        return (
+            self.maybe_uuid_do_not_use or str(self.as_pointer()),
+            self.mapping_revision,
+        )
 
 
 class StoryboardEntryOrTransition(PropertyGroup):
@@ -703,10 +759,7 @@ class Storyboard(PropertyGroup, ListMixin[StoryboardEntry]):
             the index of the storyboard entry containing the given frame, or
             -1 if the current frame does not belong to any of the entries
         """
-        for index, entry in enumerate(self.entries):
-            if entry.contains_frame(frame):
-                return index
-        return -1
+        return self._get_frame_index().find_interval_containing(frame)
 
     def get_index_of_entry_after_frame(self, frame: int) -> int:
         """Returns the index of the storyboard entry that comes after the given
@@ -720,15 +773,7 @@ class Storyboard(PropertyGroup, ListMixin[StoryboardEntry]):
             the index of the closest storyboard entry after the given frame, or
             -1 if the current frame is after the end of the storyboard
         """
-        best_distance, closest = float("inf"), -1
-        for index, entry in enumerate(self.entries):
-            if entry.frame_start > frame:
-                diff = entry.frame_start - frame
-                if diff < best_distance:
-                    best_distance = diff
-                    closest = index
-
-        return closest
+        return self._get_frame_index().find_first_interval_after(frame)
 
     def get_index_of_entry_before_frame(self, frame: int) -> int:
         """Returns the index of the storyboard entry that comes before the given
@@ -742,17 +787,9 @@ class Storyboard(PropertyGroup, ListMixin[StoryboardEntry]):
             the index of the closest storyboard entry before the given frame, or
             -1 if the current frame is before the start of the storyboard
         """
-        best_distance, closest = float("inf"), -1
-        for index, entry in enumerate(self.entries):
-            # note that entries are open ended from the right,
-            # so we allow equality below as well
-            if entry.frame_end <= frame:
-                diff = frame - entry.frame_end
-                if diff < best_distance:
-                    best_distance = diff
-                    closest = index
-
-        return closest
+        # note that entries are open ended from the right, so the index
+        # considers entries ending exactly at the given frame as well
+        return self._get_frame_index().find_last_interval_before(frame)
 
     def get_mapping_at_frame(self, frame: int) -> Mapping | None:
         """Returns the mapping of drones at a given frame based on mappings
@@ -762,14 +799,12 @@ class Storyboard(PropertyGroup, ListMixin[StoryboardEntry]):
             The mapping between drones and the formation at the given frame.
         """
         index = self.get_index_of_entry_containing_frame(frame)
-        if index >= 0:
-            return self.entries[index].get_mapping()
-
-        index = self.get_index_of_entry_before_frame(frame)
-        if index >= 0:
-            return self.entries[index].get_mapping()
+        if index < 0:
+            index = self.get_index_of_entry_before_frame(frame)
+        if index < 0:
+            return None
 
-        return None
+        return self.entries[index].get_mapping()
 
     def get_formation_status_at_frame(self, frame: int) -> str:
         """Returns the name of the storyboard entry containing the given frame
@@ -996,6 +1031,21 @@ class Storyboard(PropertyGroup, ListMixin[StoryboardEntry]):
         """Sort the items in the storyboard in ascending order of start time."""
         # Sort the items in the storyboard itself
         sort_collection(self.entries, key=StoryboardEntry.sort_key)
+        invalidate_storyboard_index()
+
+    def _get_frame_index(self) -> FrameIntervalIndex:
+        """Returns the cached frame index of the entries of the storyboard,
+        rebuilding it if needed.
+        """
+        key = self.as_pointer()
+        index = _index_cache.get(key)
+        entries = self.entries
+        if index is None or len(index) != len(entries):
+            index = _index_cache[key] = FrameIntervalIndex(
+                [entry.frame_start for entry in entries],
+                [entry.frame_end for entry in entries],
+            )
+        return index
 
     def _regenerate_entries_or_transitions(self) -> None:
         """Regenerates the entries or transitions list."""
@@ -4,6 +4,8 @@ from typing import Any, cast
 import bpy
 from bpy.types import Collection, Context, Mesh, MeshVertex, Object, Scene, VertexGroup
 from mathutils import Vector
+from numpy import empty, float32, fromiter, int32
+from numpy.typing import NDArray
 
 from sbstudio.model.types import Coordinate3D
 
@@ -14,9 +16,13 @@ __all__ = (
     "duplicate_object",
     "get_axis_aligned_bounding_box_of_object",
     "get_derived_object_after_applying_modifiers",
+    "get_vertex_coordinates_of_object",
+    "get_vertex_indices_of_object_in_vertex_group",
+    "get_vertex_indices_of_object_in_vertex_group_by_name",
     "get_vertices_of_object",
     "get_vertices_of_object_in_vertex_group",
     "get_vertices_of_object_in_vertex_group_by_name",
+    "invalidate_vertex_group_cache",
     "link_to_scene",
     "object_contains_vertex",
     "remove_objects",
@@ -74,6 +80,86 @@ def get_vertices_of_object(object: Object):
     return getattr(data, "vertices", [])
 
 
+_vertex_group_cache: dict[tuple[int, int, int], NDArray[int32]] = {}
+"""Cache of the indices of the vertices in vertex groups of meshes, keyed by
+the address of the mesh, the index of the vertex group and the number of
+vertices in the mesh. Evaluated (temporary) meshes are never cached. The cache
+is cleared whenever the dependency graph reports that a mesh was updated.
+"""
+
+_EMPTY_INDICES: NDArray[int32] = empty(0, dtype=int32)
+
+
+def invalidate_vertex_group_cache() -> None:
+    """Clears the cached vertex group memberships of all meshes. Must be called
+    whenever the vertex group assignments of a mesh might have changed.
+    """
+    _vertex_group_cache.clear()
+
+
+def get_vertex_indices_of_object_in_vertex_group(
+    object: Object, group: VertexGroup
+) -> NDArray[int32]:
+    """Returns the indices of all the vertices in the given object that are
+    members of the given vertex group, in increasing order.
+
+    Blender provides no bulk accessor for vertex group memberships so they
+    need to be collected vertex by vertex. The result is therefore cached for
+    meshes that are not evaluated (temporary) copies until the next mesh update
+    in the dependency graph. The returned array must not be modified.
+
+    Parameters:
+        object: the object to query
+        group: the vertex group
+    """
+    mesh = object.data if object else None
+    if mesh is None:
+        return _EMPTY_INDICES
+
+    mesh = cast(Mesh, mesh)
+    vertices = mesh.vertices
+    cacheable = not mesh.is_evaluated
+    if cacheable:
+        key = (mesh.as_pointer(), group.index, len(vertices))
+        result = _vertex_group_cache.get(key)
+        if result is not None:
+            return result
+
+    index = group.index
+    result = fromiter(
+        (
+            vertex.index
+            for vertex in vertices
+            if any(g.group == index for g in vertex.groups)
+        ),
+        dtype=int32,
+    )
+    result.flags.writeable = False
+
+    if cacheable:
+        _vertex_group_cache[key] = result
+
+    return result
+
+
+def get_vertex_indices_of_object_in_vertex_group_by_name(
+    object: Object, name: str
+) -> NDArray[int32]:
+    """Returns the indices of all the vertices in the given object that are
+    members of the given vertex group by name.
+
+    Parameters:
+        object: the object to query
+        name: the name of the vertex group
+    """
+    group = object.vertex_groups.get(name)
+    return (
+        get_vertex_indices_of_object_in_vertex_group(object, group)
+        if group
+        else _EMPTY_INDICES
+    )
+
+
 def get_vertices_of_object_in_vertex_group(
     object: Object, group: VertexGroup
 ) -> list[MeshVertex]:
@@ -82,17 +168,14 @@ def get_vertices_of_object_in_vertex_group(
 
     Parameters:
         object: the object to query
-        name: the name of the vertex group
+        group: the vertex group
     """
-    result: list[MeshVertex] = []
-    mesh = object.data if object else None
-    if mesh is not None:
-        mesh = cast(Mesh, mesh)
-        index = group.index
-        for vertex in mesh.vertices:
-            if any(g.group == index for g in vertex.groups):
-                result.append(vertex)
-    return result
+    indices = get_vertex_indices_of_object_in_vertex_group(object, group)
+    if not len(indices):
+        return []
+
+    vertices = cast(Mesh, object.data).vertices
+    return [vertices[index] for index in indices.tolist()]
 
 
 def get_vertices_of_object_in_vertex_group_by_name(
@@ -109,6 +192,18 @@ def get_vertices_of_object_in_vertex_group_by_name(
     return get_vertices_of_object_in_vertex_group(object, group) if group else []
 
 
+def get_vertex_coordinates_of_object(object: Object) -> NDArray[float32]:
+    """Returns the local coordinates of all the vertices of the given object in
+    a NumPy array, one vertex per row, or an empty array if the object is not
+    a mesh.
+    """
+    vertices = get_vertices_of_object(object)
+    result = empty((len(vertices), 3), dtype=float32)
+    if len(result):
+        vertices.foreach_get("co", result.ravel())
+    return result
+
+
 @with_scene
 def link_to_scene(
     object: Object | Collection,
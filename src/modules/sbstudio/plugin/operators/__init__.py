@@ -18,6 +18,7 @@ from .create_takeoff_grid import CreateTakeoffGridOperator
 from .detach_materials_from_template import DetachMaterialsFromDroneTemplateOperator
 from .duplicate_light_effect import DuplicateLightEffectOperator
 from .export_light_effects import ExportLightEffectsOperator
+from .export_to_bundle import SkybrushBundleExportOperator
 from .export_to_csv import SkybrushCSVExportOperator
 from .export_to_dac import DACExportOperator
 from .export_to_ddsf import DDSFExportOperator
@@ -151,6 +152,7 @@ __all__ = (
     "SetServerURLOperator",
     "SetGatewayURLOperator",
     "SetupSceneOperator",
+    "SkybrushBundleExportOperator",
     "SkybrushCSVExportOperator",
     "SkybrushExportOperator",
     "SkybrushPDFExportOperator",
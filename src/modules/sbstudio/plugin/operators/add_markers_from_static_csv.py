@@ -1,12 +1,13 @@
-import csv
 import logging
 
 from bpy.path import ensure_ext
 from bpy.props import BoolProperty, StringProperty
 from bpy_extras.io_utils import ImportHelper
-from numpy import array, zeros
+from numpy import column_stack, full, ones
 from numpy.typing import NDArray
 
+from sbstudio.model.skybrush_csv import parse_skybrush_static_csv
+
 from .base import PointsAndColors, StaticMarkerCreationOperator
 
 __all__ = ("AddMarkersFromStaticCSVOperator",)
@@ -43,14 +44,11 @@ class AddMarkersFromStaticCSVOperator(StaticMarkerCreationOperator, ImportHelper
 
     def _create_points(self, context) -> PointsAndColors:
         filepath = ensure_ext(self.filepath, self.filename_ext)
-        point_color_pairs = parse_static_csv_zip(filepath)
-
-        points = zeros((len(point_color_pairs), 3), dtype=float)
-        colors = zeros((len(point_color_pairs), 4), dtype=float)
+        with open(filepath, "rb") as csv_file:
+            _, table = parse_skybrush_static_csv(csv_file.read(), filename=filepath)
 
-        for index, (p, c) in enumerate(point_color_pairs.values()):
-            points[index, :] = p
-            colors[index, :] = c / 255
+        points = table[:, :3]
+        colors = column_stack((table[:, 3:6] / 255, ones(len(table))))
 
         return PointsAndColors(points, colors)
 
@@ -72,43 +70,9 @@ def parse_static_csv_zip(filename: str) -> dict[str, Item]:
     Raises:
         RuntimeError: on parse errors
     """
-    result: dict[str, Item] = {}
-    header_passed: bool = False
-
-    with open(filename, "r") as csv_file:
-        for row in csv.reader(csv_file, delimiter=","):
-            # skip empty lines
-            if not row:
-                continue
-
-            # skip possible header line (starting with "Name")
-            if not header_passed:
-                header_passed = True
-                if row[0].lower().startswith("name"):
-                    continue
-
-            # parse line and check for errors
-            try:
-                name = row[0]
-                x, y, z = (float(value) for value in row[1:4])
-                if len(row) > 4:
-                    r, g, b = (int(value) for value in row[4:7])
-                else:
-                    r, g, b = 255, 255, 255
-                header_passed = True
-            except Exception:
-                raise RuntimeError(
-                    f"Invalid content in input CSV file {filename!r}, row {row!r}"
-                ) from None
-
-            # check name
-            if name in result:
-                raise RuntimeError(f"Duplicate object name in input CSV file: {name}")
-
-            # store position and color entry
-            result[name] = (
-                array((x, y, z), dtype=float),
-                array((r, g, b, 255), dtype=int),
-            )
-
-    return result
+    with open(filename, "rb") as csv_file:
+        names, table = parse_skybrush_static_csv(csv_file.read(), filename=filename)
+
+    points = table[:, :3]
+    colors = column_stack((table[:, 3:6], full(len(table), 255))).astype(int)
+    return {name: (points[index], colors[index]) for index, name in enumerate(names)}
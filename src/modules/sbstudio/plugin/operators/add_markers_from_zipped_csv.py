@@ -1,5 +1,5 @@
-import csv
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import IO
 from zipfile import ZipFile
@@ -8,9 +8,12 @@ from bpy.path import ensure_ext
 from bpy.props import BoolProperty, StringProperty
 from bpy_extras.io_utils import ImportHelper
 from natsort import natsorted
+from numpy import float64
+from numpy.typing import NDArray
 
 from sbstudio.model.color import Color4D
 from sbstudio.model.point import Point4D
+from sbstudio.model.skybrush_csv import parse_skybrush_csv
 
 from .base import DynamicMarkerCreationOperator, TrajectoryAndLightProgram
 
@@ -18,6 +21,11 @@ __all__ = ("AddMarkersFromZippedCSVOperator", "parse_compressed_csv_zip")
 
 log = logging.getLogger(__name__)
 
+_MAX_WORKERS = 4
+"""Maximum number of worker threads to use for parsing the files in the
+archive.
+"""
+
 #############################################################################
 # Helper functions for the importer
 #############################################################################
@@ -80,56 +88,54 @@ def parse_compressed_csv_zip(
     result: dict[str, TrajectoryAndLightProgram] = {}
 
     with ZipFile(filename, "r") as zip_file:
-        for filename in natsorted(zip_file.namelist()):
-            name = Path(filename).stem
-            if name in result:
-                raise RuntimeError(f"Duplicate object name in input CSV files: {name}")
-
-            data = TrajectoryAndLightProgram()
-            header_passed: bool = False
-
-            timestamps = data.timestamps
-            trajectory = data.trajectory
-            light_program = data.light_program
-
-            with zip_file.open(filename, "r") as csv_file:
-                lines = [line.decode("ascii") for line in csv_file]
-                for row in csv.reader(lines, delimiter=","):
-                    # skip empty lines
-                    if not row:
-                        continue
-                    # skip possible header line (starting with "Time_msec")
-                    if not header_passed:
-                        header_passed = True
-                        first_token = row[0].lower()
-                        if first_token.startswith(
-                            "time_msec"
-                        ) or first_token.startswith("time [msec]"):
-                            continue
-                    # parse line and check for errors
-                    try:
-                        t = float(row[0]) / 1000.0
-                        x, y, z = (float(value) for value in row[1:4])
-                        if len(row) > 4:
-                            r, g, b = (int(value) for value in row[4:7])
-                        else:
-                            r, g, b = 255, 255, 255
-                    except Exception:
-                        raise RuntimeError(
-                            f"Invalid content in input CSV file {filename!r}, row {row!r}"
-                        ) from None
-
-                    # store position and color entry
-                    timestamps.append(t)
-                    trajectory.append(Point4D(t, x, y, z))
-                    light_program.append(Color4D(t, r, g, b))
-
-            if output_fps:
-                trajectory.resample_in_place(output_fps)
-
-            # store the result only if there is at least one point, otherwise
-            # there's nothing we can construct
-            if timestamps:
-                result[name] = data
+        members = natsorted(zip_file.namelist())
+        names = [Path(member).stem for member in members]
+        if len(set(names)) != len(names):
+            seen: set[str] = set()
+            for name in names:
+                if name in seen:
+                    raise RuntimeError(
+                        f"Duplicate object name in input CSV files: {name}"
+                    )
+                seen.add(name)
+
+        def parse(member: str) -> NDArray[float64]:
+            return parse_skybrush_csv(zip_file.read(member), filename=member)
+
+        # Decompress and parse the files in worker threads; the results are
+        # consumed in the original order so errors are reported for the first
+        # invalid file
+        executor = ThreadPoolExecutor(max_workers=_MAX_WORKERS)
+        try:
+            for name, table in zip(names, executor.map(parse, members)):
+                # store the result only if there is at least one point,
+                # otherwise there's nothing we can construct
+                if len(table):
+                    result[name] = _create_trajectory_and_light_program(
+                        table, output_fps
+                    )
+        finally:
+            executor.shutdown(cancel_futures=True)
 
     return result
+
+
+def _create_trajectory_and_light_program(
+    table: NDArray[float64], output_fps: float | None
+) -> TrajectoryAndLightProgram:
+    """Creates a trajectory and a light program from a table of timestamps,
+    coordinates and colors returned by `parse_skybrush_csv()`.
+    """
+    timestamps = table[:, 0].tolist()
+    colors = table[:, 4:7].astype(int).tolist()
+
+    data = TrajectoryAndLightProgram(timestamps=timestamps)
+    data.trajectory.points = [Point4D(*row) for row in table[:, :4].tolist()]
+    data.light_program.colors = [
+        Color4D(t, r, g, b) for t, (r, g, b) in zip(timestamps, colors)
+    ]
+
+    if output_fps:
+        data.trajectory.resample_in_place(output_fps)
+
+    return data
@@ -3,19 +3,21 @@ from __future__ import annotations
 import logging
 import os
 from abc import abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
 import bpy
 from bpy.props import BoolProperty, EnumProperty
-from bpy.types import Collection, Context, FCurve, Operator
+from bpy.types import Collection, Context, FCurve, Operator, Timer
 from bpy_extras.io_utils import ExportHelper
 from numpy import array, floating
 from numpy.typing import NDArray
 
 from sbstudio.api.errors import SkybrushStudioAPIError
+from sbstudio.background_job import BackgroundJob
 from sbstudio.model.file_formats import FileFormat
-from sbstudio.model.light_program import LightProgram
+from sbstudio.model.light_program import LightProgram, rasterize_light_programs
 from sbstudio.model.point import Point3D
 from sbstudio.model.trajectory import Trajectory
 from sbstudio.model.types import Coordinate3D
@@ -24,8 +26,10 @@ from sbstudio.plugin.actions import (
     ensure_f_curve_exists_for_data_path_and_index,
 )
 from sbstudio.plugin.errors import StoryboardValidationError
+from sbstudio.plugin.keyframes import add_keyframes_in_bulk
 from sbstudio.plugin.model.drone_groups import DroneGroupsProperties, get_drone_groups
 from sbstudio.plugin.model.formation import (
+    add_point_cloud_to_formation,
     add_points_to_formation,
     get_markers_from_formation,
 )
@@ -36,6 +40,11 @@ from sbstudio.plugin.selection import Collections, select_only
 
 log = logging.getLogger(__name__)
 
+_EXPORT_TIME_SLICE = 0.05
+"""Length of the time slices in which exporter operators sample the scene
+while keeping the user interface responsive, in seconds.
+"""
+
 
 class FormationOperator(Operator):
     """Operator mixin that allows an operator to be executed if we have a
@@ -215,10 +224,35 @@ class ExportOperator(Operator, ExportHelper):
         description="Whether to redraw the scene during export after every frame",
     )
 
+    # whether to keep the user interface responsive during the export. Set
+    # when the operator is invoked from the user interface; exports started
+    # from scripts finish before the operator returns unless it is set
+    run_in_background = BoolProperty(
+        name="Run in background",
+        default=False,
+        description=(
+            "Keep the user interface responsive while the show is being "
+            "exported. The operator returns before the output file is written"
+        ),
+        options={"HIDDEN", "SKIP_SAVE"},
+    )
+
+    _job: BackgroundJob[None] | None = None
+    """The export job while the operator is running in modal mode."""
+
+    _timer: Timer | None = None
+    """Timer that drives the export job while the operator is running in modal
+    mode.
+    """
+
     def execute(self, context: Context):
-        from sbstudio.plugin.api import call_api_from_blender_operator
+        from sbstudio.model.local_rendering import is_rendered_locally
+        from sbstudio.plugin.api import (
+            get_api,
+            report_api_errors_to_blender_operator,
+        )
 
-        from .utils import export_show_to_file_using_api
+        from .utils import iter_export_show_to_file_using_api
 
         filepath = bpy.path.ensure_ext(self.filepath, self.filename_ext)
 
@@ -233,16 +267,101 @@ class ExportOperator(Operator, ExportHelper):
             **self.get_settings(),
         }
 
+        formats = self.get_formats()
+
         try:
-            with call_api_from_blender_operator(self, self.get_operator_name()) as api:
-                export_show_to_file_using_api(
-                    api, context, settings, filepath, self.get_format()
+            with report_api_errors_to_blender_operator(self, self.get_operator_name()):
+                # No need to access the server (or to have online access at
+                # all) if the show is rendered locally
+                api = None if is_rendered_locally(formats, settings) else get_api()
+
+                # bpy.context is passed instead of context because the job
+                # may outlive the current operator invocation
+                job = BackgroundJob(
+                    iter_export_show_to_file_using_api(
+                        api,
+                        bpy.context,
+                        settings,
+                        filepath,
+                        formats,
+                        on_progress=lambda report: job.handle_progress(report),
+                    )
                 )
+                if (
+                    not self.run_in_background
+                    or bpy.app.background
+                    or context.window is None
+                ):
+                    # Called from a script or no user interface to keep
+                    # responsive
+                    job.run()
+                    self.report({"INFO"}, "Export successful")
+                    return {"FINISHED"}
         except Exception:
             return {"CANCELLED"}
 
-        self.report({"INFO"}, "Export successful")
-        return {"FINISHED"}
+        wm = context.window_manager
+        self._job = job
+        self._timer = wm.event_timer_add(_EXPORT_TIME_SLICE, window=context.window)
+        wm.modal_handler_add(self)
+        wm.progress_begin(0, 100)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context: Context, event):
+        from sbstudio.plugin.api import report_api_errors_to_blender_operator
+
+        job = self._job
+        if job is None:
+            return {"CANCELLED"}
+
+        if event.type == "ESC" and not job.cancelled:
+            job.cancel()
+            if not job.running_in_background:
+                self._finish_modal(context)
+                self.report({"WARNING"}, "Export cancelled")
+                return {"CANCELLED"}
+
+            # The worker thread stops at its next progress report. Keep
+            # running until then so its outcome is reported and not lost
+            context.workspace.status_text_set("Cancelling export...")
+            return {"RUNNING_MODAL"}
+
+        if event.type != "TIMER":
+            # Block user interaction while the scene is being sampled, but
+            # let Blender handle events when the job runs in the background
+            return {"PASS_THROUGH"} if job.running_in_background else {"RUNNING_MODAL"}
+
+        try:
+            with report_api_errors_to_blender_operator(self, self.get_operator_name()):
+                finished = job.step(_EXPORT_TIME_SLICE)
+                if finished:
+                    job.result()
+        except Exception:
+            self._finish_modal(context)
+            return {"CANCELLED"}
+
+        if finished:
+            self._finish_modal(context)
+            self.report({"INFO"}, "Export successful")
+            return {"FINISHED"}
+
+        progress = job.progress
+        if progress is not None and not job.cancelled:
+            if progress.percentage is not None:
+                context.window_manager.progress_update(progress.percentage)
+            context.workspace.status_text_set(progress.format())
+
+        return {"RUNNING_MODAL"}
+
+    def _finish_modal(self, context: Context) -> None:
+        """Cleans up after the operator finished running in modal mode."""
+        wm = context.window_manager
+        if self._timer is not None:
+            wm.event_timer_remove(self._timer)
+            self._timer = None
+        wm.progress_end()
+        context.workspace.status_text_set(None)
+        self._job = None
 
     def get_format(self) -> FileFormat:
         """Returns the file format that the operator uses. Must be overridden
@@ -250,6 +369,13 @@ class ExportOperator(Operator, ExportHelper):
         """
         raise NotImplementedError
 
+    def get_formats(self) -> FileFormat | Sequence[FileFormat]:
+        """Returns the file format that the operator exports into, or a list of
+        formats to export into a single ZIP bundle with a single request. The
+        default implementation returns the format returned by `get_format()`.
+        """
+        return self.get_format()
+
     def get_operator_name(self) -> str:
         """Returns the name of the operator to be used in error messages when
         the operation fails.
@@ -271,6 +397,7 @@ class ExportOperator(Operator, ExportHelper):
             filepath, _ = os.path.splitext(filepath)
             self.filepath = f"{filepath}{self.filename_ext}"
 
+        self.run_in_background = True
         context.window_manager.fileselect_add(self)
         return {"RUNNING_MODAL"}
 
@@ -368,24 +495,20 @@ class DynamicMarkerCreationOperator(FormationOperator):
                 )
                 f_curves.append(f_curve)
 
-            # add keypoints to f-curves in low level mode
+            # add keypoints to f-curves in bulk
             t0 = trajectory.points[0].t
-            frames = [frame_start + round((p.t - t0) * fps) for p in trajectory.points]
-            values_x = [p.x for p in trajectory.points]
-            values_y = [p.y for p in trajectory.points]
-            values_z = [p.z for p in trajectory.points]
-            for f_curve, values in zip(f_curves, [values_x, values_y, values_z]):
-                f_curve.keyframe_points.add(len(frames))
-                for i, (frame, value) in enumerate(zip(frames, values)):
-                    kp = f_curve.keyframe_points[i]
-                    kp.co = (frame, value)
-                    kp.interpolation = "LINEAR"
-                    kp.handle_left_type = "AUTO_CLAMPED"
-                    kp.handle_right_type = "AUTO_CLAMPED"
-
-            # Commit the insertions that we've made in low level mode
-            for f_curve in f_curves:
-                f_curve.update()
+            points = array(
+                [(p.t, p.x, p.y, p.z) for p in trajectory.points], dtype=float
+            )
+            frames = frame_start + ((points[:, 0] - t0) * fps).round()
+            for axis, f_curve in enumerate(f_curves):
+                add_keyframes_in_bulk(
+                    f_curve,
+                    frames,
+                    points[:, axis + 1],
+                    interpolation="LINEAR",
+                    handle_type="AUTO_CLAMPED",
+                )
 
         # store light program as a light effect with color image
         log.info("Creating light effects...")
@@ -418,21 +541,8 @@ class DynamicMarkerCreationOperator(FormationOperator):
                 width=duration,
                 height=len(light_programs),
             )
-            pixels = []
-            for light_program in light_programs:
-                color = light_program.colors[0]
-                t0 = color.t
-                j_last = 0
-                for next_color in light_program.colors[1:]:
-                    j_next = round((next_color.t - t0) * fps)
-                    pixels.extend(list(color.as_vector()) * (j_next - j_last))
-                    j_last = j_next
-                    color = next_color
-                if j_next < duration:
-                    pixels.extend(list(color.as_vector()))
-                else:
-                    pixels[-4:] = list(color.as_vector())
-            image.pixels.foreach_set(pixels)
+            pixels = rasterize_light_programs(light_programs, fps, duration)
+            image.pixels.foreach_set(pixels.ravel())
             image.pack()
 
         if not trajectories_and_lights:
@@ -469,6 +579,16 @@ class StaticMarkerCreationOperator(FormationOperator):
     optionally extended with a list of colors corresponding to the points.
     """
 
+    point_cloud = BoolProperty(
+        name="Single mesh",
+        description=(
+            "Store the markers as the vertices of a single mesh instead of "
+            "creating a separate object for each marker. Recommended for large "
+            "formations"
+        ),
+        default=False,
+    )
+
     def execute_on_formation(self, formation: Collection | None, context: Context):
         assert formation is not None
         # Construct the point set
@@ -496,7 +616,10 @@ class StaticMarkerCreationOperator(FormationOperator):
         points += array(context.scene.cursor.location, dtype=float)
 
         # Create the markers
-        add_points_to_formation(formation, points.tolist())
+        if self.point_cloud:
+            add_point_cloud_to_formation(formation, points)
+        else:
+            add_points_to_formation(formation, points.tolist())
 
         # Decide whether we should import the colors of the markers as well
         should_import_colors = (
@@ -10,7 +10,11 @@ from sbstudio.plugin.materials import (
     detach_pyro_material_from_drone_template,
     get_material_for_pyro,
 )
-from sbstudio.plugin.model.formation import add_points_to_formation, create_formation
+from sbstudio.plugin.model.formation import (
+    add_point_cloud_to_formation,
+    add_points_to_formation,
+    create_formation,
+)
 from sbstudio.plugin.model.storyboard import StoryboardEntryPurpose, get_storyboard
 from sbstudio.plugin.selection import select_only
 from sbstudio.plugin.utils import propose_names
@@ -282,6 +286,16 @@ class CreateTakeoffGridOperator(Operator):
         unit="LENGTH",
     )
 
+    point_cloud = BoolProperty(
+        name="Single mesh",
+        description=(
+            "Store the points of the takeoff grid as the vertices of a single "
+            "mesh instead of creating a separate object for each point. "
+            "Recommended for large grids"
+        ),
+        default=False,
+    )
+
     def draw(self, context):
         layout = self.layout
         layout.use_property_split = True
@@ -305,6 +319,7 @@ class CreateTakeoffGridOperator(Operator):
             layout.prop(self, "drones_per_slot_col")
             layout.prop(self, "intra_slot_spacing_row")
             layout.prop(self, "intra_slot_spacing_col")
+            layout.prop(self, "point_cloud")
 
     def execute(self, context):
         # This code path is invoked after an undo-redo
@@ -383,7 +398,9 @@ class CreateTakeoffGridOperator(Operator):
         if not takeoff_grid:
             storyboard = get_storyboard(context=context)
             entry = storyboard.add_new_entry(
-                formation=create_formation(Formations.TAKEOFF_GRID, points),
+                formation=create_formation(
+                    Formations.TAKEOFF_GRID, points, point_cloud=self.point_cloud
+                ),
                 frame_start=context.scene.frame_start,
                 duration=0,
                 purpose=StoryboardEntryPurpose.TAKEOFF,
@@ -392,5 +409,7 @@ class CreateTakeoffGridOperator(Operator):
             )
             entry.update_mapping(list(range(len(points))))
 
+        elif self.point_cloud:
+            add_point_cloud_to_formation(takeoff_grid, points)
         else:
             add_points_to_formation(takeoff_grid, points)
@@ -0,0 +1,252 @@
+from collections.abc import Sequence
+from typing import Any
+
+from bpy.props import (
+    BoolProperty,
+    EnumProperty,
+    FloatProperty,
+    IntProperty,
+    StringProperty,
+)
+from bpy.types import Context
+
+from sbstudio.model.file_formats import FileFormat, get_supported_file_formats
+
+from .base import ExportOperator
+from .utils import get_show_location
+
+__all__ = ("SkybrushBundleExportOperator",)
+
+
+_FORMAT_PROPERTIES: dict[FileFormat, str] = {
+    FileFormat.SKYC: "export_skyc",
+    FileFormat.PDF: "export_pdf",
+    FileFormat.CSV: "export_csv",
+    FileFormat.DAC: "export_dac",
+    FileFormat.DROTEK: "export_drotek",
+    FileFormat.DSS: "export_dss",
+    FileFormat.DSS3: "export_dss3",
+    FileFormat.EVSKY: "export_evsky",
+    FileFormat.LITEBEE: "export_litebee",
+    FileFormat.VVIZ: "export_vviz",
+    FileFormat.FINALE_CSV: "export_finale_csv",
+    FileFormat.DDSF: "export_ddsf",
+    FileFormat.KMZ: "export_kmz",
+}
+"""Mapping from the formats that can be included in an export bundle to the
+names of the properties of the operator that enable them.
+"""
+
+
+#############################################################################
+# Operator that allows the user to export the show into multiple formats in
+# a single request
+#############################################################################
+
+
+class SkybrushBundleExportOperator(ExportOperator):
+    """Export object trajectories and light animation into multiple formats at
+    once, reusing the samples of the show across the formats where possible.
+    """
+
+    bl_idname = "export_scene.skybrush_bundle"
+    bl_label = "Export Bundle"
+    bl_options = {"REGISTER"}
+
+    # List of file extensions that correspond to the zipped bundles
+    filter_glob = StringProperty(default="*.zip", options={"HIDDEN"})
+    filename_ext = ".zip"
+
+    ##################################################
+    # formats to include in the bundle
+
+    export_skyc = BoolProperty(name="Skybrush .skyc", default=True)
+    export_pdf = BoolProperty(name="Validation report .pdf", default=True)
+    export_csv = BoolProperty(name="Skybrush .csv", default=False)
+    export_dac = BoolProperty(name="HG .dac", default=False)
+    export_drotek = BoolProperty(name="Drotek .json", default=False)
+    export_dss = BoolProperty(name="DSS .path", default=False)
+    export_dss3 = BoolProperty(name="DSS .path3", default=False)
+    export_evsky = BoolProperty(name="EVSKY .essp", default=False)
+    export_litebee = BoolProperty(name="Litebee .bin", default=False)
+    export_vviz = BoolProperty(name="Finale 3D .vviz", default=False)
+    export_finale_csv = BoolProperty(name="Finale 3D .csv", default=False)
+    export_ddsf = BoolProperty(name="Depence .ddsf", default=False)
+    export_kmz = BoolProperty(name="Google Earth .kmz", default=False)
+
+    ##################################################
+    # settings shared by all the formats
+
+    output_fps = IntProperty(
+        name="Trajectory FPS",
+        default=4,
+        description="Number of samples to take from trajectories per second",
+    )
+
+    light_output_fps = IntProperty(
+        name="Light FPS",
+        default=4,
+        description="Number of samples to take from light programs per second",
+    )
+
+    use_pyro_control = BoolProperty(
+        name="Export pyro (PRO)",
+        description="Specifies whether the pyro program of each drone should be included in the show",
+        default=False,
+    )
+
+    use_yaw_control = BoolProperty(
+        name="Export yaw (PRO)",
+        description="Specifies whether the yaw angle of each drone should be controlled during the show",
+        default=False,
+    )
+
+    export_audio = BoolProperty(
+        name="Export audio",
+        description="Specifies whether a single audio file in the VSE should be exported into the show file",
+        default=False,
+    )
+
+    export_cameras = BoolProperty(
+        name="Export cameras",
+        description="Specifies whether cameras defined in Blender should be exported into the show file",
+        default=False,
+    )
+
+    extract_bundle = BoolProperty(
+        name="Extract files",
+        description=(
+            "Extract the exported files into a folder next to the bundle, "
+            "named after the bundle"
+        ),
+        default=True,
+    )
+
+    ##################################################
+    # format-specific settings
+
+    drone_model = EnumProperty(
+        name="Drone model",
+        description="List of supported High Great drone models",
+        items=[
+            ("FYLO", "Fylo", "High Great Fylo indoor drone"),
+            ("EMO", "Emo", "High Great EMO outdoor drone"),
+        ],
+        default="FYLO",
+    )
+
+    gcs_type = EnumProperty(
+        name="GCS type",
+        description="List of GCS software used with High Great drone models",
+        items=[
+            ("BEEDANCE", "Beedance", "BeeDance - for indoor Fylo drones"),
+            ("FLYDANCE", "Flydance", "FlyDance - for outdoor EMO drones"),
+            ("ZEROSPACE", "Zerospace", "ZeroSpace - for outdoor EMO drones"),
+        ],
+        default="BEEDANCE",
+    )
+
+    kmz_export_mode = EnumProperty(
+        name="KMZ export mode",
+        description="List of supported export modes",
+        items=[
+            ("POINT", "Point", "Visualize drone objects as points"),
+            (
+                "TRAJECTORY",
+                "Trajectory",
+                "Visualize drone objects and their trajectories",
+            ),
+        ],
+        default="TRAJECTORY",
+    )
+
+    time_offset = FloatProperty(
+        name="VVIZ time offset",
+        default=0,
+        description="Time offset to add to the output relative to Finale 3D time, in seconds",
+    )
+
+    def draw(self, context):
+        layout = self.layout
+        layout.use_property_split = True
+
+        layout.prop(self, "export_selected")
+        layout.prop(self, "frame_range")
+        layout.prop(self, "redraw")
+        layout.prop(self, "output_fps")
+        layout.prop(self, "light_output_fps")
+        layout.prop(self, "extract_bundle")
+
+        column = layout.column(align=True)
+        column.label(text="Formats:")
+        for format in self._get_available_formats():
+            column.prop(self, _FORMAT_PROPERTIES[format])
+
+        column = layout.column(align=True)
+        column.label(text="Export features:")
+        column.prop(self, "export_audio")
+        column.prop(self, "export_cameras")
+        column.prop(self, "use_pyro_control")
+        column.prop(self, "use_yaw_control")
+
+        formats = self.get_formats()
+        if FileFormat.DAC in formats:
+            column = layout.column(align=True)
+            column.label(text="HG .dac export:")
+            column.prop(self, "drone_model")
+            column.prop(self, "gcs_type")
+        if FileFormat.KMZ in formats:
+            layout.prop(self, "kmz_export_mode")
+        if FileFormat.VVIZ in formats:
+            layout.prop(self, "time_offset")
+
+    def execute(self, context: Context):
+        formats = self.get_formats()
+        if not formats:
+            self.report({"ERROR_INVALID_INPUT"}, "Select at least one format")
+            return {"CANCELLED"}
+
+        if FileFormat.KMZ in formats and get_show_location(context) is None:
+            self.report(
+                {"ERROR_INVALID_INPUT"},
+                "Google Earth KMZ exporter requires a valid show location",
+            )
+            return {"CANCELLED"}
+
+        return super().execute(context)
+
+    def get_format(self) -> FileFormat:
+        raise RuntimeError("Bundle exporter uses multiple formats")
+
+    def get_formats(self) -> Sequence[FileFormat]:
+        return [
+            format
+            for format in self._get_available_formats()
+            if getattr(self, _FORMAT_PROPERTIES[format])
+        ]
+
+    def get_operator_name(self) -> str:
+        return "bundle exporter"
+
+    def get_settings(self) -> dict[str, Any]:
+        return {
+            "output_fps": self.output_fps,
+            "light_output_fps": self.light_output_fps,
+            "use_pyro_control": self.use_pyro_control,
+            "use_yaw_control": self.use_yaw_control,
+            "export_audio": self.export_audio,
+            "export_cameras": self.export_cameras,
+            "extract_bundle": self.extract_bundle,
+            "drone_model": self.drone_model.lower(),
+            "gcs_type": self.gcs_type.lower(),
+            "export_mode": self.kmz_export_mode,
+            "time_offset": self.time_offset,
+        }
+
+    @staticmethod
+    def _get_available_formats() -> list[FileFormat]:
+        """Returns the formats that can be included in the bundle with the
+        current server, in the order they are shown to the user.
+        """
+        supported = get_supported_file_formats()
+        return [format for format in _FORMAT_PROPERTIES if format in supported]
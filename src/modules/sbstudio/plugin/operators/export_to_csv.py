@@ -11,7 +11,7 @@ post-processing.
 
 from typing import Any
 
-from bpy.props import FloatProperty, StringProperty
+from bpy.props import BoolProperty, FloatProperty, StringProperty
 
 from sbstudio.model.file_formats import FileFormat
 
@@ -43,6 +43,15 @@ class SkybrushCSVExportOperator(ExportOperator):
         description="Number of samples to take from trajectories and lights per second",
     )
 
+    render_locally = BoolProperty(
+        name="Render locally",
+        default=False,
+        description=(
+            "Render the output on this computer instead of the Skybrush Studio "
+            "server. Does not need a connection to the server"
+        ),
+    )
+
     def get_format(self) -> FileFormat:
         return FileFormat.CSV
 
@@ -53,4 +62,5 @@ class SkybrushCSVExportOperator(ExportOperator):
         return {
             "output_fps": self.output_fps,
             "light_output_fps": self.output_fps,
+            "render_locally": self.render_locally,
         }
@@ -2,7 +2,7 @@ from typing import Any
 
 from bpy.props import EnumProperty, StringProperty
 
-from sbstudio.model.file_formats import FileFormat
+from sbstudio.model.file_formats import FIXED_FRAME_RATES, FileFormat
 
 from .base import ExportOperator
 
@@ -54,8 +54,8 @@ class DACExportOperator(ExportOperator):
 
     def get_settings(self) -> dict[str, Any]:
         return {
-            "output_fps": 30,
-            "light_output_fps": 30,
+            "output_fps": FIXED_FRAME_RATES[FileFormat.DAC],
+            "light_output_fps": FIXED_FRAME_RATES[FileFormat.DAC],
             "drone_model": self.drone_model.lower(),
             "gcs_type": self.gcs_type.lower(),
         }
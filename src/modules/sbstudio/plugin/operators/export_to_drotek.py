@@ -2,7 +2,7 @@ from typing import Any
 
 from bpy.props import BoolProperty, FloatProperty, StringProperty
 
-from sbstudio.model.file_formats import FileFormat
+from sbstudio.model.file_formats import FIXED_FRAME_RATES, FileFormat
 
 from .base import ExportOperator
 
@@ -48,7 +48,7 @@ class DrotekExportOperator(ExportOperator):
     def get_settings(self) -> dict[str, Any]:
         return {
             "spacing": self.spacing,
-            "output_fps": 5,
-            "light_output_fps": 5,
+            "output_fps": FIXED_FRAME_RATES[FileFormat.DROTEK],
+            "light_output_fps": FIXED_FRAME_RATES[FileFormat.DROTEK],
             "use_rgbw": self.use_rgbw,
         }
@@ -3,7 +3,7 @@ animation to a Google Earth KMZ file."""
 
 from typing import Any
 
-from bpy.props import EnumProperty, FloatProperty, StringProperty
+from bpy.props import BoolProperty, EnumProperty, FloatProperty, StringProperty
 from bpy.types import Context
 
 from sbstudio.model.file_formats import FileFormat
@@ -51,6 +51,15 @@ class KMZExportOperator(ExportOperator):
         default="TRAJECTORY",
     )
 
+    render_locally = BoolProperty(
+        name="Render locally",
+        default=False,
+        description=(
+            "Render the output on this computer instead of the Skybrush Studio "
+            "server. Does not need a connection to the server"
+        ),
+    )
+
     def execute(self, context: Context):
         if get_show_location(context) is None:
             self.report(
@@ -72,6 +81,7 @@ class KMZExportOperator(ExportOperator):
             "output_fps": self.output_fps,
             "light_output_fps": self.output_fps,
             "export_mode": self.export_mode,
+            "render_locally": self.render_locally,
         }
 
     def invoke(self, context: Context, event):
@@ -1,29 +1,45 @@
-from collections.abc import Callable, Iterable, Sequence
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from enum import Enum
-from functools import partial
-from math import inf
+from hashlib import blake2b
 from typing import cast
 
 import bpy
 from bpy.props import EnumProperty
-from bpy.types import Collection, Mesh, MeshVertex, Object
+from bpy.types import Collection, Mesh, Object
+from numpy import float32
 
+from sbstudio.api import SkybrushStudioAPI
 from sbstudio.api.errors import SkybrushStudioAPIError
 from sbstudio.api.types import Mapping
 from sbstudio.errors import SkybrushStudioError
+from sbstudio.model.influence_curves import (
+    InfluenceCurveDescriptor,
+    InfluenceCurveKeyframes,
+    InfluenceCurveTransitionType,
+    plan_influence_curves,
+)
+from sbstudio.model.types import Coordinate3D
 from sbstudio.plugin.actions import (
     cleanup_actions_for_object,
     ensure_animation_data_exists_for_object,
+    ensure_f_curve_exists_for_data_path_and_index,
 )
 from sbstudio.plugin.api import call_api_from_blender_operator, get_api
 from sbstudio.plugin.constants import Collections
-from sbstudio.plugin.keyframes import set_keyframes, update_fcurves
+from sbstudio.plugin.keyframes import add_keyframes_in_bulk, remove_keyframes_in_range
 from sbstudio.plugin.model.formation import (
+    ResolvedFormation,
     get_markers_and_related_objects_from_formation,
     get_world_coordinates_of_markers_from_formation,
+    resolve_formation,
 )
 from sbstudio.plugin.model.storyboard import Storyboard, StoryboardEntry
+from sbstudio.plugin.objects import get_vertex_indices_of_object_in_vertex_group
 from sbstudio.plugin.tasks.safety_check import invalidate_caches
 from sbstudio.plugin.utils import create_internal_id
 from sbstudio.plugin.utils.evaluator import create_position_evaluator
@@ -32,157 +48,53 @@ from sbstudio.plugin.utils.transition import (
     find_transition_constraint_between,
     set_constraint_name_from_storyboard_entry,
 )
-from sbstudio.utils import constant
+from sbstudio.utils import PhaseTimer, constant
 
 from .base import StoryboardOperator
 
 __all__ = ("RecalculateTransitionsOperator",)
 
-
-class InfluenceCurveTransitionType(Enum):
-    """Possible types of a transition phase of an influence curve."""
-
-    LINEAR = "linear"
-    SMOOTH_FROM_LEFT = "smoothFromLeft"
-    SMOOTH_FROM_RIGHT = "smoothFromRight"
-    SMOOTH = "smooth"
-
-    @classmethod
-    def from_enum_property(cls, value: str):
-        """Create an influence curve transition type from its
-        representation as a Blender EnumProperty."""
-        parts = value.lower().split("_")
-        return cls(parts[0] + "".join(p.capitalize() for p in parts[1:]))
+log = logging.getLogger(__name__)
 
 
-@dataclass
-class InfluenceCurveDescriptor:
-    """Dataclass that describes how the influence curve of a constraint should
-    look like.
-
-    We currently work with one type of influence curve at the moment. The curve
-    starts from zero at the start of the scene, stays zero until (and including)
-    a _windup start frame_, then transitions to 1 until (and including) a
-    _start frame_. The transition can be linear, smooth from the left,
-    smooth from the right or completely smooth. The curve will then either stay
-    1 indefinitely, or stay 1 until a designated _end frame_.
-
-    The key points of the influence curve are described by this data class. It
-    also provides a method to apply these points to an existing constraint.
-    """
-
-    scene_start_frame: int
-    """The start frame of the entire scene."""
+def write_influence_curves(
+    items: Sequence[tuple[Object, str, InfluenceCurveDescriptor]],
+) -> None:
+    """Writes the influence curves described by the given descriptors to the
+    F-curves of the given objects in bulk.
 
-    windup_start_frame: int | None
-    """The windup start frame, i.e. the _last_ frame when the influence curve
-    should still be zero before winding up to full influence. `None` means that
-    it is the same as the start frame of the scene.
+    The keyframes of all the curves are computed in one go. For each curve, the
+    existing keyframes from the first new keyframe onwards are removed and the
+    new keyframes are appended with `foreach_set()`.
 
-    When this frame is earlier than the start frame of the scene, it is assumed
-    to be equal to the start frame of the scene.
-    """
-
-    start_frame: int
-    """The first frame when the influence should become equal to 1. Must be
-    larger than the windup start frame; when it is smaller or equal, it is
-    assumed to be one larger than the windup start frame.
+    Parameters:
+        items: the objects, data paths and influence curve descriptors to write
     """
+    if not items:
+        return
 
-    end_frame: int | None = None
-    """The last frame when the influence is still equal to 1; ``None`` means
-    that the influence curve stays 1 infinitely.
-
-    The end frame must be larger than or equal to the start frame; when it is
-    smaller, it is assumed to be equal to the start frame.
-    """
+    keyframes = InfluenceCurveKeyframes.from_descriptors(
+        [descriptor for _, _, descriptor in items]
+    )
 
-    windup_type: InfluenceCurveTransitionType = InfluenceCurveTransitionType.SMOOTH
-    """The type of the windup transition that defines its velocity profile."""
+    for row, (object, data_path, _) in enumerate(items):
+        mask = keyframes.mask[row]
+        frames = keyframes.frames[row, mask]
 
-    def __init__(
-        self,
-        scene_start_frame: int,
-        windup_start_frame: int | None,
-        start_frame: int,
-        end_frame: int | None = None,
-        windup_type: InfluenceCurveTransitionType = InfluenceCurveTransitionType.SMOOTH,
-    ):
-        # Note that explicit __init__() method implementation is needed to
-        # ensure that int type arguments are truly ints
-        self.scene_start_frame = round(scene_start_frame)
-        self.windup_start_frame = (
-            None if windup_start_frame is None else round(windup_start_frame)
+        ensure_animation_data_exists_for_object(object)
+        fcurve = ensure_f_curve_exists_for_data_path_and_index(
+            object, data_path=data_path, index=0
         )
-        self.start_frame = round(start_frame)
-        self.end_frame = None if end_frame is None else round(end_frame)
-        self.windup_type = windup_type
-
-    def apply(self, object, data_path: str) -> None:
-        """Applies the influence curve descriptor to the given data path of the
-        given Blender object by updating the keyframes appropriately.
-
-        Parameters:
-            object: the object on which the keyframes are to be set
-            data_path: the data path to use
-        """
-        # Special case: if the start frame is the start of the scene, it means
-        # that this is the first transition in the timeline. In this case we
-        # need to start with an influence of 1 to ensure that the drone do not
-        # jump around in the first frame of the show if their associated
-        # takeoff marker is at a different position from the position of the
-        # drone itself
-
-        is_first = self.scene_start_frame == self.start_frame
-        keyframes: list[tuple[int, float]] = [
-            (self.scene_start_frame - (1 if is_first else 0), 0.0)
-        ]
-
-        # Hold current influence value until the start of the windup
-        if (
-            not is_first
-            and self.windup_start_frame is not None
-            and self.windup_start_frame > self.scene_start_frame
-        ):
-            keyframes.append((self.windup_start_frame, keyframes[-1][1]))
-
-        # Ramp up to 1 at the start frame
-        frame = max(self.start_frame, keyframes[-1][0] + 1)
-        start_of_transition = len(keyframes) - 1
-        keyframes.append((frame, 1.0))
-        end_of_transition = len(keyframes) - 1
-
-        # Add a keyframe at the end frame
-        if self.end_frame is not None:
-            end_frame = max(self.end_frame, frame)
-            if end_frame > frame:
-                keyframes.append((end_frame, 1.0))
-
-            # Do not wind the constraint down to zero after the end frame; it
-            # makes it harder to remove storyboard entries from the middle of
-            # the storyboard as the end frame of the previous constraint would
-            # have to be adjusted
-            # keyframes.append((end_frame + 1, 0.0))
-
-        keyframe_objs = set_keyframes(
-            object,
-            data_path,
-            keyframes,
-            clear_range=(None, inf),
-            interpolation="LINEAR",
+        remove_keyframes_in_range(fcurve, float(frames[0]), None)
+        add_keyframes_in_bulk(
+            fcurve,
+            frames,
+            keyframes.values[row, mask],
+            interpolation=keyframes.interpolations[row, mask].tolist(),
+            handle_left_type=keyframes.handle_left_types[row, mask].tolist(),
+            handle_right_type=keyframes.handle_right_types[row, mask].tolist(),
         )
 
-        if self.windup_type != InfluenceCurveTransitionType.LINEAR:
-            kf_start = keyframe_objs[start_of_transition]
-            kf_start.interpolation = "BEZIER"
-            if self.windup_type == InfluenceCurveTransitionType.SMOOTH_FROM_RIGHT:
-                kf_start.handle_right_type = "VECTOR"
-                update_fcurves(object, data_path)
-            if self.windup_type == InfluenceCurveTransitionType.SMOOTH_FROM_LEFT:
-                kf_end = keyframe_objs[end_of_transition]
-                kf_end.handle_left_type = "VECTOR"
-                update_fcurves(object, data_path)
-
 
 class _LazyFormationTargetList:
     """Helper object that takes a reference to a storyboard entry, and provides
@@ -194,33 +106,19 @@ class _LazyFormationTargetList:
     _formation: Collection | None = None
     """The formation of the storyboard entry."""
 
-    _items: list[Object | MeshVertex] | None = None
+    _resolved: ResolvedFormation | None = None
 
     def __init__(self, entry: StoryboardEntry | None):
         self._formation = entry.formation if entry else None
 
     def find(self, item, *, default: int = 0) -> int:
-        if item is None:
+        if item is None or self._formation is None:
             return default
 
-        if self._items is None:
-            self._items = self._validate_items()
+        if self._resolved is None:
+            self._resolved = resolve_formation(self._formation)
 
-        try:
-            return self._items.index(item)
-        except ValueError:
-            return default
-
-    def _validate_items(self) -> list[Object | MeshVertex]:
-        if self._formation is None:
-            return []
-        else:
-            return [
-                v
-                for v, _ in get_markers_and_related_objects_from_formation(
-                    self._formation
-                )
-            ]
+        return self._resolved.find(item, default=default)
 
 
 def get_coordinates_of_formation(formation, *, frame: int) -> list[tuple[float, ...]]:
@@ -394,13 +292,15 @@ def calculate_departure_index_of_drone(
         if vertex_index is not None:
             previous_target = previous_mesh.vertices[vertex_index]
         else:
-            for vertex in previous_mesh.vertices:
-                try:
-                    if vertex_group.weight(vertex.index) > 0:
-                        previous_target = vertex
-                        break
-                except Exception:
-                    pass
+            # Look for the first vertex with a positive weight among the
+            # members of the vertex group
+            indices = get_vertex_indices_of_object_in_vertex_group(
+                previous_obj, vertex_group
+            )
+            for index in indices.tolist():
+                if vertex_group.weight(index) > 0:
+                    previous_target = previous_mesh.vertices[index]
+                    break
             else:
                 # No vertex in the group; something is wrong
                 return 0
@@ -485,27 +385,11 @@ def update_transition_constraint_properties(drone, entry: StoryboardEntry, marke
     return constraint
 
 
-def update_transition_constraint_influence(
-    drone, constraint, descriptor: InfluenceCurveDescriptor
-) -> None:
-    """Updates the F-curve of the influence parameter of the constraint that
-    attaches a given drone to the formation of a given storyboard entry.
-
-    Parameters:
-        drone: the drone that the transition constraint affects
-        constraint: the transition constraint
-        descriptor: the descriptor that describes how the influence F-curve
-            should look like
+def get_influence_data_path_of_constraint(constraint) -> str:
+    """Returns the data path of the influence parameter of the given
+    constraint, relative to the object that owns the constraint.
     """
-    # Construct the data path of the constraint we are going to
-    # modify
-    key = f"constraints[{constraint.name!r}].influence".replace("'", '"')
-
-    # Create keyframes for the influence of the constraint
-    ensure_animation_data_exists_for_object(drone)
-
-    # Apply the influence curve to the drone
-    descriptor.apply(drone, key)
+    return f"constraints[{constraint.name!r}].influence".replace("'", '"')
 
 
 def update_transition_for_storyboard_entry(
@@ -518,10 +402,17 @@ def update_transition_for_storyboard_entry(
     previous_mapping: Mapping | None,
     start_of_scene: int,
     start_of_next: int | None,
+    prefetcher: MappingPrefetcher | None = None,
+    phase_totals: PhaseTimer | None = None,
 ) -> Mapping | None:
     """Updates the transition constraints corresponding to the given
     storyboard entry.
 
+    The time spent in the mapping, constraint setup and curve write phases of
+    the transition is logged when the transition is done. Cleanup is not part
+    of a single transition; it runs once after all the transitions were
+    recalculated, see `recalculate_transitions()`.
+
     Parameters:
         entry: the storyboard entry
         entry_index: index of the storyboard entry
@@ -536,6 +427,12 @@ def update_transition_for_storyboard_entry(
         start_of_scene: the first frame of the scene
         start_of_next: the frame where the _next_ storyboard entry starts;
             `None` if this is the last storyboard entry
+        prefetcher: optional object holding the point matching requests that
+            were sent to the API in advance; the mapping is calculated from
+            the current positions of the drones if it has no usable result
+            for the given entry
+        phase_totals: optional timer that the time spent in the phases of the
+            transition is added to
 
     Returns:
         the mapping from drone index to marker index in the current
@@ -554,158 +451,127 @@ def update_transition_for_storyboard_entry(
         # free segment, nothing to do here
         return None
 
-    markers_and_objects = get_markers_and_related_objects_from_formation(formation)
-    num_markers = len(markers_and_objects)
-    end_of_previous = previous_entry.frame_end if previous_entry else start_of_scene
-
-    # Calculate the positions to start the transition from. For most formations
-    # this will be the current positions of the drones at the end of the previous
-    # formation. However, the _first_ formation needs to be treated in a special
-    # manner -- it has no preceding formation so we simply need to map each drone
-    # to the marker with the same index, and we need to ensure that we have at
-    # least as many markers as the number of drones
-    if previous_entry:
-        start_points = get_positions_of(drones, frame=end_of_previous)
-    else:
-        start_points = get_positions_of(
-            (marker for marker, _ in markers_and_objects), frame=end_of_previous
+    timer = PhaseTimer()
+
+    with timer.phase("mapping"):
+        markers_and_objects = get_markers_and_related_objects_from_formation(formation)
+        num_markers = len(markers_and_objects)
+        end_of_previous = previous_entry.frame_end if previous_entry else start_of_scene
+
+        # Calculate the positions to start the transition from. For most formations
+        # this will be the current positions of the drones at the end of the previous
+        # formation. However, the _first_ formation needs to be treated in a special
+        # manner -- it has no preceding formation so we simply need to map each drone
+        # to the marker with the same index, and we need to ensure that we have at
+        # least as many markers as the number of drones
+        mapping = (
+            prefetcher.get_mapping(entry_index, previous_mapping)
+            if prefetcher
+            else None
         )
-        if len(drones) != len(start_points):
-            raise SkybrushStudioError(
-                f"First formation has {len(start_points)} markers but the scene "
-                f'contains {len(drones)} drones. Check the "Drones" collection '
-                f"and the first formation for consistency."
-            )
-
-    mapping = calculate_mapping_for_transition_into_storyboard_entry(
-        entry,
-        start_points,
-        num_targets=num_markers,
-    )
+        if mapping is None:
+            if previous_entry:
+                start_points = get_positions_of(drones, frame=end_of_previous)
+            else:
+                start_points = get_positions_of(
+                    (marker for marker, _ in markers_and_objects),
+                    frame=end_of_previous,
+                )
+                if len(drones) != len(start_points):
+                    raise SkybrushStudioError(
+                        f"First formation has {len(start_points)} markers but the "
+                        f'scene contains {len(drones)} drones. Check the "Drones" '
+                        f"collection and the first formation for consistency."
+                    )
 
-    # Store mapping in Blender-compatible format for later use
-    entry.update_mapping(mapping)
+            mapping = calculate_mapping_for_transition_into_storyboard_entry(
+                entry,
+                start_points,
+                num_targets=num_markers,
+            )
 
-    # Calculate how many drones will participate in the transition
-    num_drones_transitioning = sum(
-        1 for target_index in mapping if target_index is not None
-    )
+        # Store mapping in Blender-compatible format for later use
+        entry.update_mapping(mapping)
 
     # Placeholder for the list of objects in the current and previous formations;
     # will be calculated on-demand for staggered transitions if needed
     objects_in_formation = _LazyFormationTargetList(entry)
     objects_in_previous_formation = _LazyFormationTargetList(previous_entry)
 
-    # Create a mapping that maps indices of points in the source formation to
-    # the corresponding schedule overrides (if any)
-    schedule_override_map = entry.get_enabled_schedule_override_map()
+    def get_departure_index(drone_index: int) -> int:
+        return calculate_departure_index_of_drone(
+            drones[drone_index],
+            drone_index,
+            previous_entry,
+            entry_index - 1,
+            previous_mapping,
+            objects_in_previous_formation,
+        )
+
+    def get_arrival_index(drone_index: int) -> int:
+        target_index = mapping[drone_index]
+        assert target_index is not None
+        marker, _ = markers_and_objects[target_index]
+        return objects_in_formation.find(marker)
 
     # Now we have the index of the target point that each drone
     # should be mapped to, and we have `None` for those drones that
     # will not participate in the formation
-    todo: list[Callable[[], None]] = []
-    for drone_index, drone in enumerate(drones):
-        target_index = mapping[drone_index]
-        if target_index is None:
-            marker, obj = None, None
-        else:
-            marker, obj = markers_and_objects[target_index]
-
-        constraint = update_transition_constraint_properties(drone, entry, marker, obj)
-
-        if constraint is not None:
-            # windup_start_frame can be later than end_of_previous for
-            # staggered departures.
-
-            windup_type = InfluenceCurveTransitionType.from_enum_property(
+    with timer.phase("constraint setup"):
+        descriptors = plan_influence_curves(
+            mapping,
+            name=entry.name,
+            scene_start_frame=start_of_scene,
+            windup_start_frame=end_of_previous,
+            start_frame=entry.frame_start,
+            end_frame=start_of_next,
+            windup_type=InfluenceCurveTransitionType.from_enum_property(
                 entry.transition_velocity_profile
-            )
-            windup_start_frame = end_of_previous
-            start_frame = entry.frame_start
-            departure_delay = 0
-            arrival_delay = 0
-            departure_index: int | None = None
-
-            if entry.is_staggered:
-                # Determine the index of the drone in the departure sequence
-                # and in the arrival sequence
-                departure_index = calculate_departure_index_of_drone(
-                    drone,
-                    drone_index,
-                    previous_entry,
-                    entry_index - 1,
-                    previous_mapping,
-                    objects_in_previous_formation,
-                )
-                arrival_index = objects_in_formation.find(marker)
-
-                departure_delay = entry.pre_delay_per_drone_in_frames * departure_index
-                arrival_delay = -entry.post_delay_per_drone_in_frames * (
-                    num_drones_transitioning - arrival_index - 1
-                )
-
-            if schedule_override_map:
-                # Determine the index of the drone in the departure sequence
-                # so we can look up whether there is an override for it. Note
-                # that we do not need to do this again if we already have the
-                # departure index
-                if departure_index is None:
-                    departure_index = calculate_departure_index_of_drone(
-                        drone,
-                        drone_index,
-                        previous_entry,
-                        entry_index - 1,
-                        previous_mapping,
-                        objects_in_previous_formation,
-                    )
-
-                override = schedule_override_map.get(departure_index)
-                if override:
-                    departure_delay = override.pre_delay
-                    arrival_delay = -override.post_delay
-
-            windup_start_frame += departure_delay
-            start_frame += arrival_delay
+            ),
+            is_first=previous_entry is None,
+            pre_delay_per_drone=entry.pre_delay_per_drone_in_frames,
+            post_delay_per_drone=entry.post_delay_per_drone_in_frames,
+            schedule_overrides={
+                index: (override.pre_delay, override.post_delay)
+                for index, override in entry.get_enabled_schedule_override_map().items()
+            },
+            get_departure_index=get_departure_index,
+            get_arrival_index=get_arrival_index if entry.is_staggered else None,
+        )
 
-            if previous_entry is None:
-                # Special case: this is the constraint that holds the drones at
-                # the first formation, so we need to set the start frame and
-                # the windup start frame to the start of the scene
-                start_frame = windup_start_frame = start_of_scene
+        todo: list[tuple[Object, str, InfluenceCurveDescriptor]] = []
+        for drone_index, drone in enumerate(drones):
+            target_index = mapping[drone_index]
+            if target_index is None:
+                marker, obj = None, None
             else:
-                if windup_start_frame >= start_frame:
-                    raise SkybrushStudioError(
-                        f"Not enough time to plan staggered transition to "
-                        f"formation {entry.name!r} at drone index {drone_index + 1} "
-                        f"(1-based). Try decreasing departure or arrival delay "
-                        f"or allow more time for the transition."
-                    )
+                marker, obj = markers_and_objects[target_index]
 
-            # start_frame can be earlier than entry.frame_start for
-            # staggered arrivals.
-            descriptor = InfluenceCurveDescriptor(
-                scene_start_frame=start_of_scene,
-                windup_start_frame=windup_start_frame,
-                start_frame=start_frame,
-                end_frame=start_of_next,
-                windup_type=windup_type,
+            constraint = update_transition_constraint_properties(
+                drone, entry, marker, obj
             )
 
-            # Do not update the influence curve now in case we have problems
-            # with drones coming later in the enumeration; just store the
-            # operation to call and then we'll do it in one batch at the end
-            todo.append(
-                partial(
-                    update_transition_constraint_influence,
-                    drone,
-                    constraint,
-                    descriptor,
+            descriptor = descriptors[drone_index]
+            if constraint is not None and descriptor is not None:
+                # Do not update the influence curve now in case we have
+                # problems with drones coming later in the enumeration; just
+                # store what to write and then we'll do it in one batch at the
+                # end
+                todo.append(
+                    (
+                        drone,
+                        get_influence_data_path_of_constraint(constraint),
+                        descriptor,
+                    )
                 )
-            )
 
     # Commit all the changes to the influence curves that we have planned above
-    for func in todo:
-        func()
+    with timer.phase("curve write"):
+        write_influence_curves(todo)
+
+    log.info(f"Transition to {entry.name!r} recalculated: {timer}")
+    if phase_totals is not None:
+        phase_totals.add(timer)
 
     return mapping
 
@@ -740,12 +606,274 @@ class RecalculationTask:
         )
 
 
+class TransitionFingerprinter:
+    """Calculates content fingerprints of the inputs of transitions so we can
+    tell whether a transition needs to be recalculated.
+
+    The fingerprint of a transition covers the geometry of the target
+    formation, the timing and the transition settings of the target entry,
+    its schedule overrides, and the end positions of the previous entry, i.e.
+    the geometry of the previous formation and the mapping of the drones to
+    its markers. Formation geometry is digested once per formation and frame.
+    """
+
+    _digests: dict[tuple[int, int], str]
+    """Digests of formation geometries, keyed by the formation and the frame."""
+
+    def __init__(self, *, num_drones: int, start_of_scene: int):
+        self._num_drones = num_drones
+        self._start_of_scene = start_of_scene
+        self._digests = {}
+
+    def fingerprint(self, task: RecalculationTask) -> str:
+        """Returns the fingerprint of the inputs of the transition described
+        by the given task, or an empty string if the transition cannot be
+        fingerprinted and must always be recalculated.
+        """
+        entry = task.entry
+        previous_entry = task.previous_entry
+
+        if entry.formation is None:
+            return ""
+
+        if previous_entry is None:
+            start = [
+                self._start_of_scene,
+                self._digest(entry.formation, self._start_of_scene),
+            ]
+        elif previous_entry.formation is None:
+            # The drones move freely in the previous entry so we cannot tell
+            # where they are without evaluating them
+            return ""
+        else:
+            start = [
+                previous_entry.frame_end,
+                self._digest(previous_entry.formation, previous_entry.frame_end),
+                previous_entry.mapping,
+            ]
+
+        overrides = sorted(
+            (override.index, override.pre_delay, override.post_delay)
+            for override in entry.get_enabled_schedule_override_map().values()
+        )
+        inputs = [
+            self._num_drones,
+            self._digest(entry.formation, entry.frame_start),
+            entry.frame_start,
+            entry.duration,
+            task.start_frame_of_next_entry,
+            entry.transition_type,
+            entry.transition_schedule,
+            entry.transition_velocity_profile,
+            entry.pre_delay_per_drone_in_frames,
+            entry.post_delay_per_drone_in_frames,
+            overrides,
+            start,
+        ]
+        return blake2b(json.dumps(inputs).encode("utf-8"), digest_size=16).hexdigest()
+
+    def _digest(self, formation: Collection, frame: int) -> str:
+        key = formation.as_pointer(), frame
+        digest = self._digests.get(key)
+        if digest is None:
+            coords = get_world_coordinates_of_markers_from_formation(
+                formation, frame=frame
+            )
+            digest = self._digests[key] = blake2b(
+                coords.astype(float32).tobytes(), digest_size=16
+            ).hexdigest()
+        return digest
+
+
+class MappingPrefetcher:
+    """Sends the point matching requests of auto-mapped transitions to the
+    API concurrently, ahead of the recalculation of the transitions, which
+    then happens one by one on the main thread.
+
+    The start points of a transition are the positions of the drones at the
+    end of the previous entry. These are known in advance when the previous
+    entry is a formation that every drone is mapped to, except that we do not
+    know yet _which_ drone is at which marker. Requests are therefore sent
+    with the markers of the previous formation as source points, and the
+    results are translated to drone indices with the mapping of the previous
+    entry once it becomes known. Transitions for which this is not possible
+    are left to the caller, who calculates the mapping from the actual
+    positions of the drones.
+    """
+
+    max_workers: int = 4
+    """Maximum number of requests to send to the API at the same time."""
+
+    _api: SkybrushStudioAPI | None
+    _executor: ThreadPoolExecutor | None
+
+    _futures: dict[int, Future[tuple[Mapping, float | None]]]
+    """Pending or completed requests, keyed by the index of the target entry
+    of the transition.
+    """
+
+    def __init__(self, *, num_drones: int, start_of_scene: int):
+        self._num_drones = num_drones
+        self._start_of_scene = start_of_scene
+        self._futures = {}
+        self._api = None
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """Cancels all the requests that have not been sent yet and releases
+        the worker threads.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._futures.clear()
+
+    def submit(self, task: RecalculationTask) -> bool:
+        """Sends the point matching request of the transition described by
+        the given task to the API in the background if its start and target
+        points are known in advance.
+
+        Returns:
+            whether the request was sent
+        """
+        entry = task.entry
+        previous_entry = task.previous_entry
+        if (
+            entry.is_locked
+            or entry.formation is None
+            or entry.transition_type != "AUTO"
+        ):
+            return False
+
+        if previous_entry is None:
+            source = get_coordinates_of_formation(
+                entry.formation, frame=self._start_of_scene
+            )
+        elif previous_entry.formation is not None:
+            source = get_coordinates_of_formation(
+                previous_entry.formation, frame=previous_entry.frame_end
+            )
+        else:
+            return False
+
+        if len(source) != self._num_drones:
+            return False
+
+        target = get_coordinates_of_formation(entry.formation, frame=entry.frame_start)
+
+        if self._api is None or self._executor is None:
+            # The API object and the gateway that signs the requests must be
+            # retrieved on the main thread as they access the add-on
+            # preferences
+            self._api = get_api().with_gateway_resolved()
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        self._futures[task.entry_index] = self._executor.submit(
+            self._api.match_points,
+            cast(list[Coordinate3D], source),
+            cast(list[Coordinate3D], target),
+            radius=0,
+        )
+        return True
+
+    def get_mapping(
+        self, entry_index: int, previous_mapping: Mapping | None
+    ) -> Mapping | None:
+        """Returns the mapping of the transition into the entry with the
+        given index, waiting for the corresponding request if needed.
+
+        Parameters:
+            entry_index: index of the target entry of the transition
+            previous_mapping: the mapping of the previous entry; ignored for
+                the first entry
+
+        Returns:
+            the mapping from drone indices to marker indices, or `None` if no
+            request was sent for the entry or if its result cannot be used
+            because not every marker of the previous formation is occupied
+            by exactly one drone
+
+        Raises:
+            SkybrushStudioAPIError: if the request failed
+        """
+        future = self._futures.pop(entry_index, None)
+        if future is None:
+            return None
+
+        num_drones = self._num_drones
+        if entry_index == 0:
+            drone_at_marker = list(range(num_drones))
+        else:
+            drone_at_marker = [-1] * num_drones
+            for drone_index, marker_index in enumerate(previous_mapping or ()):
+                if marker_index is not None and 0 <= marker_index < num_drones:
+                    drone_at_marker[marker_index] = drone_index
+            if (
+                previous_mapping is None
+                or len(previous_mapping) != num_drones
+                or -1 in drone_at_marker
+            ):
+                future.cancel()
+                return None
+
+        try:
+            match, _ = future.result()
+        except Exception as ex:
+            if not isinstance(ex, SkybrushStudioAPIError):
+                raise SkybrushStudioAPIError from ex
+            else:
+                raise
+
+        result: list[int | None] = [None] * num_drones
+        for target_index, marker_index in enumerate(match):
+            if marker_index is not None:
+                result[drone_at_marker[marker_index]] = target_index
+        return result
+
+
 def recalculate_transitions(
-    tasks: Iterable[RecalculationTask], *, start_of_scene: int
-) -> None:
+    tasks: Iterable[RecalculationTask],
+    *,
+    start_of_scene: int,
+    only_changed: bool = False,
+) -> int:
+    """Recalculates the transitions described by the given tasks, in the
+    order they are given.
+
+    The fingerprint of the inputs of each recalculated transition is stored
+    in the target entry of the transition.
+
+    Each transition logs the time spent in its own phases. The cleanup of the
+    actions and the constraints of the drones is performed once at the end, so
+    it is reported only in the summary that is logged at the end, together
+    with the total time spent in the phases of all the transitions.
+
+    Parameters:
+        tasks: the transitions to recalculate
+        start_of_scene: the first frame of the scene
+        only_changed: when `True`, transitions whose fingerprint matches the
+            one stored in the target entry are skipped and the stored mapping
+            of the entry is reused. Transitions that depend on a recalculated
+            one are recalculated as well if its mapping has changed.
+
+    Returns:
+        the number of transitions that were recalculated
+    """
     drones = Collections.find_drones().objects
     if not drones:
-        return
+        return 0
+
+    tasks = list(tasks)
+    fingerprinter = TransitionFingerprinter(
+        num_drones=len(drones), start_of_scene=start_of_scene
+    )
+    num_recalculated = 0
 
     # Mapping from drone indices to marker indices in the previous
     # formation, or ``None`` if this is not known for some reason. Possible
@@ -756,10 +884,41 @@ def recalculate_transitions(
     #   don't have the mapping now
     previous_mapping: Mapping | None = None
 
-    with create_position_evaluator() as get_positions_of:
+    # Total time spent in the phases of all the transitions, and in the
+    # cleanup that is performed once for all of them
+    timer = PhaseTimer()
+
+    with (
+        create_position_evaluator() as get_positions_of,
+        MappingPrefetcher(
+            num_drones=len(drones), start_of_scene=start_of_scene
+        ) as prefetcher,
+    ):
+        # Send the point matching requests whose inputs are known in advance
+        # so the API can work on them while we are busy with the transitions
+        for task in tasks:
+            if (
+                not only_changed
+                or fingerprinter.fingerprint(task) != task.entry.transition_fingerprint
+            ):
+                prefetcher.submit(task)
+
         # Iterate through the entries for which we need to recalculate the
         # transitions
         for task in tasks:
+            # The fingerprint does not depend on the transition itself, only on
+            # the transitions before it, so it is enough to calculate it when
+            # we need to decide whether to skip the transition or when we
+            # store it after the recalculation
+            fingerprint = fingerprinter.fingerprint(task) if only_changed else None
+            if (
+                only_changed
+                and fingerprint
+                and fingerprint == task.entry.transition_fingerprint
+            ):
+                previous_mapping = task.entry.get_mapping()
+                continue
+
             previous_mapping = update_transition_for_storyboard_entry(
                 task.entry,
                 task.entry_index,
@@ -769,17 +928,32 @@ def recalculate_transitions(
                 previous_mapping=previous_mapping,
                 start_of_scene=start_of_scene,
                 start_of_next=task.start_frame_of_next_entry,
+                prefetcher=prefetcher,
+                phase_totals=timer,
             )
+            if not task.entry.is_locked:
+                if fingerprint is None:
+                    fingerprint = fingerprinter.fingerprint(task)
+                task.entry.transition_fingerprint = fingerprint
+                num_recalculated += 1
 
-    # Remove F-curves with data paths that refer to nonexistent constraints
-    for drone in drones:
-        try:
-            cleanup_actions_for_object(drone)
-        except Exception:
-            pass
+    if only_changed and not num_recalculated:
+        return 0
+
+    with timer.phase("cleanup"):
+        # Remove F-curves with data paths that refer to nonexistent constraints
+        for drone in drones:
+            try:
+                cleanup_actions_for_object(drone)
+            except Exception:
+                pass
+
+        bpy.ops.skybrush.fix_constraint_ordering()
+        invalidate_caches(clear_result=True)
+
+    log.info(f"Transitions recalculated: {timer}")
 
-    bpy.ops.skybrush.fix_constraint_ordering()
-    invalidate_caches(clear_result=True)
+    return num_recalculated
 
 
 class RecalculateTransitionsOperator(StoryboardOperator):
@@ -818,6 +992,16 @@ class RecalculateTransitionsOperator(StoryboardOperator):
                 "TRACKING_FORWARDS",
                 5,
             ),
+            None,
+            (
+                "CHANGED",
+                "Changed transitions only",
+                "Recalculates only those transitions whose inputs have changed "
+                "since they were last calculated, and the transitions that "
+                "depend on them",
+                "FILE_REFRESH",
+                6,
+            ),
         ],
         name="Scope",
         description=(
@@ -858,11 +1042,18 @@ class RecalculateTransitionsOperator(StoryboardOperator):
 
         try:
             with call_api_from_blender_operator(self, "transition planner"):
-                recalculate_transitions(tasks, start_of_scene=start_of_scene)
+                num_recalculated = recalculate_transitions(
+                    tasks,
+                    start_of_scene=start_of_scene,
+                    only_changed=self.scope == "CHANGED",
+                )
             bpy.ops.skybrush.update_time_markers_from_storyboard()
             success = True
         except Exception:
             success = False
+        else:
+            if self.scope == "CHANGED":
+                self.report({"INFO"}, f"{num_recalculated} transition(s) recalculated")
 
         return {"FINISHED"} if success else {"CANCELLED"}
 
@@ -899,7 +1090,7 @@ class RecalculateTransitionsOperator(StoryboardOperator):
             frame = bpy.context.scene.frame_current
             index = storyboard.get_index_of_entry_after_frame(frame)
             condition = index.__eq__
-        elif self.scope == "ALL":
+        elif self.scope in ("ALL", "CHANGED"):
             condition = constant(True)
         else:
             condition = constant(False)
@@ -3,10 +3,14 @@ from math import degrees, radians
 from bpy.props import FloatProperty, IntProperty, StringProperty
 from bpy.types import Operator
 
-from sbstudio.model.pyro_markers import PyroMarker, PyroPayload
-from sbstudio.plugin.constants import NUM_PYRO_CHANNELS
+from sbstudio.model.pyro_markers import PyroMarker, PyroMarkers, PyroPayload
+from sbstudio.plugin.constants import NUM_PYRO_CHANNELS, Collections
 from sbstudio.plugin.selection import get_selected_drones
-from sbstudio.plugin.utils.pyro_markers import add_pyro_marker_to_object
+from sbstudio.plugin.utils.pyro_markers import (
+    get_pyro_event_index,
+    get_pyro_markers_of_object,
+    set_pyro_markers_of_object,
+)
 
 __all__ = ("TriggerPyroOnSelectedDronesOperator",)
 
@@ -103,24 +107,45 @@ class TriggerPyroOnSelectedDronesOperator(Operator):
             self.report({"ERROR"}, "Select some drones first to trigger pyro")
             return False
 
+        # Use the pyro event index to look up the existing markers of the
+        # selected drones so we do not need to decode them one by one
+        drones = Collections.find_drones(create=False)
+        assert drones is not None
+
+        objects = drones.objects
+        index = get_pyro_event_index(drones, context.scene.render.fps)
         frame = context.scene.frame_current
+        num_replaced = 0
         for drone in selection:
-            self._trigger_pyro_on_single_drone(drone, frame)
+            drone_index = objects.find(drone.name)
+            if drone_index < 0:
+                markers = get_pyro_markers_of_object(drone)
+            else:
+                markers = PyroMarkers.from_dict(
+                    dict(index.markers[drone_index].markers)
+                )
+            if self.channel in markers.markers:
+                num_replaced += 1
+            self._trigger_pyro_on_single_drone(drone, markers, frame)
+
+        if num_replaced:
+            self.report(
+                {"INFO"},
+                f"Replaced existing pyro events on channel {self.channel} "
+                f"of {num_replaced} drone(s)",
+            )
 
         return True
 
-    def _trigger_pyro_on_single_drone(self, drone, frame: int):
-        add_pyro_marker_to_object(
-            drone,
-            channel=self.channel,
-            marker=PyroMarker(
-                frame=frame,
-                payload=PyroPayload(
-                    name=self.name,
-                    duration=self.duration,
-                    prefire_time=self.prefire_time,
-                    yaw=round(degrees(self.yaw), 3),
-                    pitch=round(degrees(self.pitch), 3),
-                ),
+    def _trigger_pyro_on_single_drone(self, drone, markers: PyroMarkers, frame: int):
+        markers.markers[self.channel] = PyroMarker(
+            frame=frame,
+            payload=PyroPayload(
+                name=self.name,
+                duration=self.duration,
+                prefire_time=self.prefire_time,
+                yaw=round(degrees(self.yaw), 3),
+                pitch=round(degrees(self.pitch), 3),
             ),
         )
+        set_pyro_markers_of_object(drone, markers)
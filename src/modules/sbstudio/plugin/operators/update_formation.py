@@ -6,6 +6,7 @@ from sbstudio.plugin.constants import Collections
 from sbstudio.plugin.model.formation import (
     add_objects_to_formation,
     add_points_to_formation,
+    invalidate_formation_cache,
 )
 from sbstudio.plugin.objects import remove_objects
 from sbstudio.plugin.selection import (
@@ -161,6 +162,7 @@ class UpdateFormationOperator(FormationOperator):
 
         # Delete the markers from the formation that are not used elsewhere
         remove_objects(to_delete)
+        invalidate_formation_cache()
 
         # Add the new points and objects to the formation
         add_points_to_formation(formation, new_points)
@@ -1,27 +1,28 @@
 """Utility functions for operators."""
 
 import logging
-from collections.abc import Iterator
+from collections.abc import Callable, Generator, Iterator, Sequence
 from contextlib import contextmanager
 from itertools import groupby
 from math import degrees
 from operator import attrgetter
 from pathlib import Path
 from typing import Any, cast
+from zipfile import ZIP_DEFLATED, ZipFile
 
 from bpy.path import basename
 from bpy.types import Context
 from natsort import natsorted
 
-from sbstudio.api import SkybrushStudioAPI
+from sbstudio.api import SkybrushGatewayAPI, SkybrushStudioAPI
 from sbstudio.api.types import Version
 from sbstudio.api.version import is_backend_version_at_least
-from sbstudio.model.file_formats import FileFormat
-from sbstudio.model.light_program import LightProgram
+from sbstudio.model.file_formats import FIXED_FRAME_RATES, FileFormat
+from sbstudio.model.local_rendering import is_rendered_locally, render_show_locally
 from sbstudio.model.location import ShowLocation
 from sbstudio.model.safety_check import SafetyCheckParams
-from sbstudio.model.trajectory import Trajectory
-from sbstudio.model.yaw import YawSetpointList
+from sbstudio.model.sampling import get_decimation_indices, get_frame_step
+from sbstudio.model.simplification_cache import SimplificationCache
 from sbstudio.plugin.constants import Collections
 from sbstudio.plugin.errors import SkybrushStudioExportWarning, TaskCancelled
 from sbstudio.plugin.gateway import get_gateway
@@ -40,23 +41,26 @@ from sbstudio.plugin.utils import with_context
 from sbstudio.plugin.utils.audio import get_audio_from_context
 from sbstudio.plugin.utils.cameras import get_cameras_from_context
 from sbstudio.plugin.utils.gps_coordinates import parse_latitude, parse_longitude
-from sbstudio.plugin.utils.progress import ProgressHandler, ProgressReport
+from sbstudio.plugin.utils.progress import (
+    ProgressHandler,
+    ProgressReport,
+    StepBasedProgressReport,
+    combine_progress_handlers,
+)
 from sbstudio.plugin.utils.pyro_markers import get_pyro_markers_of_object
 from sbstudio.plugin.utils.sampling import (
+    ObjectSamples,
     frame_range,
-    sample_colors_of_objects,
-    sample_positions_and_colors_of_objects,
-    sample_positions_and_yaw_of_objects,
-    sample_positions_colors_and_yaw_of_objects,
-    sample_positions_of_objects,
+    iter_samples_of_objects,
 )
 from sbstudio.plugin.utils.time_markers import get_time_markers_from_context
-from sbstudio.utils import get_ends
+from sbstudio.utils import get_ends, run_to_completion
 
 __all__ = (
     "export_show_to_file_using_api",
     "get_drones_to_export",
     "get_show_location",
+    "iter_export_show_to_file_using_api",
 )
 
 
@@ -69,16 +73,23 @@ class _default_settings:
     redraw: bool | None = None
 
 
+_simplification_cache = SimplificationCache()
+"""Cache of the simplified light programs of the drones from recent exports
+so consecutive exports of the same show do not need to simplify the light
+programs of drones that have not changed since the previous export.
+"""
+
+
 ################################################################################
 # Helper functions for exporter operators
 
 
 def export_show_to_file_using_api(
-    api: SkybrushStudioAPI,
+    api: SkybrushStudioAPI | None,
     context: Context,
     settings: dict[str, Any],
     filepath: str | Path,
-    format: FileFormat,
+    format: FileFormat | Sequence[FileFormat],
 ) -> None:
     """Creates Skybrush-compatible output from Blender trajectories and color
     animation.
@@ -86,11 +97,14 @@ def export_show_to_file_using_api(
     This is a helper function for Skybrush export operators.
 
     Parameters:
-        api: the Skybrush Studio API object
+        api: the Skybrush Studio API object; may be ``None`` if the show is
+            rendered locally
         context: the main Blender context
         settings: export settings dictionary
         filepath: the output path where the export should write
-        format: the format that the API should produce
+        format: the format that the API should produce, or a list of formats
+            to produce in a single request. A list of formats is saved as a
+            single ZIP file even if it contains only one format
 
     Raises:
         SkybrushStudioExportWarning: when a local check failed and the export
@@ -99,9 +113,78 @@ def export_show_to_file_using_api(
         SkybrushStudioAPIError: for server-side export errors. These are
             converted into errors on the Blender UI.
     """
+    finish = run_to_completion(
+        iter_export_show_to_file_using_api(api, context, settings, filepath, format)
+    )
+    finish(None)
+
 
+def iter_export_show_to_file_using_api(
+    api: SkybrushStudioAPI | None,
+    context: Context,
+    settings: dict[str, Any],
+    filepath: str | Path,
+    format: FileFormat | Sequence[FileFormat],
+    *,
+    on_progress: ProgressHandler | None = None,
+) -> Generator[int, None, Callable[[ProgressHandler | None], None]]:
+    """Step-by-step variant of `export_show_to_file_using_api()` that allows
+    the caller to keep the user interface responsive during the export.
+
+    The generator performs the parts of the export that need access to Blender
+    (collecting the settings and sampling the drones) and yields the index of
+    every sampled frame. When it is exhausted, it returns a function that performs
+    the rest of the export: the simplification of the samples and the
+    rendering of the show on the server (or locally, for the formats that
+    support it when the ``render_locally`` setting is enabled). The Studio
+    Gateway that signs the requests and reports the progress of the export is
+    looked up by the generator, so the returned function does not access
+    Blender and can be called from a worker thread. It takes an optional
+    progress handler; when the handler requests cancellation, the function
+    raises `TaskCancelled` and the output file is left untouched.
+
+    Parameters:
+        api: the Skybrush Studio API object; may be ``None`` if the show is
+            rendered locally (see `is_rendered_locally()`)
+        context: the main Blender context. Pass `bpy.context` if the generator
+            is consumed across multiple Blender event handler invocations
+        settings: export settings dictionary
+        filepath: the output path where the export should write
+        format: the format that the API should produce, or a list of formats
+            to produce in a single request. A list of formats is saved as a
+            single ZIP file even if it contains only one format
+        on_progress: optional progress handler that is notified about the
+            progress of the sampling
+
+    Raises:
+        SkybrushStudioExportWarning: when a local check failed and the export
+            operation did not start. These are converted into warnings on the
+            Blender UI.
+        SkybrushStudioAPIError: for server-side export errors. These are
+            converted into errors on the Blender UI.
+    """
     log.info(f"Exporting show content to {filepath}")
 
+    # determine the renderer(s) to use. Renderers that need samples taken at
+    # different frames are rendered in separate batches
+    local_format: FileFormat | None = None
+    if isinstance(format, FileFormat):
+        is_bundle = False
+        message, renderer, renderer_params = _get_renderer_for_format(format, settings)
+        batches = [(settings, renderer, renderer_params)]
+        if is_rendered_locally(format, settings):
+            local_format = format
+    else:
+        is_bundle = True
+        formats = list(format)
+        if not formats:
+            raise SkybrushStudioExportWarning("No output formats were selected")
+        message = f"Exporting show to a bundle of {len(formats)} format(s)"
+        batches = _get_batches_for_bundle(formats, settings)
+
+    if local_format is None and api is None:
+        raise RuntimeError("Skybrush Studio API is needed to render the show")
+
     # get framerange
     log.info(f"Getting frame range from {settings.get('frame_range')}")
     frame_range = _get_frame_range_from_export_settings(settings, context=context)
@@ -127,28 +210,16 @@ def export_show_to_file_using_api(
     # get trajectories, light programs and yaw setpoints
     if use_yaw_control:
         log.info("Getting object trajectories, light programs and yaw setpoints")
-        (
-            trajectories,
-            lights,
-            yaw_setpoints,
-        ) = _get_trajectories_lights_and_yaw_setpoints(
-            drones,
-            settings,
-            frame_range,
-            context=context,
-        )
     else:
         log.info("Getting object trajectories and light programs")
-        (
-            trajectories,
-            lights,
-        ) = _get_trajectories_and_lights(
-            drones,
-            settings,
-            frame_range,
-            context=context,
-        )
-        yaw_setpoints = None
+    samples_of_batches = yield from _iter_samples_of_batches(
+        drones,
+        [batch_settings for batch_settings, _, _ in batches],
+        frame_range,
+        use_yaw_control=use_yaw_control,
+        on_progress=on_progress,
+        context=context,
+    )
 
     # get pyro control enabled state
     use_pyro_control: bool = settings.get("use_pyro_control", False)
@@ -171,9 +242,9 @@ def export_show_to_file_using_api(
     # get time markers (cues)
     time_markers = get_time_markers_from_context(context)
 
-    # get audio
+    # get audio; local renderers do not export audio
     export_audio = settings.get("export_audio", False)
-    if export_audio:
+    if export_audio and api is not None and local_format is None:
         # Check if the backend version is sufficient for audio export
         minimum_version = Version(2, 40, 0)
         if is_backend_version_at_least(minimum_version, api=api):
@@ -215,28 +286,231 @@ def export_show_to_file_using_api(
     # get show segments
     show_segments = _get_segments(context=context)
 
-    # shift all time-dependent items so that the time axis of the exported show
-    # starts at 0
-    delta = -frame_range[0] / context.scene.render.fps
-    if delta != 0:
-        for trajectory in trajectories.values():
-            trajectory.shift_time_in_place(delta)
-        for light_program in lights.values():
-            light_program.shift_time_in_place(delta)
-        if pyro_programs:
-            for pyro_program in pyro_programs.values():
-                pyro_program.shift_time_in_place(-frame_range[0])
-        if yaw_setpoints:
-            for yaw_setpoint in yaw_setpoints.values():
-                yaw_setpoint.shift_time_in_place(delta)
-        time_markers.shift_time_in_place(delta)
-        show_segments = {
-            k: (v[0] + delta, v[1] + delta) for k, v in show_segments.items()
-        }
+    # all time-dependent items will be shifted so that the time axis of the
+    # exported show starts at 0
+    first_frame = frame_range[0]
+    delta = -first_frame / context.scene.render.fps
 
-    renderer_params = {}
+    # The Studio Gateway is configured in the add-on preferences so it must be
+    # looked up here and not in the returned function
+    if api is not None and local_format is None:
+        server_api = api.with_gateway_resolved()
+        progress_gateway = _find_gateway()
+    else:
+        server_api = progress_gateway = None
+
+    def finish(on_progress: ProgressHandler | None = None) -> None:
+        # Local renderers write the raw samples so they need no simplification
+        if local_format is None:
+            hits = _simplification_cache.hits
+            for samples in samples_of_batches:
+                samples.simplify(cache=_simplification_cache, on_progress=on_progress)
+            log.info(
+                f"Reused {_simplification_cache.hits - hits} simplified "
+                "light programs from previous exports"
+            )
+
+        segments = show_segments
+
+        if delta != 0:
+            for samples in samples_of_batches:
+                for trajectory in samples.trajectories.values():
+                    trajectory.shift_time_in_place(delta)
+                for light_program in samples.lights.values():
+                    light_program.shift_time_in_place(delta)
+                if use_yaw_control:
+                    for yaw_setpoint in samples.yaw_setpoints.values():
+                        yaw_setpoint.shift_time_in_place(delta)
+            if pyro_programs:
+                for pyro_program in pyro_programs.values():
+                    pyro_program.shift_time_in_place(-first_frame)
+            time_markers.shift_time_in_place(delta)
+            segments = {k: (v[0] + delta, v[1] + delta) for k, v in segments.items()}
+
+        log.info(message)
+
+        # Render into a temporary file first so a cancelled export does not
+        # leave a partial or outdated output file behind. Batches are rendered
+        # into separate files first and then merged into a single bundle
+        output = Path(filepath)
+        partial_output = output.with_name(f"{output.name}.part")
+        if len(batches) > 1:
+            batch_outputs = [
+                output.with_name(f"{output.name}.{index}.part")
+                for index in range(len(batches))
+            ]
+        else:
+            batch_outputs = [partial_output]
+
+        try:
+            if server_api is None:
+                assert local_format is not None
+                if local_format is FileFormat.KMZ and show_location is None:
+                    raise SkybrushStudioExportWarning(
+                        "Google Earth KMZ exporter requires a valid show location"
+                    )
+                samples = samples_of_batches[0]
+                render_show_locally(
+                    local_format,
+                    partial_output,
+                    samples.trajectories,
+                    samples.lights,
+                    title=show_title,
+                    location=show_location,
+                    kmz_mode=(
+                        "point"
+                        if settings.get("export_mode") == "POINT"
+                        else "trajectory"
+                    ),
+                )
+            else:
+                with _report_progress_using_gateway(message, progress_gateway):
+                    for (_, renderer, renderer_params), samples, batch_output in zip(
+                        batches, samples_of_batches, batch_outputs
+                    ):
+                        server_api.export(
+                            show_title=show_title,
+                            show_type=show_type,
+                            show_location=show_location,
+                            show_segments=segments,
+                            validation=validation,
+                            trajectories=samples.trajectories,
+                            lights=samples.lights,
+                            pyro_programs=pyro_programs,
+                            yaw_setpoints=(
+                                samples.yaw_setpoints if use_yaw_control else None
+                            ),
+                            output=batch_output,
+                            time_markers=time_markers,
+                            audio=audio,
+                            cameras=cameras,
+                            renderer=renderer,
+                            renderer_params=renderer_params,
+                        )
+                if len(batch_outputs) > 1:
+                    _merge_zip_files(batch_outputs, partial_output)
+
+            if on_progress:
+                progress = StepBasedProgressReport(1, operation=message)
+                progress.start()
+                progress.add_step()
+                progress.finish()
+                if on_progress(progress):
+                    raise TaskCancelled(f"Cancelled operation: {message}")
+
+            partial_output.replace(output)
+        finally:
+            for path in {partial_output, *batch_outputs}:
+                path.unlink(missing_ok=True)
+
+        if is_bundle and settings.get("extract_bundle", False):
+            _extract_bundle(output)
+
+        log.info("Export finished")
+
+    return finish
+
+
+def get_drones_to_export(selected_only: bool = False):
+    """Returns the drone objects to export.
+
+    Parameters:
+        selected_only: whether to export the selected drones only (`True`) or
+            all the drones in the appropriate collection (`False`)
+
+    Yields:
+        drone objects passing all specified filters natural-sorted by their name
+    """
+    drone_collection = Collections.find_drones(create=False)
+    if not drone_collection:
+        return []
+
+    to_export = [
+        drone
+        for drone in drone_collection.objects
+        if not selected_only or drone.select_get()
+    ]
+
+    return natsorted(to_export, key=attrgetter("name"))
+
+
+def get_show_location(context: Context) -> ShowLocation | None:
+    """Returns the current show location.
+
+    Parameters:
+        context: the main Blender context
+
+    Returns:
+        the current show location or None if it is not set
+    """
+    scene_settings = getattr(context.scene.skybrush, "settings", None)
+
+    return (
+        ShowLocation(
+            latitude=parse_latitude(scene_settings.latitude_of_show_origin),
+            longitude=parse_longitude(scene_settings.longitude_of_show_origin),
+            orientation=degrees(scene_settings.show_orientation),
+        )
+        if scene_settings and scene_settings.use_show_origin_and_orientation
+        else None
+    )
+
+
+################################################################################
+# Private helper functions
+
+
+def _extract_bundle(path: Path) -> None:
+    """Extracts the files of a ZIP file containing the show in multiple formats
+    into a directory next to the ZIP file, named after the ZIP file.
+    """
+    target = path.with_suffix("")
+    log.info(f"Extracting exported files to {target}")
+    with ZipFile(path) as bundle:
+        bundle.extractall(target)
+
+
+def _merge_zip_files(inputs: Sequence[Path], output: Path) -> None:
+    """Merges the files of the given ZIP files into a single ZIP file.
+
+    Files whose names appeared in an earlier input are skipped.
+    """
+    names: set[str] = set()
+    with ZipFile(output, "w", compression=ZIP_DEFLATED) as merged:
+        for input in inputs:
+            with ZipFile(input) as bundle:
+                for info in bundle.infolist():
+                    if info.filename not in names:
+                        names.add(info.filename)
+                        merged.writestr(info, bundle.read(info))
+
+
+@with_context
+def _get_frame_range_from_export_settings(
+    settings, *, context: Context | None = None
+) -> tuple[int, int] | None:
+    """Returns the range of frames to export, based on the chosen export settings
+    of the user.
+
+    Parameters:
+        settings: the export settings chosen by the user
+        context: the main Blender context
+
+    Returns:
+        frame range to be used during the export (both ends inclusive)
+    """
+    return resolve_frame_range(settings["frame_range"], context=context)
+
+
+def _get_renderer_for_format(
+    format: FileFormat, settings: dict[str, Any]
+) -> tuple[str, str | list[str], Any]:
+    """Returns the message to show while the show is being exported into the
+    given format, the name of the renderer that the server should use and the
+    parameters of the renderer.
+    """
+    renderer_params: Any = {}
 
-    # create Skybrush converter object
     if format is FileFormat.SKYC:
         message = "Exporting show to Skybrush .skyc format"
         renderer = "skyc"
@@ -302,14 +576,14 @@ def export_show_to_file_using_api(
             "light_fps": settings["light_output_fps"],
         }
     elif format is FileFormat.FINALE_CSV:
-        log.info("Exporting show to Finale 3D Do-It-Yourself .csv format")
+        message = "Exporting show to Finale 3D Do-It-Yourself .csv format"
         renderer = "finale-csv"
         renderer_params = {
             "fps": settings["output_fps"],
             "light_fps": settings["light_output_fps"],
         }
     elif format is FileFormat.KMZ:
-        log.info("Exporting show to Google Earth .kmz format")
+        message = "Exporting show to Google Earth .kmz format"
         renderer = "kmz"
         renderer_params = {
             "fps": settings["output_fps"],
@@ -329,94 +603,64 @@ def export_show_to_file_using_api(
     else:
         raise RuntimeError(f"Unhandled format: {format!r}")
 
-    log.info(message)
-
-    with report_progress_during_api_operation(message):
-        api.export(
-            show_title=show_title,
-            show_type=show_type,
-            show_location=show_location,
-            show_segments=show_segments,
-            validation=validation,
-            trajectories=trajectories,
-            lights=lights,
-            pyro_programs=pyro_programs,
-            yaw_setpoints=yaw_setpoints,
-            output=filepath,
-            time_markers=time_markers,
-            audio=audio,
-            cameras=cameras,
-            renderer=renderer,
-            renderer_params=renderer_params,
-        )
+    return message, renderer, renderer_params
 
-    log.info("Export finished")
 
+def _get_batches_for_bundle(
+    formats: Sequence[FileFormat], settings: dict[str, Any]
+) -> list[tuple[dict[str, Any], list[str], list[dict[str, Any] | None]]]:
+    """Splits a bundle of the given formats into batches that are rendered
+    with a single request to the server, from a single set of samples.
 
-def get_drones_to_export(selected_only: bool = False):
-    """Returns the drone objects to export.
-
-    Parameters:
-        selected_only: whether to export the selected drones only (`True`) or
-            all the drones in the appropriate collection (`False`)
-
-    Yields:
-        drone objects passing all specified filters natural-sorted by their name
-    """
-    drone_collection = Collections.find_drones(create=False)
-    if not drone_collection:
-        return []
-
-    to_export = [
-        drone
-        for drone in drone_collection.objects
-        if not selected_only or drone.select_get()
-    ]
-
-    return natsorted(to_export, key=attrgetter("name"))
-
-
-def get_show_location(context: Context) -> ShowLocation | None:
-    """Returns the current show location.
-
-    Parameters:
-        context: the main Blender context
+    Some renderers of the server do not resample the show, and some exporters
+    always use a fixed frame rate, so each format must be rendered from the
+    same samples as when it is exported on its own. Formats that need the same
+    frame rates are rendered in the same batch.
 
     Returns:
-        the current show location or None if it is not set
+        the export settings to use when sampling the show for each batch, and
+        the names and the parameters of the renderers of the batch
     """
-    scene_settings = getattr(context.scene.skybrush, "settings", None)
-
-    return (
-        ShowLocation(
-            latitude=parse_latitude(scene_settings.latitude_of_show_origin),
-            longitude=parse_longitude(scene_settings.longitude_of_show_origin),
-            orientation=degrees(scene_settings.show_orientation),
+    batches: dict[
+        tuple[int, int], tuple[dict[str, Any], list[str], list[dict[str, Any] | None]]
+    ] = {}
+    for format in formats:
+        format_settings = _get_settings_for_format(format, settings)
+        key = (
+            format_settings.get("output_fps", _default_settings.output_fps),
+            format_settings.get("light_output_fps", _default_settings.light_output_fps),
         )
-        if scene_settings and scene_settings.use_show_origin_and_orientation
-        else None
-    )
-
-
-################################################################################
-# Private helper functions
+        batch = batches.get(key)
+        if batch is None:
+            batch = batches[key] = (
+                {**settings, "output_fps": key[0], "light_output_fps": key[1]},
+                [],
+                [],
+            )
 
+        _, renderer, params = _get_renderer_for_format(format, format_settings)
+        if isinstance(renderer, list):
+            batch[1].extend(renderer)
+            batch[2].extend(params)
+        else:
+            batch[1].append(renderer)
+            batch[2].append(params or None)
 
-@with_context
-def _get_frame_range_from_export_settings(
-    settings, *, context: Context | None = None
-) -> tuple[int, int] | None:
-    """Returns the range of frames to export, based on the chosen export settings
-    of the user.
+    return list(batches.values())
 
-    Parameters:
-        settings: the export settings chosen by the user
-        context: the main Blender context
 
-    Returns:
-        frame range to be used during the export (both ends inclusive)
+def _get_settings_for_format(
+    format: FileFormat, settings: dict[str, Any]
+) -> dict[str, Any]:
+    """Returns the export settings to use for the given format when it is
+    part of a bundle, taking into account that some exporters always use a
+    fixed frame rate.
     """
-    return resolve_frame_range(settings["frame_range"], context=context)
+    fps = FIXED_FRAME_RATES.get(format)
+    if fps is None:
+        return settings
+    else:
+        return {**settings, "output_fps": fps, "light_output_fps": fps}
 
 
 @with_context
@@ -475,131 +719,114 @@ def _get_segments(context: Context | None = None) -> dict[str, tuple[float, floa
 
 
 @with_context
-def _get_trajectories_and_lights(
+def _iter_samples_of_batches(
     drones,
-    settings: dict[str, Any],
+    settings_of_batches: Sequence[dict[str, Any]],
     bounds: tuple[int, int],
     *,
+    use_yaw_control: bool = False,
+    on_progress: ProgressHandler | None = None,
     context: Context | None = None,
-) -> tuple[dict[str, Trajectory], dict[str, LightProgram]]:
-    """Get trajectories and LED lights of all selected/picked objects.
+) -> Generator[int, None, list[ObjectSamples]]:
+    """Get trajectories, LED lights and optionally yaw setpoints of all
+    selected/picked objects for multiple batches of renderers that need the
+    samples at different frame rates, one frame at a time.
+
+    The samples of a batch are taken from the samples of an earlier batch if
+    the latter were taken at all the frames that the batch needs; otherwise
+    the show is sampled again.
 
     Parameters:
-        context: the main Blender context
         drones: the list of drones to export
-        settings: export settings
+        settings_of_batches: the export settings of each batch
         bounds: the frame range used for exporting
+        use_yaw_control: whether to sample the yaw setpoints as well
+        on_progress: optional progress handler to notify in addition to the
+            default progress reporting mechanism
+        context: the main Blender context
+
+    Yields:
+        the index of each frame after it has been sampled
 
     Returns:
-        dictionary of Trajectory and LightProgram objects indexed by object names
+        the samples of each batch, not simplified yet
     """
-    trajectory_fps = settings.get("output_fps", _default_settings.output_fps)
-    light_fps = settings.get("light_output_fps", _default_settings.light_output_fps)
-    redraw = settings.get("redraw", _default_settings.redraw)
+    assert context is not None
 
-    if redraw is None:
-        # Redraw the scene if we have at least one video-based light effect but
-        # do not redraw otherwise
-        assert context is not None
-        redraw = any(
-            effect.is_animated
-            for effect in context.scene.skybrush.light_effects.entries
+    scene_fps = context.scene.render.fps
+    steps = [
+        (
+            get_frame_step(
+                scene_fps,
+                settings.get("output_fps", _default_settings.output_fps),
+            ),
+            get_frame_step(
+                scene_fps,
+                settings.get("light_output_fps", _default_settings.light_output_fps),
+            ),
         )
+        for settings in settings_of_batches
+    ]
 
-    frames = frame_range(
-        bounds[0],
-        bounds[1],
-        context=context,
-    )
-
-    trajectories: dict[str, Trajectory]
-    lights: dict[str, LightProgram]
-
-    if trajectory_fps == light_fps:
-        # This is easy, we can iterate over the show once
-        with (
-            suspended_safety_checks(),
-            suspended_color_update_callbacks(),
-            report_progress_during_api_operation() as on_progress,
-        ):
-            frame_iter = frames.iter(
-                trajectory_fps,
-                operation=f"Sampling trajectories and lights at {trajectory_fps} FPS",
-                on_progress=on_progress,
+    # Sample the batches with the most frames first so the other batches can
+    # reuse their samples
+    order = sorted(range(len(steps)), key=steps.__getitem__)
+    result: list[ObjectSamples | None] = [None] * len(steps)
+    sampled: list[tuple[int, int, ObjectSamples]] = []
+    for index in order:
+        trajectory_step, light_step = steps[index]
+        for source_trajectory_step, source_light_step, source in sampled:
+            trajectory_indices = get_decimation_indices(
+                *bounds, source_trajectory_step, trajectory_step
+            )
+            light_indices = get_decimation_indices(
+                *bounds, source_light_step, light_step
             )
-            result = sample_positions_and_colors_of_objects(
+            if trajectory_indices is not None and light_indices is not None:
+                result[index] = source.decimate(trajectory_indices, light_indices)
+                break
+        else:
+            samples = yield from _iter_samples_of_drones(
                 drones,
-                frame_iter,
+                settings_of_batches[index],
+                bounds,
+                use_yaw_control=use_yaw_control,
+                on_progress=on_progress,
                 context=context,
-                redraw=redraw,
-                simplify=True,
             )
+            sampled.append((trajectory_step, light_step, samples))
+            result[index] = samples
 
-        trajectories = {}
-        lights = {}
-
-        for key, (trajectory, light_program) in result.items():
-            trajectories[key] = trajectory
-            lights[key] = light_program
-
-    else:
-        # We need to iterate over the show twice, once for the trajectories,
-        # once for the lights
-        with suspended_safety_checks():
-            with (
-                suspended_light_effects(),
-                report_progress_during_api_operation() as on_progress,
-            ):
-                frame_iter = frames.iter(
-                    trajectory_fps,
-                    operation=f"Sampling trajectories at {trajectory_fps} FPS",
-                    on_progress=on_progress,
-                )
-                trajectories = sample_positions_of_objects(
-                    drones,
-                    frame_iter,
-                    context=context,
-                    simplify=True,
-                )
-
-            with (
-                suspended_color_update_callbacks(),
-                report_progress_during_api_operation() as on_progress,
-            ):
-                frame_iter = frames.iter(
-                    light_fps,
-                    operation=f"Sampling lights at {light_fps} FPS",
-                    on_progress=on_progress,
-                )
-                lights = sample_colors_of_objects(
-                    drones,
-                    frame_iter,
-                    context=context,
-                    redraw=redraw,
-                    simplify=True,
-                )
-
-    return trajectories, lights
+    return cast(list[ObjectSamples], result)
 
 
-@with_context
-def _get_trajectories_lights_and_yaw_setpoints(
+def _iter_samples_of_drones(
     drones,
     settings: dict[str, Any],
     bounds: tuple[int, int],
     *,
+    use_yaw_control: bool = False,
+    on_progress: ProgressHandler | None = None,
     context: Context | None = None,
-) -> tuple[dict[str, Trajectory], dict[str, LightProgram], dict[str, YawSetpointList]]:
-    """Get trajectories, LED lights and yaw setpoints of all selected/picked objects.
+) -> Generator[int, None, ObjectSamples]:
+    """Get trajectories, LED lights and optionally yaw setpoints of all
+    selected/picked objects, one frame at a time.
 
     Parameters:
         context: the main Blender context
         drones: the list of drones to export
         settings: export settings
         bounds: the frame range used for exporting
+        use_yaw_control: whether to sample the yaw setpoints as well
+        on_progress: optional progress handler to notify in addition to the
+            default progress reporting mechanism
+
+    Yields:
+        the index of each frame after it has been sampled
 
     Returns:
-        dictionary of Trajectory, LightProgram and YawSetpointList objects indexed by object names
+        the trajectories, light programs and yaw setpoints of the drones, not
+        simplified yet
     """
     trajectory_fps = settings.get("output_fps", _default_settings.output_fps)
     light_fps = settings.get("light_output_fps", _default_settings.light_output_fps)
@@ -620,84 +847,75 @@ def _get_trajectories_lights_and_yaw_setpoints(
         context=context,
     )
 
-    trajectories: dict[str, Trajectory]
-    lights: dict[str, LightProgram]
-    yaw_setpoints: dict[str, YawSetpointList]
-
     if trajectory_fps == light_fps:
         # This is easy, we can iterate over the show once
+        what = (
+            "trajectories, lights and yaw setpoints"
+            if use_yaw_control
+            else "trajectories and lights"
+        )
         with (
             suspended_safety_checks(),
             suspended_color_update_callbacks(),
-            report_progress_during_api_operation() as on_progress,
+            report_progress_during_api_operation() as reporter,
         ):
             frame_iter = frames.iter(
                 trajectory_fps,
-                operation=f"Sampling trajectories, lights and yaw setpoints at {trajectory_fps} FPS",
-                on_progress=on_progress,
+                operation=f"Sampling {what} at {trajectory_fps} FPS",
+                on_progress=combine_progress_handlers(reporter, on_progress),
             )
-            result = sample_positions_colors_and_yaw_of_objects(
+            samples = yield from iter_samples_of_objects(
                 drones,
                 frame_iter,
-                context=context,
+                positions=True,
+                colors=True,
+                yaw=use_yaw_control,
                 redraw=redraw,
-                simplify=True,
+                context=context,
             )
 
-        trajectories = {}
-        lights = {}
-        yaw_setpoints = {}
-
-        for key, (trajectory, light_program, yaw_curve) in result.items():
-            trajectories[key] = trajectory
-            lights[key] = light_program
-            yaw_setpoints[key] = yaw_curve
-
     else:
         # We need to iterate over the show twice, once for the trajectories
-        # and yaw setpoints, once for the lights
+        # (and yaw setpoints), once for the lights
+        what = "trajectories and yaw setpoints" if use_yaw_control else "trajectories"
         with suspended_safety_checks():
             with (
                 suspended_light_effects(),
-                report_progress_during_api_operation() as on_progress,
+                report_progress_during_api_operation() as reporter,
             ):
                 frame_iter = frames.iter(
                     trajectory_fps,
-                    operation=f"Sampling trajectories and yaw setpoints at {trajectory_fps} FPS",
-                    on_progress=on_progress,
+                    operation=f"Sampling {what} at {trajectory_fps} FPS",
+                    on_progress=combine_progress_handlers(reporter, on_progress),
                 )
-                result = sample_positions_and_yaw_of_objects(
+                samples = yield from iter_samples_of_objects(
                     drones,
                     frame_iter,
+                    positions=True,
+                    yaw=use_yaw_control,
                     context=context,
-                    simplify=True,
                 )
 
-                trajectories = {}
-                yaw_setpoints = {}
-
-                for key, (trajectory, yaw_curve) in result.items():
-                    trajectories[key] = trajectory
-                    yaw_setpoints[key] = yaw_curve
-
             with (
                 suspended_color_update_callbacks(),
-                report_progress_during_api_operation() as on_progress,
+                report_progress_during_api_operation() as reporter,
             ):
                 frame_iter = frames.iter(
                     light_fps,
                     operation=f"Sampling lights at {light_fps} FPS",
-                    on_progress=on_progress,
+                    on_progress=combine_progress_handlers(reporter, on_progress),
                 )
-                lights = sample_colors_of_objects(
+                light_samples = yield from iter_samples_of_objects(
                     drones,
                     frame_iter,
-                    context=context,
+                    colors=True,
                     redraw=redraw,
-                    simplify=True,
+                    context=context,
                 )
 
-    return trajectories, lights, yaw_setpoints
+        samples.lights = light_samples.lights
+
+    return samples
 
 
 @contextmanager
@@ -725,11 +943,30 @@ def _report_progress_on_console(title: str = "") -> Iterator[ProgressHandler]:
 
 @contextmanager
 def report_progress_during_api_operation(title: str = "") -> Iterator[ProgressHandler]:
+    with _report_progress_using_gateway(title, _find_gateway()) as on_progress:
+        yield on_progress
+
+
+def _find_gateway() -> SkybrushGatewayAPI | None:
+    """Returns the Studio Gateway configured in the add-on preferences, or
+    ``None`` if it is not configured or it could not be looked up.
+    """
     try:
-        gateway = get_gateway()
+        return get_gateway()
     except Exception:
-        gateway = None
+        return None
+
 
+@contextmanager
+def _report_progress_using_gateway(
+    title: str, gateway: SkybrushGatewayAPI | None
+) -> Generator[ProgressHandler]:
+    """Reports the progress of an API operation on the given Studio Gateway,
+    or on the console if there is no gateway or it is not functional.
+
+    Unlike `report_progress_during_api_operation()`, this function does not
+    access Blender.
+    """
     # Note that at this point it is not ensured that the gateway is running,
     # only that it is configured, so we need to test if it is functional
     # before we actually select it as the progress context.
@@ -12,6 +12,7 @@ from sbstudio.plugin.operators import (
     KMZExportOperator,
     LitebeeExportOperator,
     RefreshFileFormatsOperator,
+    SkybrushBundleExportOperator,
     SkybrushCSVExportOperator,
     SkybrushExportOperator,
     SkybrushPDFExportOperator,
@@ -117,6 +118,13 @@ class ExportPanel(Panel):
             layout.separator()
             needs_separator = False
 
+        layout.operator(
+            SkybrushBundleExportOperator.bl_idname,
+            text="Export to multiple formats",
+        )
+
+        layout.separator()
+
         layout.operator(
             RefreshFileFormatsOperator.bl_idname, text="Refresh file formats (PRO)"
         )
@@ -0,0 +1,162 @@
+"""Precomputed spatial features of the swarm that light effect presets can use
+to avoid recomputing the same position-dependent quantities in every frame.
+
+Most presets are a combination of some position-dependent quantity (polar
+angle around the swarm center, distance from the center etc.) and some
+time-dependent arithmetic. The position-dependent part does not change while
+the swarm is holding a static formation, so we calculate it once per formation
+hold and share it between frames and light effects.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from numpy import arctan2, degrees, float32, sqrt, subtract
+from numpy.typing import NDArray
+
+if TYPE_CHECKING:
+    from sbstudio.plugin.model.light_effects import LightEffectEvaluationContext
+
+__all__ = (
+    "SpatialFeatures",
+    "clear_spatial_feature_store",
+    "get_spatial_features",
+)
+
+
+def _read_only(array: NDArray[float32]) -> NDArray[float32]:
+    """Marks the given array as read-only and returns it."""
+    array.flags.writeable = False
+    return array
+
+
+class SpatialFeatures:
+    """Position-dependent features of a swarm, computed lazily on first access
+    and cached afterwards.
+
+    All per-drone arrays are ordered the same way as the positions that the
+    features were computed from. The arrays are shared between frames and
+    light effects, so they are read-only; presets must copy them before
+    modifying them.
+    """
+
+    positions: NDArray[float32]
+    """The positions of the drones, as an array of shape ``(N, 3)``."""
+
+    center: NDArray[float32]
+    """The barycenter of the swarm."""
+
+    _derived: dict[Hashable, Any]
+    """Additional cached quantities derived from the positions by the presets
+    themselves; see `get_or_compute()`.
+    """
+
+    def __init__(self, positions: NDArray[float32], center: NDArray[float32]):
+        """Constructor.
+
+        Parameters:
+            positions: the positions of the drones
+            center: the barycenter of the swarm
+        """
+        self.positions = positions
+        self.center = center
+        self._derived = {}
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @cached_property
+    def centered(self) -> NDArray[float32]:
+        """The positions of the drones relative to the barycenter of the swarm."""
+        return _read_only(subtract(self.positions, self.center, dtype=float32))
+
+    @cached_property
+    def angle(self) -> NDArray[float32]:
+        """The polar angle of each drone around the swarm center in the XY plane,
+        in degrees, in the range [0; 360).
+        """
+        dx = self.positions[:, 0] - self.center[0]
+        dy = self.positions[:, 1] - self.center[1]
+        return _read_only(degrees(arctan2(dy, dx)) % 360)
+
+    @cached_property
+    def radius(self) -> NDArray[float32]:
+        """The distance of each drone from the swarm center in the XY plane."""
+        dx = self.positions[:, 0] - self.center[0]
+        dy = self.positions[:, 1] - self.center[1]
+        return _read_only(sqrt(dx * dx + dy * dy))
+
+    @cached_property
+    def normalized_radius(self) -> NDArray[float32]:
+        """The distance of each drone from the swarm center in the XY plane,
+        divided by the largest such distance. When all the drones are at the
+        center, the radii are left unscaled.
+        """
+        r = self.radius
+        r_max = r.max() if len(r) > 0 else 1.0
+        if r_max == 0:
+            r_max = 1.0
+        return _read_only(r / r_max)
+
+    def get_or_compute(self, key: Hashable, func: Callable[[SpatialFeatures], Any]):
+        """Returns a quantity derived from the positions with the given key,
+        computing it with the given function if it has not been computed yet.
+
+        Presets can use this to cache time-independent parts of their
+        calculation. The key must be unique across all presets; the best is to
+        use a tuple whose first element is the ID of the preset.
+        """
+        try:
+            return self._derived[key]
+        except KeyError:
+            value = self._derived[key] = func(self)
+            return value
+
+
+_MAX_STORE_SIZE = 8
+"""Maximum number of feature sets to keep in the feature store."""
+
+_store: OrderedDict[tuple[str | None, int], SpatialFeatures] = OrderedDict()
+"""Feature store, keyed by the ID of the storyboard entry and a fingerprint of the
+positions that the features were computed from. Least recently used items are
+evicted first.
+"""
+
+
+def clear_spatial_feature_store() -> None:
+    """Removes all the feature sets from the feature store."""
+    _store.clear()
+
+
+def get_spatial_features(context: LightEffectEvaluationContext) -> SpatialFeatures:
+    """Returns the spatial features of the swarm in the given light effect
+    evaluation context.
+
+    The features are cached in the context itself so they are shared between
+    all the light effects evaluated in the same frame. They are also stored
+    in a global feature store, keyed by the storyboard entry and the positions
+    of the drones, so they are reused across frames while the swarm is holding
+    a static formation.
+    """
+    try:
+        return context._cache["spatial_features"]
+    except KeyError:
+        pass
+
+    positions = context.positions.as_array
+    key = (context.storyboard_entry_id, hash(positions.tobytes()))
+    features = _store.get(key)
+    if features is None or len(features) != len(positions):
+        features = SpatialFeatures(positions, context.swarm_center)
+        _store[key] = features
+        while len(_store) > _MAX_STORE_SIZE:
+            _store.popitem(last=False)
+    else:
+        _store.move_to_end(key)
+
+    context._cache["spatial_features"] = features
+    return features
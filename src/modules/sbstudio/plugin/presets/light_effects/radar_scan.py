@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from numpy import arctan2, degrees, float32, where
+from numpy import float32, where
 from numpy.typing import NDArray
 
 from .base import register_preset
+from .features import get_spatial_features
 from .utils import get_formation_indices
 
 if TYPE_CHECKING:
@@ -16,11 +17,9 @@ if TYPE_CHECKING:
 
 
 def _get_fan_phase_and_width(
-    positions: NDArray[float32], cx: float, cy: float, n: int
+    context: LightEffectEvaluationContext, n: int
 ) -> tuple[NDArray[float32], float]:
-    dx = positions[:, 0] - cx
-    dy = positions[:, 1] - cy
-    angles = degrees(arctan2(dy, dx)) % 360
+    angles = get_spatial_features(context).angle
     span = 360.0 / n
     half_span = span / 2
     return angles, half_span
@@ -48,9 +47,7 @@ def radar_scan(
     n = len(out)
     if n == 0:
         return
-    pos = context.positions.as_array
-    cx, cy, _ = context.swarm_center
-    angles, half_span = _get_fan_phase_and_width(pos, cx, cy, n)
+    angles, half_span = _get_fan_phase_and_width(context, n)
     indices = get_formation_indices(context)
     center_angle = (frame * 2) % 360
     out[:] = where(
@@ -75,9 +72,7 @@ def radar_scan_2(
     n = len(out)
     if n == 0:
         return
-    pos = context.positions.as_array
-    cx, cy, _ = context.swarm_center
-    angles, half_span = _get_fan_phase_and_width(pos, cx, cy, n)
+    angles, half_span = _get_fan_phase_and_width(context, n)
     center_angle = (-frame * 2) % 360
     out[:] = where(
         _is_in_fan(angles, center_angle, half_span),
@@ -102,9 +97,7 @@ def radar_scan_3(
     n = len(out)
     if n == 0:
         return
-    pos = context.positions.as_array
-    cx, cy, _ = context.swarm_center
-    angles, half_span = _get_fan_phase_and_width(pos, cx, cy, n)
+    angles, half_span = _get_fan_phase_and_width(context, n)
     center_angle = (frame * 2) % 360
     fi = get_formation_indices(context)
     out[:] = where(
@@ -129,9 +122,7 @@ def radar_scan_4(
     n = len(out)
     if n == 0:
         return
-    pos = context.positions.as_array
-    cx, cy, _ = context.swarm_center
-    angles, half_span = _get_fan_phase_and_width(pos, cx, cy, n)
+    angles, half_span = _get_fan_phase_and_width(context, n)
     center_angle = (frame * 3) % 360
     out[:] = where(
         _is_in_fan(angles, center_angle, half_span),
@@ -155,9 +146,7 @@ def radar_scan_5(
     n = len(out)
     if n == 0:
         return
-    pos = context.positions.as_array
-    cx, cy, _ = context.swarm_center
-    angles, half_span = _get_fan_phase_and_width(pos, cx, cy, n)
+    angles, half_span = _get_fan_phase_and_width(context, n)
     center_angle = (-frame * 3) % 360
     out[:] = where(
         _is_in_fan(angles, center_angle, half_span),
@@ -181,9 +170,7 @@ def continuous_radar_scan_test(
     n = len(out)
     if n == 0:
         return
-    pos = context.positions.as_array
-    cx, cy, _ = context.swarm_center
-    angles, _ = _get_fan_phase_and_width(pos, cx, cy, n)
+    angles, _ = _get_fan_phase_and_width(context, n)
     center_angle = (frame * 2) % 360
     diff = ((angles - center_angle + 180) % 360) - 180
     brightness = (1 - abs(diff / 30)).clip(0, 1)
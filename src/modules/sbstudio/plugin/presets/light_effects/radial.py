@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from numpy import float32, hypot, sin
+from numpy import float32, sin
 from numpy.typing import NDArray
 
 from .base import register_preset
+from .features import get_spatial_features
 
 if TYPE_CHECKING:
     from sbstudio.plugin.model.light_effects import (
@@ -26,13 +27,8 @@ def radial_diffusion(
     *,
     out: NDArray[float32],
 ) -> None:
-    positions = context.positions.as_array
-    cx, cy, _ = context.swarm_center
-    r = hypot(positions[:, 0] - cx, positions[:, 1] - cy)
-    r_max = r.max() if len(r) > 0 else 1.0
-    if r_max == 0:
-        r_max = 1.0
-    tau = (r / r_max - frame * 0.01) % 1.0
+    r = get_spatial_features(context).normalized_radius
+    tau = (r - frame * 0.01) % 1.0
     out[:] = ((sin(tau * 2 * 3.14159) + 1) / 2).astype(float32)
 
 
@@ -48,13 +44,8 @@ def radial_diffusion_2(
     *,
     out: NDArray[float32],
 ) -> None:
-    positions = context.positions.as_array
-    cx, cy, _ = context.swarm_center
-    r = hypot(positions[:, 0] - cx, positions[:, 1] - cy)
-    r_max = r.max() if len(r) > 0 else 1.0
-    if r_max == 0:
-        r_max = 1.0
-    tau = (r / r_max + frame * 0.01) % 1.0
+    r = get_spatial_features(context).normalized_radius
+    tau = (r + frame * 0.01) % 1.0
     out[:] = ((sin(tau * 2 * 3.14159) + 1) / 2).astype(float32)
 
 
@@ -70,13 +61,8 @@ def radial_diffusion_3(
     *,
     out: NDArray[float32],
 ) -> None:
-    positions = context.positions.as_array
-    cx, cy, _ = context.swarm_center
-    r = hypot(positions[:, 0] - cx, positions[:, 1] - cy)
-    r_max = r.max() if len(r) > 0 else 1.0
-    if r_max == 0:
-        r_max = 1.0
-    tau = (r / r_max - frame * 0.005) % 1.0
+    r = get_spatial_features(context).normalized_radius
+    tau = (r - frame * 0.005) % 1.0
     out[:] = ((sin(tau * 4 * 3.14159) + 1) / 2).astype(float32)
 
 
@@ -92,13 +78,8 @@ def radial_convergence(
     *,
     out: NDArray[float32],
 ) -> None:
-    positions = context.positions.as_array
-    cx, cy, _ = context.swarm_center
-    r = hypot(positions[:, 0] - cx, positions[:, 1] - cy)
-    r_max = r.max() if len(r) > 0 else 1.0
-    if r_max == 0:
-        r_max = 1.0
-    tau = (1 - r / r_max - frame * 0.01) % 1.0
+    r = get_spatial_features(context).normalized_radius
+    tau = (1 - r - frame * 0.01) % 1.0
     out[:] = ((sin(tau * 2 * 3.14159) + 1) / 2).astype(float32)
 
 
@@ -114,13 +95,8 @@ def radial_convergence_2(
     *,
     out: NDArray[float32],
 ) -> None:
-    positions = context.positions.as_array
-    cx, cy, _ = context.swarm_center
-    r = hypot(positions[:, 0] - cx, positions[:, 1] - cy)
-    r_max = r.max() if len(r) > 0 else 1.0
-    if r_max == 0:
-        r_max = 1.0
-    tau = (1 - r / r_max + frame * 0.01) % 1.0
+    r = get_spatial_features(context).normalized_radius
+    tau = (1 - r + frame * 0.01) % 1.0
     out[:] = ((sin(tau * 2 * 3.14159) + 1) / 2).astype(float32)
 
 
@@ -136,11 +112,6 @@ def radial_convergence_3(
     *,
     out: NDArray[float32],
 ) -> None:
-    positions = context.positions.as_array
-    cx, cy, _ = context.swarm_center
-    r = hypot(positions[:, 0] - cx, positions[:, 1] - cy)
-    r_max = r.max() if len(r) > 0 else 1.0
-    if r_max == 0:
-        r_max = 1.0
-    tau = (1 - r / r_max - frame * 0.005) % 1.0
+    r = get_spatial_features(context).normalized_radius
+    tau = (1 - r - frame * 0.005) % 1.0
     out[:] = ((sin(tau * 4 * 3.14159) + 1) / 2).astype(float32)
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from numpy import array, empty, float32, int32, subtract
+from numpy import array, empty, float32, int32
 from numpy.typing import NDArray
 
+from .features import get_spatial_features
+
 if TYPE_CHECKING:
     from sbstudio.plugin.model.light_effects import LightEffectEvaluationContext
 
@@ -28,7 +30,8 @@ def get_formation_indices(
 
 
 def get_centered_positions(context: LightEffectEvaluationContext) -> NDArray[float32]:
-    """Returns drone positions centered around the swarm's barycenter."""
-    positions = context.positions.as_array
-    center = context.swarm_center
-    return subtract(positions, center, dtype=float32)
+    """Returns drone positions centered around the swarm's barycenter.
+
+    The returned array is shared with other light effects and is read-only.
+    """
+    return get_spatial_features(context).centered
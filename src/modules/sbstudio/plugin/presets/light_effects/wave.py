@@ -6,6 +6,7 @@ from numpy import abs, clip, float32, sin
 from numpy.typing import NDArray
 
 from .base import register_preset
+from .features import get_spatial_features
 
 if TYPE_CHECKING:
     from sbstudio.plugin.model.light_effects import (
@@ -14,6 +15,15 @@ if TYPE_CHECKING:
     )
 
 
+def _get_sawtooth_offsets(
+    context: LightEffectEvaluationContext, axis: int
+) -> NDArray[float32]:
+    return get_spatial_features(context).get_or_compute(
+        ("wave_sawtooth", axis),
+        lambda features: sin(features.positions[:, axis] * 0.1) * 0.5,
+    )
+
+
 @register_preset(
     id="wave_sawtooth",
     label="Sawtooth Wave",
@@ -29,8 +39,7 @@ def wave_sawtooth(
     n = len(out)
     if n == 0:
         return
-    positions = context.positions.as_array
-    v = (frame * 0.05 + sin(positions[:, 0] * 0.1) * 0.5) % 1.0
+    v = (frame * 0.05 + _get_sawtooth_offsets(context, 0)) % 1.0
     out[:] = v.astype(float32)
 
 
@@ -49,8 +58,7 @@ def wave_sawtooth_2(
     n = len(out)
     if n == 0:
         return
-    positions = context.positions.as_array
-    v = (frame * 0.05 + sin(positions[:, 1] * 0.1) * 0.5) % 1.0
+    v = (frame * 0.05 + _get_sawtooth_offsets(context, 1)) % 1.0
     out[:] = v.astype(float32)
 
 
@@ -69,8 +77,7 @@ def wave_sawtooth_3(
     n = len(out)
     if n == 0:
         return
-    positions = context.positions.as_array
-    v = (frame * 0.05 + sin(positions[:, 2] * 0.1) * 0.5) % 1.0
+    v = (frame * 0.05 + _get_sawtooth_offsets(context, 2)) % 1.0
     out[:] = v.astype(float32)
 
 
@@ -89,8 +96,10 @@ def wave_triangle(
     n = len(out)
     if n == 0:
         return
-    positions = context.positions.as_array
-    v = (frame * 0.04 + sin(positions[:, 0] * 0.05)) % 1.0
+    offsets = get_spatial_features(context).get_or_compute(
+        ("wave_triangle",), lambda features: sin(features.positions[:, 0] * 0.05)
+    )
+    v = (frame * 0.04 + offsets) % 1.0
     out[:] = (1 - abs(2 * v - 1)).astype(float32)
 
 
@@ -109,14 +118,8 @@ def expanding_pulse(
     n = len(out)
     if n == 0:
         return
-    positions = context.positions.as_array
-    dx = positions[:, 0] - context.swarm_center[0]
-    dy = positions[:, 1] - context.swarm_center[1]
-    r = (dx * dx + dy * dy) ** 0.5
-    r_max = r.max() if len(r) > 0 else 1.0
-    if r_max == 0:
-        r_max = 1.0
-    v = (frame * 0.04 - r / r_max) % 1.0
+    r = get_spatial_features(context).normalized_radius
+    v = (frame * 0.04 - r) % 1.0
     out[:] = (1 - abs(2 * v - 1)).astype(float32)
 
 
@@ -135,14 +138,8 @@ def sawtooth_pulse(
     n = len(out)
     if n == 0:
         return
-    positions = context.positions.as_array
-    dx = positions[:, 0] - context.swarm_center[0]
-    dy = positions[:, 1] - context.swarm_center[1]
-    r = (dx * dx + dy * dy) ** 0.5
-    r_max = r.max() if len(r) > 0 else 1.0
-    if r_max == 0:
-        r_max = 1.0
-    v = (frame * 0.04 - r / r_max) % 1.0
+    r = get_spatial_features(context).normalized_radius
+    v = (frame * 0.04 - r) % 1.0
     out[:] = v.astype(float32)
 
 
@@ -161,8 +158,13 @@ def spatial_wave(
     n = len(out)
     if n == 0:
         return
-    positions = context.positions.as_array
-    phase = (frame * 0.1 + positions[:, 0] * 0.2 + positions[:, 1] * 0.1) / 6.28
+    offsets = get_spatial_features(context).get_or_compute(
+        ("spatial_wave",),
+        lambda features: (
+            features.positions[:, 0] * 0.2 + features.positions[:, 1] * 0.1
+        ),
+    )
+    phase = (frame * 0.1 + offsets) / 6.28
     v = (phase - phase.astype(int)).astype(float32)
     out[:] = clip(1.5 - abs(v - 0.5) * 4, 0, 1)
 
@@ -182,7 +184,12 @@ def spatial_wave_2(
     n = len(out)
     if n == 0:
         return
-    positions = context.positions.as_array
-    phase = (frame * 0.1 + positions[:, 0] * 0.1 + positions[:, 1] * 0.3) / 6.28
+    offsets = get_spatial_features(context).get_or_compute(
+        ("spatial_wave_2",),
+        lambda features: (
+            features.positions[:, 0] * 0.1 + features.positions[:, 1] * 0.3
+        ),
+    )
+    phase = (frame * 0.1 + offsets) / 6.28
     v = (phase - phase.astype(int)).astype(float32)
     out[:] = clip(1.5 - abs(v - 0.5) * 4, 0, 1)
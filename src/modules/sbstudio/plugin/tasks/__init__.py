@@ -1,14 +1,20 @@
 from .base import Task
+from .formation_cache import InvalidateFormationCacheTask
 from .initialization import InitializationTask
 from .light_effects import UpdateLightEffectsTask
 from .pixel_cache import InvalidatePixelCacheTask
 from .pyro_effects import PyroEffectsTask
 from .safety_check import SafetyCheckTask
+from .storyboard_cache import InvalidateStoryboardIndexTask
+from .vertex_group_cache import InvalidateVertexGroupCacheTask
 
 __all__ = (
     "Task",
     "InitializationTask",
+    "InvalidateFormationCacheTask",
     "InvalidatePixelCacheTask",
+    "InvalidateStoryboardIndexTask",
+    "InvalidateVertexGroupCacheTask",
     "PyroEffectsTask",
     "SafetyCheckTask",
     "UpdateLightEffectsTask",
@@ -31,6 +31,7 @@ _handler_names: list[str] = [
     "save_pre",
     "save_post",
     "undo_pre",
+    "undo_post",
     "version_update",
 ]
 
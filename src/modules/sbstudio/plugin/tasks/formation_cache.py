@@ -0,0 +1,38 @@
+from bpy.types import Depsgraph, Scene
+
+from sbstudio.plugin.model.formation import invalidate_formation_cache
+from sbstudio.plugin.tasks.base import Task
+
+__all__ = ("InvalidateFormationCacheTask",)
+
+
+def invalidate_formation_cache_on_depsgraph_update(
+    scene: Scene, depsgraph: Depsgraph
+) -> None:
+    """Invalidates the cached formation markers if objects, meshes or
+    collections were changed.
+    """
+    if (
+        depsgraph.id_type_updated("OBJECT")
+        or depsgraph.id_type_updated("MESH")
+        or depsgraph.id_type_updated("COLLECTION")
+    ):
+        invalidate_formation_cache()
+
+
+def invalidate_formation_cache_unconditionally(*args) -> None:
+    # Used to ignore the positional arguments
+    invalidate_formation_cache()
+
+
+class InvalidateFormationCacheTask(Task):
+    """Background task that is responsible for invalidating the cached marker
+    lists of formations when the formations change.
+    """
+
+    functions = {
+        "depsgraph_update_post": invalidate_formation_cache_on_depsgraph_update,
+        "load_post": invalidate_formation_cache_unconditionally,
+        "redo_post": invalidate_formation_cache_unconditionally,
+        "undo_post": invalidate_formation_cache_unconditionally,
+    }
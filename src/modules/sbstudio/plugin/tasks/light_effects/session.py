@@ -67,18 +67,21 @@ class LightEffectUpdateSession:
 
         if self._context is None:
             drones, base_colors = self._owner._create_mutable_color_array_for_drones()
+            storyboard = self._scene.skybrush.storyboard
+            entry_index = storyboard.get_index_of_entry_containing_frame(self._frame)
             self._context = LightEffectEvaluationContext(
                 drones=drones,
                 positions=ObjectPositions(drones),
-                mapping=self._scene.skybrush.storyboard.get_mapping_at_frame(
-                    self._frame
-                ),
+                mapping=storyboard.get_mapping_at_frame(self._frame),
                 # empty mask is enough because we will erase it anyway every time we
                 # evaluate a new effect
                 mask=empty((len(drones),), dtype=bool),
                 random_seq=self._scene.skybrush.settings.random_sequence_root,
                 backdrop=base_colors,
                 colors=empty_like(base_colors),
+                storyboard_entry_id=(
+                    storyboard.entries[entry_index].id if entry_index >= 0 else None
+                ),
             )
 
         return self._context
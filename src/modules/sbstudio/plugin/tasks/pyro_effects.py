@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 
 import bpy
 
+from sbstudio.model.types import Coordinate3D
 from sbstudio.plugin.constants import Collections
 from sbstudio.plugin.overlays.pyro import (
     DEFAULT_PYRO_OVERLAY_MARKER_COLOR,
@@ -15,7 +16,10 @@ from sbstudio.plugin.overlays.pyro import (
     PyroOverlayMarker,
 )
 from sbstudio.plugin.utils.evaluator import get_position_of_object
-from sbstudio.plugin.utils.pyro_markers import get_pyro_markers_of_object
+from sbstudio.plugin.utils.pyro_markers import (
+    get_pyro_event_index,
+    invalidate_pyro_event_index,
+)
 
 from .base import Task
 from .utils import Suspension
@@ -47,32 +51,51 @@ def run_update_pyro_overlay_markers(scene: Scene, depsgraph: Depsgraph) -> None:
     # active pyro effect at the moment
     frame = scene.frame_current
     fps = scene.render.fps
+    objects = drones.objects
+    index = get_pyro_event_index(drones, fps)
     overlay_markers: list[PyroOverlayMarker] = []
     overlay_info_blocks: list[PyroOverlayInfo] = []
-    for drone in drones.objects:
-        markers = get_pyro_markers_of_object(drone)
-        info_lines = []
-        position = None
-        for channel, marker in markers.markers.items():
-            if pyro_control.visualization == "INFO":
-                info_lines.append(f"C{channel} F{marker.frame}: {marker.payload.name}")
-            elif pyro_control.visualization == "MARKERS" and marker.is_active_at_frame(
-                frame, fps
-            ):
-                if position is None:
-                    position = get_position_of_object(drone)
-                # TODO: change color with pyro channel
-                color = DEFAULT_PYRO_OVERLAY_MARKER_COLOR
-                overlay_markers.append((position, color))
-        if info_lines:
+    if pyro_control.visualization == "INFO":
+        for drone_index, markers in enumerate(index.markers):
+            if markers.markers:
+                info_lines = [
+                    f"C{channel} F{marker.frame}: {marker.payload.name}"
+                    for channel, marker in markers.markers.items()
+                ]
+                position = get_position_of_object(objects[drone_index])
+                overlay_info_blocks.append((position, info_lines))
+    elif pyro_control.visualization == "MARKERS":
+        positions: dict[int, Coordinate3D] = {}
+        drone_indices, _ = index.get_events_active_at_frame(frame)
+        for drone_index in drone_indices.tolist():
+            position = positions.get(drone_index)
             if position is None:
-                position = get_position_of_object(drone)
-            overlay_info_blocks.append((position, info_lines))
+                position = positions[drone_index] = get_position_of_object(
+                    objects[drone_index]
+                )
+            # TODO: change color with pyro channel
+            color = DEFAULT_PYRO_OVERLAY_MARKER_COLOR
+            overlay_markers.append((position, color))
 
     pyro_control.update_pyro_overlay_markers(overlay_markers)
     pyro_control.update_pyro_overlay_info_blocks(overlay_info_blocks)
 
 
+def invalidate_pyro_event_index_on_depsgraph_update(
+    scene: Scene, depsgraph: Depsgraph
+) -> None:
+    """Invalidates the pyro event index if objects or collections were changed
+    (e.g., drones were added, removed or edited).
+    """
+    if depsgraph.id_type_updated("OBJECT") or depsgraph.id_type_updated("COLLECTION"):
+        invalidate_pyro_event_index()
+
+
+def invalidate_pyro_event_index_after_undo_redo(*args) -> None:
+    # Used to ignore the positional arguments
+    invalidate_pyro_event_index()
+
+
 def ensure_overlays_enabled():
     """Ensures that the pyro marker overlay is enabled after loading a file."""
     pyro_control = bpy.context.scene.skybrush.pyro_control
@@ -81,6 +104,7 @@ def ensure_overlays_enabled():
 
 def run_tasks_post_load(*args):
     """Runs all the tasks that should be completed after loading a file."""
+    invalidate_pyro_event_index()
     ensure_overlays_enabled()
 
 
@@ -96,7 +120,12 @@ class PyroEffectsTask(Task):
     """
 
     functions = {
-        "depsgraph_update_post": run_update_pyro_overlay_markers,
+        "depsgraph_update_post": [
+            invalidate_pyro_event_index_on_depsgraph_update,
+            run_update_pyro_overlay_markers,
+        ],
         "frame_change_post": run_update_pyro_overlay_markers,
         "load_post": run_tasks_post_load,
+        "redo_post": invalidate_pyro_event_index_after_undo_redo,
+        "undo_post": invalidate_pyro_event_index_after_undo_redo,
     }
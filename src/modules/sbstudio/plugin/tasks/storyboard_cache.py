@@ -0,0 +1,23 @@
+from sbstudio.plugin.model.storyboard import invalidate_storyboard_index
+from sbstudio.plugin.tasks.base import Task
+
+__all__ = ("InvalidateStoryboardIndexTask",)
+
+
+def invalidate_storyboard_index_unconditionally(*args) -> None:
+    # Used to ignore the positional arguments
+    invalidate_storyboard_index()
+
+
+class InvalidateStoryboardIndexTask(Task):
+    """Background task that is responsible for invalidating the cached frame
+    indices and decoded mappings of storyboards when the storyboard is replaced
+    behind our back (i.e. when a file is loaded or an operation is undone or
+    redone).
+    """
+
+    functions = {
+        "load_post": invalidate_storyboard_index_unconditionally,
+        "redo_post": invalidate_storyboard_index_unconditionally,
+        "undo_post": invalidate_storyboard_index_unconditionally,
+    }
@@ -0,0 +1,32 @@
+from bpy.types import Depsgraph, Scene
+
+from sbstudio.plugin.objects import invalidate_vertex_group_cache
+from sbstudio.plugin.tasks.base import Task
+
+__all__ = ("InvalidateVertexGroupCacheTask",)
+
+
+def invalidate_vertex_group_cache_on_depsgraph_update(
+    scene: Scene, depsgraph: Depsgraph
+) -> None:
+    """Invalidates the cached vertex group memberships if a mesh was changed."""
+    if depsgraph.id_type_updated("MESH"):
+        invalidate_vertex_group_cache()
+
+
+def invalidate_vertex_group_cache_unconditionally(*args) -> None:
+    # Used to ignore the positional arguments
+    invalidate_vertex_group_cache()
+
+
+class InvalidateVertexGroupCacheTask(Task):
+    """Background task that is responsible for invalidating the cached vertex
+    group memberships of meshes when the meshes change.
+    """
+
+    functions = {
+        "depsgraph_update_post": invalidate_vertex_group_cache_on_depsgraph_update,
+        "load_post": invalidate_vertex_group_cache_unconditionally,
+        "redo_post": invalidate_vertex_group_cache_unconditionally,
+        "undo_post": invalidate_vertex_group_cache_unconditionally,
+    }
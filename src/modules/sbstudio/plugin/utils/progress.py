@@ -2,10 +2,10 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Iterable, Iterator, Sized
-from itertools import chain
 from time import time
 from typing import Protocol, TypeVar
 
+from sbstudio.model.sampling import get_frame_step, get_sampled_frames
 from sbstudio.plugin.errors import TaskCancelled
 
 __all__ = (
@@ -13,6 +13,7 @@ __all__ = (
     "ProgressHandler",
     "StepBasedProgressReport",
     "FrameRange",
+    "combine_progress_handlers",
     "report_progress",
 )
 
@@ -218,6 +219,34 @@ ProgressHandler = Callable[[ProgressReport], bool]
 Return value of `True` means that the task needs to be cancelled."""
 
 
+def combine_progress_handlers(
+    *handlers: ProgressHandler | None,
+) -> ProgressHandler | None:
+    """Combines multiple progress handlers into a single one that forwards
+    each progress report to all the handlers.
+
+    The combined handler requests cancellation if at least one of the handlers
+    requested it. `None` handlers are ignored.
+
+    Returns:
+        the combined handler, or `None` if all the handlers were `None`
+    """
+    valid_handlers = [handler for handler in handlers if handler is not None]
+    if not valid_handlers:
+        return None
+    elif len(valid_handlers) == 1:
+        return valid_handlers[0]
+
+    def handler(progress: ProgressReport) -> bool:
+        cancelled = False
+        for handler in valid_handlers:
+            if handler(progress):
+                cancelled = True
+        return cancelled
+
+    return handler
+
+
 def report_progress(
     iterable: Iterable[T],
     *,
@@ -315,19 +344,9 @@ class FrameRange:
         operation: str | None = None,
         on_progress: ProgressHandler | None = None,
     ) -> Iterator[int]:
-        frame_step = max(1, int(self._fps // fps))
-
-        dist = self._end - self._start
-        if dist < 0:
-            return iter([])
-
-        if dist % frame_step == 0:
-            it = range(self._start, self._end + 1, frame_step)
-            size_hint = len(it)
-        else:
-            it = range(self._start, self._end, frame_step)
-            size_hint = len(it) + 1
-            it = chain(it, [self._end])
+        frame_step = get_frame_step(self._fps, fps)
+        it = get_sampled_frames(self._start, self._end, frame_step)
+        size_hint = len(it)
 
         def _report_factory(num_steps: int | None) -> StepBasedProgressReport:
             return _FrameIteratorProgressReport(
@@ -1,9 +1,9 @@
 from random import randint
 
 import bpy
-from bpy.types import Object, ParticleSystem
+from bpy.types import Collection, Object, ParticleSystem
 
-from sbstudio.model.pyro_markers import PyroMarker, PyroMarkers
+from sbstudio.model.pyro_markers import PyroEventIndex, PyroMarker, PyroMarkers
 from sbstudio.plugin.constants import NUM_PYRO_CHANNELS
 from sbstudio.plugin.materials import (
     detach_pyro_material_from_drone_template,
@@ -13,7 +13,9 @@ from sbstudio.plugin.materials import (
 __all__ = (
     "add_pyro_marker_to_object",
     "ensure_pyro_particle_system",
+    "get_pyro_event_index",
     "get_pyro_markers_of_object",
+    "invalidate_pyro_event_index",
     "remove_pyro_particle_system",
     "set_pyro_markers_of_object",
     "update_pyro_particles_of_object",
@@ -33,6 +35,56 @@ def add_pyro_marker_to_object(ob: Object, channel: int, marker: PyroMarker) -> N
     set_pyro_markers_of_object(ob, markers)
 
 
+_pyro_event_index: PyroEventIndex | None = None
+"""Global pyro event index of the drones in the scene; ``None`` if it has not
+been built yet or if it has been invalidated.
+"""
+
+_pyro_event_index_key: tuple[str, int, float] | None = None
+"""Key of the global pyro event index that identifies the drone collection
+and the frame rate that the index was built for.
+"""
+
+
+def get_pyro_event_index(drones: Collection, fps: float) -> PyroEventIndex:
+    """Returns the pyro event index of the given drone collection, building
+    it first if needed.
+
+    The index is cached and it is rebuilt only if it was invalidated with
+    `invalidate_pyro_event_index()`, or if the number of drones or the frame
+    rate changed since the index was built. Drone indices in the index refer
+    to the order of the objects in the drone collection.
+
+    Args:
+        drones: the collection containing the drones
+        fps: the number of frames per second in the scene
+
+    Returns:
+        the pyro event index of the drones
+    """
+    global _pyro_event_index, _pyro_event_index_key
+
+    objects = drones.objects
+    key = (drones.name, len(objects), fps)
+    if _pyro_event_index is None or _pyro_event_index_key != key:
+        _pyro_event_index = PyroEventIndex.from_markers(
+            [get_pyro_markers_of_object(drone) for drone in objects], fps
+        )
+        _pyro_event_index_key = key
+
+    return _pyro_event_index
+
+
+def invalidate_pyro_event_index() -> None:
+    """Invalidates the global pyro event index. Must be called whenever the
+    pyro markers of a drone are modified.
+    """
+    global _pyro_event_index, _pyro_event_index_key
+
+    _pyro_event_index = None
+    _pyro_event_index_key = None
+
+
 def get_pyro_markers_of_object(ob: Object) -> PyroMarkers:
     """Get pyro markers from the Skybrush context of an object.
 
@@ -110,6 +162,7 @@ def set_pyro_markers_of_object(ob: Object, markers: PyroMarkers) -> None:
         markers: the markers to set
     """
     ob.skybrush.pyro_markers = markers.as_str()
+    invalidate_pyro_event_index()
 
     update_pyro_particles_of_object(ob)
 
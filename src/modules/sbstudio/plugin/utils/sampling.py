@@ -1,5 +1,6 @@
 from collections import defaultdict
-from collections.abc import Iterable, Sequence
+from collections.abc import Generator, Iterable, Sequence
+from dataclasses import dataclass, field, replace
 
 import bpy
 from bpy.types import Context, Object
@@ -7,6 +8,7 @@ from bpy.types import Context, Object
 from sbstudio.model.color import Color4D
 from sbstudio.model.light_program import LightProgram
 from sbstudio.model.point import Point4D
+from sbstudio.model.simplification_cache import SimplificationCache
 from sbstudio.model.trajectory import Trajectory
 from sbstudio.model.yaw import YawSetpoint, YawSetpointList
 from sbstudio.plugin.tasks.light_effects import get_final_color_of_drone
@@ -14,13 +16,21 @@ from sbstudio.plugin.utils.evaluator import (
     get_position_of_object,
     get_xyz_euler_rotation_of_object,
 )
-from sbstudio.plugin.utils.progress import FrameRange
+from sbstudio.plugin.utils.progress import (
+    FrameRange,
+    ProgressHandler,
+    StepBasedProgressReport,
+    report_progress,
+)
+from sbstudio.utils import run_to_completion
 
 from .decorators import with_context
 
 __all__ = (
     "each_frame_in",
     "frame_range",
+    "iter_samples_of_objects",
+    "ObjectSamples",
     "sample_colors_of_objects",
     "sample_positions_of_objects",
     "sample_positions_and_yaw_of_objects",
@@ -78,6 +88,161 @@ def each_frame_in(
         yield frame, time
 
 
+@dataclass
+class ObjectSamples:
+    """Positions, colors and yaw angles sampled from a set of Blender objects,
+    indexed by the names of the objects.
+    """
+
+    trajectories: dict[str, Trajectory] = field(default_factory=dict)
+    """The sampled trajectories of the objects."""
+
+    lights: dict[str, LightProgram] = field(default_factory=dict)
+    """The sampled light programs of the objects."""
+
+    yaw_setpoints: dict[str, YawSetpointList] = field(default_factory=dict)
+    """The sampled yaw setpoints of the objects."""
+
+    def decimate(
+        self, trajectory_indices: Sequence[int], light_indices: Sequence[int]
+    ) -> "ObjectSamples":
+        """Returns a subset of the samples, taken at a subset of the frames that
+        these samples were taken at.
+
+        The returned samples do not share any objects with these samples so
+        either of them can be modified in place.
+
+        Parameters:
+            trajectory_indices: the indices of the frames of the trajectories
+                and the yaw setpoints to keep
+            light_indices: the indices of the frames of the light programs to
+                keep
+        """
+        return ObjectSamples(
+            trajectories={
+                key: Trajectory(
+                    [replace(trajectory.points[i]) for i in trajectory_indices]
+                )
+                for key, trajectory in self.trajectories.items()
+            },
+            lights={
+                key: LightProgram([replace(program.colors[i]) for i in light_indices])
+                for key, program in self.lights.items()
+            },
+            yaw_setpoints={
+                key: YawSetpointList(
+                    [replace(setpoints.setpoints[i]) for i in trajectory_indices]
+                )
+                for key, setpoints in self.yaw_setpoints.items()
+            },
+        )
+
+    def simplify(
+        self,
+        *,
+        cache: SimplificationCache | None = None,
+        on_progress: ProgressHandler | None = None,
+    ) -> None:
+        """Simplifies the trajectories, light programs and yaw setpoints in
+        place by removing excess samples that are identical to previous ones.
+
+        Does not need access to Blender so it can be called from a worker
+        thread.
+
+        Parameters:
+            cache: optional cache of simplified light programs; light programs
+                that are found in the cache are not simplified again
+            on_progress: optional progress handler that is notified after each
+                object is processed
+        """
+        keys = list({**self.trajectories, **self.lights, **self.yaw_setpoints})
+        for key in report_progress(
+            keys,
+            operation="Simplifying samples",
+            report_factory=StepBasedProgressReport,
+            on_progress=on_progress,
+        ):
+            if key in self.trajectories:
+                self.trajectories[key].simplify_in_place()
+            if key in self.lights:
+                self.lights[key] = (
+                    cache.simplify_light_program(key, self.lights[key])
+                    if cache is not None
+                    else self.lights[key].simplify()
+                )
+            if key in self.yaw_setpoints:
+                self.yaw_setpoints[key] = self.yaw_setpoints[key].simplify()
+
+
+@with_context
+def iter_samples_of_objects(
+    objects: Sequence[Object],
+    frames: Iterable[int],
+    *,
+    positions: bool = False,
+    colors: bool = False,
+    yaw: bool = False,
+    redraw: bool = False,
+    context: Context | None = None,
+) -> Generator[int, None, ObjectSamples]:
+    """Samples the positions, colors and/or yaw angles of the given Blender
+    objects at the given frames, one frame at a time.
+
+    The generator yields the index of each frame after it has been sampled so
+    the caller can interleave sampling with other work (e.g., redrawing the
+    user interface) and returns the samples when all the frames have been
+    processed. The samples are not simplified.
+
+    Parameters:
+        objects: the Blender objects to process
+        frames: an iterable yielding the indices of the frames to process
+        positions: whether to sample the positions of the objects
+        colors: whether to sample the colors of the objects
+        yaw: whether to sample the yaw angles of the objects
+        redraw: whether to redraw the Blender window after each frame is set
+            (this is necessary to ensure that the light colors are updated
+            correctly for video-based light effects)
+        context: the Blender execution context; `None` means the current
+            Blender context
+    """
+    trajectories = defaultdict(Trajectory)
+    lights = defaultdict(LightProgram)
+    yaw_setpoints = defaultdict(YawSetpointList)
+
+    for frame, time in each_frame_in(frames, context=context, redraw=redraw):
+        for obj in objects:
+            key = obj.name
+            if positions:
+                trajectories[key].append(Point4D(time, *get_position_of_object(obj)))
+            if colors:
+                color = get_final_color_of_drone(obj)
+                lights[key].append(
+                    Color4D(
+                        time,
+                        _to_int_255(color[0]),
+                        _to_int_255(color[1]),
+                        _to_int_255(color[2]),
+                    )
+                )
+            if yaw:
+                rotation = get_xyz_euler_rotation_of_object(obj)
+                # note the conversion from Blender CCW to Skybrush CW representation
+                yaw_setpoints[key].append(YawSetpoint(time, -rotation[2]))
+
+        yield frame
+
+    # Ensure that the yaw curve makes sense even if the extracted yaw angles
+    # "wrap around" the boundary between -180 and 180 degrees
+    for yaw_setpoint_list in yaw_setpoints.values():
+        yaw_setpoint_list.unwrap()
+
+    return ObjectSamples(
+        trajectories=dict(trajectories),
+        lights=dict(lights),
+        yaw_setpoints=dict(yaw_setpoints),
+    )
+
+
 @with_context
 def sample_positions_of_objects(
     objects: Sequence[Object],
@@ -102,17 +267,12 @@ def sample_positions_of_objects(
     Returns:
         a dictionary mapping the names of the objects to their trajectories
     """
-    trajectories = defaultdict(Trajectory)
-
-    for _, time in each_frame_in(frames, context=context):
-        for obj in objects:
-            key = obj.name
-            trajectories[key].append(Point4D(time, *get_position_of_object(obj)))
-
+    samples = run_to_completion(
+        iter_samples_of_objects(objects, frames, positions=True, context=context)
+    )
     if simplify:
-        return {key: value.simplify_in_place() for key, value in trajectories.items()}
-    else:
-        return dict(trajectories)
+        samples.simplify()
+    return samples.trajectories
 
 
 @with_context
@@ -140,36 +300,17 @@ def sample_positions_and_yaw_of_objects(
     Returns:
         a dictionaries mapping the names of the objects to their trajectories and yaw setpoints
     """
-    trajectories = defaultdict(Trajectory)
-    yaw_setpoints = defaultdict(YawSetpointList)
-
-    for _, time in each_frame_in(frames, context=context):
-        for obj in objects:
-            key = obj.name
-            trajectories[key].append(Point4D(time, *get_position_of_object(obj)))
-            rotation = get_xyz_euler_rotation_of_object(obj)
-            # note the conversion from Blender CCW to Skybrush CW representation
-            yaw_setpoints[key].append(YawSetpoint(time, -rotation[2]))
-
-    # Ensure that the yaw curve makes sense even if the extracted yaw angles
-    # "wrap around" the boundary between -180 and 180 degrees
-    for yaw in yaw_setpoints.values():
-        yaw.unwrap()
-
+    samples = run_to_completion(
+        iter_samples_of_objects(
+            objects, frames, positions=True, yaw=True, context=context
+        )
+    )
     if simplify:
-        return {
-            key: (
-                trajectory.simplify_in_place(),
-                yaw_setpoints[key].simplify(),
-            )
-            for key, trajectory in trajectories.items()
-        }
-
-    else:
-        return {
-            key: (trajectory, yaw_setpoints[key])
-            for key, trajectory in trajectories.items()
-        }
+        samples.simplify()
+    return {
+        key: (trajectory, samples.yaw_setpoints[key])
+        for key, trajectory in samples.trajectories.items()
+    }
 
 
 @with_context
@@ -201,25 +342,14 @@ def sample_colors_of_objects(
     Returns:
         a dictionary mapping the names of the objects to their light programs
     """
-    lights = defaultdict(LightProgram)
-
-    for _, time in each_frame_in(frames, context=context, redraw=redraw):
-        for obj in objects:
-            key = obj.name
-            color = get_final_color_of_drone(obj)
-            lights[key].append(
-                Color4D(
-                    time,
-                    _to_int_255(color[0]),
-                    _to_int_255(color[1]),
-                    _to_int_255(color[2]),
-                )
-            )
-
+    samples = run_to_completion(
+        iter_samples_of_objects(
+            objects, frames, colors=True, redraw=redraw, context=context
+        )
+    )
     if simplify:
-        return {key: value.simplify() for key, value in lights.items()}
-    else:
-        return dict(lights)
+        samples.simplify()
+    return samples.lights
 
 
 @with_context
@@ -252,33 +382,22 @@ def sample_positions_and_colors_of_objects(
         a dictionary mapping the names of the objects to their trajectories
         and light programs
     """
-    trajectories = defaultdict(Trajectory)
-    lights = defaultdict(LightProgram)
-
-    for _, time in each_frame_in(frames, context=context, redraw=redraw):
-        for obj in objects:
-            key = obj.name
-            pos = get_position_of_object(obj)
-            color = get_final_color_of_drone(obj)
-            trajectories[key].append(Point4D(time, *pos))
-            lights[key].append(
-                Color4D(
-                    time,
-                    _to_int_255(color[0]),
-                    _to_int_255(color[1]),
-                    _to_int_255(color[2]),
-                )
-            )
-
+    samples = run_to_completion(
+        iter_samples_of_objects(
+            objects,
+            frames,
+            positions=True,
+            colors=True,
+            redraw=redraw,
+            context=context,
+        )
+    )
     if simplify:
-        return {
-            key: (trajectory.simplify_in_place(), lights[key].simplify())
-            for key, trajectory in trajectories.items()
-        }
-    else:
-        return {
-            key: (trajectory, lights[key]) for key, trajectory in trajectories.items()
-        }
+        samples.simplify()
+    return {
+        key: (trajectory, samples.lights[key])
+        for key, trajectory in samples.trajectories.items()
+    }
 
 
 @with_context
@@ -312,47 +431,23 @@ def sample_positions_colors_and_yaw_of_objects(
         a dictionary mapping the names of the objects to their trajectories and
         light programs
     """
-    trajectories = defaultdict(Trajectory)
-    lights = defaultdict(LightProgram)
-    yaw_setpoints = defaultdict(YawSetpointList)
-
-    for _, time in each_frame_in(frames, context=context, redraw=redraw):
-        for obj in objects:
-            key = obj.name
-            pos = get_position_of_object(obj)
-            color = get_final_color_of_drone(obj)
-            rotation = get_xyz_euler_rotation_of_object(obj)
-            trajectories[key].append(Point4D(time, *pos))
-            lights[key].append(
-                Color4D(
-                    time,
-                    _to_int_255(color[0]),
-                    _to_int_255(color[1]),
-                    _to_int_255(color[2]),
-                )
-            )
-            # note the conversion from Blender CCW to Skybrush CW representation
-            yaw_setpoints[key].append(YawSetpoint(time, -rotation[2]))
-
-    # Ensure that the yaw curve makes sense even if the extracted yaw angles
-    # "wrap around" the boundary between -180 and 180 degrees
-    for yaw in yaw_setpoints.values():
-        yaw.unwrap()
-
+    samples = run_to_completion(
+        iter_samples_of_objects(
+            objects,
+            frames,
+            positions=True,
+            colors=True,
+            yaw=True,
+            redraw=redraw,
+            context=context,
+        )
+    )
     if simplify:
-        return {
-            key: (
-                trajectory.simplify_in_place(),
-                lights[key].simplify(),
-                yaw_setpoints[key].simplify(),
-            )
-            for key, trajectory in trajectories.items()
-        }
-    else:
-        return {
-            key: (trajectory, lights[key], yaw_setpoints[key])
-            for key, trajectory in trajectories.items()
-        }
+        samples.simplify()
+    return {
+        key: (trajectory, samples.lights[key], samples.yaw_setpoints[key])
+        for key, trajectory in samples.trajectories.items()
+    }
 
 
 @with_context
@@ -0,0 +1,190 @@
+"""Content-addressed cache for the responses of deterministic API requests."""
+
+from collections.abc import Iterator
+from hashlib import blake2b
+from json import dumps
+from os import scandir, utime
+from pathlib import Path
+from threading import Lock, get_ident
+from typing import Any
+
+from sbstudio.utils import LRUCache
+
+__all__ = ("ResponseCache",)
+
+
+class ResponseCache:
+    """Two-level cache of API responses, keyed by a hash of the endpoint, the
+    request body and the version of the server.
+
+    Responses are kept in a size-limited in-memory cache with LRU eviction,
+    and optionally also in a directory on disk so they survive restarts. The
+    disk cache is bounded by the total size of the stored responses; when the
+    limit is exceeded, the least recently used responses are removed.
+
+    The cache is safe to use from multiple threads.
+    """
+
+    directory: Path | None
+    """The directory where the responses are stored on disk; ``None`` if the
+    responses are kept in memory only.
+    """
+
+    max_disk_size: int
+    """Maximum total size of the responses stored on disk, in bytes."""
+
+    _disk_size: int | None
+    """Total size of the responses stored on disk; ``None`` if it has not
+    been calculated yet.
+    """
+
+    _lock: Lock
+    """Lock that guards the in-memory cache and the disk size counter."""
+
+    _memory: LRUCache[str, bytes]
+    """The in-memory cache."""
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        *,
+        max_items_in_memory: int = 256,
+        max_disk_size: int = 256 * 1024 * 1024,
+    ):
+        """Constructor.
+
+        Args:
+            directory: the directory where the responses are stored on disk;
+                ``None`` to keep the responses in memory only
+            max_items_in_memory: maximum number of responses to keep in memory
+            max_disk_size: maximum total size of the responses stored on
+                disk, in bytes
+        """
+        self.directory = Path(directory) if directory is not None else None
+        self.max_disk_size = max_disk_size
+
+        self._disk_size = None
+        self._lock = Lock()
+        self._memory = LRUCache(max_items_in_memory)
+
+    @staticmethod
+    def key_of(endpoint: str, body: Any, version: str) -> str:
+        """Returns the cache key of a request.
+
+        Args:
+            endpoint: the endpoint that the request is sent to
+            body: the JSON body of the request
+            version: the version of the server that handles the request
+        """
+        canonical_body = dumps(body, sort_keys=True, separators=(",", ":"))
+        hasher = blake2b(digest_size=20)
+        for part in (endpoint, version, canonical_body):
+            hasher.update(part.encode("utf-8"))
+            hasher.update(b"\0")
+        return hasher.hexdigest()
+
+    def clear(self) -> None:
+        """Removes all the responses from the cache."""
+        with self._lock:
+            self._memory.clear()
+            self._disk_size = None
+
+        for path in self._iter_disk_entries():
+            path.unlink(missing_ok=True)
+
+    def get(self, key: str) -> bytes | None:
+        """Returns the response stored with the given key, or ``None`` if the
+        cache does not contain such a response.
+        """
+        with self._lock:
+            value = self._memory.get(key) if key in self._memory else None
+
+        path = self._path_of(key)
+        if path is None:
+            return value
+
+        try:
+            if value is None:
+                value = path.read_bytes()
+                with self._lock:
+                    self._memory[key] = value
+
+            # Mark the response as recently used for the disk cache as well
+            utime(path)
+        except OSError:
+            pass
+
+        return value
+
+    def put(self, key: str, value: bytes) -> None:
+        """Stores a response in the cache with the given key."""
+        with self._lock:
+            self._memory[key] = value
+
+        path = self._path_of(key)
+        if path is None:
+            return
+
+        try:
+            old_size = path.stat().st_size if path.exists() else 0
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{get_ident()}.tmp")
+            tmp_path.write_bytes(value)
+            tmp_path.replace(path)
+        except OSError:
+            # Disk cache is best-effort only
+            return
+
+        with self._lock:
+            if self._disk_size is None:
+                self._disk_size = sum(
+                    entry.stat().st_size for entry in self._iter_disk_entries()
+                )
+            else:
+                self._disk_size += len(value) - old_size
+            needs_eviction = self._disk_size > self.max_disk_size
+
+        if needs_eviction:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Removes the least recently used responses from the disk cache until
+        the total size of the stored responses falls below the limit.
+        """
+        entries = []
+        for path in self._iter_disk_entries():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        entries.sort()
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total_size <= self.max_disk_size:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+        with self._lock:
+            self._disk_size = total_size
+
+    def _iter_disk_entries(self) -> Iterator[Path]:
+        """Iterates over the paths of the responses stored on disk."""
+        if self.directory is None:
+            return
+
+        try:
+            with scandir(self.directory) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith(".json"):
+                        yield Path(entry.path)
+        except OSError:
+            return
+
+    def _path_of(self, key: str) -> Path | None:
+        """Returns the path of the file storing the response with the given
+        key on disk, or ``None`` if the cache is in-memory only.
+        """
+        return self.directory / f"{key}.json" if self.directory else None
@@ -0,0 +1,82 @@
+"""Timer that measures how long the individual steps of loading and registering
+the add-on take.
+"""
+
+import logging
+from collections.abc import Generator
+from contextlib import contextmanager
+from time import perf_counter
+
+__all__ = ("StartupTimer",)
+
+
+class StartupTimer:
+    """Measures the duration of the individual steps of the startup of the
+    add-on, such as importing its modules and registering its types, and
+    reports them when the total duration exceeds a given budget.
+
+    Note that the duration of an import step includes the time needed to import
+    all the modules that it depends on and that have not been imported yet, so
+    the order of the steps matters when interpreting the results.
+    """
+
+    budget: float | None
+    """Time budget of the startup, in seconds; ``None`` if there is no
+    budget.
+    """
+
+    steps: list[tuple[str, float]]
+    """Names and durations of the steps measured so far, in the order they
+    were measured.
+    """
+
+    def __init__(self, budget: float | None = None):
+        """Constructor.
+
+        Args:
+            budget: time budget of the startup, in seconds
+        """
+        self.budget = budget
+        self.steps = []
+
+    @property
+    def total(self) -> float:
+        """Total duration of the steps measured so far, in seconds."""
+        return sum(duration for _, duration in self.steps)
+
+    @property
+    def over_budget(self) -> bool:
+        """Whether the total duration of the steps exceeds the budget."""
+        return self.budget is not None and self.total > self.budget
+
+    def format(self) -> str:
+        """Formats the durations of the steps as a human-readable report, with
+        the slowest steps first.
+        """
+        lines = [f"Startup took {self.total * 1000:.1f} ms"]
+        for name, duration in sorted(self.steps, key=lambda step: -step[1]):
+            lines.append(f"  {duration * 1000:8.1f} ms  {name}")
+        return "\n".join(lines)
+
+    @contextmanager
+    def measure(self, name: str) -> Generator[None]:
+        """Context manager that measures the duration of the step with the
+        given name.
+        """
+        started_at = perf_counter()
+        try:
+            yield
+        finally:
+            self.steps.append((name, perf_counter() - started_at))
+
+    def report(self, log: logging.Logger) -> None:
+        """Writes the report to the given logger, as a warning if the startup
+        exceeded its budget and as a debug message otherwise.
+        """
+        level = logging.WARNING if self.over_budget else logging.DEBUG
+        if log.isEnabledFor(level):
+            log.log(level, self.format())
+
+    def reset(self) -> None:
+        """Forgets all the steps measured so far."""
+        self.steps.clear()
@@ -1,6 +1,6 @@
 import importlib.util
 from collections import OrderedDict
-from collections.abc import Callable, Iterable, MutableMapping, Sequence
+from collections.abc import Callable, Generator, Iterable, MutableMapping, Sequence
 from contextlib import contextmanager
 from functools import wraps
 from pathlib import Path
@@ -17,6 +17,8 @@ __all__ = (
     "create_path_and_open",
     "distance_sq_of",
     "measure_time",
+    "PhaseTimer",
+    "run_to_completion",
     "simplify_path",
 )
 
@@ -122,6 +124,61 @@ def measure_time(message: str, *, enabled: bool = True) -> Iterator[None]:
         print(f"{message}: {elapsed_msec:.6f} msec")
 
 
+class PhaseTimer:
+    """Accumulates the time spent in the named phases of a longer operation so
+    the durations can be reported at the end of the operation.
+
+    Example::
+
+        timer = PhaseTimer()
+        with timer.phase("mapping"):
+            ...
+        with timer.phase("curve write"):
+            ...
+        log.info(f"Transition finished: {timer}")
+    """
+
+    _durations: dict[str, int]
+    """Total time spent in each phase so far, in nanoseconds, in the order the
+    phases were first entered.
+    """
+
+    def __init__(self):
+        self._durations = {}
+
+    def __str__(self) -> str:
+        return ", ".join(
+            f"{name} {duration / 1_000_000:.1f} ms"
+            for name, duration in self._durations.items()
+        )
+
+    @property
+    def durations(self) -> dict[str, float]:
+        """The total time spent in each phase so far, in seconds."""
+        return {
+            name: duration / 1_000_000_000 for name, duration in self._durations.items()
+        }
+
+    def add(self, other: "PhaseTimer") -> None:
+        """Adds the time spent in the phases of another timer to the phases
+        of this timer.
+        """
+        for name, duration in other._durations.items():
+            self._durations[name] = self._durations.get(name, 0) + duration
+
+    @contextmanager
+    def phase(self, name: str) -> Generator[None]:
+        """Context manager that adds the time spent in the execution context to
+        the phase with the given name.
+        """
+        start = monotonic_ns()
+        try:
+            yield
+        finally:
+            elapsed = monotonic_ns() - start
+            self._durations[name] = self._durations.get(name, 0) + elapsed
+
+
 def negate(func: Callable[..., bool]) -> Callable[..., bool]:
     """Decorator that takes a function that returns a Boolean value and returns
     another function that returns the negation of the result of the original
@@ -142,6 +199,17 @@ EqFunc = Callable[[T, T], bool]
 """Type of an equality function used by `simplify_path`."""
 
 
+def run_to_completion(generator: Generator[Any, Any, T]) -> T:
+    """Runs the given generator until it is exhausted, discarding the items it
+    yields, and returns its return value.
+    """
+    while True:
+        try:
+            next(generator)
+        except StopIteration as ex:
+            return ex.value
+
+
 def simplify_path(
     points: Sequence[T],
     *,
@@ -0,0 +1,18 @@
+"""Shared configuration of the unit tests."""
+
+import sys
+from types import ModuleType
+
+try:
+    import mathutils  # noqa: F401
+except ImportError:
+    # Some model classes (e.g., Color4D and Point4D) import Blender's mathutils
+    # module only to provide conversions to mathutils.Vector. Install a minimal
+    # stand-in so these classes can be tested outside Blender.
+    class Vector(tuple):
+        def __new__(cls, values=()):
+            return super().__new__(cls, values)
+
+    mathutils = ModuleType("mathutils")
+    mathutils.Vector = Vector
+    sys.modules["mathutils"] = mathutils
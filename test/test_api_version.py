@@ -0,0 +1,85 @@
+"""Unit tests for the cache of the known versions of the Studio server."""
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from time import sleep
+
+import pytest
+from sbstudio.api import SkybrushStudioAPI
+from sbstudio.api import version as version_module
+from sbstudio.api.constants import BINARY_POINTS_FEATURE
+from sbstudio.api.types import Limits, Version
+from sbstudio.api.version import get_backend_version, is_backend_version_at_least
+
+
+class _CountingAPI(SkybrushStudioAPI):
+    """API object that counts the queries it would send to the server instead
+    of sending them. Copies of the object record their queries in the same
+    list.
+    """
+
+    def __init__(self, *args, **kwds):
+        super().__init__(*args, **kwds)
+        self.queries = []
+
+    def get_limits(self) -> Limits:
+        self.queries.append("limits")
+        return Limits(features=[BINARY_POINTS_FEATURE])
+
+    def get_version(self) -> Version:
+        self.queries.append("version")
+        # Give the other threads a chance to query the version concurrently
+        sleep(0.01)
+        return Version(2, 40, 0)
+
+    @staticmethod
+    def _find_gateway():
+        return None
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    version_module._backend_versions.clear()
+    yield
+    version_module._backend_versions.clear()
+
+
+class TestBackendVersionCache:
+    def test_copies_share_the_version(self):
+        api = _CountingAPI("http://localhost:8000")
+        assert get_backend_version(api) == Version(2, 40, 0)
+
+        copies = [api.with_gateway_resolved() for _ in range(3)]
+        for copy in copies:
+            assert is_backend_version_at_least(Version(2, 0, 0), api=copy)
+            assert copy._supports_binary_points()
+
+        assert api.queries == ["version", "limits"]
+
+    def test_concurrent_queries_from_copies(self):
+        api = _CountingAPI("http://localhost:8000")
+        copies = [api.with_gateway_resolved() for _ in range(8)]
+        barrier = Barrier(len(copies))
+
+        def query(copy):
+            barrier.wait()
+            return get_backend_version(copy)
+
+        with ThreadPoolExecutor(max_workers=len(copies)) as pool:
+            versions = list(pool.map(query, copies))
+
+        assert versions == [Version(2, 40, 0)] * len(copies)
+        assert api.queries.count("version") == 1
+
+        # The original object finds the version queried by the copies
+        get_backend_version(api)
+        assert api.queries.count("version") == 1
+
+    def test_different_servers(self):
+        first = _CountingAPI("http://localhost:8000")
+        second = _CountingAPI("http://localhost:8001")
+        third = _CountingAPI("http://localhost:8000", api_key="secret-key")
+        for api in (first, second, third, first, second, third):
+            get_backend_version(api)
+
+        assert [api.queries for api in (first, second, third)] == [["version"]] * 3
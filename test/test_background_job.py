@@ -0,0 +1,141 @@
+"""Unit tests for the long-running jobs that keep the user interface of
+Blender responsive.
+"""
+
+from threading import Event
+from time import perf_counter, sleep
+
+import pytest
+from sbstudio.background_job import BackgroundJob
+from sbstudio.plugin.errors import TaskCancelled
+
+
+def steps(num_steps, worker, *, delay=0.0, log=None):
+    """Main-thread phase of a job that takes the given number of steps and
+    then returns the given worker function.
+    """
+    for index in range(num_steps):
+        if delay:
+            sleep(delay)
+        if log is not None:
+            log.append(index)
+        yield index
+    return worker
+
+
+def wait_until_finished(job, timeout=5):
+    deadline = perf_counter() + timeout
+    while not job.step(0.01):
+        assert perf_counter() < deadline, "job did not finish in time"
+        sleep(0.001)
+
+
+class TestBackgroundJob:
+    def test_run(self):
+        log = []
+        job = BackgroundJob(steps(5, lambda on_progress: 42, log=log))
+        assert job.run() == 42
+        assert log == [0, 1, 2, 3, 4]
+        assert not job.running_in_background
+
+    def test_step_is_time_sliced(self):
+        log = []
+        job = BackgroundJob(steps(10, lambda on_progress: 42, delay=0.01, log=log))
+
+        assert not job.step(0.025)
+        assert 1 <= len(log) < 10
+        assert not job.running_in_background
+
+        wait_until_finished(job)
+        assert log == list(range(10))
+        assert job.result() == 42
+
+    def test_result_before_finished(self):
+        job = BackgroundJob(steps(3, lambda on_progress: 42))
+        with pytest.raises(RuntimeError, match="not finished"):
+            job.result()
+
+    def test_result_after_exception_in_main_thread_phase(self):
+        def failing_steps():
+            yield
+            raise ValueError("boom")
+
+        job = BackgroundJob(failing_steps())
+        with pytest.raises(ValueError, match="boom"):
+            wait_until_finished(job)
+
+    def test_result_after_exception_in_worker(self):
+        def worker(on_progress):
+            raise ValueError("boom")
+
+        job = BackgroundJob(steps(3, worker))
+        wait_until_finished(job)
+        with pytest.raises(ValueError, match="boom"):
+            job.result()
+
+    def test_cancel_in_main_thread_phase(self):
+        log = []
+        job = BackgroundJob(steps(10, lambda on_progress: 42, delay=0.01, log=log))
+        job.step(0.015)
+        job.cancel()
+
+        assert job.cancelled
+        assert job.step()
+        assert len(log) < 10
+        with pytest.raises(TaskCancelled):
+            job.result()
+
+    def test_cancel_in_worker_phase(self):
+        started = Event()
+        handler_results = []
+
+        def worker(on_progress):
+            started.set()
+            while not on_progress(None):
+                sleep(0.001)
+            handler_results.append(on_progress(None))
+            raise TaskCancelled("worker noticed the cancellation")
+
+        job = BackgroundJob(steps(1, worker))
+        while not job.running_in_background:
+            job.step()
+        assert started.wait(5)
+        assert job.handle_progress(None) is False
+
+        job.cancel()
+        wait_until_finished(job)
+
+        assert handler_results == [True]
+        with pytest.raises(TaskCancelled, match="worker noticed"):
+            job.result()
+
+    def test_late_exception_after_cancellation_is_not_lost(self):
+        started = Event()
+        release = Event()
+
+        def worker(on_progress):
+            started.set()
+            release.wait(5)
+            raise ValueError("upload failed")
+
+        job = BackgroundJob(steps(1, worker))
+        while not job.running_in_background:
+            job.step()
+        assert started.wait(5)
+
+        job.cancel()
+        assert not job.step()
+
+        release.set()
+        wait_until_finished(job)
+        with pytest.raises(ValueError, match="upload failed"):
+            job.result()
+
+    def test_handle_progress_records_last_report(self):
+        job = BackgroundJob(steps(1, lambda on_progress: None))
+        assert job.handle_progress("first") is False
+        assert job.handle_progress("second") is False
+        assert job.progress == "second"
+
+        job.cancel()
+        assert job.handle_progress("third") is True
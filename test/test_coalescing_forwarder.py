@@ -0,0 +1,79 @@
+"""Unit tests for the rate-limited coalescing forwarder."""
+
+from threading import Event
+from time import monotonic, sleep
+
+from sbstudio.coalescing_forwarder import CoalescingForwarder
+
+
+class Recorder:
+    def __init__(self, *, cancel_after: int | None = None, delay: float = 0.0):
+        self.items = []
+        self.sent_at = []
+        self.cancel_after = cancel_after
+        self.delay = delay
+        self.first_sent = Event()
+
+    def __call__(self, item) -> bool:
+        sleep(self.delay)
+        self.items.append(item)
+        self.sent_at.append(monotonic())
+        self.first_sent.set()
+        return self.cancel_after is not None and len(self.items) > self.cancel_after
+
+
+class TestCoalescingForwarder:
+    def test_coalesces_items(self):
+        recorder = Recorder(delay=0.05)
+        with CoalescingForwarder(recorder, max_rate=1000, poll_interval=None) as fwd:
+            fwd.submit(0)
+            assert recorder.first_sent.wait(1)
+            for i in range(1, 100):
+                fwd.submit(i)
+
+        assert recorder.items[0] == 0
+        assert recorder.items[-1] == 99
+        assert len(recorder.items) < 10
+
+    def test_rate_limit(self):
+        recorder = Recorder()
+        with CoalescingForwarder(recorder, max_rate=20, poll_interval=None) as fwd:
+            started_at = monotonic()
+            while monotonic() - started_at < 0.3:
+                fwd.submit(monotonic())
+                sleep(0.001)
+
+        intervals = [b - a for a, b in zip(recorder.sent_at, recorder.sent_at[1:-1])]
+        assert 3 <= len(recorder.items) <= 10
+        assert all(interval >= 0.045 for interval in intervals)
+
+    def test_close_sends_pending_item(self):
+        recorder = Recorder()
+        with CoalescingForwarder(recorder, max_rate=0.1, poll_interval=None) as fwd:
+            fwd.submit("first")
+            assert recorder.first_sent.wait(1)
+            fwd.submit("second")
+            fwd.submit("last")
+
+        assert recorder.items == ["first", "last"]
+
+    def test_polls_cancellation(self):
+        recorder = Recorder(cancel_after=1)
+        with CoalescingForwarder(recorder, poll_interval=0.02) as fwd:
+            assert not fwd.submit("item")
+            sleep(0.2)
+            assert fwd.cancelled
+            assert fwd.submit("another")
+
+        assert recorder.items[:2] == ["item", "item"]
+
+    def test_error_stops_forwarding(self):
+        def send(item) -> bool:
+            raise RuntimeError("boom")
+
+        with CoalescingForwarder(send) as fwd:
+            fwd.submit(1)
+            sleep(0.05)
+            fwd.submit(2)
+
+        assert not fwd.cancelled
@@ -0,0 +1,213 @@
+"""Unit tests for the pool of persistent HTTP connections."""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import loads
+from threading import Thread
+from time import sleep
+from urllib.error import HTTPError, URLError
+
+import pytest
+from sbstudio.connection_pool import ConnectionPool
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.num_connections += 1  # type: ignore
+
+    def do_CONNECT(self):
+        # Refuse to open tunnels; we only check that the tunnel is requested
+        self.server.requests.append(("CONNECT", self.path, self.headers))  # type: ignore
+        self._respond(403, b"{}")
+
+    def do_GET(self):
+        self.server.requests.append(("GET", self.path, self.headers))  # type: ignore
+        if self.path == "/error":
+            self._respond(400, b'{"detail": "bad request"}')
+        elif self.path == "/close":
+            self._respond(200, b"{}", close=True)
+        elif self.path == "/drop":
+            # Close the connection without notifying the client
+            self._respond(200, b"{}")
+            self.close_connection = True
+        elif self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/echo")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        else:
+            self._respond(200, f'{{"path": "{self.path}"}}'.encode())
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        self._respond(200, self.rfile.read(length))
+
+    def log_message(self, format, *args):
+        pass
+
+    def _respond(self, status: int, body: bytes, *, close: bool = False):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if close:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture(autouse=True)
+def no_proxy_in_environment(monkeypatch):
+    for scheme in ("http", "https", "all"):
+        monkeypatch.delenv(f"{scheme}_proxy", raising=False)
+        monkeypatch.delenv(f"{scheme.upper()}_PROXY", raising=False)
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    server.num_connections = 0  # type: ignore
+    server.requests = []  # type: ignore
+    thread = Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def url(server):
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}"
+
+
+def get(pool: ConnectionPool, url: str):
+    with pool.request("GET", url) as response:
+        return loads(response.read())
+
+
+class TestConnectionPool:
+    def test_reuses_connection(self, server, url):
+        pool = ConnectionPool()
+        for i in range(5):
+            assert get(pool, f"{url}/echo/{i}") == {"path": f"/echo/{i}"}
+        with pool.request("POST", f"{url}/post", body=b"[1, 2]") as response:
+            assert loads(response.read()) == [1, 2]
+
+        assert server.num_connections == 1
+        assert pool.num_idle_connections == 1
+
+    def test_unread_body_is_drained(self, server, url):
+        pool = ConnectionPool()
+        for _ in range(3):
+            with pool.request("GET", f"{url}/echo"):
+                pass
+        assert server.num_connections == 1
+
+    def test_idle_timeout(self, server, url):
+        pool = ConnectionPool(idle_timeout=0.05)
+        get(pool, f"{url}/echo")
+        get(pool, f"{url}/echo")
+        sleep(0.1)
+        get(pool, f"{url}/echo")
+        assert server.num_connections == 2
+
+    def test_bounded_number_of_idle_connections(self, server, url):
+        pool = ConnectionPool(max_idle_connections_per_host=2)
+        with (
+            pool.request("GET", f"{url}/1") as r1,
+            pool.request("GET", f"{url}/2") as r2,
+            pool.request("GET", f"{url}/3") as r3,
+        ):
+            for response in (r1, r2, r3):
+                response.read()
+
+        assert server.num_connections == 3
+        assert pool.num_idle_connections == 2
+
+        pool.close()
+        assert pool.num_idle_connections == 0
+
+    def test_connection_close(self, server, url):
+        pool = ConnectionPool()
+        get(pool, f"{url}/close")
+        assert pool.num_idle_connections == 0
+        get(pool, f"{url}/echo")
+        assert server.num_connections == 2
+
+    def test_stale_connection_is_retried(self, server, url):
+        pool = ConnectionPool()
+        get(pool, f"{url}/drop")
+        sleep(0.05)
+        assert get(pool, f"{url}/echo") == {"path": "/echo"}
+        assert server.num_connections == 2
+
+    def test_http_error(self, server, url):
+        pool = ConnectionPool()
+        with pytest.raises(HTTPError) as info:
+            get(pool, f"{url}/error")
+
+        assert info.value.status == 400
+        assert loads(info.value.read()) == {"detail": "bad request"}
+
+        get(pool, f"{url}/echo")
+        assert server.num_connections == 1
+
+    def test_redirect(self, server, url):
+        pool = ConnectionPool()
+        assert get(pool, f"{url}/redirect") == {"path": "/echo"}
+        assert server.num_connections == 1
+
+    def test_connection_refused(self, server, url):
+        server.shutdown()
+        server.server_close()
+        with pytest.raises(URLError) as info:
+            get(ConnectionPool(), f"{url}/echo")
+        assert isinstance(info.value.reason, ConnectionRefusedError)
+
+    def test_user_agent(self, server, url):
+        get(ConnectionPool(), f"{url}/echo")
+        with ConnectionPool().request(
+            "GET", f"{url}/echo", headers={"user-agent": "test"}
+        ):
+            pass
+
+        agents = [headers.get("User-Agent") for _, _, headers in server.requests]
+        assert agents[0].startswith("Python-urllib/")
+        assert agents[1] == "test"
+
+
+class TestProxy:
+    def test_http_proxy(self, server, url):
+        pool = ConnectionPool(proxies={"http": f"http://user:p%40ss@{url[7:]}"})
+        for _ in range(2):
+            assert get(pool, "http://example.invalid:8080/echo?x=1#y") == {
+                "path": "http://example.invalid:8080/echo?x=1"
+            }
+
+        _, _, headers = server.requests[0]
+        assert headers["Host"] == "example.invalid:8080"
+        assert headers["Proxy-Authorization"] == "Basic dXNlcjpwQHNz"
+        assert server.num_connections == 1
+
+    def test_https_tunnel(self, server, url):
+        pool = ConnectionPool(proxies={"https": url})
+        with pytest.raises(URLError, match="403"):
+            get(pool, "https://example.invalid/echo")
+
+        assert server.requests[0][:2] == ("CONNECT", "example.invalid:443")
+
+    def test_bypass(self, server, url):
+        pool = ConnectionPool(
+            proxies={"http": "http://example.invalid:3128", "no": "foo, 127.0.0.1"}
+        )
+        assert get(pool, f"{url}/echo") == {"path": "/echo"}
+
+    def test_unsupported_proxy(self):
+        pool = ConnectionPool(proxies={"http": "socks5://127.0.0.1:1080"})
+        with pytest.raises(URLError, match="unsupported proxy"):
+            get(pool, "http://example.invalid/echo")
@@ -0,0 +1,69 @@
+"""Unit tests for the loading of the translations of the user interface."""
+
+from json import dump
+
+from sbstudio.i18n import TranslationCatalog, compile_translations
+from sbstudio.i18n.translations import translations_dict
+
+
+class TestTranslations:
+    def test_compiled_translations_are_up_to_date(self):
+        # If this test fails, run etc/scripts/sort_translations.py
+        catalog = TranslationCatalog()
+        for locale in catalog.available_locales:
+            catalog.ensure_loaded(locale)
+
+        expected = {}
+        for lang, translations in translations_dict.items():
+            translations = {key: value for key, value in translations.items() if key[1]}
+            if translations:
+                expected[lang] = translations
+
+        assert catalog.translations == expected
+
+    def test_compile_skips_headers_fuzzy_and_empty_translations(self):
+        compiled = compile_translations(
+            [
+                (
+                    ("*", ""),
+                    ((), ()),
+                    ("hu_HU", "Project-Id-Version: ...", (False, ())),
+                ),
+                (
+                    ("*", "Foo"),
+                    ((), ()),
+                    ("hu_HU", "Izé", (False, ())),
+                    ("de_DE", "", (False, ())),
+                ),
+                (("Operator", "Bar"), ((), ()), ("hu_HU", "Bigyó", (True, ()))),
+                (("*", "Baz"), ((), ()), ("hu_HU", "Hoppá", (False, ()))),
+            ]
+        )
+        assert compiled == {"hu_HU": [("*", "Baz", "Hoppá"), ("*", "Foo", "Izé")]}
+
+
+class TestTranslationCatalog:
+    def test_loads_locales_on_demand(self, tmp_path):
+        for lang, items in {
+            "sr": [["*", "Foo", "Фу"]],
+            "sr_RS@latin": [["*", "Foo", "Fu"]],
+            "hu_HU": [["*", "Foo", "Izé"]],
+        }.items():
+            with (tmp_path / f"{lang}.json").open("w", encoding="utf-8") as fp:
+                dump(items, fp)
+
+        catalog = TranslationCatalog(tmp_path)
+        assert catalog.available_locales == ["hu_HU", "sr", "sr_RS@latin"]
+        assert catalog.translations == {}
+
+        assert not catalog.ensure_loaded("en_US")
+        assert catalog.ensure_loaded("sr_RS@latin")
+        assert catalog.translations == {
+            "sr": {("*", "Foo"): "Фу"},
+            "sr_RS@latin": {("*", "Foo"): "Fu"},
+        }
+        assert not catalog.ensure_loaded("sr_RS@latin")
+
+        report = catalog.format_memory_report()
+        assert report.startswith("Loaded translations for sr, sr_RS@latin")
+        assert "skipped 1 other language(s)" in report
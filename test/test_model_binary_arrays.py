@@ -0,0 +1,39 @@
+"""Unit tests for the binary representation of point sets and index arrays."""
+
+from base64 import b64decode, b64encode
+
+import pytest
+from numpy.testing import assert_allclose
+from sbstudio.model.binary_arrays import (
+    decode_index_array,
+    decode_point_array,
+    encode_index_array,
+    encode_point_array,
+)
+
+
+class TestPointArrays:
+    def test_round_trip(self):
+        points = [(0.0, 1.5, -2.25), (1000.125, 3.0, 40.5)]
+        encoded = encode_point_array(points)
+        assert len(b64decode(encoded)) == 24
+        assert_allclose(decode_point_array(encoded), points)
+
+    def test_empty(self):
+        assert encode_point_array([]) == ""
+        assert decode_point_array("") == []
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            encode_point_array([(1.0, 2.0)])
+        with pytest.raises(ValueError):
+            decode_point_array(b64encode(bytes(8)).decode("ascii"))
+
+
+class TestIndexArrays:
+    def test_round_trip(self):
+        items = [2, None, 0, 1, None]
+        assert decode_index_array(encode_index_array(items)) == items
+
+    def test_empty(self):
+        assert decode_index_array(encode_index_array([])) == []
@@ -0,0 +1,120 @@
+"""Unit tests for the influence curves of transitions."""
+
+import pytest
+from numpy.testing import assert_array_equal
+from sbstudio.errors import SkybrushStudioError
+from sbstudio.model.influence_curves import (
+    InfluenceCurveDescriptor,
+    InfluenceCurveKeyframes,
+    InfluenceCurveTransitionType,
+    plan_influence_curves,
+)
+
+SMOOTH = InfluenceCurveTransitionType.SMOOTH
+
+
+def plan(mapping, **kwds):
+    args = {
+        "name": "test",
+        "scene_start_frame": 0,
+        "windup_start_frame": 100,
+        "start_frame": 200,
+        "end_frame": 300,
+        "windup_type": SMOOTH,
+    }
+    args.update(kwds)
+    return plan_influence_curves(mapping, **args)
+
+
+class TestPlanInfluenceCurves:
+    def test_unmapped_drones(self):
+        descriptors = plan([None, 2, None, 0, 1])
+        assert descriptors[0] is None
+        assert descriptors[2] is None
+        for index in (1, 3, 4):
+            descriptor = descriptors[index]
+            assert descriptor is not None
+            assert descriptor.windup_start_frame == 100
+            assert descriptor.start_frame == 200
+            assert descriptor.end_frame == 300
+
+    def test_all_unmapped(self):
+        assert plan([None, None]) == [None, None]
+
+    def test_first_transition(self):
+        descriptors = plan([1, None, 0], is_first=True)
+        assert descriptors[1] is None
+        for index in (0, 2):
+            descriptor = descriptors[index]
+            assert descriptor is not None
+            assert descriptor.windup_start_frame == 0
+            assert descriptor.start_frame == 0
+
+    def test_staggered_with_unmapped_drones(self):
+        mapping = [None, 1, 0, None, 2]
+        departure_indices = {1: 0, 2: 1, 4: 2}
+        queried = []
+
+        def get_departure_index(drone_index):
+            queried.append(drone_index)
+            return departure_indices[drone_index]
+
+        descriptors = plan(
+            mapping,
+            pre_delay_per_drone=10,
+            post_delay_per_drone=5,
+            get_departure_index=get_departure_index,
+            get_arrival_index=lambda drone_index: mapping[drone_index],
+        )
+
+        # Arrival delays are calculated from the number of drones that are
+        # actually transitioning, not from the number of drones
+        assert descriptors[0] is None
+        assert descriptors[3] is None
+        assert [
+            (d.windup_start_frame, d.start_frame) for d in descriptors if d is not None
+        ] == [(100, 195), (110, 190), (120, 200)]
+        assert queried == [1, 2, 4]
+
+    def test_schedule_overrides(self):
+        descriptors = plan(
+            [0, None, 1],
+            schedule_overrides={1: (20, 30)},
+            get_departure_index=lambda drone_index: drone_index // 2,
+        )
+        assert descriptors[1] is None
+        assert descriptors[0] == InfluenceCurveDescriptor(0, 100, 200, 300)
+        assert descriptors[2] == InfluenceCurveDescriptor(0, 120, 170, 300)
+
+    def test_not_enough_time(self):
+        with pytest.raises(SkybrushStudioError, match="at drone index 3"):
+            plan(
+                [None, 0, 1],
+                pre_delay_per_drone=60,
+                get_departure_index=lambda drone_index: drone_index,
+                get_arrival_index=lambda drone_index: drone_index,
+            )
+
+
+class TestInfluenceCurveKeyframes:
+    def test_keyframes(self):
+        keyframes = InfluenceCurveKeyframes.from_descriptors(
+            [
+                InfluenceCurveDescriptor(0, 100, 200, 300),
+                InfluenceCurveDescriptor(
+                    0, 0, 0, None, InfluenceCurveTransitionType.LINEAR
+                ),
+            ]
+        )
+        assert_array_equal(keyframes.frames[0], [0, 100, 200, 300])
+        assert_array_equal(keyframes.mask[0], [True, True, True, True])
+        assert_array_equal(keyframes.values[0], [0, 0, 1, 1])
+        assert keyframes.interpolations[0].tolist() == [
+            "LINEAR",
+            "BEZIER",
+            "LINEAR",
+            "LINEAR",
+        ]
+
+        assert_array_equal(keyframes.frames[1, keyframes.mask[1]], [-1, 0])
+        assert keyframes.interpolations[1].tolist() == ["LINEAR"] * 4
@@ -0,0 +1,86 @@
+"""Unit tests for the FrameIntervalIndex class."""
+
+import random
+
+import pytest
+from sbstudio.model.intervals import FrameIntervalIndex
+
+
+def _containing(starts, ends, frame):
+    for index, (start, end) in enumerate(zip(starts, ends)):
+        if start <= frame <= end:
+            return index
+    return -1
+
+
+def _after(starts, ends, frame):
+    best, closest = float("inf"), -1
+    for index, start in enumerate(starts):
+        if start > frame and start - frame < best:
+            best, closest = start - frame, index
+    return closest
+
+
+def _before(starts, ends, frame):
+    best, closest = float("inf"), -1
+    for index, end in enumerate(ends):
+        if end <= frame and frame - end < best:
+            best, closest = frame - end, index
+    return closest
+
+
+class TestFrameIntervalIndex:
+    def test_empty(self):
+        index = FrameIntervalIndex([], [])
+        assert len(index) == 0
+        assert index.find_interval_containing(0) == -1
+        assert index.find_first_interval_after(0) == -1
+        assert index.find_last_interval_before(0) == -1
+
+    def test_unsorted_intervals(self):
+        index = FrameIntervalIndex([200, 0, 100], [249, 49, 149])
+        assert index.find_interval_containing(0) == 1
+        assert index.find_interval_containing(49) == 1
+        assert index.find_interval_containing(50) == -1
+        assert index.find_interval_containing(120) == 2
+        assert index.find_interval_containing(250) == -1
+        assert index.find_first_interval_after(49) == 2
+        assert index.find_first_interval_after(200) == -1
+        assert index.find_last_interval_before(160) == 2
+        assert index.find_last_interval_before(48) == -1
+
+    def test_length_mismatch(self):
+        with pytest.raises(ValueError):
+            FrameIntervalIndex([1, 2], [3])
+
+    @pytest.mark.parametrize("overlapping", [False, True])
+    def test_matches_linear_scan(self, overlapping):
+        rng = random.Random(42)
+        for _ in range(50):
+            starts, ends = [], []
+            frame = 0
+            for _ in range(rng.randint(1, 12)):
+                if overlapping:
+                    frame = rng.randint(0, 100)
+                else:
+                    frame += rng.randint(1, 10)
+                starts.append(frame)
+                frame += rng.randint(0, 10)
+                ends.append(frame)
+            if not overlapping:
+                order = list(range(len(starts)))
+                rng.shuffle(order)
+                starts = [starts[i] for i in order]
+                ends = [ends[i] for i in order]
+
+            index = FrameIntervalIndex(starts, ends)
+            for frame in range(-2, max(ends) + 3):
+                assert index.find_interval_containing(frame) == _containing(
+                    starts, ends, frame
+                )
+                assert index.find_first_interval_after(frame) == _after(
+                    starts, ends, frame
+                )
+                assert index.find_last_interval_before(frame) == _before(
+                    starts, ends, frame
+                )
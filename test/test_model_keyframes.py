@@ -0,0 +1,31 @@
+"""Unit tests for the Blender-independent helpers of keyframes."""
+
+from sbstudio.model.keyframes import resolve_keyframe_values
+
+
+class TestResolveKeyframeValues:
+    def test_scalar(self):
+        values = [(1, None), (5, 2.5), (9, None)]
+        assert resolve_keyframe_values(values, 7.0) == [(1, 7.0), (5, 2.5), (9, 7.0)]
+
+    def test_array(self):
+        values = [(1, None), (5, (1.0, 2.0, 3.0)), (9, None)]
+        current = (7.0, 8.0, 9.0)
+        assert resolve_keyframe_values(values, current, 0) == [
+            (1, 7.0),
+            (5, 1.0),
+            (9, 7.0),
+        ]
+        assert resolve_keyframe_values(values, current, 2) == [
+            (1, 9.0),
+            (5, 3.0),
+            (9, 9.0),
+        ]
+
+    def test_every_none_value_uses_the_current_value(self):
+        # None values must be treated the same way at every frame, whether it
+        # is the first frame or a later one, so keyframes that exist already
+        # are overwritten with the current value as well
+        values = [(frame, None) for frame in range(0, 100, 10)]
+        resolved = resolve_keyframe_values(values, 4.0)
+        assert [value for _, value in resolved] == [4.0] * 10
@@ -0,0 +1,61 @@
+"""Unit tests for the Google Earth KMZ writer."""
+
+from io import BytesIO
+from xml.etree import ElementTree
+from zipfile import ZipFile
+
+import numpy as np
+import pytest
+from sbstudio.model.kmz import write_kmz
+from sbstudio.model.location import ShowLocation
+
+NS = {
+    "kml": "http://www.opengis.net/kml/2.2",
+    "gx": "http://www.google.com/kml/ext/2.2",
+}
+
+
+def write(tables, **kwds) -> ElementTree.Element:
+    output = BytesIO()
+    location = ShowLocation(orientation=90, latitude=47.0, longitude=19.0)
+    write_kmz(output, tables, location=location, **kwds)
+    with ZipFile(output) as zip_file:
+        assert zip_file.namelist() == ["doc.kml"]
+        return ElementTree.fromstring(zip_file.read("doc.kml"))
+
+
+class TestKMZWriter:
+    def test_tracks(self):
+        table = np.array([[0, 0, 0, 1, 255, 0, 0], [0.5, 100, 0, 2, 255, 0, 0]])
+        root = write([("A & B", table)], title="Show", mode="point")
+
+        assert root.findtext("kml:Document/kml:name", namespaces=NS) == "Show"
+        placemarks = root.findall("kml:Document/kml:Placemark", NS)
+        assert len(placemarks) == 1
+        assert placemarks[0].findtext("kml:name", namespaces=NS) == "A & B"
+
+        track = placemarks[0].find("gx:Track", NS)
+        assert track is not None
+        whens = [e.text for e in track.findall("kml:when", NS)]
+        assert whens == ["1970-01-01T00:00:00.000Z", "1970-01-01T00:00:00.500Z"]
+
+        # X axis points to the East so moving along X changes the longitude only
+        coords = [e.text.split() for e in track.findall("gx:coord", NS)]
+        (lon0, lat0, alt0), (lon1, lat1, alt1) = [map(float, c) for c in coords]
+        assert (lon0, lat0, alt0) == (19.0, 47.0, 1.0)
+        assert lat1 == pytest.approx(47.0)
+        assert lon1 == pytest.approx(19.0013, abs=1e-4)
+        assert alt1 == 2.0
+
+    def test_trajectory_mode(self):
+        table = np.array([[0, 0, 0, 1, 0, 0, 255], [1, 0, 10, 2, 0, 0, 255]])
+        root = write([("d1", table), ("d2", table)], mode="trajectory")
+
+        placemarks = root.findall("kml:Document/kml:Placemark", NS)
+        assert [p.findtext("kml:name", namespaces=NS) for p in placemarks] == [
+            "d1",
+            "d1 trajectory",
+            "d2",
+            "d2 trajectory",
+        ]
+        assert placemarks[1].find("kml:LineString", NS) is not None
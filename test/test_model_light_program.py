@@ -0,0 +1,58 @@
+"""Unit tests for the rasterization of light programs."""
+
+from numpy.testing import assert_allclose
+from sbstudio.model.color import Color4D
+from sbstudio.model.light_program import LightProgram, rasterize_light_programs
+
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+BLUE = (0, 0, 255)
+
+
+def _program(*keys: tuple[float, tuple[int, int, int], bool]) -> LightProgram:
+    return LightProgram([Color4D(t, *rgb, is_fade=fade) for t, rgb, fade in keys])
+
+
+def _rgba(rgb: tuple[int, int, int]) -> list[float]:
+    return [rgb[0] / 255, rgb[1] / 255, rgb[2] / 255, 1.0]
+
+
+class TestRasterizeLightPrograms:
+    def test_shape_and_alpha(self):
+        result = rasterize_light_programs([_program((0, RED, True))] * 3, 10, 7)
+        assert result.shape == (3, 7, 4)
+        assert result.dtype.name == "float32"
+        assert_allclose(result[..., 3], 1.0)
+
+    def test_step_colors(self):
+        program = _program((0, RED, True), (0.2, GREEN, True), (0.5, BLUE, True))
+        result = rasterize_light_programs([program], 10, 7)
+        expected = [RED, RED, GREEN, GREEN, GREEN, BLUE, BLUE]
+        assert_allclose(result[0], [_rgba(rgb) for rgb in expected])
+
+    def test_programs_are_relative_to_their_first_keyframe(self):
+        program = _program((3, RED, True), (3.2, GREEN, True))
+        result = rasterize_light_programs([program], 10, 4)
+        expected = [RED, RED, GREEN, GREEN]
+        assert_allclose(result[0], [_rgba(rgb) for rgb in expected])
+
+    def test_last_keyframe_beyond_range(self):
+        program = _program((0, RED, True), (0.1, GREEN, True), (1, BLUE, True))
+        result = rasterize_light_programs([program], 10, 4)
+        expected = [RED, GREEN, GREEN, BLUE]
+        assert_allclose(result[0], [_rgba(rgb) for rgb in expected])
+
+    def test_fades(self):
+        program = _program((0, RED, True), (0.4, (0, 0, 0), True), (0.6, BLUE, False))
+        result = rasterize_light_programs([program], 10, 8, fades=True)
+        assert_allclose(result[0, :5, 0], [1.0, 0.75, 0.5, 0.25, 0.0])
+        assert_allclose(result[0, 4:6, :3], 0.0)
+        assert_allclose(result[0, 6:], [_rgba(BLUE)] * 2)
+
+        # Without fades, the same program is a step function
+        result = rasterize_light_programs([program], 10, 8)
+        assert_allclose(result[0, :4], [_rgba(RED)] * 4)
+
+    def test_empty_program(self):
+        result = rasterize_light_programs([LightProgram()], 10, 3)
+        assert_allclose(result[0], [[0.0, 0.0, 0.0, 1.0]] * 3)
@@ -0,0 +1,95 @@
+"""Unit tests for the rendering of shows without the Skybrush Studio server."""
+
+import socket
+from io import BytesIO
+from zipfile import ZipFile
+
+import pytest
+from numpy.testing import assert_allclose
+from sbstudio.model.color import Color4D
+from sbstudio.model.file_formats import FileFormat
+from sbstudio.model.light_program import LightProgram
+from sbstudio.model.local_rendering import (
+    is_rendered_locally,
+    iter_tables_of_samples,
+    render_show_locally,
+)
+from sbstudio.model.location import ShowLocation
+from sbstudio.model.point import Point4D
+from sbstudio.model.skybrush_csv import parse_skybrush_csv
+from sbstudio.model.trajectory import Trajectory
+
+
+@pytest.fixture
+def offline(monkeypatch):
+    """Fixture that makes every attempt to open a network connection fail,
+    like when online access is turned off in Blender.
+    """
+
+    def connect(*args, **kwds):
+        raise AssertionError("Network access attempted while offline")
+
+    monkeypatch.setattr(socket.socket, "connect", connect)
+    monkeypatch.setattr(socket, "create_connection", connect)
+
+
+@pytest.fixture
+def samples():
+    trajectories = {
+        "d1": Trajectory([Point4D(0, 0, 0, 0), Point4D(0.5, 1, 0, 2)]),
+        "d2": Trajectory([Point4D(0, 5, 5, 0), Point4D(0.5, 5, 5, 1)]),
+    }
+    lights = {
+        "d1": LightProgram([Color4D(0, 255, 0, 0), Color4D(0.5, 0, 0, 255)]),
+    }
+    return trajectories, lights
+
+
+class TestIsRenderedLocally:
+    @pytest.mark.parametrize("format", [FileFormat.CSV, FileFormat.KMZ])
+    def test_local_formats(self, format):
+        assert is_rendered_locally(format, {"render_locally": True})
+        assert not is_rendered_locally(format, {"render_locally": False})
+        assert not is_rendered_locally(format, {})
+
+    def test_server_formats(self):
+        assert not is_rendered_locally(FileFormat.SKYC, {"render_locally": True})
+
+    def test_bundles_are_rendered_by_the_server(self):
+        assert not is_rendered_locally([FileFormat.CSV], {"render_locally": True})
+
+
+class TestRenderShowLocally:
+    def test_tables(self, samples):
+        tables = dict(iter_tables_of_samples(*samples))
+        assert_allclose(
+            tables["d1"], [[0, 0, 0, 0, 255, 0, 0], [0.5, 1, 0, 2, 0, 0, 255]]
+        )
+        assert_allclose(tables["d2"][:, 4:], 255)
+
+    def test_csv_while_offline(self, offline, samples):
+        output = BytesIO()
+        render_show_locally(FileFormat.CSV, output, *samples)
+
+        with ZipFile(output) as zip_file:
+            assert zip_file.namelist() == ["d1.csv", "d2.csv"]
+            table = parse_skybrush_csv(zip_file.read("d1.csv"))
+            assert_allclose(table[:, :4], [[0, 0, 0, 0], [0.5, 1, 0, 2]])
+
+    def test_kmz_while_offline(self, offline, samples):
+        output = BytesIO()
+        location = ShowLocation(orientation=0, latitude=47.0, longitude=19.0)
+        render_show_locally(
+            FileFormat.KMZ, output, *samples, title="Show", location=location
+        )
+
+        with ZipFile(output) as zip_file:
+            assert b"<name>Show</name>" in zip_file.read("doc.kml")
+
+    def test_kmz_without_location(self, samples):
+        with pytest.raises(ValueError, match="show location"):
+            render_show_locally(FileFormat.KMZ, BytesIO(), *samples)
+
+    def test_server_format(self, samples):
+        with pytest.raises(ValueError, match="cannot be rendered locally"):
+            render_show_locally(FileFormat.SKYC, BytesIO(), *samples)
@@ -0,0 +1,26 @@
+"""Unit tests for the string representation of mappings."""
+
+import pytest
+from sbstudio.model.mapping import (
+    decode_mapping,
+    encode_mapping,
+    is_legacy_encoded_mapping,
+)
+
+
+class TestMappingEncoding:
+    @pytest.mark.parametrize(
+        "mapping", [[], [0, 1, 2], [3, None, 0, None, 1], list(range(10000))]
+    )
+    def test_round_trip(self, mapping):
+        encoded = encode_mapping(mapping)
+        assert not is_legacy_encoded_mapping(encoded)
+        assert decode_mapping(encoded) == mapping
+
+    def test_legacy_json(self):
+        assert is_legacy_encoded_mapping(" [0, null, 1] ")
+        assert decode_mapping("[0, null, 1]") == [0, None, 1]
+
+    @pytest.mark.parametrize("encoded", ["", "  ", "[", "garbage"])
+    def test_no_mapping(self, encoded):
+        assert decode_mapping(encoded) is None
@@ -0,0 +1,74 @@
+"""Unit tests for the PyroEventIndex class."""
+
+import pytest
+from numpy.testing import assert_array_equal
+from sbstudio.model.pyro_markers import (
+    PyroEventIndex,
+    PyroMarker,
+    PyroMarkers,
+    PyroPayload,
+)
+
+
+def _markers(**events: tuple[int, float]) -> PyroMarkers:
+    """Creates pyro markers from keyword arguments of the form
+    ``c<channel>=(frame, duration)``.
+    """
+    return PyroMarkers(
+        markers={
+            int(key[1:]): PyroMarker(
+                frame=frame, payload=PyroPayload(name=key, duration=duration)
+            )
+            for key, (frame, duration) in events.items()
+        }
+    )
+
+
+@pytest.fixture
+def swarm() -> list[PyroMarkers]:
+    return [
+        _markers(c1=(100, 10), c2=(500, 1)),
+        _markers(),
+        _markers(c1=(50, 2)),
+        _markers(c3=(120, 30)),
+    ]
+
+
+class TestConstruction:
+    def test_empty(self):
+        index = PyroEventIndex.from_markers([], fps=25)
+        assert len(index) == 0
+        assert index.num_drones == 0
+        assert len(index.get_drones_active_at_frame(0)) == 0
+
+    def test_events_are_sorted_by_start_frame(self, swarm):
+        index = PyroEventIndex.from_markers(swarm, fps=25)
+        assert len(index) == 4
+        assert index.num_drones == 4
+        assert_array_equal(index.start_frames, [50, 100, 120, 500])
+        assert_array_equal(index.end_frames, [100, 350, 870, 525])
+        assert_array_equal(index.drone_indices, [2, 0, 3, 0])
+        assert_array_equal(index.channels, [1, 1, 3, 2])
+
+
+class TestQueries:
+    @pytest.mark.parametrize("frame", [0, 49, 50, 99, 100, 120, 351, 500, 525, 526])
+    def test_matches_is_active_at_frame(self, swarm, frame):
+        fps = 25
+        index = PyroEventIndex.from_markers(swarm, fps=fps)
+        expected = sorted(
+            (drone_index, channel)
+            for drone_index, markers in enumerate(swarm)
+            for channel, marker in markers.markers.items()
+            if marker.is_active_at_frame(frame, fps)
+        )
+        drone_indices, channels = index.get_events_active_at_frame(frame)
+        assert sorted(zip(drone_indices.tolist(), channels.tolist())) == expected
+
+    def test_drones_active_at_frame_are_unique(self):
+        index = PyroEventIndex.from_markers(
+            [_markers(c1=(10, 1), c2=(10, 1)), _markers(c1=(5, 1))], fps=10
+        )
+        assert_array_equal(index.get_drones_active_at_frame(10), [0, 1])
+        assert_array_equal(index.get_drones_active_at_frame(20), [0])
+        assert_array_equal(index.get_drones_active_at_frame(21), [])
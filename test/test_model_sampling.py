@@ -0,0 +1,52 @@
+"""Unit tests for the selection of the frames to sample during exports."""
+
+import pytest
+from sbstudio.model.sampling import (
+    get_decimation_indices,
+    get_frame_step,
+    get_sampled_frames,
+)
+
+
+class TestFrameSelection:
+    @pytest.mark.parametrize(
+        "scene_fps, fps, step",
+        [(24, 4, 6), (24, 30, 1), (25, 4, 6), (24, 5, 4), (30, 7, 4), (24, 24, 1)],
+    )
+    def test_frame_step(self, scene_fps, fps, step):
+        assert get_frame_step(scene_fps, fps) == step
+
+    def test_sampled_frames(self):
+        assert get_sampled_frames(0, 12, 6) == [0, 6, 12]
+        assert get_sampled_frames(1, 14, 6) == [1, 7, 13, 14]
+        assert get_sampled_frames(5, 5, 6) == [5]
+        assert get_sampled_frames(5, 3, 6) == [5]
+
+
+class TestDecimation:
+    @pytest.mark.parametrize(
+        "start, end, source_step, target_step",
+        [(0, 240, 1, 6), (3, 250, 1, 6), (0, 241, 2, 6), (10, 10, 1, 4), (0, 97, 4, 4)],
+    )
+    def test_decimated_samples_match_direct_sampling(
+        self, start, end, source_step, target_step
+    ):
+        # A bundle samples the show once at the source step and then selects
+        # the samples of each format; the result must be the same as when the
+        # format is exported on its own, sampled at the target step
+        def sample(frame):
+            return (frame / 24, frame**2 % 7)
+
+        source = [sample(f) for f in get_sampled_frames(start, end, source_step)]
+        direct = [sample(f) for f in get_sampled_frames(start, end, target_step)]
+
+        indices = get_decimation_indices(start, end, source_step, target_step)
+        assert indices is not None
+        assert [source[index] for index in indices] == direct
+
+    @pytest.mark.parametrize(
+        "start, end, source_step, target_step",
+        [(0, 240, 4, 6), (0, 240, 6, 1), (0, 241, 6, 6 * 2 + 1)],
+    )
+    def test_frames_not_sampled(self, start, end, source_step, target_step):
+        assert get_decimation_indices(start, end, source_step, target_step) is None
@@ -0,0 +1,57 @@
+"""Unit tests for the cache of simplified light programs."""
+
+from sbstudio.model.color import Color4D
+from sbstudio.model.light_program import LightProgram
+from sbstudio.model.simplification_cache import SimplificationCache
+
+
+def blinking_light_program(period: int = 2) -> LightProgram:
+    return LightProgram(
+        [
+            Color4D(t, 255 if (t // period) % 2 else 0, 0, 0, is_fade=False)
+            for t in range(10)
+        ]
+    )
+
+
+class TestSimplificationCache:
+    def test_light_program(self):
+        cache = SimplificationCache()
+        expected = blinking_light_program().simplify().colors
+        for _ in range(2):
+            program = cache.simplify_light_program("drone", blinking_light_program())
+            assert program.colors == expected
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        assert (
+            cache.simplify_light_program(
+                "drone", blinking_light_program(period=3)
+            ).colors
+            == blinking_light_program(period=3).simplify().colors
+        )
+        cache.simplify_light_program("other", blinking_light_program())
+        assert (cache.hits, cache.misses) == (1, 3)
+        assert len(cache) == 3
+
+        cache.clear()
+        assert len(cache) == 0
+        assert (cache.hits, cache.misses) == (0, 0)
+
+    def test_cached_objects_are_copies(self):
+        cache = SimplificationCache()
+        cache.simplify_light_program(
+            "drone", blinking_light_program()
+        ).shift_time_in_place(5)
+
+        second = cache.simplify_light_program("drone", blinking_light_program())
+        second.shift_time_in_place(5)
+        third = cache.simplify_light_program("drone", blinking_light_program())
+        assert third.colors[0].t == 0
+        assert second.colors[0].t == 5
+
+    def test_eviction(self):
+        cache = SimplificationCache(max_size=2)
+        for name in ("a", "b", "c"):
+            cache.simplify_light_program(name, blinking_light_program())
+        cache.simplify_light_program("a", blinking_light_program())
+        assert (cache.hits, cache.misses) == (0, 4)
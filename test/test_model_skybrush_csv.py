@@ -0,0 +1,95 @@
+"""Unit tests for the Skybrush CSV parsers and writer."""
+
+from io import BytesIO
+from zipfile import ZipFile
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from sbstudio.model.skybrush_csv import (
+    format_skybrush_csv,
+    parse_skybrush_csv,
+    parse_skybrush_static_csv,
+    write_skybrush_csv_zip,
+)
+
+
+class TestDynamicCSV:
+    def test_header_and_colors(self):
+        data = b"Time_msec,x,y,z,Red,Green,Blue\r\n0,1,2,3,255,0,0\r\n\r\n40,1,2,4,0,255,0\r\n"
+        assert_allclose(
+            parse_skybrush_csv(data),
+            [[0, 1, 2, 3, 255, 0, 0], [0.04, 1, 2, 4, 0, 255, 0]],
+        )
+
+    def test_default_colors(self):
+        data = b"0,1,2,3\n1000,4,5,6\n"
+        assert_allclose(
+            parse_skybrush_csv(data),
+            [[0, 1, 2, 3, 255, 255, 255], [1, 4, 5, 6, 255, 255, 255]],
+        )
+
+    def test_mixed_rows(self):
+        data = b'0,1,2,3\n40,1,2,4,0,255,0\n"80",1,2,5\n'
+        table = parse_skybrush_csv(data)
+        assert table.shape == (3, 7)
+        assert_allclose(table[:, 4], [255, 0, 255])
+
+    def test_empty(self):
+        assert parse_skybrush_csv(b"").shape == (0, 7)
+        assert parse_skybrush_csv(b"Time [msec],x,y,z\n").shape == (0, 7)
+
+    def test_invalid_row(self):
+        with pytest.raises(RuntimeError, match=r"'a.csv', row \['40', '1', 'x', '4'\]"):
+            parse_skybrush_csv(b"0,1,2,3\n40,1,x,4\n", filename="a.csv")
+
+    def test_fractional_color(self):
+        with pytest.raises(RuntimeError, match="Invalid content"):
+            parse_skybrush_csv(b"0,1,2,3,255,0.5,0\n")
+
+    def test_timestamps_not_increasing(self):
+        with pytest.raises(RuntimeError, match="strictly increasing"):
+            parse_skybrush_csv(b"0,1,2,3\n0,1,1,4\n")
+
+
+class TestStaticCSV:
+    def test_names_and_colors(self):
+        data = b"Name,x,y,z,Red,Green,Blue\nd1,1,2,3,10,20,30\nd2,4,5,6,0,0,0\n"
+        names, table = parse_skybrush_static_csv(data)
+        assert names == ["d1", "d2"]
+        assert_allclose(table, [[1, 2, 3, 10, 20, 30], [4, 5, 6, 0, 0, 0]])
+
+    def test_quoted_names(self):
+        names, table = parse_skybrush_static_csv(b'"a,b",1,2,3\nc,4,5,6\n')
+        assert names == ["a,b", "c"]
+        assert_allclose(table[:, 3:], 255)
+
+    def test_duplicate_names(self):
+        with pytest.raises(RuntimeError, match="Duplicate object name"):
+            parse_skybrush_static_csv(b"d1,1,2,3\nd1,4,5,6\n")
+
+
+class TestDynamicCSVWriter:
+    def test_format(self):
+        table = [[0, 1, 2, 3, 255, 0, 0], [0.04, 1.23456, -0.0001, 4, 0, 255.2, 0]]
+        assert format_skybrush_csv(np.array(table)) == (
+            b"Time_msec,x,y,z,Red,Green,Blue\r\n"
+            b"0,1.000,2.000,3.000,255,0,0\r\n"
+            b"40,1.235,0.000,4.000,0,255,0\r\n"
+        )
+
+    def test_zip_roundtrip(self):
+        tables = [
+            (
+                f"drone{i}",
+                np.array([[0, i, 2, 3, 255, 0, 0], [0.25, i, 2, 4, 0, 0, 255]]),
+            )
+            for i in range(20)
+        ]
+        output = BytesIO()
+        write_skybrush_csv_zip(output, tables)
+
+        with ZipFile(output) as zip_file:
+            assert zip_file.namelist() == [f"drone{i}.csv" for i in range(20)]
+            for name, table in tables:
+                assert_allclose(parse_skybrush_csv(zip_file.read(f"{name}.csv")), table)
@@ -0,0 +1,91 @@
+"""Unit tests for the spatial feature store of light effect presets."""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+from sbstudio.plugin.presets.light_effects.features import (
+    SpatialFeatures,
+    clear_spatial_feature_store,
+    get_spatial_features,
+)
+
+
+class _Positions:
+    def __init__(self, positions):
+        self.as_array = positions
+
+    def __len__(self):
+        return len(self.as_array)
+
+
+class _Context:
+    def __init__(self, positions, storyboard_entry_id=None):
+        self.positions = _Positions(positions)
+        self.storyboard_entry_id = storyboard_entry_id
+        self._cache = {}
+
+    @property
+    def swarm_center(self):
+        return self.positions.as_array.mean(axis=0).astype(np.float32)
+
+
+@pytest.fixture(autouse=True)
+def empty_store():
+    clear_spatial_feature_store()
+    yield
+    clear_spatial_feature_store()
+
+
+@pytest.fixture
+def positions():
+    return np.array([[1, 0, 5], [0, 1, 2], [-1, 0, 9], [0, -1, 2]], dtype=np.float32)
+
+
+class TestSpatialFeatures:
+    def test_polar_coordinates(self, positions):
+        features = SpatialFeatures(positions, positions.mean(axis=0))
+        assert_allclose(features.angle, [0, 90, 180, 270], atol=1e-5)
+        assert_allclose(features.radius, [1, 1, 1, 1])
+        assert_allclose(features.normalized_radius, [1, 1, 1, 1])
+
+    def test_all_drones_at_center(self):
+        positions = np.zeros((3, 3), dtype=np.float32)
+        features = SpatialFeatures(positions, positions.mean(axis=0))
+        assert_array_equal(features.normalized_radius, [0, 0, 0])
+
+    def test_cached_arrays_are_read_only(self, positions):
+        features = SpatialFeatures(positions, positions.mean(axis=0))
+        for name in ("centered", "angle", "radius", "normalized_radius"):
+            array = getattr(features, name)
+            with pytest.raises(ValueError, match="read-only"):
+                array[0] = 0
+
+    def test_get_or_compute(self, positions):
+        features = SpatialFeatures(positions, positions.mean(axis=0))
+        calls = []
+
+        def compute(f):
+            calls.append(f)
+            return f.positions[:, 0] * 2
+
+        first = features.get_or_compute("test", compute)
+        second = features.get_or_compute("test", compute)
+        assert first is second
+        assert calls == [features]
+
+
+class TestFeatureStore:
+    def test_shared_within_context(self, positions):
+        context = _Context(positions, "entry")
+        assert get_spatial_features(context) is get_spatial_features(context)
+
+    def test_reused_across_frames_in_same_formation(self, positions):
+        first = get_spatial_features(_Context(positions, "entry"))
+        second = get_spatial_features(_Context(positions.copy(), "entry"))
+        assert first is second
+
+    def test_not_reused_when_positions_or_entry_change(self, positions):
+        first = get_spatial_features(_Context(positions, "entry"))
+        assert get_spatial_features(_Context(positions, "other")) is not first
+        moved = positions + 1
+        assert get_spatial_features(_Context(moved, "entry")) is not first
@@ -0,0 +1,39 @@
+"""Regression tests that compare the outputs of the built-in light effect
+presets with the golden arrays generated by
+``etc/scripts/benchmark_light_effect_presets.py``.
+"""
+
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = (
+    Path(__file__).resolve().parent.parent
+    / "etc"
+    / "scripts"
+    / "benchmark_light_effect_presets.py"
+)
+
+
+@pytest.fixture(scope="module")
+def harness():
+    spec = spec_from_file_location("benchmark_light_effect_presets", SCRIPT_PATH)
+    assert spec is not None and spec.loader is not None
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_preset_outputs_match_golden_arrays(harness):
+    presets = list(harness.iter_preset_mapping())
+    assert presets
+    assert harness.check_golden_outputs(presets) == []
+
+
+def test_make_swarm_is_deterministic(harness):
+    first_positions, first_mapping = harness.make_swarm(100)
+    second_positions, second_mapping = harness.make_swarm(100)
+    assert (first_positions == second_positions).all()
+    assert first_mapping == second_mapping
+    assert sorted(first_mapping) == list(range(100))
@@ -0,0 +1,46 @@
+"""Unit tests for the cache of API responses."""
+
+from os import utime
+
+from sbstudio.response_cache import ResponseCache
+
+
+class TestResponseCache:
+    def test_key_is_canonical(self):
+        key = ResponseCache.key_of("match", {"a": 1, "b": [(1, 2)]}, "2.0.0")
+        assert key == ResponseCache.key_of("match", {"b": [[1, 2]], "a": 1}, "2.0.0")
+        assert key != ResponseCache.key_of("match", {"a": 1, "b": [[1, 2]]}, "2.1.0")
+        assert key != ResponseCache.key_of("plan", {"a": 1, "b": [[1, 2]]}, "2.0.0")
+
+    def test_memory_only(self):
+        cache = ResponseCache(max_items_in_memory=2)
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+        assert cache.get("a") == b"1"
+        cache.put("c", b"3")
+
+        assert cache.get("a") == b"1"
+        assert cache.get("b") is None
+        assert cache.get("c") == b"3"
+
+    def test_disk_persistence(self, tmp_path):
+        ResponseCache(tmp_path).put("a", b"[1, 2]")
+        cache = ResponseCache(tmp_path)
+        assert cache.get("a") == b"[1, 2]"
+        assert cache.get("b") is None
+
+        cache.clear()
+        assert ResponseCache(tmp_path).get("a") is None
+
+    def test_disk_eviction(self, tmp_path):
+        cache = ResponseCache(tmp_path, max_disk_size=35)
+        for index, key in enumerate("abc"):
+            cache.put(key, b"x" * 10)
+            utime(tmp_path / f"{key}.json", (index, index))
+
+        # "a" is used more recently than "b"
+        assert cache.get("a") is not None
+        cache.put("d", b"x" * 10)
+
+        cache = ResponseCache(tmp_path)
+        assert sorted(path.stem for path in tmp_path.iterdir()) == ["a", "c", "d"]
@@ -0,0 +1,35 @@
+"""Unit tests for the timer that measures the startup of the add-on."""
+
+import logging
+
+from sbstudio.startup_timer import StartupTimer
+
+
+class TestStartupTimer:
+    def test_measure(self):
+        timer = StartupTimer()
+        with timer.measure("first"):
+            pass
+        with timer.measure("second"):
+            sum(range(100000))
+
+        assert [name for name, _ in timer.steps] == ["first", "second"]
+        assert timer.total == sum(duration for _, duration in timer.steps)
+        assert not timer.over_budget
+
+        lines = timer.format().splitlines()
+        assert lines[0].startswith("Startup took")
+        assert lines[1].endswith("second")
+
+        timer.reset()
+        assert timer.steps == []
+
+    def test_report_over_budget(self, caplog):
+        timer = StartupTimer(budget=0)
+        with timer.measure("slow step"):
+            sum(range(1000))
+
+        assert timer.over_budget
+        with caplog.at_level(logging.WARNING):
+            timer.report(logging.getLogger("test"))
+        assert "slow step" in caplog.text
@@ -0,0 +1,56 @@
+"""Unit tests for the PhaseTimer class."""
+
+import pytest
+from sbstudio.utils import PhaseTimer
+
+
+class TestPhaseTimer:
+    def test_empty(self):
+        timer = PhaseTimer()
+        assert timer.durations == {}
+        assert str(timer) == ""
+
+    def test_phases_accumulate_in_order(self):
+        timer = PhaseTimer()
+        with timer.phase("mapping"):
+            pass
+        with timer.phase("curve write"):
+            pass
+        with timer.phase("mapping"):
+            pass
+
+        durations = timer.durations
+        assert list(durations) == ["mapping", "curve write"]
+        assert all(duration >= 0 for duration in durations.values())
+        assert str(timer).startswith("mapping ")
+        assert ", curve write " in str(timer)
+
+    def test_phase_is_recorded_on_exception(self):
+        timer = PhaseTimer()
+        try:
+            with timer.phase("failing"):
+                raise RuntimeError
+        except RuntimeError:
+            pass
+        assert list(timer.durations) == ["failing"]
+
+    def test_add(self):
+        first = PhaseTimer()
+        with first.phase("mapping"):
+            pass
+        second = PhaseTimer()
+        with second.phase("curve write"):
+            pass
+        with second.phase("mapping"):
+            pass
+
+        total = PhaseTimer()
+        total.add(first)
+        total.add(second)
+
+        durations = total.durations
+        assert list(durations) == ["mapping", "curve write"]
+        assert durations["mapping"] == pytest.approx(
+            first.durations["mapping"] + second.durations["mapping"]
+        )
+        assert durations["curve write"] == second.durations["curve write"]
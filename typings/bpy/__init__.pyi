@@ -1,13 +1,14 @@
 from collections.abc import Sequence
 
 import bpy.app as app
+import bpy.msgbus as msgbus
 import bpy.ops as ops
 import bpy.path as path
 import bpy.utils as utils
 
 from .types import BlendData, Context, Object
 
-__all__ = ("app", "context", "data", "ops", "path", "utils")
+__all__ = ("app", "context", "data", "msgbus", "ops", "path", "utils")
 
 class _Context(Context):
     selected_objects: Sequence[Object]
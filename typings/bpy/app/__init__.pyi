@@ -3,6 +3,7 @@ import bpy.app.timers as timers
 import bpy.app.translations as translations
 
 __all__ = (
+    "background",
     "handlers",
     "online_access",
     "online_access_override",
@@ -14,6 +15,8 @@ __all__ = (
     "version_string",
 )
 
+background: bool
+
 version: tuple[int, int, int]
 version_file: tuple[int, int, int]
 version_string: str
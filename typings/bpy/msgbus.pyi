@@ -0,0 +1,12 @@
+from collections.abc import Callable
+from typing import Any
+
+def clear_by_owner(owner: Any) -> None: ...
+def subscribe_rna(
+    *,
+    key: Any,
+    owner: Any,
+    args: tuple[Any, ...],
+    notify: Callable[..., None],
+    options: set[str] = ...,
+) -> None: ...
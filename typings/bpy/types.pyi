@@ -104,6 +104,7 @@ class bpy_prop_collection_idprop(bpy_prop_collection[T]):
     def remove(self, index: int) -> None: ...
 
 class bpy_struct:
+    def as_pointer(self) -> int: ...
     def keyframe_delete(
         self,
         data_path: str,
@@ -200,6 +201,7 @@ Self = TypeVar("Self", bound="ID")
 
 class ID(bpy_struct):
     name: str
+    is_evaluated: bool
     users: int
     id_type: IdType
     use_fake_user: bool
@@ -283,6 +285,9 @@ class MeshVertex(bpy_struct):
     index: int
     select: bool
 
+class MeshVertices(bpy_prop_collection[MeshVertex]):
+    def add(self, count: int = 0) -> None: ...
+
 class MeshEdge(bpy_struct):
     hide: bool
     index: int
@@ -318,16 +323,21 @@ class VertexGroup(bpy_struct):
     name: str
 
     def add(
-        self, index: int, weight: float, type: Literal["ADD", "REPLACE", "SUBTRACT"]
+        self,
+        index: Sequence[int],
+        weight: float,
+        type: Literal["ADD", "REPLACE", "SUBTRACT"],
     ) -> None: ...
-    def remove(self, index: int) -> None: ...
+    def remove(self, index: Sequence[int]) -> None: ...
     def weight(self, index: int) -> float: ...
 
 class VertexGroupElement(bpy_struct):
     group: int
     weight: float
 
-class VertexGroups(bpy_prop_collection[VertexGroup]): ...
+class VertexGroups(bpy_prop_collection[VertexGroup]):
+    def new(self, name: str = "Group") -> VertexGroup: ...
+
 class ViewLayer(bpy_struct): ...
 
 class Action(ID):
@@ -365,11 +375,14 @@ class MaterialSlot(bpy_struct):
     material: Material | None
 
 class Mesh(ID):
-    vertices: bpy_prop_collection[MeshVertex]
+    vertices: MeshVertices
     edges: bpy_prop_collection[MeshEdge]
     polygons: bpy_prop_collection[MeshPolygon]
 
     def transform(self, matrix: Matrix, shape_keys: bool = False) -> None: ...
+    def update(
+        self, calc_edges: bool = False, calc_edges_loose: bool = False
+    ) -> None: ...
 
 class NodeTree(ID):
     nodes: bpy_prop_collection[Node]
@@ -416,6 +429,8 @@ class Depsgraph(bpy_struct):
     scene: Scene
     scene_eval: Scene
 
+    def id_type_updated(self, id_type: str) -> bool: ...
+
 class Event(bpy_struct): ...
 
 OperatorReturnItems = set[
@@ -479,6 +494,10 @@ class ParticleSystem(bpy_struct):
 class Preferences(bpy_struct):
     addons: bpy_prop_collection[Addon]
     system: System
+    view: PreferencesView
+
+class PreferencesView(bpy_struct):
+    language: str
 
 class Scene(ID):
     frame_current: int
@@ -535,6 +554,10 @@ class TimelineMarker(bpy_struct):
     select: bool
     camera: Object | None
 
+class Timer(bpy_struct):
+    time_delta: float
+    time_duration: float
+
 class ToolSettings(bpy_struct):
     mesh_select_mode: list[bool]
 
@@ -542,7 +565,17 @@ class View3DCursor(bpy_struct):
     location: Vector
     matrix: Matrix
 
+class Window(bpy_struct):
+    screen: Screen
+
+class WorkSpace(ID):
+    def status_text_set(self, text: str | None) -> None: ...
+
 class WindowManager(ID):
+    def event_timer_add(
+        self, time_step: float, *, window: Window | None = None
+    ) -> Timer: ...
+    def event_timer_remove(self, timer: Timer) -> None: ...
     def fileselect_add(self, operator: Operator) -> None: ...
     def invoke_confirm(
         self,
@@ -561,6 +594,10 @@ class WindowManager(ID):
         operator: Operator,
         width: int = 0,
     ) -> None: ...
+    def modal_handler_add(self, operator: Operator) -> bool: ...
+    def progress_begin(self, min: float, max: float) -> None: ...
+    def progress_end(self) -> None: ...
+    def progress_update(self, value: float) -> None: ...
 
 class Context(bpy_struct):
     area: Area
@@ -576,7 +613,9 @@ class Context(bpy_struct):
     selected_objects: list[Object]
     space_data: Space
     tool_settings: ToolSettings
+    window: Window | None
     window_manager: WindowManager
+    workspace: WorkSpace
 
     def copy(self) -> Context: ...
     def evaluated_depsgraph_get(self) -> Depsgraph: ...
@@ -668,6 +707,7 @@ class CollectionObjects(bpy_struct, bpy_prop_collection[Object]):
     def unlink(self, object: Object) -> None: ...
 
 class FCurveKeyframePoints(bpy_prop_collection[Keyframe]):
+    def add(self, count: int = 1) -> None: ...
     def clear(self) -> None: ...
     def deduplicate(self) -> None: ...
     def handles_recalc(self) -> None: ...
@@ -1,4 +1,4 @@
-from typing import Type
+from typing import Literal, Type
 
 from bpy.types import (
     AddonPreferences,
@@ -41,3 +41,9 @@ def unregister_class(
         | NodeSocket
     ],
 ) -> None: ...
+def user_resource(
+    resource_type: Literal["DATAFILES", "CONFIG", "SCRIPTS", "EXTENSIONS"],
+    *,
+    path: str = "",
+    create: bool = False,
+) -> str: ...